@@ -53,6 +53,7 @@ class Settings(BaseSettings):
     REDIS_SOCKET_CONNECT_TIMEOUT: int = 5
     REDIS_RETRY_ON_TIMEOUT: bool = True
     REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    REDIS_FALLBACK_MAX_ENTRIES: int = 1000  # in-memory cache entries kept while Redis is down
 
     # Subscription Limits (India)
     FREE_RESUME_LIMIT: int = 1
@@ -92,6 +93,12 @@ class Settings(BaseSettings):
     CACHE_SUBSCRIPTION_TTL: int = 300  # 5 minutes
     CACHE_RESUME_TTL: int = 600  # 10 minutes
     CACHE_AI_RESPONSE_TTL: int = 3600  # 1 hour
+    CACHE_BLOG_TTL: int = 86400  # 1 day — keys are versioned, so this only bounds memory
+    RESUME_PARSE_CACHE_ENABLED: bool = True     # AI parse results per uploaded file (see resume_parse_cache)
+    RESUME_PARSE_CACHE_TTL: int = 604800        # 7 days
+    RESUME_PARSE_CACHE_MAX_ENTRIES: int = 20    # per user
+    RESUME_PARSE_CACHE_MAX_ENTRY_KB: int = 256
+    RESUME_PREPARSE_ENABLED: bool = True        # rule-based parse first; Claude only fills gaps (see resume_preparser)
 
     # AI Assist Quotas (daily limits)
     FREE_AI_ASSIST_LIMIT: int = 10
@@ -104,6 +111,36 @@ class Settings(BaseSettings):
     RESEND_FROM_NAME: str = "Resume Builder"
     EMAIL_ENABLED: bool = True
 
+    # Transactional email outbox (drained in the background, see email_outbox_service)
+    EMAIL_OUTBOX_WORKER_ENABLED: bool = True
+    EMAIL_OUTBOX_POLL_SECONDS: int = 5
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 8
+    EMAIL_OUTBOX_RETENTION_DAYS: int = 30  # finished rows are deleted after this
+
+    # Background jobs for long cron work (see job_runner)
+    JOB_WORKER_ENABLED: bool = True
+    JOB_WORKER_CONCURRENCY: int = 2        # jobs run in parallel per API process
+    JOB_POLL_SECONDS: int = 5
+    JOB_MAX_ATTEMPTS: int = 3              # restarts after a worker dies mid-job
+
+    # Resume PDF rendering on a process pool (see pdf_render_pool)
+    PDF_POOL_ENABLED: bool = True
+    PDF_POOL_WORKERS: int = 0              # 0 = one per usable CPU, up to PDF_POOL_AUTO_MAX_WORKERS
+    PDF_POOL_AUTO_MAX_WORKERS: int = 2     # cap when sized automatically (per API process)
+    PDF_POOL_QUEUE_PER_WORKER: int = 4     # renders admitted per worker before 503
+    PDF_CACHE_ENABLED: bool = True         # content-addressed PDF byte cache (see pdf_cache)
+    PDF_CACHE_DIR: Optional[str] = None    # default {tmp}/resume-pdf-cache
+    PDF_CACHE_MAX_MB: int = 256
+    PDF_SECTION_CACHE_SIZE: int = 512      # built section flowables kept per process
+    RESUME_EXPORT_CONCURRENCY: int = 0     # renders in flight per ZIP export; 0 = one per pool worker
+
+    # Resume file uploads (see utils.uploads)
+    RESUME_UPLOAD_MAX_MB: int = 10
+    RESUME_UPLOAD_SPOOL_KB: int = 1024     # kept in memory up to this size, then spooled to disk
+    RESUME_EXTRACT_WORKERS: int = 2        # processes for page-parallel PDF text extraction; 0 = serial
+    RESUME_EXTRACT_PARALLEL_PAGES: int = 8 # PDFs with at least this many pages are split across them
+
     # Cron Job Secret
     CRON_SECRET: Optional[str] = None
 
@@ -113,8 +150,17 @@ class Settings(BaseSettings):
 
     # Blog Automation
     BLOG_POSTS_PER_RUN: int = 3            # how many posts the cron generates per run
+    BLOG_GENERATION_CONCURRENCY: int = 10  # parallel Claude calls per run
+    BLOG_RELATED_POSTS: int = 6            # related articles stored per post
     INDEXNOW_API_KEY: Optional[str] = None  # get from Bing Webmaster Tools
     SITE_URL: str = "https://resumebuilder.pulsestack.in"
+    BLOG_SITEMAP_BASE_URL: Optional[str] = None  # public sitemap prefix; default {SITE_URL}/sitemaps/blog
+
+    # On-demand ISR revalidation of blog pages (frontend /api/revalidate)
+    REVALIDATE_SECRET: Optional[str] = None          # shared with the frontend; unset = disabled
+    REVALIDATE_URL: Optional[str] = None             # default {SITE_URL}/api/revalidate
+    REVALIDATE_DEBOUNCE_SECONDS: float = 5.0         # flush after this much quiet
+    REVALIDATE_MAX_WAIT_SECONDS: float = 30.0        # ...but never later than this
 
     # Google Search Console Indexing API
     # Paste the full service account JSON as a single-line string in Railway env vars
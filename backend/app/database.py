@@ -70,8 +70,10 @@ def init_db() -> None:
     This should be called once during application startup
     or handled by Alembic migrations in production.
     """
-    from app.models import user, resume, payment, coupon, drip_email_log, blog, interview, portfolio  # Import all models
+    from app.models import user, resume, resume_upload, payment, coupon, drip_email_log, email_outbox, background_job, blog, interview, portfolio  # Import all models
+    from app.services.blog_search import ensure_search_index
     Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
 
 
 def close_db() -> None:
@@ -8,6 +8,7 @@ configures middleware, and includes all API routers.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
+import asyncio
 from contextlib import asynccontextmanager
 
 from app.config import get_settings
@@ -19,6 +20,13 @@ from app.routes.blog import router as blog_router
 from app.routes.interview import router as interview_router
 from app.routes.portfolio import router as portfolio_router
 from app.services.redis_service import RedisService
+from app.services.email_outbox_service import email_outbox_service
+from app.services.job_runner import job_runner
+from app.services.http_clients import http_clients
+from app.services.pdf_render_pool import pdf_render_pool
+from app.services.pdf_cache import pdf_cache
+from app.services.text_extraction import extraction_pool
+from app.services.revalidation_service import revalidation_notifier
 from app.middleware.rate_limit import RateLimitMiddleware
 import app.services.redis_service as redis_service_module
 
@@ -56,10 +64,39 @@ async def lifespan(app: FastAPI):
     # Store in module for global access
     redis_service_module.redis_service = redis_service
 
+    # Start transactional email outbox drainer
+    outbox_task = None
+    if settings.EMAIL_OUTBOX_WORKER_ENABLED:
+        outbox_task = asyncio.create_task(email_outbox_service.run_worker())
+
+    # Start background job worker (cron jobs)
+    job_task = None
+    if settings.JOB_WORKER_ENABLED:
+        job_task = asyncio.create_task(job_runner.run_worker())
+
+    # Keep-alive clients for the upstream APIs (jobs, payments, indexing)
+    http_clients.start()
+
+    # Spawn and pre-warm the PDF render processes
+    if settings.PDF_POOL_ENABLED:
+        await asyncio.to_thread(pdf_render_pool.start)
+
     yield
 
     # Shutdown
     logger.info("Shutting down Resume Builder API...")
+    for task in (outbox_task, job_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    await asyncio.to_thread(pdf_render_pool.shutdown)
+    await asyncio.to_thread(extraction_pool.shutdown)
+    # Don't lose revalidations still waiting out their debounce
+    await asyncio.to_thread(revalidation_notifier.flush)
+    await http_clients.aclose()
     if redis_service:
         await redis_service.disconnect()
 
@@ -151,6 +188,9 @@ async def health_check():
         "cache_enabled": settings.CACHE_ENABLED,
         "rate_limit_enabled": settings.RATE_LIMIT_ENABLED,
         "available_templates": available_templates,
+        "pdf_pool": pdf_render_pool.stats(),
+        "pdf_cache": pdf_cache.stats(),
+        "upstreams": http_clients.stats(),
     }
 
 
@@ -6,21 +6,28 @@ This module exports all database models for easy importing.
 
 from .user import User, SubscriptionType
 from .resume import Resume
+from .resume_upload import ResumeUpload
 from .payment import Payment, PaymentStatus
 from .coupon import Coupon
 from .drip_email_log import DripEmailLog
-from .blog import BlogPost, BlogKeyword, BlogDailyReport
+from .email_outbox import EmailOutbox
+from .background_job import BackgroundJob
+from .blog import BlogPost, BlogRelatedPost, BlogKeyword, BlogDailyReport
 from .interview import InterviewSession, InterviewQuestion, InterviewAnswer
 
 __all__ = [
     "User",
     "SubscriptionType",
     "Resume",
+    "ResumeUpload",
     "Payment",
     "PaymentStatus",
     "Coupon",
     "DripEmailLog",
+    "EmailOutbox",
+    "BackgroundJob",
     "BlogPost",
+    "BlogRelatedPost",
     "BlogKeyword",
     "BlogDailyReport",
     "InterviewSession",
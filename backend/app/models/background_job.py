@@ -0,0 +1,84 @@
+"""
+Background job model.
+
+Long-running work (daily blog generation, IndexNow re-submission, keyword
+seeding, drip campaigns, ...) is recorded here by the HTTP endpoint that
+triggers it and executed afterwards by the job runner, so the request
+returns immediately with a job id that can be polled for progress.
+"""
+
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Index, text
+from datetime import datetime
+from ..database import Base
+
+
+class BackgroundJob(Base):
+    """
+    One queued / running / finished background job.
+
+    Attributes:
+        id: Public job identifier (UUID4 string)
+        job_type: Registered handler name (generate_blogs, reindex_all, ...)
+        lock_key: Jobs sharing a lock key never run concurrently, across
+            all replicas; defaults to job_type
+        params: Keyword arguments for the handler
+        status: queued / running / succeeded / failed
+        progress: Completion percentage (0-100)
+        message: Human-readable description of the current step
+        result: Handler return value once succeeded
+        error: Error message if the job failed
+        attempts: Number of times a worker has started this job
+        started_at: When the current attempt started
+        heartbeat_at: Last progress update from the worker
+        finished_at: When the job succeeded or failed
+    """
+
+    __tablename__ = "background_jobs"
+
+    id           = Column(String(36), primary_key=True)
+    job_type     = Column(String(50), nullable=False)
+    lock_key     = Column(String(100), nullable=False)
+    params       = Column(JSON, nullable=False, default=dict)
+    status       = Column(String(20), nullable=False, default="queued")
+    progress     = Column(Integer, nullable=False, default=0)
+    message      = Column(String(255), nullable=True)
+    result       = Column(JSON, nullable=True)
+    error        = Column(Text, nullable=True)
+    attempts     = Column(Integer, nullable=False, default=0)
+    started_at   = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at  = Column(DateTime, nullable=True)
+    created_at   = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at   = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_background_jobs_status", "status", "created_at"),
+        # At most one queued-or-running job per lock key
+        Index(
+            "uq_background_jobs_active_lock", "lock_key",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+            sqlite_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id":      self.id,
+            "job_type":    self.job_type,
+            "status":      self.status,
+            "progress":    self.progress,
+            "message":     self.message,
+            "result":      self.result,
+            "error":       self.error,
+            "attempts":    self.attempts,
+            "created_at":  self.created_at.isoformat() if self.created_at else None,
+            "started_at":  self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<BackgroundJob(id='{self.id}', type='{self.job_type}', "
+            f"status='{self.status}', progress={self.progress})>"
+        )
@@ -4,18 +4,24 @@ Blog models for the automated blog system.
 Covers blog posts, keyword research, and daily run reports.
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, LargeBinary, JSON, Float, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 from datetime import datetime
 from ..database import Base
 
+# JSONB on Postgres; plain JSON on SQLite so the blog tables (and the FTS5
+# search equivalent) can be created in local / test databases
+JSONType = JSONB().with_variant(JSON(), "sqlite")
+
 
 class BlogPost(Base):
     """
     Stores every published (or draft) blog post.
 
     Content is full HTML, served via /api/blog/:slug.
-    ISR on the Next.js side caches each page for 1 hour,
+    ISR on the Next.js side caches each page for a day and is revalidated
+    on demand when a post changes (services/revalidation_service.py),
     so fetching this row only happens on cache miss.
     """
 
@@ -28,7 +34,7 @@ class BlogPost(Base):
     excerpt         = Column(Text, nullable=True)
     content         = Column(Text, nullable=True)          # Full HTML content
     category        = Column(String(50), nullable=False)   # resume-tips / interview-prep / career-advice
-    tags            = Column(JSONB, default=list)
+    tags            = Column(JSONType, default=list)
     author          = Column(String(100), default="Resume Builder Team")
     read_time       = Column(Integer, default=5)           # minutes
     featured        = Column(Boolean, default=False)
@@ -37,9 +43,15 @@ class BlogPost(Base):
     # SEO fields
     meta_description = Column(Text, nullable=True)
     primary_keyword  = Column(String(255), nullable=True)
-    lsi_keywords     = Column(JSONB, default=list)
+    lsi_keywords     = Column(JSONType, default=list)
     word_count       = Column(Integer, default=0)
 
+    # Precomputed GET /api/blog/{slug} response (see services/blog_cache.py).
+    # The bodies are deferred so ordinary post queries don't load them.
+    content_hash    = Column(String(64), nullable=True)       # sha256 of the JSON body → ETag
+    body_gzip       = deferred(Column(LargeBinary, nullable=True))
+    body_br         = deferred(Column(LargeBinary, nullable=True))
+
     # Indexing tracking
     indexnow_submitted     = Column(Boolean, default=False)
     indexnow_submitted_at  = Column(DateTime, nullable=True)
@@ -87,6 +99,33 @@ class BlogPost(Base):
         }
 
 
+class BlogRelatedPost(Base):
+    """
+    Precomputed "related articles" for a post — its top-N most similar
+    posts by keywords, tags and category (see services/related_posts.py).
+
+    Rebuilt in full by the rebuild_related_posts job and updated
+    incrementally whenever run_daily_generation publishes.
+    """
+
+    __tablename__ = "blog_related_posts"
+
+    id              = Column(Integer, primary_key=True, index=True)
+    post_id         = Column(Integer, ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False)
+    related_post_id = Column(Integer, ForeignKey("blog_posts.id", ondelete="CASCADE"), nullable=False)
+    position        = Column(Integer, nullable=False)   # 0 = most related
+    score           = Column(Float, nullable=False)     # cosine similarity
+    created_at      = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_blog_related_posts_post", "post_id", "position"),
+    )
+
+    def __repr__(self) -> str:
+        return (f"<BlogRelatedPost(post_id={self.post_id}, related_post_id={self.related_post_id}, "
+                f"position={self.position})>")
+
+
 class BlogKeyword(Base):
     """
     Keyword research pool consumed by the daily blog generator.
@@ -141,9 +180,10 @@ class BlogDailyReport(Base):
     google_submitted     = Column(Integer, default=0)
     google_success       = Column(Integer, default=0)
     sitemap_updated      = Column(Boolean, default=False)
-    keywords_used        = Column(JSONB, default=list)
+    keywords_used        = Column(JSONType, default=list)
     total_blogs_published = Column(Integer, default=0)
-    errors               = Column(JSONB, default=list)
+    errors               = Column(JSONType, default=list)
+    post_timings         = Column(JSONType, default=list)  # [{keyword, slug, seconds, status}]
     created_at           = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     def __repr__(self) -> str:
@@ -162,4 +202,5 @@ class BlogDailyReport(Base):
             "keywords_used":        self.keywords_used or [],
             "total_blogs_published": self.total_blogs_published,
             "errors":               self.errors or [],
+            "post_timings":         self.post_timings or [],
         }
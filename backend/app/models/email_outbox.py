@@ -0,0 +1,59 @@
+"""
+Transactional email outbox model.
+
+Emails are written to this table in the same transaction as the business
+change that triggers them (signup, payment webhook, ...) and delivered
+later by the outbox drainer, so request latency never includes a round
+trip to the mail provider.
+"""
+
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Index
+from datetime import datetime
+from ..database import Base
+
+
+class EmailOutbox(Base):
+    """
+    One pending / sent transactional email.
+
+    Attributes:
+        id: Primary key identifier
+        idempotency_key: Unique key per logical email; enqueueing the same
+            key twice is a no-op and it is forwarded to Resend so a retried
+            send is never delivered twice
+        email_type: Which EmailService sender to use (welcome, password_reset, ...)
+        to_email: Recipient address (denormalized for debugging)
+        payload: Keyword arguments for the EmailService sender; secrets
+            such as the reset token are removed once the row is finished
+        status: pending / sending / sent / skipped / failed
+        attempts: Number of delivery attempts made so far
+        next_attempt_at: Earliest time the drainer may (re)try this row;
+            doubles as the claim lease while status is 'sending'
+        last_error: Error message from the most recent failed attempt
+        sent_at: Timestamp of successful delivery
+    """
+
+    __tablename__ = "email_outbox"
+
+    id              = Column(Integer, primary_key=True, index=True)
+    idempotency_key = Column(String(255), unique=True, nullable=False)
+    email_type      = Column(String(50), nullable=False)
+    to_email        = Column(String(255), nullable=False)
+    payload         = Column(JSON, nullable=False, default=dict)
+    status          = Column(String(20), nullable=False, default="pending")
+    attempts        = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error      = Column(Text, nullable=True)
+    sent_at         = Column(DateTime, nullable=True)
+    created_at      = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at      = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_email_outbox_due", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmailOutbox(id={self.id}, type='{self.email_type}', "
+            f"status='{self.status}', attempts={self.attempts})>"
+        )
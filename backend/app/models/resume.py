@@ -23,6 +23,9 @@ class Resume(Base):
         job_description: Target job description for optimization
         content: Original resume data as JSON
         optimized_content: AI-optimized resume data as JSON
+        normalized_content: content in canonical form (NULL if already canonical)
+        normalized_optimized_content: optimized_content in canonical form
+        content_schema_version: Normalizer version the two columns above were built with
         ats_score: ATS compatibility score (0-100)
         template_name: Name of the PDF template to use
         created_at: Timestamp when resume was created
@@ -44,6 +47,11 @@ class Resume(Base):
     content = Column(JSON, nullable=False)
     optimized_content = Column(JSON, nullable=True)
 
+    # Canonical form for PDFs / AI prompts, maintained on write (see resume_content)
+    normalized_content = Column(JSON, nullable=True)
+    normalized_optimized_content = Column(JSON, nullable=True)
+    content_schema_version = Column(Integer, nullable=True)
+
     # ATS scoring
     ats_score = Column(Integer, nullable=True)
 
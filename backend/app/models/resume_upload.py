@@ -0,0 +1,36 @@
+"""
+Pending resume upload model.
+
+POST /api/resume/upload stores the uploaded file here and returns right
+away; the parse_resume_upload background job reads it back, parses it
+and replaces it with a Resume row. Keeping the bytes in the database
+(rather than on local disk) lets the job run on any API replica.
+"""
+
+from sqlalchemy import Column, Integer, String, LargeBinary, ForeignKey, DateTime
+from datetime import datetime
+from ..database import Base
+
+
+class ResumeUpload(Base):
+    """
+    An uploaded resume file waiting to be parsed.
+
+    Attributes:
+        id: Primary key identifier
+        user_id: Foreign key to the user who uploaded the file
+        filename: Original filename (its extension selects the extractor)
+        file_content: Raw file bytes
+        created_at: Timestamp of the upload
+    """
+
+    __tablename__ = "resume_uploads"
+
+    id           = Column(Integer, primary_key=True, index=True)
+    user_id      = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    filename     = Column(String(255), nullable=False)
+    file_content = Column(LargeBinary, nullable=False)
+    created_at   = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ResumeUpload(id={self.id}, user_id={self.user_id}, filename='{self.filename}')>"
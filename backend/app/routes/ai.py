@@ -29,6 +29,7 @@ from app.schemas.resume import (
 )
 from app.dependencies import get_current_user
 from app.services.claude_service import claude_service
+from app.services.resume_content import canonical_content
 from app.config import get_settings
 from datetime import datetime
 
@@ -307,7 +308,7 @@ async def optimize_resume(
     try:
         # Optimize resume using Claude
         optimization_result = await claude_service.optimize_resume(
-            resume_content=resume.content,
+            resume_content=canonical_content(resume),
             job_description=request_data.job_description,
             optimization_level=request_data.optimization_level
         )
@@ -460,7 +461,7 @@ async def analyze_resume_ats(
     try:
         # Analyze ATS score
         result = await claude_service.analyze_ats_score(
-            resume_content=resume.content,
+            resume_content=canonical_content(resume),
             job_description=request_data.job_description
         )
 
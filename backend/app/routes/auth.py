@@ -8,6 +8,7 @@ user registration, login, and profile retrieval.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import Dict, Any
+import hashlib
 import logging
 
 from app.database import get_db
@@ -27,7 +28,7 @@ from app.schemas.user import (
 from app.utils.auth import hash_password, verify_password, create_access_token, create_password_reset_token, verify_password_reset_token
 from app.dependencies import get_current_user, get_current_active_user
 from app.config import get_settings
-from app.services.email_service import email_service
+from app.services.email_outbox_service import enqueue_email, email_outbox_service
 
 # Initialize router
 router = APIRouter()
@@ -100,20 +101,23 @@ async def signup(
     # Add to database
     try:
         db.add(new_user)
+        db.flush()  # get id for the outbox idempotency key
+
+        # Stage welcome email in the same transaction; the outbox drainer sends it
+        enqueue_email(
+            db,
+            "welcome",
+            new_user.email,
+            idempotency_key=f"welcome:{new_user.id}",
+            user_email=new_user.email,
+            user_name=new_user.name,
+        )
+
         db.commit()
         db.refresh(new_user)
+        email_outbox_service.notify()
         logger.info(f"New user registered: {new_user.email} (ID: {new_user.id})")
 
-        # Send welcome email
-        try:
-            email_service.send_welcome_email(
-                user_email=new_user.email,
-                user_name=new_user.name
-            )
-        except Exception as email_error:
-            # Don't fail signup if email fails
-            logger.error(f"Failed to send welcome email to {new_user.email}: {str(email_error)}")
-
         return new_user
 
     except Exception as e:
@@ -290,19 +294,23 @@ async def google_auth(
 
             try:
                 db.add(user)
+                db.flush()  # get id for the outbox idempotency key
+
+                # Stage welcome email in the same transaction; the outbox drainer sends it
+                enqueue_email(
+                    db,
+                    "welcome",
+                    user.email,
+                    idempotency_key=f"welcome:{user.id}",
+                    user_email=user.email,
+                    user_name=user.name,
+                )
+
                 db.commit()
                 db.refresh(user)
+                email_outbox_service.notify()
                 logger.info(f"New Google user registered: {user.email} (ID: {user.id})")
 
-                # Send welcome email
-                try:
-                    email_service.send_welcome_email(
-                        user_email=user.email,
-                        user_name=user.name
-                    )
-                except Exception as email_error:
-                    logger.error(f"Failed to send welcome email to {user.email}: {str(email_error)}")
-
             except Exception as e:
                 db.rollback()
                 logger.error(f"Error creating Google user: {str(e)}")
@@ -551,18 +559,26 @@ async def forgot_password(
         # Generate reset token
         reset_token = create_password_reset_token(user.email)
 
-        # Send reset email
-        email_service.send_password_reset_email(
+        # Queue reset email (keyed by token so a double-submit sends one email)
+        token_hash = hashlib.sha256(reset_token.encode()).hexdigest()[:32]
+        enqueue_email(
+            db,
+            "password_reset",
+            user.email,
+            idempotency_key=f"password_reset:{user.id}:{token_hash}",
             user_email=user.email,
             user_name=user.name,
-            reset_token=reset_token
+            reset_token=reset_token,
         )
+        db.commit()
+        email_outbox_service.notify()
 
-        logger.info(f"Password reset email sent to: {user.email}")
+        logger.info(f"Password reset email queued for: {user.email}")
         return {"message": "If the email exists, a password reset link has been sent"}
 
     except Exception as e:
-        logger.error(f"Error sending password reset email: {str(e)}")
+        db.rollback()
+        logger.error(f"Error queueing password reset email: {str(e)}")
         # Still return success to not reveal if email exists
         return {"message": "If the email exists, a password reset link has been sent"}
 
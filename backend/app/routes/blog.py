@@ -8,24 +8,51 @@ Endpoints
 GET /api/blog                → paginated list (supports ?category=&page=&per_page=&featured=)
 GET /api/blog/slugs          → all published slugs (used by Next.js generateStaticParams)
 GET /api/blog/sitemap-data   → slug + dates for sitemap generation
+GET /api/blog/sitemap.xml    → sitemap index over the blog sitemap shards
+GET /api/blog/sitemap-{n}.xml → urlset for shard n (≤ 50 000 posts each)
+GET /api/blog/search         → full-text search (?q=&limit=&category=)
 GET /api/blog/{slug}         → full blog post including HTML content
+GET /api/blog/{slug}/related → precomputed related posts (?limit=)
 """
 
+import gzip
 import logging
+from collections import OrderedDict
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from app.database import get_db
 from app.models.blog import BlogPost
+from app.services.blog_cache import (
+    cached_blog_response,
+    choose_encoding,
+    etag_for,
+    etag_matches,
+    http_date,
+    not_modified_since,
+    precompress_post,
+)
+from app.services.blog_search import search_posts
+from app.services.related_posts import related_posts_index
+from app.services.sitemap_service import (
+    get_cached_shard,
+    gunzip_chunks,
+    iter_index_xml,
+    sitemap_shards,
+    stream_and_cache_shard,
+)
 from app.schemas.blog import (
     BlogPostResponse,
     BlogPostListItem,
     BlogPostListResponse,
     BlogSlugEntry,
     BlogSitemapEntry,
+    BlogSearchResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -33,9 +60,11 @@ router = APIRouter()
 
 
 # ── GET /api/blog ──────────────────────────────────────────────────────────
+# Listing endpoints are served from the versioned blog cache
+# (services/blog_cache.py); the DB is only queried after a publish.
 
 @router.get("", response_model=BlogPostListResponse)
-def list_blogs(
+async def list_blogs(
     category: Optional[str] = Query(None, description="Filter by category slug"),
     page:     int            = Query(1,    ge=1,  description="Page number"),
     per_page: int            = Query(10,   ge=1,  le=50, description="Results per page"),
@@ -46,85 +75,260 @@ def list_blogs(
     Return a paginated list of published blog posts.
     Content field is excluded to keep the payload small.
     """
-    query = db.query(BlogPost).filter(BlogPost.status == "published")
+    def build() -> dict:
+        query = db.query(BlogPost).filter(BlogPost.status == "published")
 
-    if category:
-        query = query.filter(BlogPost.category == category)
+        if category:
+            query = query.filter(BlogPost.category == category)
 
-    if featured is not None:
-        query = query.filter(BlogPost.featured == featured)
+        if featured is not None:
+            query = query.filter(BlogPost.featured == featured)
 
-    query = query.order_by(BlogPost.published_at.desc())
+        query = query.order_by(BlogPost.published_at.desc())
 
-    total      = query.count()
-    posts      = query.offset((page - 1) * per_page).limit(per_page).all()
-    total_pages = (total + per_page - 1) // per_page
+        total      = query.count()
+        posts      = query.offset((page - 1) * per_page).limit(per_page).all()
+        total_pages = (total + per_page - 1) // per_page
 
-    return BlogPostListResponse(
-        posts       = [BlogPostListItem.model_validate(p) for p in posts],
-        total       = total,
-        page        = page,
-        per_page    = per_page,
-        total_pages = total_pages,
-    )
+        return BlogPostListResponse(
+            posts       = [BlogPostListItem.model_validate(p) for p in posts],
+            total       = total,
+            page        = page,
+            per_page    = per_page,
+            total_pages = total_pages,
+        ).model_dump(mode="json")
+
+    key = f"list:{category or ''}:{featured}:{page}:{per_page}"
+    return JSONResponse(await cached_blog_response(key, build))
 
 
 # ── GET /api/blog/slugs ────────────────────────────────────────────────────
 # Must be defined BEFORE /{slug} so FastAPI doesn't treat "slugs" as a slug.
 
 @router.get("/slugs", response_model=list[BlogSlugEntry])
-def list_slugs(db: Session = Depends(get_db)):
+async def list_slugs(db: Session = Depends(get_db)):
     """
     Return all published slugs.
     Used by Next.js generateStaticParams() at build time.
     """
-    rows = (
-        db.query(BlogPost.slug)
-        .filter(BlogPost.status == "published")
-        .order_by(BlogPost.published_at.desc())
-        .all()
-    )
-    return [BlogSlugEntry(slug=row.slug) for row in rows]
+    def build() -> list[dict]:
+        rows = (
+            db.query(BlogPost.slug)
+            .filter(BlogPost.status == "published")
+            .order_by(BlogPost.published_at.desc())
+            .all()
+        )
+        return [{"slug": row.slug} for row in rows]
+
+    return JSONResponse(await cached_blog_response("slugs", build))
 
 
 # ── GET /api/blog/sitemap-data ─────────────────────────────────────────────
 
 @router.get("/sitemap-data", response_model=list[BlogSitemapEntry])
-def sitemap_data(db: Session = Depends(get_db)):
+async def sitemap_data(db: Session = Depends(get_db)):
     """
     Return slug + published_at + updated_at for every published post.
     Used by the sitemap generator service.
     """
-    rows = (
-        db.query(BlogPost.slug, BlogPost.published_at, BlogPost.updated_at)
-        .filter(BlogPost.status == "published")
-        .order_by(BlogPost.published_at.desc())
-        .all()
-    )
-    return [
-        BlogSitemapEntry(
-            slug         = row.slug,
-            published_at = row.published_at,
-            updated_at   = row.updated_at,
+    def build() -> list[dict]:
+        rows = (
+            db.query(BlogPost.slug, BlogPost.published_at, BlogPost.updated_at)
+            .filter(BlogPost.status == "published")
+            .order_by(BlogPost.published_at.desc())
+            .all()
+        )
+        return [
+            BlogSitemapEntry(
+                slug         = row.slug,
+                published_at = row.published_at,
+                updated_at   = row.updated_at,
+            ).model_dump(mode="json")
+            for row in rows
+        ]
+
+    return JSONResponse(await cached_blog_response("sitemap-data", build))
+
+
+# ── GET /api/blog/sitemap.xml ──────────────────────────────────────────────
+# Shard boundaries are cached with the listings; shard bodies are streamed
+# once per blog version and then served from the cached gzip copy
+# (services/sitemap_service.py).
+
+XML_MEDIA_TYPE = "application/xml"
+
+
+@router.get("/sitemap.xml", response_class=Response)
+async def sitemap_index(db: Session = Depends(get_db)):
+    """Sitemap index listing every blog sitemap shard."""
+    shards = await cached_blog_response("sitemap-shards", lambda: sitemap_shards(db))
+    return Response(content="".join(iter_index_xml(shards)), media_type=XML_MEDIA_TYPE)
+
+
+@router.get("/sitemap-{shard}.xml", response_class=Response)
+async def sitemap_shard(
+    shard: int,
+    accept_encoding: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """One <urlset> shard of up to 50 000 published posts."""
+    shards = await cached_blog_response("sitemap-shards", lambda: sitemap_shards(db))
+    if not 1 <= shard <= len(shards):
+        raise HTTPException(status_code=404, detail=f"Sitemap shard {shard} not found")
+
+    headers = {"Vary": "Accept-Encoding"}
+    body = await get_cached_shard(shard)
+    if body is None:
+        return StreamingResponse(
+            stream_and_cache_shard(db, shards[shard - 1]),
+            media_type=XML_MEDIA_TYPE,
+            headers=headers,
         )
-        for row in rows
-    ]
+
+    if choose_encoding(accept_encoding, {"gzip"}) == "gzip":
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=body, media_type=XML_MEDIA_TYPE, headers=headers)
+    return StreamingResponse(gunzip_chunks(body), media_type=XML_MEDIA_TYPE, headers=headers)
+
+
+# ── GET /api/blog/search ───────────────────────────────────────────────────
+
+# Free text would add a cache key per query, so only searches repeated
+# within the last SEARCH_TRACKED_QUERIES distinct ones are cached
+SEARCH_TRACKED_QUERIES = 1000
+_recent_searches: "OrderedDict[str, None]" = OrderedDict()
+
+
+def _is_repeat_search(key: str) -> bool:
+    """Record a search and say whether it was among the recent ones."""
+    seen = key in _recent_searches
+    _recent_searches[key] = None
+    _recent_searches.move_to_end(key)
+    while len(_recent_searches) > SEARCH_TRACKED_QUERIES:
+        _recent_searches.popitem(last=False)
+    return seen
+
+
+@router.get("/search", response_model=BlogSearchResponse)
+async def search_blogs(
+    q:        str            = Query(..., min_length=2, max_length=200, description="Search text"),
+    limit:    int            = Query(10, ge=1, le=50, description="Max results"),
+    category: Optional[str]  = Query(None, description="Filter by category slug"),
+    db: Session = Depends(get_db),
+):
+    """
+    Full-text search over published posts (title, excerpt, content, LSI
+    keywords), best match first, with highlighted snippets.
+    Repeated searches are cached with the blog listings until the next
+    publish.
+    """
+    normalized = " ".join(q.lower().split())
+
+    def build() -> dict:
+        hits = search_posts(db, normalized, limit=limit, category=category)
+        return BlogSearchResponse(query=normalized, results=hits).model_dump(mode="json")
+
+    key = f"search:{category or ''}:{limit}:{normalized}"
+    if not _is_repeat_search(key):
+        return JSONResponse(await run_in_threadpool(build))
+    return JSONResponse(await cached_blog_response(key, build))
+
+
+# ── GET /api/blog/{slug}/related ───────────────────────────────────────────
+
+@router.get("/{slug}/related", response_model=list[BlogPostListItem])
+async def related_blogs(
+    slug:  str,
+    limit: int = Query(6, ge=1, le=20, description="Max related posts"),
+    db: Session = Depends(get_db),
+):
+    """
+    Return the posts most related to `slug` (shared keywords, tags and
+    category), read from the precomputed blog_related_posts index.
+    """
+    def build() -> Optional[list[dict]]:
+        posts = related_posts_index.get_related(db, slug, limit)
+        if not posts and not db.query(
+            db.query(BlogPost.id)
+            .filter(BlogPost.slug == slug, BlogPost.status == "published")
+            .exists()
+        ).scalar():
+            return None
+        return [BlogPostListItem.model_validate(p).model_dump(mode="json") for p in posts]
+
+    data = await cached_blog_response(f"related:{slug}:{limit}", build)
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"Blog post '{slug}' not found")
+    return JSONResponse(data)
 
 
 # ── GET /api/blog/{slug} ───────────────────────────────────────────────────
 
 @router.get("/{slug}", response_model=BlogPostResponse)
-def get_blog(slug: str, db: Session = Depends(get_db)):
+def get_blog(
+    slug: str,
+    accept_encoding:   Optional[str] = Header(None),
+    if_none_match:     Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """
     Return a single published blog post including full HTML content.
     Next.js caches this response via ISR (revalidate: 3600).
+
+    The body is precomputed at publish time (see services/blog_cache.py):
+    conditional requests are answered with 304 from the stored hash /
+    updated_at alone, and otherwise the stored br / gzip variant matching
+    Accept-Encoding is returned without touching the HTML content column.
     """
-    post = (
-        db.query(BlogPost)
+    meta = (
+        db.query(BlogPost.id, BlogPost.content_hash, BlogPost.updated_at, BlogPost.published_at)
         .filter(BlogPost.slug == slug, BlogPost.status == "published")
         .first()
     )
-    if not post:
+    if not meta:
         raise HTTPException(status_code=404, detail=f"Blog post '{slug}' not found")
 
-    return BlogPostResponse.model_validate(post)
+    content_hash  = meta.content_hash
+    last_modified = meta.updated_at or meta.published_at
+    if content_hash is None:
+        # Published before precompression existed — backfill once
+        post = db.query(BlogPost).filter(BlogPost.id == meta.id).first()
+        precompress_post(post)
+        db.commit()
+        content_hash  = post.content_hash
+        last_modified = post.updated_at or post.published_at
+        logger.info(f"Backfilled precompressed body for blog post '{slug}'")
+
+    headers = {
+        "ETag": etag_for(content_hash),
+        "Vary": "Accept-Encoding",
+    }
+    if last_modified:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 §13.2.2)
+    if if_none_match is not None:
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    elif last_modified and not_modified_since(if_modified_since, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body_gzip, body_br = (
+        db.query(BlogPost.body_gzip, BlogPost.body_br)
+        .filter(BlogPost.id == meta.id)
+        .one()
+    )
+    available = {"gzip"} | ({"br"} if body_br else set())
+    encoding = choose_encoding(accept_encoding, available)
+
+    if encoding == "br":
+        body = body_br
+    elif encoding == "gzip":
+        body = body_gzip
+    else:
+        body = gzip.decompress(body_gzip)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=bytes(body), media_type="application/json", headers=headers)
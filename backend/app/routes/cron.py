@@ -1,28 +1,59 @@
 import logging
 import os
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Header
 from pydantic import BaseModel
 from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.config import get_settings
-from app.services.drip_service import process_drip_emails, DRIP_EMAIL_SUBJECTS, DRIP_TEMPLATE_NAMES, _build_drip_text
+from app.services.drip_service import DRIP_EMAIL_SUBJECTS, DRIP_TEMPLATE_NAMES, _build_drip_text
 from app.services.email_service import email_service
-from app.services.blog_generator import blog_generator
-from app.services.indexnow_service import indexnow_service
-from app.services.google_indexing_service import google_indexing_service
+from app.services.email_outbox_service import email_outbox_service
+from app.services.job_runner import job_runner
+import app.services.cron_jobs  # noqa: F401  (registers job handlers)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/drip-emails")
-async def run_drip_emails(
+def _queue_job(
+    db: Session,
+    background_tasks: BackgroundTasks,
+    job_type: str,
+    params: Optional[dict] = None,
+) -> dict:
+    """
+    Enqueue a background job and build the 202 response body.
+
+    If the in-process worker is disabled the job runs after the response
+    is sent, via FastAPI background tasks.
+    """
+    job, created = job_runner.enqueue(db, job_type, params=params)
+    if job_runner.worker_running:
+        job_runner.notify()
+    elif created:
+        background_tasks.add_task(job_runner.run_pending)
+
+    return {
+        "status":     job.status,
+        "job_id":     job.id,
+        "job_type":   job.job_type,
+        "created":    created,
+        "status_url": f"/api/cron/jobs/{job.id}",
+    }
+
+
+@router.post("/drip-emails", status_code=status.HTTP_202_ACCEPTED)
+def run_drip_emails(
+    background_tasks: BackgroundTasks,
     x_cron_secret: str = Header(..., alias="X-Cron-Secret"),
     db: Session = Depends(get_db),
 ):
-    """Process drip email campaign. Protected by CRON_SECRET header."""
+    """
+    Queue the drip email campaign as a background job.
+    Protected by CRON_SECRET header. Poll the returned status_url for progress.
+    """
     settings = get_settings()
     if not settings.CRON_SECRET or x_cron_secret != settings.CRON_SECRET:
         logger.warning("Drip email cron called with invalid secret")
@@ -31,9 +62,7 @@ async def run_drip_emails(
             detail="Invalid cron secret",
         )
 
-    stats = process_drip_emails(db)
-    logger.info(f"Drip email cron completed: {stats}")
-    return {"status": "ok", "stats": stats}
+    return _queue_job(db, background_tasks, "drip_emails")
 
 
 class TestDripRequest(BaseModel):
@@ -110,22 +139,46 @@ async def test_drip_email(
         )
 
 
+# ── POST /api/cron/email-outbox ───────────────────────────────────────────
+
+@router.post("/email-outbox")
+def drain_email_outbox(
+    x_cron_secret: str = Header(..., alias="X-Cron-Secret"),
+    db: Session = Depends(get_db),
+):
+    """
+    Deliver due transactional emails from the outbox.
+
+    The API process drains the outbox in the background already; this is a
+    fallback for deployments that run with EMAIL_OUTBOX_WORKER_ENABLED=false.
+    Protected by X-Cron-Secret header.
+    """
+    settings = get_settings()
+    if not settings.CRON_SECRET or x_cron_secret != settings.CRON_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid cron secret",
+        )
+
+    stats = email_outbox_service.drain(db)
+    return {"status": "ok", "stats": stats}
+
+
 # ── POST /api/cron/generate-blogs ─────────────────────────────────────────
 
-@router.post("/generate-blogs")
+@router.post("/generate-blogs", status_code=status.HTTP_202_ACCEPTED)
 def run_generate_blogs(
+    background_tasks: BackgroundTasks,
     x_cron_secret: str = Header(..., alias="X-Cron-Secret"),
     db: Session = Depends(get_db),
 ):
     """
     Daily blog automation cron.
 
-    1. Picks top-N pending keywords by buyer_intent
-    2. Generates full HTML posts via Claude API
-    3. Pings Bing via IndexNow immediately after each publish
-    4. Notifies Google Search Console Indexing API
-    5. Runs retry safety-nets for any previously failed submissions
-    6. Returns a full report
+    Queues the generate_blogs job (see cron_jobs.generate_blogs), which
+    generates posts via Claude, pings IndexNow / Google, and retries earlier
+    failed submissions. Returns the job id immediately; the full report is
+    the job result at GET /api/cron/jobs/{job_id}.
 
     Protected by X-Cron-Secret header.
     Schedule: daily at 9 AM IST  →  03:30 UTC  →  cron: 30 3 * * *
@@ -138,76 +191,50 @@ def run_generate_blogs(
             detail="Invalid cron secret",
         )
 
-    errors: list[str] = []
-
-    # ── 1. Generate blog posts ─────────────────────────────────────────────
-    try:
-        report = blog_generator.run_daily_generation(
-            db,
-            count=settings.BLOG_POSTS_PER_RUN,
-        )
-        errors.extend(report.errors or [])
-    except Exception as exc:
-        logger.error(f"Blog generation failed: {exc}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Blog generation failed: {exc}",
-        )
-
-    # ── 2. Retry-submit any previously failed IndexNow posts ──────────────
-    try:
-        indexnow_retry = indexnow_service.submit_pending_posts(db)
-        if indexnow_retry["errors"]:
-            errors.extend(indexnow_retry["errors"])
-    except Exception as exc:
-        logger.warning(f"IndexNow retry failed: {exc}")
-        errors.append(f"IndexNow retry: {exc}")
-
-    # ── 3. Retry-submit any previously failed Google posts ────────────────
-    try:
-        google_retry = google_indexing_service.submit_pending_posts(db)
-        if google_retry["errors"]:
-            errors.extend(google_retry["errors"])
-    except Exception as exc:
-        logger.warning(f"Google indexing retry failed: {exc}")
-        errors.append(f"Google indexing retry: {exc}")
-
-    logger.info(
-        f"generate-blogs cron done — "
-        f"published={report.blogs_published}, "
-        f"indexnow={report.indexnow_success}, "
-        f"google={report.google_success}, "
-        f"errors={len(errors)}"
+    return _queue_job(
+        db, background_tasks, "generate_blogs",
+        params={"count": settings.BLOG_POSTS_PER_RUN},
     )
 
-    return {
-        "status": "ok",
-        "blogs_published":   report.blogs_published,
-        "indexnow_success":  report.indexnow_success,
-        "google_success":    report.google_success,
-        "keywords_used":     report.keywords_used,
-        "total_published":   report.total_blogs_published,
-        "errors":            errors,
-    }
-
 
 # ── POST /api/cron/reindex-all ────────────────────────────────────────────
 
-@router.post("/reindex-all")
+@router.post("/reindex-all", status_code=status.HTTP_202_ACCEPTED)
 def reindex_all(
+    background_tasks: BackgroundTasks,
     x_cron_secret: str = Header(..., alias="X-Cron-Secret"),
     db: Session = Depends(get_db),
 ):
     """
-    One-time endpoint to submit ALL published blog posts + key static pages
-    to IndexNow in a single batch call.
+    Queue a job that submits ALL published blog posts + key static pages
+    to IndexNow, streamed in chunks of up to 10 000 URLs.
 
-    Use this to recover from the bug where only 1 URL was submitted per
-    cron run. Safe to call multiple times (idempotent).
+    Safe to call multiple times (idempotent).
     Protected by X-Cron-Secret header.
     """
-    from app.models.blog import BlogPost
+    settings = get_settings()
+    if not settings.CRON_SECRET or x_cron_secret != settings.CRON_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid cron secret",
+        )
+
+    return _queue_job(db, background_tasks, "reindex_all")
+
 
+# ── POST /api/cron/rebuild-related-posts ─────────────────────────────────
+
+@router.post("/rebuild-related-posts", status_code=status.HTTP_202_ACCEPTED)
+def run_rebuild_related_posts(
+    background_tasks: BackgroundTasks,
+    x_cron_secret: str = Header(..., alias="X-Cron-Secret"),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue a job that recomputes the related posts of every published post.
+    Idempotent — schedule weekly, or run once after deploying the table.
+    Protected by X-Cron-Secret header.
+    """
     settings = get_settings()
     if not settings.CRON_SECRET or x_cron_secret != settings.CRON_SECRET:
         raise HTTPException(
@@ -215,66 +242,43 @@ def reindex_all(
             detail="Invalid cron secret",
         )
 
-    site_url = indexnow_service.site_url
-
-    # ── Static public pages ────────────────────────────────────────────────
-    static_paths = [
-        "/",
-        "/blog",
-        "/pricing",
-        "/jobs",
-        "/resume",
-        "/privacy",
-        "/terms",
-        "/refund",
-    ]
-    static_urls = [f"{site_url}{p}" for p in static_paths]
-
-    # ── All published blog posts ───────────────────────────────────────────
-    posts = (
-        db.query(BlogPost)
-        .filter(BlogPost.status == "published")
-        .order_by(BlogPost.published_at.desc())
-        .all()
-    )
-    blog_urls = [f"{site_url}/blog/{p.slug}" for p in posts]
+    return _queue_job(db, background_tasks, "rebuild_related_posts")
 
-    all_urls = static_urls + blog_urls
-    logger.info(
-        f"reindex-all: submitting {len(all_urls)} URLs "
-        f"({len(static_urls)} static + {len(blog_urls)} blog posts)"
-    )
 
-    ok, msg = indexnow_service.submit_urls(all_urls)
+# ── POST /api/cron/backfill-normalized-content ───────────────────────────
 
-    from datetime import datetime
-    now = datetime.utcnow()
-    if ok:
-        for post in posts:
-            post.indexnow_submitted    = True
-            post.indexnow_submitted_at = now
-        db.commit()
+@router.post("/backfill-normalized-content", status_code=status.HTTP_202_ACCEPTED)
+def run_backfill_normalized_content(
+    background_tasks: BackgroundTasks,
+    x_cron_secret: str = Header(..., alias="X-Cron-Secret"),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue a job that stores normalized content for resumes written before
+    the current content schema version. Run once after the migration and
+    after every schema version bump.
+    Protected by X-Cron-Secret header.
+    """
+    settings = get_settings()
+    if not settings.CRON_SECRET or x_cron_secret != settings.CRON_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid cron secret",
+        )
 
-    return {
-        "status":        "ok" if ok else "error",
-        "message":       msg,
-        "total_urls":    len(all_urls),
-        "static_pages":  len(static_urls),
-        "blog_posts":    len(blog_urls),
-        "blog_slugs":    [p.slug for p in posts],
-        "static_urls":   static_urls,
-    }
+    return _queue_job(db, background_tasks, "backfill_normalized_content")
 
 
 # ── POST /api/cron/seed-keywords ──────────────────────────────────────────
 
-@router.post("/seed-keywords")
+@router.post("/seed-keywords", status_code=status.HTTP_202_ACCEPTED)
 def run_seed_keywords(
+    background_tasks: BackgroundTasks,
     x_cron_secret: str = Header(..., alias="X-Cron-Secret"),
     db: Session = Depends(get_db),
 ):
     """
-    One-time endpoint to seed the keyword bank from the built-in list.
+    Queue a job that seeds the keyword bank from the built-in list.
     Idempotent — safe to call multiple times.
     Protected by X-Cron-Secret header.
     """
@@ -285,129 +289,32 @@ def run_seed_keywords(
             detail="Invalid cron secret",
         )
 
-    from app.models.blog import BlogKeyword
-
-    KEYWORDS = [
-        ("ATS resume format for freshers", "resume-tips", 8200, "low", 9),
-        ("how to make ATS friendly resume", "resume-tips", 7400, "low", 9),
-        ("ATS resume checker free India", "resume-tips", 6100, "medium", 9),
-        ("best resume format for software engineer India", "resume-tips", 5800, "medium", 8),
-        ("resume format for TCS freshers 2025", "resume-tips", 5200, "low", 9),
-        ("Infosys resume format freshers", "resume-tips", 4900, "low", 9),
-        ("Wipro resume tips fresher", "resume-tips", 4600, "low", 8),
-        ("one page resume format India", "resume-tips", 4400, "medium", 8),
-        ("resume skills section for IT freshers", "resume-tips", 4100, "low", 8),
-        ("how to write summary in resume for freshers", "resume-tips", 3900, "low", 8),
-        ("resume action words for IT professionals", "resume-tips", 3700, "low", 7),
-        ("how to list projects in resume fresher", "resume-tips", 3500, "low", 8),
-        ("resume format for MBA freshers India", "resume-tips", 3300, "low", 8),
-        ("BCA resume format for freshers 2025", "resume-tips", 3100, "low", 8),
-        ("MCA resume format for freshers 2025", "resume-tips", 3000, "low", 8),
-        ("resume tips for 2 years experience India", "resume-tips", 2900, "low", 7),
-        ("how to write quantifiable achievements in resume", "resume-tips", 2800, "medium", 7),
-        ("engineering fresher resume format India", "resume-tips", 2700, "low", 8),
-        ("resume gaps how to explain India", "resume-tips", 2600, "low", 7),
-        ("ATS keywords for software developer resume", "resume-tips", 2500, "medium", 8),
-        ("best font for resume India", "resume-tips", 2400, "low", 6),
-        ("how to write objective in resume for fresher", "resume-tips", 2300, "low", 7),
-        ("resume format for data analyst India", "resume-tips", 2200, "medium", 8),
-        ("how to add certifications in resume India", "resume-tips", 2100, "low", 7),
-        ("resume dos and don'ts India 2025", "resume-tips", 2000, "low", 7),
-        ("TCS NQT interview questions and answers", "interview-prep", 9100, "low", 10),
-        ("Infosys interview questions for freshers 2025", "interview-prep", 8400, "low", 10),
-        ("HR interview questions and answers for freshers", "interview-prep", 7800, "medium", 9),
-        ("top interview questions for software engineer India", "interview-prep", 7100, "medium", 9),
-        ("Wipro interview process freshers", "interview-prep", 6500, "low", 9),
-        ("Cognizant interview questions freshers 2025", "interview-prep", 6100, "low", 9),
-        ("tell me about yourself answer for fresher IT", "interview-prep", 5800, "medium", 8),
-        ("technical interview questions for Java developer India", "interview-prep", 5400, "medium", 9),
-        ("group discussion topics for campus placement 2025", "interview-prep", 5100, "low", 8),
-        ("Accenture interview questions freshers", "interview-prep", 4900, "low", 9),
-        ("Capgemini interview questions 2025", "interview-prep", 4600, "low", 9),
-        ("HCL interview process freshers India", "interview-prep", 4300, "low", 8),
-        ("how to crack campus placement interview India", "interview-prep", 4100, "medium", 9),
-        ("Python interview questions for freshers India", "interview-prep", 3900, "medium", 8),
-        ("SQL interview questions for data analyst India", "interview-prep", 3700, "medium", 8),
-        ("aptitude test preparation for TCS NQT", "interview-prep", 3500, "low", 8),
-        ("body language tips for interview India", "interview-prep", 3300, "low", 7),
-        ("what to wear to interview India fresher", "interview-prep", 3100, "low", 6),
-        ("how to answer why should we hire you fresher", "interview-prep", 2900, "medium", 8),
-        ("React JS interview questions India 2025", "interview-prep", 2800, "medium", 8),
-        ("Node.js interview questions for freshers India", "interview-prep", 2600, "medium", 8),
-        ("system design interview preparation India", "interview-prep", 2500, "high", 8),
-        ("how to negotiate salary fresher India", "interview-prep", 2400, "low", 8),
-        ("common mistakes in HR interview India", "interview-prep", 2200, "low", 7),
-        ("mock interview tips India engineering college", "interview-prep", 2100, "low", 7),
-        ("how to get first job after engineering India", "career-advice", 8800, "medium", 9),
-        ("how to switch IT company India 2025", "career-advice", 7600, "medium", 9),
-        ("career options after BCA India 2025", "career-advice", 7100, "low", 8),
-        ("highest paying IT jobs India 2025", "career-advice", 6800, "medium", 8),
-        ("how to get job in Google India", "career-advice", 6400, "medium", 8),
-        ("LinkedIn profile tips for freshers India", "career-advice", 6000, "medium", 8),
-        ("how to write cold email to recruiter India", "career-advice", 5600, "low", 8),
-        ("off campus placement tips India 2025", "career-advice", 5300, "low", 9),
-        ("freelancing vs full time job India fresh graduate", "career-advice", 5000, "low", 7),
-        ("how to get internship in top MNC India", "career-advice", 4800, "medium", 9),
-        ("salary hike tips India IT professional", "career-advice", 4500, "low", 8),
-        ("best certifications for software engineer India 2025", "career-advice", 4300, "medium", 8),
-        ("work from home IT jobs for freshers India", "career-advice", 4100, "low", 8),
-        ("how to crack MAANG interview India", "career-advice", 3900, "high", 9),
-        ("career growth in TCS vs startup India", "career-advice", 3600, "low", 7),
-        ("how to build portfolio for software developer India", "career-advice", 3400, "medium", 8),
-        ("GitHub profile tips for fresher India", "career-advice", 3200, "low", 7),
-        ("career after 10 years gap India", "career-advice", 3000, "low", 8),
-        ("how to ask for promotion India IT", "career-advice", 2800, "low", 7),
-        ("networking tips for job seekers India", "career-advice", 2600, "medium", 7),
-        ("job search strategy for experienced IT professional India", "career-advice", 2500, "medium", 8),
-        ("how to ace Naukri profile India", "career-advice", 2300, "low", 7),
-        ("best job boards India IT 2025", "career-advice", 2200, "low", 7),
-        ("how to handle job rejection India", "career-advice", 2000, "low", 6),
-        ("work life balance IT industry India tips", "career-advice", 1900, "low", 6),
-        ("free ATS resume builder India", "resume-tips", 9500, "medium", 10),
-        ("online resume builder India free 2025", "resume-tips", 8900, "medium", 10),
-        ("resume builder for freshers India", "resume-tips", 8300, "medium", 10),
-        ("ATS score checker India free", "resume-tips", 7800, "medium", 10),
-        ("how to increase ATS score resume India", "resume-tips", 7200, "medium", 9),
-        ("TCS digital profile tips 2025", "interview-prep", 6700, "low", 9),
-        ("campus placement preparation guide India 2025", "interview-prep", 6300, "medium", 9),
-        ("data science career path India fresher", "career-advice", 5900, "medium", 9),
-        ("cloud computing career India 2025", "career-advice", 5500, "medium", 8),
-        ("DevOps engineer salary India 2025", "career-advice", 5100, "medium", 8),
-        ("AI ML engineer career path India", "career-advice", 4800, "medium", 8),
-        ("how to get remote job India international", "career-advice", 4500, "medium", 9),
-        ("upskilling tips for IT professionals India", "career-advice", 4200, "low", 7),
-        ("product manager career path India 2025", "career-advice", 3900, "medium", 8),
-        ("full stack developer roadmap India fresher", "career-advice", 3700, "medium", 8),
-        ("cybersecurity career India 2025", "career-advice", 3400, "medium", 8),
-        ("blockchain developer career India", "career-advice", 3100, "medium", 7),
-        ("internship to full time conversion tips India", "career-advice", 2900, "low", 8),
-        ("GATE vs job which is better India CSE", "career-advice", 2700, "low", 7),
-        ("how to become software architect India", "career-advice", 2500, "medium", 7),
-        ("resume for career change IT to management India", "resume-tips", 2300, "low", 8),
-        ("how to mention notice period in resume India", "resume-tips", 2100, "low", 7),
-        ("interview questions for team lead India", "interview-prep", 2000, "medium", 8),
-        ("appraisal tips for IT professionals India", "career-advice", 1900, "low", 7),
-        ("how to get job in product startup India 2025", "career-advice", 1800, "low", 8),
-    ]
-
-    inserted = skipped = 0
-    for keyword, category, volume, competition, intent in KEYWORDS:
-        if db.query(BlogKeyword).filter(BlogKeyword.keyword == keyword).first():
-            skipped += 1
-            continue
-        db.add(BlogKeyword(
-            keyword=keyword, category=category,
-            search_volume=volume, competition=competition,
-            buyer_intent=intent, status="pending",
-        ))
-        inserted += 1
-
-    db.commit()
-    pending = db.query(BlogKeyword).filter(BlogKeyword.status == "pending").count()
+    return _queue_job(db, background_tasks, "seed_keywords")
 
-    return {
-        "status": "ok",
-        "inserted": inserted,
-        "skipped": skipped,
-        "total_pending": pending,
-    }
+
+# ── GET /api/cron/jobs/{job_id} ───────────────────────────────────────────
+
+@router.get("/jobs/{job_id}")
+def get_job_status(
+    job_id: str,
+    x_cron_secret: str = Header(..., alias="X-Cron-Secret"),
+    db: Session = Depends(get_db),
+):
+    """
+    Status, progress and (once finished) result of a background job.
+    Protected by X-Cron-Secret header.
+    """
+    settings = get_settings()
+    if not settings.CRON_SECRET or x_cron_secret != settings.CRON_SECRET:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid cron secret",
+        )
+
+    job = job_runner.get(db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    return job.to_dict()
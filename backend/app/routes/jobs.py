@@ -9,7 +9,6 @@ Results cached in Redis for 30 minutes.
 import re
 import json
 import hashlib
-import httpx
 import logging
 from fastapi import APIRouter, Query, Depends, HTTPException, status
 from pydantic import BaseModel
@@ -22,6 +21,8 @@ from app.dependencies import get_current_user
 from app.models.user import User
 from app.models.resume import Resume
 from app.services.claude_service import claude_service
+from app.services.http_clients import http_clients
+from app.services.resume_content import canonical_content
 from datetime import datetime
 
 router = APIRouter()
@@ -78,10 +79,9 @@ async def _get_adzuna_jobs(
 
     url = f"{ADZUNA_BASE}/{country}/search/{page}"
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+    response = await http_clients.async_client("adzuna").get(url, params=params)
+    response.raise_for_status()
+    data = response.json()
 
     total = data.get("count", 0)
     total_pages = max(1, (total + per_page - 1) // per_page)
@@ -134,10 +134,9 @@ async def _get_remotive_jobs(
     if category:
         params["category"] = category
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(REMOTIVE_API, params=params)
-        response.raise_for_status()
-        data = response.json()
+    response = await http_clients.async_client("remotive").get(REMOTIVE_API, params=params)
+    response.raise_for_status()
+    data = response.json()
 
     all_jobs = data.get("jobs", [])
     total = len(all_jobs)
@@ -282,7 +281,7 @@ async def ats_match_job(
             detail="No resume found. Please create a resume first.",
         )
 
-    resume_content = resume.optimized_content or resume.content
+    resume_content = canonical_content(resume, use_optimized=True)
 
     # ----- Cache check -------------------------------------------------------
     desc_hash = hashlib.md5(
@@ -8,6 +8,7 @@ payment verification, subscription management, and webhook handling.
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Header
 from sqlalchemy.orm import Session
 from typing import Optional
+from datetime import datetime, timedelta
 import logging
 import json
 
@@ -17,7 +18,7 @@ from app.models.payment import Payment
 from app.routes.auth import get_current_user
 from app.services.razorpay_service import razorpay_service
 from app.services.dodo_service import dodo_service
-from app.services.email_service import email_service
+from app.services.email_outbox_service import enqueue_email, email_outbox_service
 from app.services.coupon_service import coupon_service
 from app.schemas.payment import (
     CreateOrderRequest,
@@ -450,7 +451,6 @@ async def handle_webhook(
             )
 
         # Parse webhook data
-        import json
         webhook_data = json.loads(payload)
         event_type = webhook_data.get('event')
 
@@ -469,8 +469,6 @@ async def handle_webhook(
             ).first()
 
             if payment and payment.status != "success":
-                from datetime import datetime, timedelta
-
                 payment.razorpay_payment_id = payment_id
                 payment.status = "success"
 
@@ -499,27 +497,30 @@ async def handle_webhook(
                         user.resume_count = 0
                         user.ats_analysis_count = 0
 
-                db.commit()
-                logger.info(f"Payment {payment.id} marked as success and subscription upgraded via webhook")
-
-                # Send payment success email
-                try:
-                    email_service.send_payment_success_email(
+                    # Queue payment success email with the subscription change
+                    enqueue_email(
+                        db,
+                        "payment_success",
+                        user.email,
+                        idempotency_key=f"payment_success:{payment_id}",
                         user_email=user.email,
                         user_name=user.name,
                         plan=payment.plan,
                         amount=payment.amount,
                         duration_months=payment.duration_months,
                         payment_id=payment_id,
-                        recurring=False
+                        recurring=False,
                     )
-                except Exception as email_error:
-                    logger.error(f"Failed to send payment success email: {str(email_error)}")
+
+                db.commit()
+                email_outbox_service.notify()
+                logger.info(f"Payment {payment.id} marked as success and subscription upgraded via webhook")
 
         elif event_type == 'payment.failed':
             # Payment failed
             payment_entity = webhook_data.get('payload', {}).get('payment', {}).get('entity', {})
             order_id = payment_entity.get('order_id')
+            payment_id = payment_entity.get('id')
 
             payment = db.query(Payment).filter(
                 Payment.razorpay_order_id == order_id
@@ -527,24 +528,27 @@ async def handle_webhook(
 
             if payment:
                 payment.status = "failed"
+
+                # Queue payment failed email with the status change
+                user = db.query(User).filter(User.id == payment.user_id).first()
+                if user:
+                    retry_date = (datetime.utcnow() + timedelta(days=1)).strftime("%B %d, %Y")
+                    enqueue_email(
+                        db,
+                        "payment_failed",
+                        user.email,
+                        idempotency_key=f"payment_failed:{payment_id or order_id}",
+                        user_email=user.email,
+                        user_name=user.name,
+                        plan=payment.plan,
+                        amount=payment.amount,
+                        retry_date=retry_date,
+                    )
+
                 db.commit()
+                email_outbox_service.notify()
                 logger.info(f"Payment {payment.id} marked as failed via webhook")
 
-                # Send payment failed email
-                try:
-                    user = db.query(User).filter(User.id == payment.user_id).first()
-                    if user:
-                        retry_date = (datetime.utcnow() + timedelta(days=1)).strftime("%B %d, %Y")
-                        email_service.send_payment_failed_email(
-                            user_email=user.email,
-                            user_name=user.name,
-                            plan=payment.plan,
-                            amount=payment.amount,
-                            retry_date=retry_date
-                        )
-                except Exception as email_error:
-                    logger.error(f"Failed to send payment failed email: {str(email_error)}")
-
         # Subscription webhook events (for recurring payments)
         elif event_type == 'subscription.activated':
             # Subscription activated after first payment
@@ -565,20 +569,22 @@ async def handle_webhook(
                     user.subscription_expiry = datetime.utcnow() + timedelta(days=30)
                     user.resume_count = 0
                     user.ats_analysis_count = 0
-                db.commit()
-                logger.info(f"Subscription {subscription_id} activated for user {payment.user_id}")
 
-                # Send subscription activated email
-                try:
+                    # Queue subscription activated email with the activation
                     next_billing = (datetime.utcnow() + timedelta(days=30)).strftime("%B %d, %Y")
-                    email_service.send_subscription_activated_email(
+                    enqueue_email(
+                        db,
+                        "subscription_activated",
+                        user.email,
+                        idempotency_key=f"subscription_activated:{subscription_id}",
                         user_email=user.email,
                         user_name=user.name,
                         plan=payment.plan,
-                        next_billing_date=next_billing
+                        next_billing_date=next_billing,
                     )
-                except Exception as email_error:
-                    logger.error(f"Failed to send subscription activated email: {str(email_error)}")
+                db.commit()
+                email_outbox_service.notify()
+                logger.info(f"Subscription {subscription_id} activated for user {payment.user_id}")
 
         elif event_type == 'subscription.charged':
             # Monthly payment successful - extend subscription
@@ -614,21 +620,23 @@ async def handle_webhook(
                 if user:
                     user.subscription_type = "FREE"
                     user.subscription_expiry = None
+
+                    # Queue payment failed email (subscription halted) with the downgrade
+                    enqueue_email(
+                        db,
+                        "payment_failed",
+                        user.email,
+                        idempotency_key=f"subscription_halted:{subscription_id}",
+                        user_email=user.email,
+                        user_name=user.name,
+                        plan=payment.plan,
+                        amount=payment.amount,
+                        retry_date=None,
+                    )
                     db.commit()
+                    email_outbox_service.notify()
                     logger.warning(f"Subscription {subscription_id} halted for user {payment.user_id}")
 
-                    # Send payment failed email (subscription halted)
-                    try:
-                        email_service.send_payment_failed_email(
-                            user_email=user.email,
-                            user_name=user.name,
-                            plan=payment.plan,
-                            amount=payment.amount,
-                            retry_date=None
-                        )
-                    except Exception as email_error:
-                        logger.error(f"Failed to send subscription halted email: {str(email_error)}")
-
         elif event_type == 'subscription.completed':
             # All payments completed - subscription ended
             subscription_entity = webhook_data.get('payload', {}).get('subscription', {}).get('entity', {})
@@ -658,19 +666,22 @@ async def handle_webhook(
                 # User keeps access until current period ends
                 logger.info(f"Subscription {subscription_id} cancelled for user {payment.user_id}")
 
-                # Send subscription cancelled email
-                try:
-                    user = db.query(User).filter(User.id == payment.user_id).first()
-                    if user and user.subscription_expiry:
-                        expiry_date = user.subscription_expiry.strftime("%B %d, %Y")
-                        email_service.send_subscription_cancelled_email(
-                            user_email=user.email,
-                            user_name=user.name,
-                            plan=payment.plan,
-                            expiry_date=expiry_date
-                        )
-                except Exception as email_error:
-                    logger.error(f"Failed to send subscription cancelled email: {str(email_error)}")
+                # Queue subscription cancelled email
+                user = db.query(User).filter(User.id == payment.user_id).first()
+                if user and user.subscription_expiry:
+                    expiry_date = user.subscription_expiry.strftime("%B %d, %Y")
+                    enqueue_email(
+                        db,
+                        "subscription_cancelled",
+                        user.email,
+                        idempotency_key=f"subscription_cancelled:{subscription_id}",
+                        user_email=user.email,
+                        user_name=user.name,
+                        plan=payment.plan,
+                        expiry_date=expiry_date,
+                    )
+                    db.commit()
+                    email_outbox_service.notify()
 
         return {"status": "success", "message": "Webhook processed"}
 
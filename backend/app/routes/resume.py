@@ -5,16 +5,18 @@ This module handles all resume-related API endpoints including
 creation, reading, updating, deleting, and downloading resumes.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, status, Query
+from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 import logging
 import math
 
 from app.database import get_db
-from app.models.user import User
+from app.models.user import SubscriptionType, User
 from app.models.resume import Resume
 from app.schemas.resume import (
     ResumeCreate,
@@ -26,11 +28,20 @@ from app.schemas.resume import (
     PDFDownloadRequest,
 )
 from app.schemas.ai import ATSAnalysisResponse
-from app.dependencies import get_current_user
+from app.dependencies import get_current_active_user, get_current_user
 from app.config import get_settings
-from app.services.pdf_service import pdf_service
+from app.services.blog_cache import etag_for, etag_matches
+from app.services.job_runner import job_runner
+from app.services.pdf_cache import pdf_cache, pdf_cache_key
+from app.services.pdf_render_pool import PDFPoolSaturated, pdf_render_pool
+from app.services.pdf_service import PDFService
+from app.services.resume_content import canonical_content
+from app.services.resume_export import stream_resume_export
+from app.services.resume_import import enqueue_upload, get_upload_job, upload_events, upload_status
+from app.services.resume_parse_cache import cached_parse
 from app.services.resume_parser_service import resume_parser_service
 from app.services.claude_service import claude_service
+from app.utils.uploads import UPLOAD_OPENAPI, SpooledUpload, resume_upload
 
 # Initialize router and logger
 router = APIRouter()
@@ -38,114 +49,6 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-def normalize_resume_content(content: dict) -> dict:
-    """
-    Normalize resume content structure for PDF generation.
-    Converts snake_case keys to camelCase if needed.
-    """
-    import json
-
-    # If already in camelCase format, return as is
-    if "personalInfo" in content:
-        return content
-
-    # Convert from snake_case to camelCase
-    normalized = {}
-
-    # Handle personal_info -> personalInfo
-    if "personal_info" in content:
-        personal = content["personal_info"]
-
-        # Parse if it's a JSON string
-        if isinstance(personal, str):
-            try:
-                personal = json.loads(personal)
-            except:
-                personal = {}
-
-        if isinstance(personal, dict):
-            normalized["personalInfo"] = {
-                "name": personal.get("full_name") or personal.get("name", ""),
-                "email": personal.get("email", ""),
-                "phone": personal.get("phone", ""),
-                "location": personal.get("location", ""),
-                "linkedin": personal.get("linkedin", ""),
-                "github": personal.get("github") or personal.get("website", "")
-            }
-        else:
-            normalized["personalInfo"] = {
-                "name": "",
-                "email": "",
-                "phone": "",
-                "location": "",
-                "linkedin": "",
-                "github": ""
-            }
-    elif "personalInfo" in content:
-        normalized["personalInfo"] = content["personalInfo"]
-    else:
-        # Default empty personal info
-        normalized["personalInfo"] = {
-            "name": "",
-            "email": "",
-            "phone": "",
-            "location": "",
-            "linkedin": "",
-            "github": ""
-        }
-
-    # Copy other fields with defaults
-    normalized["summary"] = content.get("summary", "")
-
-    # Normalize experience - convert start_date/end_date to duration
-    experience = content.get("experience", [])
-    normalized_experience = []
-    for exp in experience:
-        if isinstance(exp, dict):
-            normalized_exp = {
-                "company": exp.get("company", ""),
-                "position": exp.get("position", ""),
-                "location": exp.get("location", ""),
-                "description": exp.get("description", "")
-            }
-            # Convert dates to duration string
-            if "start_date" in exp or "end_date" in exp:
-                start = exp.get("start_date", "")
-                end = exp.get("end_date", "")
-                normalized_exp["duration"] = f"{start} - {end}" if start and end else exp.get("duration", "")
-            else:
-                normalized_exp["duration"] = exp.get("duration", "")
-            normalized_experience.append(normalized_exp)
-    normalized["experience"] = normalized_experience
-
-    # Normalize education - convert start_date/end_date to duration
-    education = content.get("education", [])
-    normalized_education = []
-    for edu in education:
-        if isinstance(edu, dict):
-            normalized_edu = {
-                "institution": edu.get("institution", ""),
-                "degree": edu.get("degree", ""),
-                "gpa": edu.get("gpa", "")
-            }
-            # Convert dates to duration string
-            if "start_date" in edu or "end_date" in edu:
-                start = edu.get("start_date", "")
-                end = edu.get("end_date", "")
-                normalized_edu["duration"] = f"{start} - {end}" if start and end else edu.get("duration", "")
-            else:
-                normalized_edu["duration"] = edu.get("duration", "")
-            normalized_education.append(normalized_edu)
-    normalized["education"] = normalized_education
-
-    normalized["skills"] = content.get("skills", [])
-    normalized["projects"] = content.get("projects", [])
-    normalized["certifications"] = content.get("certifications", [])
-    normalized["languages"] = content.get("languages", [])
-
-    return normalized
-
-
 @router.get("", response_model=ResumeListResponse)
 async def list_resumes(
     page: int = Query(1, ge=1, description="Page number"),
@@ -278,6 +181,90 @@ async def create_resume(
         )
 
 
+def require_pro_plan(current_user: User = Depends(get_current_active_user)) -> User:
+    """Allow only Pro subscribers whose subscription hasn't expired."""
+    if current_user.subscription_type != SubscriptionType.PRO:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Bulk export is available on the Pro plan. Upgrade your subscription."
+        )
+    return current_user
+
+
+@router.get("/export")
+async def export_resumes(
+    templates: Optional[List[str]] = Query(
+        None, description="Templates to render each resume in (default: the resume's own template)"
+    ),
+    resume_ids: Optional[List[int]] = Query(None, description="Export only these resumes"),
+    use_optimized: bool = Query(False, description="Use optimized content where available"),
+    current_user: User = Depends(require_pro_plan),
+    db: Session = Depends(get_db)
+):
+    """
+    Export resumes as a ZIP of PDFs.
+
+    The archive is streamed while it is built: PDFs render in parallel on
+    the PDF worker pool and each one is sent as soon as it is ready.
+    Disconnecting cancels the renders still queued.
+
+    Args:
+        templates: Templates to render each resume in (repeatable)
+        resume_ids: Optional subset of resume IDs (repeatable)
+        use_optimized: Whether to use optimized content
+        current_user: Authenticated Pro user
+        db: Database session
+
+    Returns:
+        StreamingResponse: application/zip
+
+    Raises:
+        HTTPException 400: If a template name is invalid
+        HTTPException 403: If the user is not on the Pro plan
+        HTTPException 404: If there are no resumes to export
+
+    Example:
+        GET /api/resume/export?templates=modern&templates=classic
+    """
+    invalid = [name for name in templates or [] if name not in PDFService.TEMPLATES]
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid template: {', '.join(invalid)}. Available: {', '.join(PDFService.TEMPLATES.keys())}"
+        )
+
+    query = db.query(func.count(Resume.id)).filter(Resume.user_id == current_user.id)
+    if resume_ids:
+        query = query.filter(Resume.id.in_(resume_ids))
+    total = query.scalar()
+    if not total:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No resumes to export"
+        )
+
+    logger.info(
+        f"User {current_user.id} exporting {total} resume(s): "
+        f"templates={templates or 'own'}, optimized={use_optimized}"
+    )
+
+    filename = f"resumes_{datetime.utcnow():%Y%m%d}.zip"
+    return StreamingResponse(
+        stream_resume_export(
+            db.get_bind(),
+            current_user.id,
+            templates=list(dict.fromkeys(templates)) if templates else None,
+            resume_ids=resume_ids,
+            use_optimized=use_optimized,
+        ),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Cache-Control": "private, no-store",
+        },
+    )
+
+
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
     resume_id: int,
@@ -514,12 +501,17 @@ async def download_resume_pdf(
     resume_id: int,
     use_optimized: bool = Query(False, description="Use optimized content"),
     template_override: str = Query(None, description="Override template (modern/classic/minimal/professional)"),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Download resume as PDF.
 
+    PDFs are cached by a hash of (normalized content, template, renderer
+    version), which is also the ETag: an unchanged resume is answered
+    with 304 or from the cache without re-rendering.
+
     Args:
         resume_id: Resume ID to download
         use_optimized: Whether to use optimized content (default: False)
@@ -528,7 +520,7 @@ async def download_resume_pdf(
         db: Database session
 
     Returns:
-        StreamingResponse: PDF file
+        Response: PDF file
 
     Raises:
         HTTPException 404: If resume not found
@@ -562,79 +554,73 @@ async def download_resume_pdf(
     # Determine which content to use
     # If optimized content requested and available, use it; otherwise use original
     if use_optimized and resume.has_optimization():
-        content = resume.optimized_content
         logger.info(f"Using optimized content for resume {resume_id}")
-    else:
-        content = resume.content
-        if use_optimized and not resume.has_optimization():
-            logger.info(f"Optimized content requested but not available for resume {resume_id}, using original")
-
-    # Ensure content is a dictionary (parse if it's a JSON string)
-    import json
-    if isinstance(content, str):
-        try:
-            content = json.loads(content)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse content as JSON: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Invalid resume content format"
-            )
+    elif use_optimized:
+        logger.info(f"Optimized content requested but not available for resume {resume_id}, using original")
 
-    # Debug logging
-    logger.info(f"Content type: {type(content)}")
-    if isinstance(content, dict):
-        logger.info(f"Content has {len(content)} top-level keys")
-        logger.info(f"personalInfo present: {'personalInfo' in content}")
-        logger.info(f"personal_info present: {'personal_info' in content}")
-
-    # Normalize content structure for PDF generation
+    # Normalized at write time (see resume_content)
     try:
-        content = normalize_resume_content(content)
-        logger.info("Content normalized for PDF generation")
+        content = canonical_content(resume, use_optimized=use_optimized)
     except Exception as e:
-        logger.error(f"Normalization failed: {str(e)}")
+        logger.error(f"Invalid content for resume {resume_id}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to prepare content: {str(e)}"
+            detail="Invalid resume content format"
         )
 
     # Determine template to use
     template_name = template_override if template_override else resume.template_name
 
     # Validate template using PDFService templates
-    from app.services.pdf_service import PDFService
     if template_name not in PDFService.TEMPLATES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid template: {template_name}. Available: {', '.join(PDFService.TEMPLATES.keys())}"
         )
 
-    try:
-        # Generate PDF
-        pdf_buffer = pdf_service.generate_resume_pdf(
-            resume_content=content,
-            template_name=template_name
-        )
+    # Create filename
+    safe_title = resume.title.replace(' ', '_').replace('/', '_')
+    filename = f"{safe_title}_{template_name}.pdf"
 
-        # Create filename
-        safe_title = resume.title.replace(' ', '_').replace('/', '_')
-        filename = f"{safe_title}_{template_name}.pdf"
+    cache_key = pdf_cache_key(content, template_name)
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "ETag": etag_for(cache_key),
+        "Cache-Control": "private, no-cache",
+    }
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-        logger.info(
-            f"PDF generated for resume {resume_id} by user {current_user.id}: "
-            f"template={template_name}, optimized={use_optimized}"
-        )
+    try:
+        pdf_bytes = None
+        if settings.PDF_CACHE_ENABLED:
+            pdf_bytes = await run_in_threadpool(pdf_cache.get, cache_key)
+
+        if pdf_bytes is None:
+            # Render on the PDF process pool (keeps the event loop free)
+            pdf_bytes = await pdf_render_pool.render(content, template_name)
+            if settings.PDF_CACHE_ENABLED:
+                await run_in_threadpool(pdf_cache.put, cache_key, pdf_bytes)
+            logger.info(
+                f"PDF generated for resume {resume_id} by user {current_user.id}: "
+                f"template={template_name}, optimized={use_optimized}"
+            )
+        else:
+            logger.info(f"PDF cache hit for resume {resume_id}: template={template_name}")
 
-        # Return PDF as streaming response
-        return StreamingResponse(
-            pdf_buffer,
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
+            headers=headers,
         )
 
+    except PDFPoolSaturated as e:
+        logger.warning(f"PDF render queue full for resume {resume_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF service is busy. Please try again shortly.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except ValueError as e:
         logger.error(f"PDF generation validation error: {str(e)}")
         raise HTTPException(
@@ -649,130 +635,142 @@ async def download_resume_pdf(
         )
 
 
-@router.post("/upload", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
+def require_resume_slot(current_user: User = Depends(get_current_user)) -> User:
+    """Allow only users below their resume limit (checked before the upload is read)."""
+    user_region = current_user.get_region() if hasattr(current_user, 'get_region') else "IN"
+    resume_limit = settings.get_resume_limit(current_user.subscription_type, user_region)
+
+    if current_user.resume_count >= resume_limit:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Resume limit reached. Your {current_user.subscription_type} plan allows {resume_limit} resume(s) per month."
+        )
+    return current_user
+
+
+@router.post("/upload", status_code=status.HTTP_202_ACCEPTED, openapi_extra=UPLOAD_OPENAPI)
 async def upload_resume(
-    file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(require_resume_slot),
+    upload: SpooledUpload = Depends(resume_upload),
     db: Session = Depends(get_db)
 ):
     """
-    Upload and parse an existing resume (PDF or DOCX).
+    Upload an existing resume (PDF or DOCX) to be parsed in the background.
 
-    This endpoint allows users to upload their existing resume and automatically
-    extract structured information using AI. The parsed data is used to create
-    a new resume in the system.
+    The file is validated and stored, and a job extracts its text, parses
+    it with AI and creates a new resume from the result. Follow the job
+    with GET /api/resume/upload/{job_id} or its Server-Sent Events stream;
+    the finished job carries the new resume's id.
 
     Supported formats:
     - PDF (.pdf)
-    - Microsoft Word (.docx, .doc)
+    - Microsoft Word (.docx); legacy .doc files are rejected
 
     Args:
-        file: Uploaded resume file
-        current_user: Authenticated user
+        background_tasks: Runs the job if the in-process worker is off
+        current_user: Authenticated user with resumes left this month
+        upload: Uploaded resume file (multipart field "file"), size- and
+            type-checked while it streams in
         db: Database session
 
     Returns:
-        ResumeResponse: Created resume with parsed data
+        dict: Job id, stage and the URLs to follow it
 
     Raises:
-        HTTPException 400: If file format is invalid or parsing fails
+        HTTPException 400: If file format is invalid (including legacy .doc)
         HTTPException 429: If user exceeds resume creation limit
         HTTPException 500: If server error occurs
 
     Example:
-        POST /api/resumes/upload
+        POST /api/resume/upload
         Content-Type: multipart/form-data
         File: resume.pdf
     """
     try:
-        # Check user's resume limit (region-specific)
-        user_region = current_user.get_region() if hasattr(current_user, 'get_region') else "IN"
-        resume_limit = settings.get_resume_limit(current_user.subscription_type, user_region)
-
-        if current_user.resume_count >= resume_limit:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Resume limit reached. Your {current_user.subscription_type} plan allows {resume_limit} resume(s) per month."
-            )
-
-        # Validate file size (max 10MB)
-        MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-        file_content = await file.read()
-
-        if len(file_content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File size exceeds 10MB limit"
-            )
-
-        # Validate file type
-        allowed_extensions = ["pdf", "docx", "doc"]
-        file_extension = file.filename.lower().split(".")[-1]
-
-        if file_extension not in allowed_extensions:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid file format. Supported formats: {', '.join(allowed_extensions)}"
-            )
-
-        logger.info(f"Parsing uploaded resume: {file.filename} for user {current_user.id}")
-
-        # Parse the resume file
-        parsed_data = resume_parser_service.parse_resume_file(
-            file_content=file_content,
-            filename=file.filename
+        job = enqueue_upload(
+            db, current_user, upload.read(), upload.filename, upload.sha256, upload.file_type
         )
+        if job_runner.worker_running:
+            job_runner.notify()
+        else:
+            background_tasks.add_task(job_runner.run_pending)
 
-        # Convert to our resume format
-        resume_content = resume_parser_service.convert_to_resume_format(parsed_data)
+        logger.info(f"Queued resume upload {upload.filename} ({upload.size} bytes) for user {current_user.id} as job {job.id}")
 
-        # Generate title from filename (remove extension)
-        resume_title = file.filename.rsplit(".", 1)[0]
-        resume_title = f"Imported: {resume_title}"
+        return {
+            **upload_status(job),
+            "status_url": f"/api/resume/upload/{job.id}",
+            "events_url": f"/api/resume/upload/{job.id}/events",
+        }
 
-        # Create resume in database
-        new_resume = Resume(
-            user_id=current_user.id,
-            title=resume_title,
-            content=resume_content,
-            template_name="modern"  # Default template
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Resume upload failed for user {current_user.id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to upload resume. Please try again."
         )
 
-        db.add(new_resume)
 
-        # Increment user's resume count
-        current_user.resume_count += 1
+@router.get("/upload/{job_id}")
+async def get_upload_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Stage and progress of a resume upload.
 
-        db.commit()
-        db.refresh(new_resume)
+    Stages: queued, extracting, parsing, saving, saved, failed. Once
+    saved, resume_id is the new resume; once failed, error says why.
 
-        logger.info(f"Resume imported successfully for user {current_user.id}: {new_resume.id}")
+    Raises:
+        HTTPException 404: If the job doesn't exist or isn't the user's
+    """
+    job = get_upload_job(db, job_id, current_user.id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    return upload_status(job)
 
-        return new_resume
 
-    except HTTPException:
-        raise
+@router.get("/upload/{job_id}/events")
+async def stream_upload_events(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Server-Sent Events stream of a resume upload's progress.
 
-    except ValueError as e:
-        logger.error(f"Resume parsing validation error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    Sends a `progress` event (same body as GET /upload/{job_id}) on every
+    change and ends with a `done` or `failed` event.
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Resume upload failed for user {current_user.id}: {str(e)}")
+    Raises:
+        HTTPException 404: If the job doesn't exist or isn't the user's
+    """
+    if get_upload_job(db, job_id, current_user.id) is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to parse resume. Please ensure the file is valid and try again."
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
         )
+    return StreamingResponse(
+        upload_events(db.get_bind(), job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
-@router.post("/parse")
+@router.post("/parse", openapi_extra=UPLOAD_OPENAPI)
 async def parse_resume_file(
-    file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    upload: SpooledUpload = Depends(resume_upload)
 ):
     """
     Parse a resume file and return structured content without saving to database.
@@ -782,11 +780,11 @@ async def parse_resume_file(
 
     Supported formats:
     - PDF (.pdf)
-    - Microsoft Word (.docx, .doc)
+    - Microsoft Word (.docx); legacy .doc files are rejected
 
     Args:
-        file: Uploaded resume/profile file
         current_user: Authenticated user
+        upload: Uploaded resume/profile file (multipart field "file")
 
     Returns:
         dict: Parsed resume content in structured format
@@ -801,38 +799,26 @@ async def parse_resume_file(
         File: linkedin_profile.pdf
     """
     try:
-        # Validate file size (max 10MB)
-        MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-        file_content = await file.read()
-
-        if len(file_content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File size exceeds 10MB limit"
-            )
-
-        if not file_content:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Uploaded file is empty"
-            )
-
-        logger.info(f"Parsing file: {file.filename} for user {current_user.id}")
+        logger.info(f"Parsing file: {upload.filename} for user {current_user.id}")
 
-        # Parse the resume file
-        parsed_data = resume_parser_service.parse_resume_file(
-            file_content=file_content,
-            filename=file.filename
+        # Parse the resume file (the extractors read the spooled file directly)
+        parsed_data = await cached_parse(
+            current_user.id,
+            upload.sha256,
+            upload.file_type,
+            lambda: resume_parser_service.parse_resume_file(
+                file_content=upload.file, filename=upload.filename, file_type=upload.file_type
+            ),
         )
 
         # Convert to our resume format
         resume_content = resume_parser_service.convert_to_resume_format(parsed_data)
 
-        logger.info(f"Successfully parsed {file.filename} for user {current_user.id}")
+        logger.info(f"Successfully parsed {upload.filename} for user {current_user.id}")
 
         return {
             "content": resume_content,
-            "filename": file.filename,
+            "filename": upload.filename,
             "message": "File parsed successfully"
         }
 
@@ -903,7 +889,7 @@ async def analyze_resume_ats(
 
         # Perform ATS analysis
         result = await claude_service.analyze_ats_score(
-            resume_content=resume.content,
+            resume_content=canonical_content(resume),
             job_description=resume.job_description
         )
 
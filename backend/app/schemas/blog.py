@@ -55,6 +55,23 @@ class BlogPostListResponse(BaseModel):
     total_pages: int
 
 
+class BlogSearchResult(BaseModel):
+    """One hit from /api/blog/search; matched terms in `snippet` are wrapped in <mark>."""
+    slug:         str
+    title:        str
+    excerpt:      Optional[str] = None
+    category:     str
+    published_at: Optional[datetime] = None
+    rank:         float
+    snippet:      Optional[str] = None
+
+
+class BlogSearchResponse(BaseModel):
+    """Top-k search results for /api/blog/search."""
+    query:   str
+    results: List[BlogSearchResult]
+
+
 class BlogSlugEntry(BaseModel):
     """Used by generateStaticParams in Next.js."""
     slug: str
@@ -101,6 +118,7 @@ class BlogDailyReportResponse(BaseModel):
     keywords_used:         List[str]
     total_blogs_published: int
     errors:                List[str]
+    post_timings:          List[dict] = []
 
     class Config:
         from_attributes = True
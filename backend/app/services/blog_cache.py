@@ -0,0 +1,269 @@
+"""
+Blog response caching.
+
+Precomputed post bodies
+  GET /api/blog/{slug} is hit on every Next.js ISR revalidation and by
+  crawlers. Instead of re-serializing the full HTML post and compressing it
+  per request, the JSON response body is rendered once at publish time and
+  stored on the row as gzip + brotli variants together with its SHA-256:
+
+    * the hash doubles as a strong ETag → If-None-Match answers 304
+    * updated_at is the Last-Modified → If-Modified-Since answers 304
+    * the variant matching Accept-Encoding is returned as-is
+
+  Call `precompress_post()` whenever a post's public fields change.
+
+Versioned listing cache
+  /api/blog, /api/blog/slugs, /api/blog/sitemap-data, search and related
+  posts responses are cached in Redis under keys that embed a global blog
+  version counter. Any commit that inserts / deletes a BlogPost, changes a
+  listed field (status, title, featured, ...) or rewrites related-posts
+  rows bumps the version via a session event, so
+  between publishes every read is a cache hit and right after one nothing
+  stale can be served — old keys are simply never read again.
+
+  Only a connected Redis is used: the version counter must be shared by
+  every worker, and a per-process fallback would keep serving listings
+  another worker has already invalidated. Without Redis, responses are
+  built on every request.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import logging
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.blog import BlogPost, BlogRelatedPost
+from app.schemas.blog import BlogPostResponse
+from app.services.redis_service import get_redis_service
+
+try:
+    import brotli
+except ImportError:  # optional — gzip-only without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+BLOG_VERSION_KEY = "blog:version"
+
+# BlogPost columns that never appear in listings / sitemap data; changing
+# only these doesn't invalidate the listing cache
+_UNLISTED_COLUMNS = frozenset({
+    "content", "content_hash", "body_gzip", "body_br",
+    "indexnow_submitted", "indexnow_submitted_at",
+    "google_submitted", "google_submitted_at",
+})
+
+GZIP_LEVEL     = 9
+BROTLI_QUALITY = 11
+
+
+def render_post_body(post: BlogPost) -> bytes:
+    """Serialize a post exactly as GET /api/blog/{slug} returns it."""
+    return BlogPostResponse.model_validate(post).model_dump_json().encode("utf-8")
+
+
+def precompress_post(post: BlogPost) -> None:
+    """
+    Render the post's response body and store its hash and compressed
+    variants on the row. Needs `post.id` / `created_at`, so call after flush.
+    """
+    body = render_post_body(post)
+    post.content_hash = hashlib.sha256(body).hexdigest()
+    post.body_gzip    = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    post.body_br      = brotli.compress(body, quality=BROTLI_QUALITY) if brotli else None
+    logger.debug(
+        f"Precompressed post {post.slug}: {len(body)}B → "
+        f"gzip {len(post.body_gzip)}B"
+        + (f", br {len(post.body_br)}B" if post.body_br else "")
+    )
+
+
+# ── HTTP helpers ───────────────────────────────────────────────────────────
+
+def choose_encoding(accept_encoding: Optional[str], available: set[str]) -> str:
+    """
+    Pick the best of `available` ("br", "gzip") allowed by an Accept-Encoding
+    header. Returns "identity" if none is acceptable.
+    """
+    if not accept_encoding:
+        return "identity"
+
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            qualities[name] = q
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_q = "identity", 0.0
+    for encoding in ("br", "gzip"):  # preference order on ties
+        q = qualities.get(encoding, wildcard)
+        if encoding in available and q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def etag_for(content_hash: str) -> str:
+    return f'"{content_hash}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive-UTC datetime as an HTTP date."""
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: datetime) -> bool:
+    """True if the resource hasn't changed since the client's copy."""
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+
+# ── Versioned listing cache ────────────────────────────────────────────────
+
+def _blog_listing_changed(session: Session) -> bool:
+    """Does this session carry a change that affects blog listings?"""
+    for obj in session.new:
+        if isinstance(obj, (BlogPost, BlogRelatedPost)):
+            return True
+    for obj in session.deleted:
+        if isinstance(obj, (BlogPost, BlogRelatedPost)):
+            return True
+    for obj in session.dirty:
+        if isinstance(obj, BlogRelatedPost):
+            return True
+        if not isinstance(obj, BlogPost):
+            continue
+        state = inspect(obj)
+        for attr in state.mapper.column_attrs:
+            if attr.key in _UNLISTED_COLUMNS:
+                continue
+            if state.attrs[attr.key].history.has_changes():
+                return True
+    return False
+
+
+@event.listens_for(Session, "before_flush")
+def _mark_blog_changes(session: Session, flush_context, instances) -> None:
+    if _blog_listing_changed(session):
+        session.info["blog_listing_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session: Session) -> None:
+    # Only once the outermost transaction commits (SAVEPOINT releases fire
+    # this too). The flag is deliberately kept across rollbacks: a spurious
+    # bump costs one cache miss, a missed one would serve stale listings.
+    if session.in_nested_transaction():
+        return
+    if session.info.pop("blog_listing_changed", False):
+        bump_blog_version()
+
+
+def bump_blog_version() -> None:
+    """
+    Invalidate every cached blog listing by incrementing the version.
+
+    Called automatically after commits that change posts (e.g. from
+    run_daily_generation). Safe from sync code and worker threads: the
+    increment is handed to the event loop that owns the Redis client.
+    """
+    try:
+        redis = get_redis_service()
+    except RuntimeError:
+        return  # Redis never initialized (scripts, tests) — nothing cached
+    loop = redis.loop
+    if loop is None or loop.is_closed():
+        return
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is loop:
+        loop.create_task(_bump(redis))
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_bump(redis), loop).result(timeout=5)
+    except Exception as exc:
+        logger.error(f"Blog cache version bump failed: {exc}")
+
+
+async def _bump(redis) -> None:
+    version = await redis.incr(BLOG_VERSION_KEY)
+    logger.info(f"Blog cache version bumped to {version}")
+    # Previous version's entries can never be read again
+    await redis.delete_pattern(f"cache:blog:v{version - 1}:*")
+
+
+async def blog_cache_key(key: str) -> Optional[str]:
+    """Redis key for `key` at the current blog version (None if not cacheable now)."""
+    try:
+        redis = get_redis_service()
+    except RuntimeError:
+        return None  # Redis never initialized (scripts, tests)
+    if not settings.CACHE_ENABLED or not redis.is_connected:
+        return None
+    version = await redis.get(BLOG_VERSION_KEY) or 0
+    return f"cache:blog:v{version}:{key}"
+
+
+async def cached_blog_response(key: str, build: Callable[[], Any]) -> Any:
+    """
+    Return the cached JSON-ready value for `key` at the current blog
+    version, or run `build()` in the threadpool and cache its result.
+    """
+    cache_key = await blog_cache_key(key)
+    if cache_key is None:
+        return await run_in_threadpool(build)
+
+    redis = get_redis_service()
+    cached = await redis.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Cache hit: {cache_key}")
+        return cached
+
+    value = await run_in_threadpool(build)
+    await redis.set(cache_key, value, settings.CACHE_BLOG_TTL)
+    return value
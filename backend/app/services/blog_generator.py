@@ -10,8 +10,9 @@ import json
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 from anthropic import Anthropic, APIError, APITimeoutError, RateLimitError
 from sqlalchemy.orm import Session
@@ -24,6 +25,8 @@ from tenacity import (
 
 from app.config import get_settings
 from app.models.blog import BlogDailyReport, BlogKeyword, BlogPost
+from app.services.blog_cache import precompress_post
+from app.services.related_posts import related_posts_index
 from app.services.indexnow_service import indexnow_service
 from app.services.google_indexing_service import google_indexing_service
 
@@ -253,6 +256,15 @@ class BlogGeneratorService:
 
     # ── Generate one post ──────────────────────────────────────────────────
 
+    @staticmethod
+    def _category_for(kw: BlogKeyword) -> str:
+        """Blog category for a keyword row."""
+        return (
+            kw.category
+            if kw.category in VALID_CATEGORIES
+            else _infer_category(kw.keyword, kw.category)
+        )
+
     def generate_post(self, kw: BlogKeyword, db: Session) -> BlogPost:
         """
         Generate a single blog post from a BlogKeyword row.
@@ -260,15 +272,24 @@ class BlogGeneratorService:
         Raises ValueError if the slug already exists.
         Raises on Claude/network errors (caller handles and logs).
         """
-        category = (
-            kw.category
-            if kw.category in VALID_CATEGORIES
-            else _infer_category(kw.keyword, kw.category)
-        )
+        category = self._category_for(kw)
         lsi: list[str] = []  # could be extended later
 
         data = self._call_claude(kw.keyword, category, lsi)
+        return self._save_post(kw, category, data, db)
 
+    def _save_post(
+        self,
+        kw: BlogKeyword,
+        category: str,
+        data: dict,
+        db: Session,
+    ) -> BlogPost:
+        """
+        Persist Claude output for `kw` as a BlogPost and mark the keyword used.
+
+        Flushes but does not commit. Must run on the thread that owns `db`.
+        """
         # Ensure slug is unique — append date suffix if needed
         base_slug = _slugify(data.get("slug") or _slugify(data["title"]))
         slug = base_slug
@@ -305,6 +326,7 @@ class BlogGeneratorService:
 
         db.add(post)
         db.flush()  # get id without committing
+        precompress_post(post)
 
         # Mark keyword used
         kw.status  = "used"
@@ -323,12 +345,14 @@ class BlogGeneratorService:
         self,
         db: Session,
         count: int = 3,
+        on_progress: Optional[Callable[[int, int], None]] = None,
     ) -> BlogDailyReport:
         """
-        Main entry point called by the cron endpoint.
+        Main entry point called by the generate_blogs background job.
 
         Picks `count` highest-intent pending keywords, generates a post for
-        each, commits, and returns a BlogDailyReport.
+        each, commits, and returns a BlogDailyReport. `on_progress(done,
+        total)` is called as each post finishes.
         """
         today = datetime.utcnow().date()
 
@@ -376,34 +400,92 @@ class BlogGeneratorService:
         keywords_used: list[str] = list(report.keywords_used or [])
         generated: list[BlogPost] = []   # posts successfully written to DB
 
+        post_timings: list[dict] = list(report.post_timings or [])
+        timings_before = len(post_timings)
+
         # ── Phase 1: generate all posts and commit ────────────────────────
-        # Must commit BEFORE pinging search engines so the posts are visible
-        # to Googlebot / Bingbot when they crawl immediately after the ping.
-        for kw in keywords:
+        # Claude calls run concurrently on a bounded thread pool; each one is
+        # a long network wait, so N posts take about as long as the slowest.
+        # The Session is not thread-safe, so workers only talk to Claude and
+        # every DB write happens here, on the request thread, inside its own
+        # SAVEPOINT — one bad post can't roll back the others. Results are
+        # saved in keyword (buyer intent) order, whatever order they finish in.
+        jobs = {kw.id: (kw, self._category_for(kw)) for kw in keywords}
+        workers = max(1, min(settings.BLOG_GENERATION_CONCURRENCY, len(jobs)))
+        run_started = time.monotonic()
+
+        def _timed_call(keyword: str, category: str):
+            """Run one Claude call; returns (data, error, seconds)."""
+            t0 = time.monotonic()
             try:
-                post = self.generate_post(kw, db)
-                report.blogs_generated += 1
-                report.blogs_published += 1
-                keywords_used.append(kw.keyword)
-                generated.append(post)
-            except json.JSONDecodeError as exc:
-                msg = f"JSON parse error for '{kw.keyword}': {exc}"
-                logger.error(msg)
-                errors.append(msg)
-                kw.status = "skipped"
-            except (APIError, APITimeoutError, RateLimitError) as exc:
-                msg = f"Claude API error for '{kw.keyword}': {exc}"
-                logger.error(msg)
-                errors.append(msg)
-                # Don't mark as skipped — retry next run
+                return self._call_claude(keyword, category, []), None, time.monotonic() - t0
+            except Exception as exc:
+                return None, exc, time.monotonic() - t0
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blog-gen") as pool:
+            futures = [
+                (kw, category, pool.submit(_timed_call, kw.keyword, category))
+                for kw, category in jobs.values()
+            ]
+            for kw, category, future in futures:
+                data, error, elapsed = future.result()
+                timing = {
+                    "keyword": kw.keyword,
+                    "slug":    None,
+                    "seconds": round(elapsed, 2),
+                    "status":  "ok",
+                }
+                try:
+                    if error is not None:
+                        raise error
+                    with db.begin_nested():
+                        post = self._save_post(kw, category, data, db)
+                    timing["slug"] = post.slug
+                    report.blogs_generated += 1
+                    report.blogs_published += 1
+                    keywords_used.append(kw.keyword)
+                    generated.append(post)
+                except json.JSONDecodeError as exc:
+                    msg = f"JSON parse error for '{kw.keyword}': {exc}"
+                    logger.error(msg)
+                    errors.append(msg)
+                    kw.status = "skipped"
+                    timing["status"] = "skipped"
+                except (APIError, APITimeoutError, RateLimitError) as exc:
+                    msg = f"Claude API error for '{kw.keyword}': {exc}"
+                    logger.error(msg)
+                    errors.append(msg)
+                    # Don't mark as skipped — retry next run
+                    timing["status"] = "retry"
+                except Exception as exc:
+                    msg = f"Unexpected error for '{kw.keyword}': {exc}"
+                    logger.error(msg)
+                    errors.append(msg)
+                    kw.status = "skipped"
+                    timing["status"] = "skipped"
+                post_timings.append(timing)
+                if on_progress:
+                    on_progress(len(post_timings) - timings_before, len(jobs))
+
+        logger.info(
+            f"Generated {len(generated)}/{len(jobs)} post(s) with {workers} worker(s) "
+            f"in {time.monotonic() - run_started:.1f}s"
+        )
+
+        # Slot the new posts into the related-posts index in the same commit,
+        # so the blog cache version bump covers both
+        if generated:
+            try:
+                with db.begin_nested():
+                    related_posts_index.update_for_posts(db, [p.id for p in generated])
             except Exception as exc:
-                msg = f"Unexpected error for '{kw.keyword}': {exc}"
+                msg = f"Related posts update failed: {exc}"
                 logger.error(msg)
                 errors.append(msg)
-                kw.status = "skipped"
 
         report.keywords_used         = keywords_used
         report.errors                = errors
+        report.post_timings          = post_timings
         report.total_blogs_published = db.query(BlogPost).filter(
             BlogPost.status == "published"
         ).count()
@@ -432,8 +514,13 @@ class BlogGeneratorService:
                     errors.append(f"IndexNow failed for {post.slug}: {msg}")
             logger.info(f"IndexNow batch ({len(indexnow_urls)} URLs): {msg}")
 
+        # Same for Google: one multipart batch call instead of one per post
+        google_results = (
+            google_indexing_service.submit_blog_posts([p.slug for p in generated])
+            if generated else {}
+        )
         for post in generated:
-            g_ok, g_msg = google_indexing_service.submit_blog_post(post.slug)
+            g_ok, g_msg = google_results[post.slug]
             if g_ok:
                 post.google_submitted    = True
                 post.google_submitted_at = now
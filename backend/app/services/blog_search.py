@@ -0,0 +1,186 @@
+"""
+Full-text search over published blog posts.
+
+Postgres
+  blog_posts.search_vector is a STORED generated tsvector over title (A),
+  lsi_keywords + excerpt (B) and tag-stripped content (C) with a GIN index
+  (migrations/add_blog_search.sql). Queries use websearch_to_tsquery, are
+  ranked with ts_rank, and only the top-k hits get a ts_headline snippet.
+
+SQLite (local dev / tests)
+  An external-content FTS5 table blog_posts_fts kept in sync by triggers,
+  ranked with bm25() and highlighted with snippet().
+
+Both paths return the same result shape; matched terms in `snippet` are
+wrapped in <mark>…</mark>.
+"""
+
+import logging
+import re
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+SNIPPET_START = "<mark>"
+SNIPPET_STOP  = "</mark>"
+
+# ── Postgres ───────────────────────────────────────────────────────────────
+
+_PG_SEARCH_VECTOR = """
+    setweight(to_tsvector('english', coalesce(title, '')), 'A')
+ || setweight(to_tsvector('english', coalesce(lsi_keywords::text, '')), 'B')
+ || setweight(to_tsvector('english', coalesce(excerpt, '')), 'B')
+ || setweight(to_tsvector('english', regexp_replace(coalesce(content, ''), '<[^>]+>', ' ', 'g')), 'C')
+"""
+
+_PG_DDL = [
+    f"""
+    ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS ({_PG_SEARCH_VECTOR}) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_blog_posts_search ON blog_posts USING GIN (search_vector)",
+]
+
+# ts_rank over the GIN-filtered matches, then ts_headline for the top-k only
+# (headline generation re-parses the document and is the expensive part).
+_PG_SEARCH_SQL = f"""
+    SELECT slug, title, excerpt, category, published_at, rank,
+           ts_headline(
+               'english',
+               regexp_replace(coalesce(content, ''), '<[^>]+>', ' ', 'g'),
+               query,
+               'StartSel={SNIPPET_START}, StopSel={SNIPPET_STOP}, MaxFragments=2, '
+               'MinWords=8, MaxWords=24, FragmentDelimiter=" … "'
+           ) AS snippet
+    FROM (
+        SELECT p.slug, p.title, p.excerpt, p.category, p.published_at, p.content,
+               q.query, ts_rank(p.search_vector, q.query, 32) AS rank
+        FROM blog_posts p, websearch_to_tsquery('english', :q) AS q(query)
+        WHERE p.status = 'published'
+          AND p.search_vector @@ q.query
+          AND (CAST(:category AS TEXT) IS NULL OR p.category = :category)
+        ORDER BY rank DESC
+        LIMIT :limit
+    ) hits
+    ORDER BY rank DESC
+"""
+
+# ── SQLite FTS5 ────────────────────────────────────────────────────────────
+
+_FTS_COLUMNS = "title, excerpt, content, lsi_keywords"
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS blog_posts_fts USING fts5(
+        {_FTS_COLUMNS},
+        content='blog_posts', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS blog_posts_fts_ai AFTER INSERT ON blog_posts BEGIN
+        INSERT INTO blog_posts_fts(rowid, {_FTS_COLUMNS})
+        VALUES (new.id, new.title, new.excerpt, new.content, new.lsi_keywords);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS blog_posts_fts_ad AFTER DELETE ON blog_posts BEGIN
+        INSERT INTO blog_posts_fts(blog_posts_fts, rowid, {_FTS_COLUMNS})
+        VALUES ('delete', old.id, old.title, old.excerpt, old.content, old.lsi_keywords);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS blog_posts_fts_au AFTER UPDATE ON blog_posts BEGIN
+        INSERT INTO blog_posts_fts(blog_posts_fts, rowid, {_FTS_COLUMNS})
+        VALUES ('delete', old.id, old.title, old.excerpt, old.content, old.lsi_keywords);
+        INSERT INTO blog_posts_fts(rowid, {_FTS_COLUMNS})
+        VALUES (new.id, new.title, new.excerpt, new.content, new.lsi_keywords);
+    END
+    """,
+]
+
+# bm25 column weights mirror the Postgres A/B/C weights; lower bm25 = better
+_SQLITE_SEARCH_SQL = f"""
+    SELECT p.slug, p.title, p.excerpt, p.category, p.published_at,
+           -bm25(blog_posts_fts, 10.0, 4.0, 1.0, 4.0) AS rank,
+           snippet(blog_posts_fts, 2, '{SNIPPET_START}', '{SNIPPET_STOP}', ' … ', 24) AS snippet
+    FROM blog_posts_fts
+    JOIN blog_posts p ON p.id = blog_posts_fts.rowid
+    WHERE blog_posts_fts MATCH :q
+      AND p.status = 'published'
+      AND (:category IS NULL OR p.category = :category)
+    ORDER BY rank DESC
+    LIMIT :limit
+"""
+
+
+_NON_MARK_TAG = re.compile(r"<(?!/?mark>)[^>]*>?")
+
+
+def _clean_snippet(snippet: Optional[str]) -> Optional[str]:
+    """Drop HTML from the source document, keeping only our <mark> tags."""
+    if snippet is None:
+        return None
+    return " ".join(_NON_MARK_TAG.sub(" ", snippet).split())
+
+
+def _fts5_query(q: str) -> Optional[str]:
+    """Turn free text into a safe FTS5 query (all terms, each quoted)."""
+    terms = re.findall(r"\w+", q.lower())
+    if not terms:
+        return None
+    return " ".join(f'"{term}"' for term in terms)
+
+
+# ── Public API ─────────────────────────────────────────────────────────────
+
+def ensure_search_index(bind) -> None:
+    """
+    Create the search column / index (Postgres) or FTS5 table + sync
+    triggers (SQLite). Idempotent; called from init_db after create_all.
+    """
+    dialect = bind.dialect.name
+    with bind.begin() as conn:
+        if dialect == "postgresql":
+            for ddl in _PG_DDL:
+                conn.execute(text(ddl))
+        elif dialect == "sqlite":
+            existed = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = 'blog_posts_fts'")
+            ).first()
+            for ddl in _SQLITE_DDL:
+                conn.execute(text(ddl))
+            if not existed:
+                # Index rows that were inserted before the triggers existed
+                conn.execute(text("INSERT INTO blog_posts_fts(blog_posts_fts) VALUES ('rebuild')"))
+        else:
+            logger.warning(f"Blog search not supported on {dialect}")
+
+
+def search_posts(
+    db: Session,
+    q: str,
+    limit: int = 10,
+    category: Optional[str] = None,
+) -> list[dict]:
+    """
+    Return the top `limit` published posts matching `q`, best first.
+
+    Each result: { slug, title, excerpt, category, published_at, rank, snippet }
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        sql, query = _PG_SEARCH_SQL, q
+    elif dialect == "sqlite":
+        sql, query = _SQLITE_SEARCH_SQL, _fts5_query(q)
+        if query is None:
+            return []
+    else:
+        raise RuntimeError(f"Blog search not supported on {dialect}")
+
+    rows = db.execute(
+        text(sql), {"q": query, "limit": limit, "category": category}
+    ).mappings().all()
+    return [{**row, "snippet": _clean_snippet(row["snippet"])} for row in rows]
@@ -0,0 +1,321 @@
+"""
+Background job handlers for the cron endpoints.
+
+Each handler used to be the body of a POST /api/cron/* route. They now run
+on the job runner (see job_runner) so the HTTP request only enqueues the
+work and returns a job id; the return value becomes the job result.
+"""
+
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.blog import BlogKeyword
+from app.services.blog_generator import blog_generator
+from app.services.drip_service import process_drip_emails
+from app.services.google_indexing_service import google_indexing_service
+from app.services import resume_content
+from app.services.indexnow_service import MAX_URLS_PER_REQUEST, indexnow_service
+from app.services.job_runner import JobContext, job_runner
+from app.services.related_posts import related_posts_index
+
+logger = logging.getLogger(__name__)
+
+# Static public pages submitted by reindex_all
+STATIC_PATHS = [
+    "/",
+    "/blog",
+    "/pricing",
+    "/jobs",
+    "/resume",
+    "/privacy",
+    "/terms",
+    "/refund",
+]
+
+# (keyword, category, search_volume, competition, buyer_intent)
+SEED_KEYWORDS = [
+    ("ATS resume format for freshers", "resume-tips", 8200, "low", 9),
+    ("how to make ATS friendly resume", "resume-tips", 7400, "low", 9),
+    ("ATS resume checker free India", "resume-tips", 6100, "medium", 9),
+    ("best resume format for software engineer India", "resume-tips", 5800, "medium", 8),
+    ("resume format for TCS freshers 2025", "resume-tips", 5200, "low", 9),
+    ("Infosys resume format freshers", "resume-tips", 4900, "low", 9),
+    ("Wipro resume tips fresher", "resume-tips", 4600, "low", 8),
+    ("one page resume format India", "resume-tips", 4400, "medium", 8),
+    ("resume skills section for IT freshers", "resume-tips", 4100, "low", 8),
+    ("how to write summary in resume for freshers", "resume-tips", 3900, "low", 8),
+    ("resume action words for IT professionals", "resume-tips", 3700, "low", 7),
+    ("how to list projects in resume fresher", "resume-tips", 3500, "low", 8),
+    ("resume format for MBA freshers India", "resume-tips", 3300, "low", 8),
+    ("BCA resume format for freshers 2025", "resume-tips", 3100, "low", 8),
+    ("MCA resume format for freshers 2025", "resume-tips", 3000, "low", 8),
+    ("resume tips for 2 years experience India", "resume-tips", 2900, "low", 7),
+    ("how to write quantifiable achievements in resume", "resume-tips", 2800, "medium", 7),
+    ("engineering fresher resume format India", "resume-tips", 2700, "low", 8),
+    ("resume gaps how to explain India", "resume-tips", 2600, "low", 7),
+    ("ATS keywords for software developer resume", "resume-tips", 2500, "medium", 8),
+    ("best font for resume India", "resume-tips", 2400, "low", 6),
+    ("how to write objective in resume for fresher", "resume-tips", 2300, "low", 7),
+    ("resume format for data analyst India", "resume-tips", 2200, "medium", 8),
+    ("how to add certifications in resume India", "resume-tips", 2100, "low", 7),
+    ("resume dos and don'ts India 2025", "resume-tips", 2000, "low", 7),
+    ("TCS NQT interview questions and answers", "interview-prep", 9100, "low", 10),
+    ("Infosys interview questions for freshers 2025", "interview-prep", 8400, "low", 10),
+    ("HR interview questions and answers for freshers", "interview-prep", 7800, "medium", 9),
+    ("top interview questions for software engineer India", "interview-prep", 7100, "medium", 9),
+    ("Wipro interview process freshers", "interview-prep", 6500, "low", 9),
+    ("Cognizant interview questions freshers 2025", "interview-prep", 6100, "low", 9),
+    ("tell me about yourself answer for fresher IT", "interview-prep", 5800, "medium", 8),
+    ("technical interview questions for Java developer India", "interview-prep", 5400, "medium", 9),
+    ("group discussion topics for campus placement 2025", "interview-prep", 5100, "low", 8),
+    ("Accenture interview questions freshers", "interview-prep", 4900, "low", 9),
+    ("Capgemini interview questions 2025", "interview-prep", 4600, "low", 9),
+    ("HCL interview process freshers India", "interview-prep", 4300, "low", 8),
+    ("how to crack campus placement interview India", "interview-prep", 4100, "medium", 9),
+    ("Python interview questions for freshers India", "interview-prep", 3900, "medium", 8),
+    ("SQL interview questions for data analyst India", "interview-prep", 3700, "medium", 8),
+    ("aptitude test preparation for TCS NQT", "interview-prep", 3500, "low", 8),
+    ("body language tips for interview India", "interview-prep", 3300, "low", 7),
+    ("what to wear to interview India fresher", "interview-prep", 3100, "low", 6),
+    ("how to answer why should we hire you fresher", "interview-prep", 2900, "medium", 8),
+    ("React JS interview questions India 2025", "interview-prep", 2800, "medium", 8),
+    ("Node.js interview questions for freshers India", "interview-prep", 2600, "medium", 8),
+    ("system design interview preparation India", "interview-prep", 2500, "high", 8),
+    ("how to negotiate salary fresher India", "interview-prep", 2400, "low", 8),
+    ("common mistakes in HR interview India", "interview-prep", 2200, "low", 7),
+    ("mock interview tips India engineering college", "interview-prep", 2100, "low", 7),
+    ("how to get first job after engineering India", "career-advice", 8800, "medium", 9),
+    ("how to switch IT company India 2025", "career-advice", 7600, "medium", 9),
+    ("career options after BCA India 2025", "career-advice", 7100, "low", 8),
+    ("highest paying IT jobs India 2025", "career-advice", 6800, "medium", 8),
+    ("how to get job in Google India", "career-advice", 6400, "medium", 8),
+    ("LinkedIn profile tips for freshers India", "career-advice", 6000, "medium", 8),
+    ("how to write cold email to recruiter India", "career-advice", 5600, "low", 8),
+    ("off campus placement tips India 2025", "career-advice", 5300, "low", 9),
+    ("freelancing vs full time job India fresh graduate", "career-advice", 5000, "low", 7),
+    ("how to get internship in top MNC India", "career-advice", 4800, "medium", 9),
+    ("salary hike tips India IT professional", "career-advice", 4500, "low", 8),
+    ("best certifications for software engineer India 2025", "career-advice", 4300, "medium", 8),
+    ("work from home IT jobs for freshers India", "career-advice", 4100, "low", 8),
+    ("how to crack MAANG interview India", "career-advice", 3900, "high", 9),
+    ("career growth in TCS vs startup India", "career-advice", 3600, "low", 7),
+    ("how to build portfolio for software developer India", "career-advice", 3400, "medium", 8),
+    ("GitHub profile tips for fresher India", "career-advice", 3200, "low", 7),
+    ("career after 10 years gap India", "career-advice", 3000, "low", 8),
+    ("how to ask for promotion India IT", "career-advice", 2800, "low", 7),
+    ("networking tips for job seekers India", "career-advice", 2600, "medium", 7),
+    ("job search strategy for experienced IT professional India", "career-advice", 2500, "medium", 8),
+    ("how to ace Naukri profile India", "career-advice", 2300, "low", 7),
+    ("best job boards India IT 2025", "career-advice", 2200, "low", 7),
+    ("how to handle job rejection India", "career-advice", 2000, "low", 6),
+    ("work life balance IT industry India tips", "career-advice", 1900, "low", 6),
+    ("free ATS resume builder India", "resume-tips", 9500, "medium", 10),
+    ("online resume builder India free 2025", "resume-tips", 8900, "medium", 10),
+    ("resume builder for freshers India", "resume-tips", 8300, "medium", 10),
+    ("ATS score checker India free", "resume-tips", 7800, "medium", 10),
+    ("how to increase ATS score resume India", "resume-tips", 7200, "medium", 9),
+    ("TCS digital profile tips 2025", "interview-prep", 6700, "low", 9),
+    ("campus placement preparation guide India 2025", "interview-prep", 6300, "medium", 9),
+    ("data science career path India fresher", "career-advice", 5900, "medium", 9),
+    ("cloud computing career India 2025", "career-advice", 5500, "medium", 8),
+    ("DevOps engineer salary India 2025", "career-advice", 5100, "medium", 8),
+    ("AI ML engineer career path India", "career-advice", 4800, "medium", 8),
+    ("how to get remote job India international", "career-advice", 4500, "medium", 9),
+    ("upskilling tips for IT professionals India", "career-advice", 4200, "low", 7),
+    ("product manager career path India 2025", "career-advice", 3900, "medium", 8),
+    ("full stack developer roadmap India fresher", "career-advice", 3700, "medium", 8),
+    ("cybersecurity career India 2025", "career-advice", 3400, "medium", 8),
+    ("blockchain developer career India", "career-advice", 3100, "medium", 7),
+    ("internship to full time conversion tips India", "career-advice", 2900, "low", 8),
+    ("GATE vs job which is better India CSE", "career-advice", 2700, "low", 7),
+    ("how to become software architect India", "career-advice", 2500, "medium", 7),
+    ("resume for career change IT to management India", "resume-tips", 2300, "low", 8),
+    ("how to mention notice period in resume India", "resume-tips", 2100, "low", 7),
+    ("interview questions for team lead India", "interview-prep", 2000, "medium", 8),
+    ("appraisal tips for IT professionals India", "career-advice", 1900, "low", 7),
+    ("how to get job in product startup India 2025", "career-advice", 1800, "low", 8),
+]
+
+
+# ── generate_blogs ─────────────────────────────────────────────────────────
+
+@job_runner.register("generate_blogs")
+def generate_blogs(db: Session, params: dict, ctx: JobContext) -> dict:
+    """
+    Daily blog automation.
+
+    1. Picks top-N pending keywords by buyer_intent
+    2. Generates full HTML posts via Claude API
+    3. Pings Bing via IndexNow and notifies Google Indexing API
+    4. Runs retry safety-nets for any previously failed submissions
+    """
+    settings = get_settings()
+    count = params.get("count") or settings.BLOG_POSTS_PER_RUN
+    errors: list[str] = []
+
+    # ── 1. Generate blog posts (0-80%) ─────────────────────────────────────
+    ctx.progress(0, f"Generating {count} post(s)")
+    report = blog_generator.run_daily_generation(
+        db,
+        count=count,
+        on_progress=lambda done, total: ctx.progress(
+            80 * done / total, f"Generated {done}/{total} post(s)"
+        ),
+    )
+    errors.extend(report.errors or [])
+
+    # ── 2. Retry-submit any previously failed IndexNow posts ──────────────
+    ctx.progress(85, "Retrying IndexNow submissions")
+    try:
+        indexnow_retry = indexnow_service.submit_pending_posts(db)
+        if indexnow_retry["errors"]:
+            errors.extend(indexnow_retry["errors"])
+    except Exception as exc:
+        logger.warning(f"IndexNow retry failed: {exc}")
+        errors.append(f"IndexNow retry: {exc}")
+
+    # ── 3. Retry-submit any previously failed Google posts ────────────────
+    ctx.progress(95, "Retrying Google Indexing submissions")
+    try:
+        google_retry = google_indexing_service.submit_pending_posts(db)
+        if google_retry["errors"]:
+            errors.extend(google_retry["errors"])
+    except Exception as exc:
+        logger.warning(f"Google indexing retry failed: {exc}")
+        errors.append(f"Google indexing retry: {exc}")
+
+    logger.info(
+        f"generate-blogs job done — "
+        f"published={report.blogs_published}, "
+        f"indexnow={report.indexnow_success}, "
+        f"google={report.google_success}, "
+        f"errors={len(errors)}"
+    )
+
+    return {
+        "blogs_published":   report.blogs_published,
+        "indexnow_success":  report.indexnow_success,
+        "google_success":    report.google_success,
+        "keywords_used":     report.keywords_used,
+        "total_published":   report.total_blogs_published,
+        "post_timings":      report.post_timings or [],
+        "errors":            errors,
+    }
+
+
+# ── reindex_all ────────────────────────────────────────────────────────────
+
+@job_runner.register("reindex_all")
+def reindex_all(db: Session, params: dict, ctx: JobContext) -> dict:
+    """
+    Submit ALL published blog posts + key static pages to IndexNow.
+
+    Streams slugs in chunks of up to 10 000 URLs and POSTs them
+    concurrently (see IndexNowService.reindex_published_posts). Idempotent.
+    """
+    site_url = indexnow_service.site_url
+    static_urls = [f"{site_url}{p}" for p in STATIC_PATHS]
+
+    ctx.progress(0, "Submitting URLs to IndexNow")
+    summary = indexnow_service.reindex_published_posts(
+        db,
+        static_urls=static_urls,
+        chunk_size=params.get("chunk_size") or MAX_URLS_PER_REQUEST,
+        on_progress=lambda done, total: ctx.progress(
+            100 * done / total, f"Processed {done}/{total} posts"
+        ),
+    )
+
+    return {
+        "status":        "ok" if summary["ok"] else "error",
+        "message":       "; ".join(summary["errors"][:5]) or "all chunks accepted",
+        "total_urls":    summary["total_urls"],
+        "static_pages":  summary["static_pages"],
+        "blog_posts":    summary["blog_posts"],
+        "chunks":        summary["chunks"],
+        "failed_chunks": summary["failed_chunks"],
+        "static_urls":   static_urls,
+    }
+
+
+# ── rebuild_related_posts ──────────────────────────────────────────────────
+
+@job_runner.register("rebuild_related_posts")
+def rebuild_related_posts(db: Session, params: dict, ctx: JobContext) -> dict:
+    """
+    Recompute the related-posts index for every published post. Daily
+    generation keeps it current incrementally; this re-weights everything.
+    """
+    ctx.progress(0, "Building related-posts index")
+    summary = related_posts_index.rebuild(
+        db,
+        top_n=params.get("top_n"),
+        on_progress=lambda done, total: ctx.progress(
+            95 * done / total, f"Indexed {done}/{total} posts"
+        ),
+    )
+    db.commit()
+    return summary
+
+
+# ── backfill_normalized_content ────────────────────────────────────────────
+
+@job_runner.register("backfill_normalized_content")
+def backfill_normalized_content(db: Session, params: dict, ctx: JobContext) -> dict:
+    """
+    Store the normalized content of every resume written before the
+    current content schema version. Commits per batch; safe to re-run.
+    """
+    ctx.progress(0, "Normalizing resume content")
+    return resume_content.backfill_normalized_content(
+        db,
+        on_progress=lambda done, total: ctx.progress(
+            95 * done / total, f"Normalized {done}/{total} resumes"
+        ),
+    )
+
+
+# ── seed_keywords ──────────────────────────────────────────────────────────
+
+@job_runner.register("seed_keywords")
+def seed_keywords(db: Session, params: dict, ctx: JobContext) -> dict:
+    """Seed the keyword bank from SEED_KEYWORDS. Idempotent."""
+    existing = {kw for (kw,) in db.query(BlogKeyword.keyword).all()}
+
+    inserted = skipped = 0
+    for i, (keyword, category, volume, competition, intent) in enumerate(SEED_KEYWORDS, 1):
+        if keyword in existing:
+            skipped += 1
+        else:
+            db.add(BlogKeyword(
+                keyword=keyword, category=category,
+                search_volume=volume, competition=competition,
+                buyer_intent=intent, status="pending",
+            ))
+            existing.add(keyword)
+            inserted += 1
+        ctx.progress(90 * i / len(SEED_KEYWORDS), "Seeding keywords")
+
+    db.commit()
+    pending = db.query(BlogKeyword).filter(BlogKeyword.status == "pending").count()
+
+    return {
+        "inserted": inserted,
+        "skipped": skipped,
+        "total_pending": pending,
+    }
+
+
+# ── drip_emails ────────────────────────────────────────────────────────────
+
+@job_runner.register("drip_emails")
+def drip_emails(db: Session, params: dict, ctx: JobContext) -> dict:
+    """Process the drip email campaign for free users."""
+    stats = process_drip_emails(
+        db,
+        on_progress=lambda done, total: ctx.progress(100 * done / total, "Processing free users"),
+    )
+    logger.info(f"Drip email job completed: {stats}")
+    return {"stats": stats}
@@ -15,6 +15,7 @@ import logging
 import json
 
 from app.config import get_settings
+from app.services.http_clients import http_clients
 
 settings = get_settings()
 from app.models.payment import Payment, PaymentStatus
@@ -159,22 +160,21 @@ class DodoService:
             if product_ids:
                 discount_data["restricted_to"] = product_ids
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/discounts",
-                    headers=self._get_headers(),
-                    json=discount_data,
-                    timeout=15.0,
-                )
+            client = http_clients.async_client("dodo")
+            response = await client.post(
+                f"{self.base_url}/discounts",
+                headers=self._get_headers(),
+                json=discount_data,
+            )
 
-                if response.status_code in [200, 201]:
-                    result = response.json()
-                    dodo_code = result.get("code", code.upper())
-                    logger.info(f"Dodo discount created: {dodo_code} ({discount_percent}%)")
-                    return dodo_code
-                else:
-                    logger.error(f"Failed to create Dodo discount: {response.status_code} - {response.text}")
-                    return None
+            if response.status_code in [200, 201]:
+                result = response.json()
+                dodo_code = result.get("code", code.upper())
+                logger.info(f"Dodo discount created: {dodo_code} ({discount_percent}%)")
+                return dodo_code
+            else:
+                logger.error(f"Failed to create Dodo discount: {response.status_code} - {response.text}")
+                return None
 
         except Exception as e:
             logger.error(f"Error creating Dodo discount: {e}")
@@ -304,20 +304,19 @@ class DodoService:
 
             logger.info(f"Creating Dodo checkout with product_id: {product_id}")
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/payments",
-                    headers=self._get_headers(),
-                    json=checkout_data,
-                    timeout=30.0
-                )
+            client = http_clients.async_client("dodo")
+            response = await client.post(
+                f"{self.base_url}/payments",
+                headers=self._get_headers(),
+                json=checkout_data,
+            )
 
-                if response.status_code not in [200, 201]:
-                    error_detail = response.text
-                    logger.error(f"Dodo checkout creation failed: {response.status_code} - {error_detail}")
-                    raise ValueError(f"Failed to create checkout: {error_detail}")
+            if response.status_code not in [200, 201]:
+                error_detail = response.text
+                logger.error(f"Dodo checkout creation failed: {response.status_code} - {error_detail}")
+                raise ValueError(f"Failed to create checkout: {error_detail}")
 
-                session_data = response.json()
+            session_data = response.json()
 
             # Extract session/payment ID and checkout URL
             session_id = session_data.get("payment_id") or session_data.get("id")
@@ -608,22 +607,21 @@ class DodoService:
                 return True, "success", user
 
             # Fetch payment status from Dodo API
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/payments/{payment_id}",
-                    headers=self._get_headers(),
-                    timeout=30.0
-                )
+            client = http_clients.async_client("dodo")
+            response = await client.get(
+                f"{self.base_url}/payments/{payment_id}",
+                headers=self._get_headers()
+            )
 
-                if response.status_code == 404:
-                    logger.warning(f"Payment {payment_id} not found in Dodo")
-                    return False, "Payment not found in Dodo", None
+            if response.status_code == 404:
+                logger.warning(f"Payment {payment_id} not found in Dodo")
+                return False, "Payment not found in Dodo", None
 
-                if response.status_code != 200:
-                    logger.error(f"Dodo API error: {response.status_code} - {response.text}")
-                    return False, f"API error: {response.status_code}", None
+            if response.status_code != 200:
+                logger.error(f"Dodo API error: {response.status_code} - {response.text}")
+                return False, f"API error: {response.status_code}", None
 
-                payment_data = response.json()
+            payment_data = response.json()
 
             logger.info(f"Dodo payment status for {payment_id}: {json.dumps(payment_data)}")
 
@@ -1,13 +1,14 @@
 import logging
 import os
 from datetime import datetime
+from typing import Callable, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.models.user import User, SubscriptionType
 from app.models.drip_email_log import DripEmailLog
 from app.services.coupon_service import coupon_service
-from app.services.email_service import email_service
+from app.services.email_service import email_service, CompiledTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -89,16 +90,28 @@ DRIP_TEXT_TEMPLATES = {
 }
 
 
-def _build_drip_text(step: int, template_vars: dict) -> str:
-    """Build plain text version of a drip email."""
-    text = DRIP_TEXT_TEMPLATES.get(step, "")
-    for key, value in template_vars.items():
-        text = text.replace(f"{{{{{key}}}}}", str(value))
-    return text
+# Parsed once at import; rendering is a single join per email
+_COMPILED_DRIP_TEXT = {
+    step: CompiledTemplate(text) for step, text in DRIP_TEXT_TEMPLATES.items()
+}
 
 
-def process_drip_emails(db: Session) -> dict:
-    """Main drip processor. Called by cron endpoint. Returns stats."""
+def _build_drip_text(step: int, template_vars: dict) -> str:
+    """Build plain text version of a drip email."""
+    template = _COMPILED_DRIP_TEXT.get(step)
+    if template is None:
+        return ""
+    return template.render(template_vars)
+
+
+def process_drip_emails(
+    db: Session,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> dict:
+    """
+    Main drip processor. Called by the drip_emails background job.
+    Returns stats; `on_progress(checked, total)` is called after each user.
+    """
     now = datetime.utcnow()
     stats = {
         "checked": 0,
@@ -201,4 +214,7 @@ def process_drip_emails(db: Session) -> dict:
             # Only process one step per user per cron run
             break
 
+        if on_progress:
+            on_progress(stats["checked"], len(free_users))
+
     return stats
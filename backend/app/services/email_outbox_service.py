@@ -0,0 +1,317 @@
+"""
+Transactional email outbox.
+
+Request handlers never talk to the mail provider directly. Instead they
+call `enqueue_email()` to stage a row in `email_outbox` inside the same
+DB transaction as the business change (new user, captured payment, ...),
+and the drainer delivers it afterwards:
+
+  1. claim due rows (FOR UPDATE SKIP LOCKED, so several API replicas can
+     drain concurrently without double-claiming)
+  2. call the matching EmailService sender with the row's idempotency key
+     (Resend de-duplicates retried sends with the same key)
+  3. mark the row sent, or reschedule it with exponential backoff
+  4. strip secrets (the password reset token) from finished rows, and
+     delete finished rows after EMAIL_OUTBOX_RETENTION_DAYS
+
+With EMAIL_ENABLED=false nothing is handed to the sender: claimed rows are
+marked 'skipped' on their first attempt instead of being retried.
+
+The drainer runs as a background task started in `main.lifespan` and can
+also be triggered on demand via POST /api/cron/email-outbox.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.email_outbox import EmailOutbox
+from app.services.email_service import email_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# email_type → EmailService method that renders and sends it
+EMAIL_SENDERS: dict[str, str] = {
+    "welcome":                "send_welcome_email",
+    "password_reset":         "send_password_reset_email",
+    "payment_success":        "send_payment_success_email",
+    "payment_failed":         "send_payment_failed_email",
+    "subscription_activated": "send_subscription_activated_email",
+    "subscription_cancelled": "send_subscription_cancelled_email",
+    "renewal_reminder":       "send_renewal_reminder_email",
+}
+
+# How long a claimed row stays invisible to other drainers. If a worker dies
+# mid-send the row becomes due again once the lease expires.
+CLAIM_LEASE = timedelta(minutes=5)
+
+# Retry backoff: 30s, 1m, 2m, 4m ... capped at 1 hour
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS  = 3600
+
+# Rows in these states are never claimed again
+FINISHED_STATUSES = ("sent", "skipped", "failed")
+
+# Payload keys holding live credentials; removed once a row is finished
+SECRET_PAYLOAD_KEYS = ("reset_token",)
+
+# How often a drainer deletes finished rows past the retention window
+PRUNE_INTERVAL = timedelta(hours=1)
+
+
+def enqueue_email(
+    db: Session,
+    email_type: str,
+    to_email: str,
+    idempotency_key: str,
+    **payload: Any,
+) -> Optional[EmailOutbox]:
+    """
+    Stage an email for delivery in the caller's transaction.
+
+    Does NOT commit — the row becomes visible to the drainer only when the
+    caller commits its business change, and disappears with it on rollback.
+
+    Args:
+        db: Database session of the current request
+        email_type: Key of EMAIL_SENDERS
+        to_email: Recipient address
+        idempotency_key: Unique key for this logical email
+        **payload: Keyword arguments for the EmailService sender
+
+    Returns:
+        EmailOutbox: The staged row, or None if the key was already enqueued
+
+    Raises:
+        ValueError: If email_type is unknown
+    """
+    if email_type not in EMAIL_SENDERS:
+        raise ValueError(f"Unknown email type: {email_type}")
+
+    existing = (
+        db.query(EmailOutbox.id)
+        .filter(EmailOutbox.idempotency_key == idempotency_key)
+        .first()
+    )
+    if existing:
+        logger.info(f"Email '{idempotency_key}' already in outbox, skipping")
+        return None
+
+    row = EmailOutbox(
+        idempotency_key = idempotency_key,
+        email_type      = email_type,
+        to_email        = to_email,
+        # Round-trip through JSON so enums / datetimes are stored as plain strings
+        payload         = json.loads(json.dumps(payload, default=str)),
+        status          = "pending",
+        attempts        = 0,
+        next_attempt_at = datetime.utcnow(),
+    )
+    db.add(row)
+    return row
+
+
+class EmailOutboxService:
+    """Drains the email outbox with retries and idempotent delivery."""
+
+    def __init__(self, sender=None) -> None:
+        self.sender = sender or email_service
+        self.max_attempts = settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        self.batch_size = settings.EMAIL_OUTBOX_BATCH_SIZE
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_prune: Optional[datetime] = None
+
+    # ── Draining ───────────────────────────────────────────────────────────
+
+    def drain(self, db: Session, limit: Optional[int] = None) -> dict:
+        """
+        Deliver every due outbox row (up to `limit`).
+
+        Returns:
+            dict: { claimed, sent, skipped, retried, failed, pruned }
+        """
+        stats = {"claimed": 0, "sent": 0, "skipped": 0, "retried": 0, "failed": 0}
+
+        rows = self._claim(db, limit or self.batch_size)
+        stats["claimed"] = len(rows)
+
+        for row in rows:
+            outcome = self._deliver(db, row)
+            stats[outcome] += 1
+
+        stats["pruned"] = self.prune(db)
+        if rows or stats["pruned"]:
+            logger.info(f"Email outbox drained: {stats}")
+        return stats
+
+    def _claim(self, db: Session, limit: int) -> list[EmailOutbox]:
+        """Lock and lease a batch of due rows so no other drainer sends them."""
+        now = datetime.utcnow()
+        rows = (
+            db.query(EmailOutbox)
+            .filter(
+                EmailOutbox.status.in_(("pending", "sending")),
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for row in rows:
+            row.status          = "sending"
+            row.attempts        = (row.attempts or 0) + 1
+            row.next_attempt_at = now + CLAIM_LEASE
+        db.commit()
+        return rows
+
+    def _deliver(self, db: Session, row: EmailOutbox) -> str:
+        """Send one claimed row and record the outcome. Returns the stats key."""
+        if not getattr(self.sender, "enabled", True):
+            row.status     = "skipped"
+            row.last_error = "Email sending disabled (EMAIL_ENABLED=false)"
+            self._finish(row)
+            db.commit()
+            logger.info(f"Email '{row.idempotency_key}' to {row.to_email} skipped: sending disabled")
+            return "skipped"
+
+        error: Optional[str] = None
+        try:
+            send = getattr(self.sender, EMAIL_SENDERS[row.email_type])
+            ok = send(**(row.payload or {}), idempotency_key=row.idempotency_key)
+            if not ok:
+                error = "Email provider rejected the message"
+        except Exception as exc:
+            error = str(exc)
+
+        now = datetime.utcnow()
+        if error is None:
+            row.status     = "sent"
+            row.sent_at    = now
+            row.last_error = None
+            self._finish(row)
+            outcome = "sent"
+        elif row.attempts >= self.max_attempts:
+            row.status     = "failed"
+            row.last_error = error
+            self._finish(row)
+            outcome = "failed"
+            logger.error(
+                f"Email '{row.idempotency_key}' to {row.to_email} failed permanently "
+                f"after {row.attempts} attempts: {error}"
+            )
+        else:
+            delay = min(BACKOFF_BASE_SECONDS * 2 ** (row.attempts - 1), BACKOFF_MAX_SECONDS)
+            row.status          = "pending"
+            row.next_attempt_at = now + timedelta(seconds=delay)
+            row.last_error      = error
+            outcome = "retried"
+            logger.warning(
+                f"Email '{row.idempotency_key}' attempt {row.attempts} failed, "
+                f"retrying in {delay}s: {error}"
+            )
+
+        db.commit()
+        return outcome
+
+    @staticmethod
+    def _finish(row: EmailOutbox) -> None:
+        """Drop secrets from a row that will never be sent again."""
+        payload = row.payload or {}
+        if any(key in payload for key in SECRET_PAYLOAD_KEYS):
+            row.payload = {k: v for k, v in payload.items() if k not in SECRET_PAYLOAD_KEYS}
+
+    # ── Retention ──────────────────────────────────────────────────────────
+
+    def prune(self, db: Session) -> int:
+        """
+        Delete finished rows older than EMAIL_OUTBOX_RETENTION_DAYS so
+        recipient addresses and names are not kept forever.
+
+        Runs at most once per PRUNE_INTERVAL per service instance.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        now = datetime.utcnow()
+        if self._last_prune is not None and now - self._last_prune < PRUNE_INTERVAL:
+            return 0
+        self._last_prune = now
+
+        cutoff = now - timedelta(days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+        deleted = (
+            db.query(EmailOutbox)
+            .filter(
+                EmailOutbox.status.in_(FINISHED_STATUSES),
+                EmailOutbox.updated_at < cutoff,
+            )
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        if deleted:
+            logger.info(f"Email outbox pruned {deleted} finished rows older than {cutoff:%Y-%m-%d}")
+        return deleted
+
+    # ── Background worker ──────────────────────────────────────────────────
+
+    def notify(self) -> None:
+        """
+        Wake the background drainer so a freshly committed email goes out
+        immediately instead of on the next poll. Safe to call from sync
+        handlers running in the threadpool; a no-op if no worker is running.
+        """
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # Event loop already closed (shutdown in progress)
+            pass
+
+    def _drain_once(self) -> dict:
+        """Drain with a dedicated session (runs in a worker thread)."""
+        from app.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            return self.drain(db)
+        finally:
+            db.close()
+
+    async def run_worker(self, poll_seconds: Optional[int] = None) -> None:
+        """Drain the outbox forever; started from main.lifespan."""
+        poll = poll_seconds or settings.EMAIL_OUTBOX_POLL_SECONDS
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        logger.info(f"Email outbox worker started (poll={poll}s)")
+
+        try:
+            while True:
+                try:
+                    stats = await asyncio.to_thread(self._drain_once)
+                    # A full batch means there may be more due rows — go again
+                    if stats["claimed"] >= self.batch_size:
+                        continue
+                except Exception as exc:
+                    logger.error(f"Email outbox drain failed: {exc}")
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=poll)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+        finally:
+            self._loop = None
+            self._wakeup = None
+            logger.info("Email outbox worker stopped")
+
+
+# Singleton instance
+email_outbox_service = EmailOutboxService()
@@ -4,13 +4,104 @@ More reliable than SMTP for cloud deployments.
 """
 
 import os
+import re
 import logging
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import resend
 
 logger = logging.getLogger(__name__)
 
+# {{variable}} placeholders used by the HTML and plain-text templates
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+class CompiledTemplate:
+    """
+    A template pre-compiled into a `str.format_map` pattern.
+
+    Parsing happens once: literal text has its braces escaped (the HTML
+    templates contain CSS) and each {{name}} placeholder becomes a format
+    field, so `render()` is a single C-level pass over the template.
+    Placeholders without a value are left untouched, matching the previous
+    str.replace() behaviour.
+    """
+
+    __slots__ = ("_pattern", "names")
+
+    def __init__(self, source: str):
+        parts = _PLACEHOLDER_RE.split(source)
+        # split() with one capture group alternates literal, name, literal, ...
+        literals = [p.replace("{", "{{").replace("}", "}}") for p in parts[0::2]]
+        self.names = tuple(parts[1::2])
+        pattern = [literals[0]]
+        for name, literal in zip(self.names, literals[1:]):
+            pattern.append(f"{{{name}}}")
+            pattern.append(literal)
+        self._pattern = "".join(pattern)
+
+    def render(self, variables: dict) -> str:
+        """Render the template with `variables` in one pass."""
+        return self._pattern.format_map(_KeepMissing(variables))
+
+
+class _KeepMissing(dict):
+    """format_map mapping that renders unknown placeholders back as {{name}}."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{{{key}}}}}"
+
+
+class _TemplateCache:
+    """
+    Compiled template cache keyed by path, invalidated on file mtime change.
+
+    The mtime is re-checked at most once per `check_interval` seconds per
+    template, so bulk sends (drip cron) don't pay a stat() per email.
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        # path -> (mtime_ns, checked_at, compiled)
+        self._entries: Dict[str, Tuple[int, float, CompiledTemplate]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> CompiledTemplate:
+        """
+        Return the compiled template for `path`, (re)parsing it only if the
+        file changed since it was cached.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+        """
+        now = time.monotonic()
+        entry = self._entries.get(path)
+        if entry is not None and now - entry[1] < self.check_interval:
+            return entry[2]
+
+        mtime = os.stat(path).st_mtime_ns
+        if entry is not None and entry[0] == mtime:
+            self._entries[path] = (mtime, now, entry[2])
+            return entry[2]
+
+        with self._lock:
+            with open(path, "r") as f:
+                compiled = CompiledTemplate(f.read())
+            self._entries[path] = (mtime, now, compiled)
+            return compiled
+
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        with self._lock:
+            self._entries.clear()
+
+
+template_cache = _TemplateCache()
+
 
 class EmailService:
     """Service for sending emails via Resend HTTP API."""
@@ -28,6 +119,7 @@ class EmailService:
 
         # Get template directory
         self.template_dir = Path(__file__).parent.parent / "templates" / "emails"
+        self._template_dir_str = str(self.template_dir)
 
         # Log configuration status
         if not self.resend_api_key:
@@ -42,7 +134,8 @@ class EmailService:
         html_content: str,
         text_content: Optional[str] = None,
         cc: Optional[List[str]] = None,
-        bcc: Optional[List[str]] = None
+        bcc: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None
     ) -> bool:
         """
         Send an email using Resend HTTP API.
@@ -54,6 +147,8 @@ class EmailService:
             text_content: Plain text content (fallback) - optional for Resend
             cc: List of CC recipients
             bcc: List of BCC recipients
+            idempotency_key: Forwarded to Resend so a retried send of the
+                same logical email is delivered at most once
 
         Returns:
             bool: True if email was sent successfully, False otherwise
@@ -86,7 +181,10 @@ class EmailService:
                 params["bcc"] = bcc
 
             # Send email via Resend HTTP API
-            response = resend.Emails.send(params)
+            if idempotency_key:
+                response = resend.Emails.send(params, {"idempotency_key": idempotency_key})
+            else:
+                response = resend.Emails.send(params)
 
             # Resend returns an object with 'id' on success
             if response and hasattr(response, 'get') and response.get('id'):
@@ -100,7 +198,12 @@ class EmailService:
             logger.error(f"Failed to send email to {to_email}: {str(e)}")
             return False
 
-    def send_welcome_email(self, user_email: str, user_name: str) -> bool:
+    def send_welcome_email(
+        self,
+        user_email: str,
+        user_name: str,
+        idempotency_key: Optional[str] = None
+    ) -> bool:
         """Send welcome email to new user."""
         subject = "Welcome to Resume Builder!"
 
@@ -121,7 +224,10 @@ Best regards,
 Resume Builder Team
         """
 
-        return self.send_email(user_email, subject, html_content, text_content)
+        return self.send_email(
+            user_email, subject, html_content, text_content,
+            idempotency_key=idempotency_key
+        )
 
     def send_payment_success_email(
         self,
@@ -131,7 +237,8 @@ Resume Builder Team
         amount: int,
         duration_months: int,
         payment_id: str,
-        recurring: bool = False
+        recurring: bool = False,
+        idempotency_key: Optional[str] = None
     ) -> bool:
         """Send payment confirmation email."""
         subject = f"Payment Successful - {plan.upper()} Plan Activated"
@@ -172,14 +279,18 @@ Best regards,
 Resume Builder Team
         """
 
-        return self.send_email(user_email, subject, html_content, text_content)
+        return self.send_email(
+            user_email, subject, html_content, text_content,
+            idempotency_key=idempotency_key
+        )
 
     def send_subscription_activated_email(
         self,
         user_email: str,
         user_name: str,
         plan: str,
-        next_billing_date: str
+        next_billing_date: str,
+        idempotency_key: Optional[str] = None
     ) -> bool:
         """Send subscription activation email."""
         subject = f"Subscription Activated - {plan.upper()} Plan"
@@ -206,7 +317,10 @@ Best regards,
 Resume Builder Team
         """
 
-        return self.send_email(user_email, subject, html_content, text_content)
+        return self.send_email(
+            user_email, subject, html_content, text_content,
+            idempotency_key=idempotency_key
+        )
 
     def send_renewal_reminder_email(
         self,
@@ -214,7 +328,8 @@ Resume Builder Team
         user_name: str,
         plan: str,
         amount: int,
-        billing_date: str
+        billing_date: str,
+        idempotency_key: Optional[str] = None
     ) -> bool:
         """Send subscription renewal reminder."""
         subject = f"Upcoming Renewal - {plan.upper()} Plan"
@@ -245,7 +360,10 @@ Best regards,
 Resume Builder Team
         """
 
-        return self.send_email(user_email, subject, html_content, text_content)
+        return self.send_email(
+            user_email, subject, html_content, text_content,
+            idempotency_key=idempotency_key
+        )
 
     def send_payment_failed_email(
         self,
@@ -253,7 +371,8 @@ Resume Builder Team
         user_name: str,
         plan: str,
         amount: int,
-        retry_date: Optional[str] = None
+        retry_date: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> bool:
         """Send payment failure notification."""
         subject = "Payment Failed - Action Required"
@@ -287,14 +406,18 @@ Best regards,
 Resume Builder Team
         """
 
-        return self.send_email(user_email, subject, html_content, text_content)
+        return self.send_email(
+            user_email, subject, html_content, text_content,
+            idempotency_key=idempotency_key
+        )
 
     def send_subscription_cancelled_email(
         self,
         user_email: str,
         user_name: str,
         plan: str,
-        expiry_date: str
+        expiry_date: str,
+        idempotency_key: Optional[str] = None
     ) -> bool:
         """Send subscription cancellation confirmation."""
         subject = "Subscription Cancelled"
@@ -324,13 +447,17 @@ Best regards,
 Resume Builder Team
         """
 
-        return self.send_email(user_email, subject, html_content, text_content)
+        return self.send_email(
+            user_email, subject, html_content, text_content,
+            idempotency_key=idempotency_key
+        )
 
     def send_password_reset_email(
         self,
         user_email: str,
         user_name: str,
-        reset_token: str
+        reset_token: str,
+        idempotency_key: Optional[str] = None
     ) -> bool:
         """Send password reset email."""
         subject = "Reset Your Password"
@@ -358,12 +485,18 @@ Best regards,
 Resume Builder Team
         """
 
-        return self.send_email(user_email, subject, html_content, text_content)
+        return self.send_email(
+            user_email, subject, html_content, text_content,
+            idempotency_key=idempotency_key
+        )
 
     def _load_template(self, template_name: str, variables: dict) -> str:
         """
         Load an email template and replace variables.
 
+        Templates are parsed once and cached (see `template_cache`); edits
+        on disk are picked up via the file mtime.
+
         Args:
             template_name: Name of the template file
             variables: Dictionary of variables to replace in template
@@ -371,22 +504,20 @@ Resume Builder Team
         Returns:
             str: Rendered HTML content
         """
-        template_path = self.template_dir / template_name
+        template_path = os.path.join(self._template_dir_str, template_name)
 
-        # If template doesn't exist, return a simple HTML version
-        if not template_path.exists():
+        try:
+            template = template_cache.get(template_path)
+        except FileNotFoundError:
+            # If template doesn't exist, return a simple HTML version
             logger.warning(f"Template {template_name} not found, using inline HTML")
             return self._generate_inline_html(template_name, variables)
+        except Exception as e:
+            logger.error(f"Failed to load template {template_name}: {str(e)}")
+            return self._generate_inline_html(template_name, variables)
 
         try:
-            with open(template_path, 'r') as f:
-                template = f.read()
-
-            # Simple template variable replacement
-            for key, value in variables.items():
-                template = template.replace(f"{{{{{key}}}}}", str(value))
-
-            return template
+            return template.render(variables)
 
         except Exception as e:
             logger.error(f"Failed to load template {template_name}: {str(e)}")
@@ -17,12 +17,16 @@ Docs: https://developers.google.com/search/apis/indexing-api/v3/quickstart
 
 import json
 import logging
-from datetime import datetime
+import re
+import threading
+import uuid
+from datetime import datetime, timedelta
 from typing import Optional
 
 import httpx
 
 from app.config import get_settings
+from app.services.http_clients import http_clients
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -32,11 +36,22 @@ INDEXING_API_URL = (
 )
 INDEXING_SCOPE = "https://www.googleapis.com/auth/indexing"
 
+# Batch endpoint: up to 100 publish calls in one multipart/mixed request
+BATCH_URL      = "https://indexing.googleapis.com/batch"
+BATCH_PATH     = "/v3/urlNotifications:publish"
+BATCH_MAX_URLS = 100
+
 # Google OAuth2 token endpoint
 TOKEN_URL = "https://oauth2.googleapis.com/token"
 
+# Refresh the cached token this long before Google says it expires
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Used when google-auth doesn't report an expiry (tokens last 60 min)
+DEFAULT_TOKEN_LIFETIME = timedelta(minutes=55)
 
-def _get_access_token(service_account_json: str) -> Optional[str]:
+
+def _get_access_token(service_account_json: str) -> tuple[Optional[str], Optional[datetime]]:
     """
     Exchange a service-account JSON key for a short-lived Bearer token.
 
@@ -44,7 +59,7 @@ def _get_access_token(service_account_json: str) -> Optional[str]:
     an access token via the OAuth2 token endpoint.  No extra dependencies
     beyond google-auth (already in requirements.txt).
 
-    Returns the access token string, or None on error.
+    Returns (access token, expiry as naive UTC), or (None, None) on error.
     """
     try:
         from google.oauth2 import service_account
@@ -56,10 +71,73 @@ def _get_access_token(service_account_json: str) -> Optional[str]:
             scopes=[INDEXING_SCOPE],
         )
         creds.refresh(GoogleRequest())
-        return creds.token
+        return creds.token, creds.expiry
     except Exception as exc:
         logger.error(f"Google auth token fetch failed: {exc}")
-        return None
+        return None, None
+
+
+def _build_batch_body(
+    urls: list[str],
+    url_type: str,
+    boundary: str,
+) -> str:
+    """Build a multipart/mixed batch body with one publish call per URL."""
+    parts = []
+    for i, url in enumerate(urls):
+        payload = json.dumps({"url": url, "type": url_type})
+        parts.append(
+            f"--{boundary}\r\n"
+            f"Content-Type: application/http\r\n"
+            f"Content-ID: <item{i}>\r\n"
+            f"\r\n"
+            f"POST {BATCH_PATH}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"\r\n"
+            f"{payload}\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n")
+    return "".join(parts)
+
+
+def _parse_batch_response(content_type: str, text: str) -> dict[int, tuple[int, str]]:
+    """
+    Split a multipart/mixed batch response into per-call results.
+
+    Returns { item index: (HTTP status, response body) }.
+    """
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        return {}
+    boundary = match.group(1)
+
+    results: dict[int, tuple[int, str]] = {}
+    for part in text.replace("\r\n", "\n").split(f"--{boundary}"):
+        cid    = re.search(r"Content-ID:\s*<response-item(\d+)>", part, re.IGNORECASE)
+        status = re.search(r"^HTTP/\d(?:\.\d)? (\d{3})", part, re.MULTILINE)
+        if not cid or not status:
+            continue
+        # part headers / embedded HTTP status line + headers / body
+        sections = part.strip("\n").split("\n\n", 2)
+        body = sections[2].strip() if len(sections) == 3 else ""
+        results[int(cid.group(1))] = (int(status.group(1)), body)
+    return results
+
+
+def _describe_result(status_code: int, body: str) -> tuple[bool, str]:
+    """Turn one publish response into (success, message)."""
+    if status_code == 200:
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            data = {}
+        notify_time = data.get("urlNotificationMetadata", {}).get(
+            "latestUpdate", {}).get("notifyTime", "")
+        return True, f"Google notified (notifyTime={notify_time})"
+
+    # 403 → service account not added as Search Console owner
+    # 429 → quota exceeded (200 URLs/day on free tier)
+    return False, f"HTTP {status_code}: {body[:300]}"
 
 
 class GoogleIndexingService:
@@ -73,31 +151,44 @@ class GoogleIndexingService:
     def __init__(self) -> None:
         self.sa_json  = settings.GOOGLE_INDEXING_SERVICE_ACCOUNT_JSON
         self.site_url = settings.SITE_URL.rstrip("/")
-        self._token:    Optional[str] = None
-        self._token_at: Optional[datetime] = None
+        self._token:        Optional[str] = None
+        self._token_expiry: Optional[datetime] = None
+        self._token_lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """The shared keep-alive client (one TLS handshake, not N); _client overrides it."""
+        return self._client or http_clients.sync_client("google_indexing")
 
     # ── Token management ───────────────────────────────────────────────────
 
     def _fresh_token(self) -> Optional[str]:
         """
-        Return a valid Bearer token, refreshing if older than 50 minutes.
-        (Google tokens last 60 min; we refresh 10 min early.)
+        Return a valid Bearer token from cache, refreshing it only when it is
+        within TOKEN_REFRESH_MARGIN of expiry. Thread-safe: concurrent
+        callers share one JWT exchange.
         """
         if not self.sa_json:
             return None
 
-        now = datetime.utcnow()
-        token_age_minutes = (
-            (now - self._token_at).total_seconds() / 60
-            if self._token_at
-            else 999
-        )
-
-        if self._token is None or token_age_minutes >= 50:
-            self._token    = _get_access_token(self.sa_json)
-            self._token_at = now
-
-        return self._token
+        with self._token_lock:
+            now = datetime.utcnow()
+            if (
+                self._token is None
+                or self._token_expiry is None
+                or now >= self._token_expiry - TOKEN_REFRESH_MARGIN
+            ):
+                token, expiry = _get_access_token(self.sa_json)
+                self._token        = token
+                self._token_expiry = (expiry or now + DEFAULT_TOKEN_LIFETIME) if token else None
+            return self._token
+
+    def _invalidate_token(self) -> None:
+        """Drop the cached token (e.g. after a 401)."""
+        with self._token_lock:
+            self._token        = None
+            self._token_expiry = None
 
     # ── Core submission ────────────────────────────────────────────────────
 
@@ -113,27 +204,21 @@ class GoogleIndexingService:
             return False, "Google Indexing API not configured or auth failed"
 
         try:
-            resp = httpx.post(
+            resp = self.client.post(
                 INDEXING_API_URL,
                 json={"url": url, "type": url_type},
                 headers={
                     "Authorization": f"Bearer {token}",
                     "Content-Type": "application/json",
                 },
-                timeout=15,
             )
+            if resp.status_code == 401:
+                self._invalidate_token()
 
-            if resp.status_code == 200:
-                data = resp.json()
-                notify_time = data.get("urlNotificationMetadata", {}).get(
-                    "latestUpdate", {}).get("notifyTime", "")
-                return True, f"Google notified (notifyTime={notify_time})"
-
-            # 403 → service account not added as Search Console owner
-            # 429 → quota exceeded (200 URLs/day on free tier)
-            msg = f"HTTP {resp.status_code}: {resp.text[:300]}"
-            logger.warning(f"Google Indexing API non-success for {url}: {msg}")
-            return False, msg
+            ok, msg = _describe_result(resp.status_code, resp.text)
+            if not ok:
+                logger.warning(f"Google Indexing API non-success for {url}: {msg}")
+            return ok, msg
 
         except httpx.TimeoutException:
             msg = "Google Indexing API request timed out"
@@ -144,6 +229,69 @@ class GoogleIndexingService:
             logger.error(msg)
             return False, msg
 
+    def _notify_batch(
+        self,
+        urls: list[str],
+        url_type: str = "URL_UPDATED",
+    ) -> dict[str, tuple[bool, str]]:
+        """
+        Notify Google about many URLs using multipart batch requests
+        (BATCH_MAX_URLS calls per HTTP round trip).
+
+        Returns { url: (success, message) }.
+        """
+        if not urls:
+            return {}
+
+        token = self._fresh_token()
+        if not token:
+            msg = "Google Indexing API not configured or auth failed"
+            return {url: (False, msg) for url in urls}
+
+        results: dict[str, tuple[bool, str]] = {}
+        for start in range(0, len(urls), BATCH_MAX_URLS):
+            chunk = urls[start:start + BATCH_MAX_URLS]
+            boundary = f"batch_{uuid.uuid4().hex}"
+            try:
+                resp = self.client.post(
+                    BATCH_URL,
+                    content=_build_batch_body(chunk, url_type, boundary),
+                    headers={
+                        "Authorization": f"Bearer {token}",
+                        "Content-Type": f"multipart/mixed; boundary={boundary}",
+                    },
+                    timeout=60,
+                )
+            except httpx.TimeoutException:
+                msg = "Google Indexing API batch request timed out"
+                logger.warning(msg)
+                results.update({url: (False, msg) for url in chunk})
+                continue
+            except Exception as exc:
+                msg = f"Google Indexing API batch request failed: {exc}"
+                logger.error(msg)
+                results.update({url: (False, msg) for url in chunk})
+                continue
+
+            if resp.status_code != 200:
+                if resp.status_code == 401:
+                    self._invalidate_token()
+                msg = f"HTTP {resp.status_code}: {resp.text[:300]}"
+                logger.warning(f"Google Indexing batch non-success: {msg}")
+                results.update({url: (False, msg) for url in chunk})
+                continue
+
+            parsed = _parse_batch_response(resp.headers.get("content-type", ""), resp.text)
+            for i, url in enumerate(chunk):
+                if i in parsed:
+                    results[url] = _describe_result(*parsed[i])
+                else:
+                    results[url] = (False, "Missing response in batch reply")
+
+        ok_count = sum(1 for ok, _ in results.values() if ok)
+        logger.info(f"Google Indexing batch: {ok_count}/{len(urls)} URLs notified")
+        return results
+
     # ── Public helpers ─────────────────────────────────────────────────────
 
     def submit_blog_post(self, slug: str) -> tuple[bool, str]:
@@ -152,6 +300,16 @@ class GoogleIndexingService:
         logger.info(f"Google Indexing: submitting {url}")
         return self._notify(url, "URL_UPDATED")
 
+    def submit_blog_posts(self, slugs: list[str]) -> dict[str, tuple[bool, str]]:
+        """
+        Notify Google about many blog posts in batched round trips.
+
+        Returns { slug: (success, message) }.
+        """
+        urls = {f"{self.site_url}/blog/{slug}": slug for slug in slugs}
+        results = self._notify_batch(list(urls), "URL_UPDATED")
+        return {urls[url]: outcome for url, outcome in results.items()}
+
     def delete_url(self, slug: str) -> tuple[bool, str]:
         """Notify Google that a blog post was removed."""
         url = f"{self.site_url}/blog/{slug}"
@@ -187,8 +345,9 @@ class GoogleIndexingService:
         errors: list[str] = []
         now = datetime.utcnow()
 
+        results = self.submit_blog_posts([post.slug for post in posts])
         for post in posts:
-            ok, msg = self.submit_blog_post(post.slug)
+            ok, msg = results[post.slug]
             if ok:
                 post.google_submitted    = True
                 post.google_submitted_at = now
@@ -0,0 +1,219 @@
+"""
+Shared, pooled HTTP clients for the upstream APIs we call.
+
+The jobs routes and DodoService opened a fresh httpx.AsyncClient for every
+request, so each Adzuna / Remotive / Dodo call paid DNS, TCP and TLS setup
+(plus building an SSL context) before sending a byte. Here every upstream
+gets one long-lived client with its own keep-alive pool, timeouts and
+limits (UPSTREAMS):
+
+  * async clients (jobs, Dodo) and sync clients (IndexNow, Google
+    Indexing, ISR revalidation — called from worker threads) are created
+    in main.lifespan and closed on shutdown; outside the app (scripts,
+    tests) they are created on first use
+  * idle connections are kept for KEEPALIVE_EXPIRY seconds rather than
+    httpx's default 5, so sparse traffic still reuses them
+  * all clients share one SSL context
+  * every request is metered per upstream — requests, errors (transport
+    failures and 5xx), TCP connections opened, and time to response
+    headers (p50 / p95 over the last TIMING_WINDOW requests); stats() is
+    reported on /health
+
+benchmarks/bench_http_clients.py compares a client per request with the
+pooled client against a local server.
+"""
+
+import logging
+import ssl
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT  = 5.0   # seconds to establish a connection, for every upstream
+KEEPALIVE_EXPIRY = 60.0  # seconds an idle connection stays in the pool
+TIMING_WINDOW    = 500   # most recent requests the latency percentiles cover
+
+
+class Upstream:
+    """Pool settings for one upstream API."""
+
+    def __init__(self, timeout: float, max_connections: int, max_keepalive: int, is_async: bool = False) -> None:
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.is_async = is_async
+
+
+UPSTREAMS: Dict[str, Upstream] = {
+    "adzuna":          Upstream(timeout=15, max_connections=20, max_keepalive=10, is_async=True),
+    "remotive":        Upstream(timeout=15, max_connections=20, max_keepalive=10, is_async=True),
+    "dodo":            Upstream(timeout=30, max_connections=10, max_keepalive=5, is_async=True),
+    # Sized for indexnow_service.REINDEX_CONCURRENCY (4) parallel submissions
+    "indexnow":        Upstream(timeout=15, max_connections=8, max_keepalive=4),
+    "google_indexing": Upstream(timeout=15, max_connections=10, max_keepalive=5),
+    "revalidation":    Upstream(timeout=10, max_connections=4, max_keepalive=2),
+}
+
+
+class _UpstreamStats:
+    """Request counters and recent timings for one upstream."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.connections = 0
+        self.timings: deque[float] = deque(maxlen=TIMING_WINDOW)
+
+    def connected(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def record(self, seconds: float, error: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += error
+            self.timings.append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            timings = sorted(self.timings)
+            requests, errors, connections = self.requests, self.errors, self.connections
+
+        def percentile(p: float) -> Optional[float]:
+            if not timings:
+                return None
+            return round(timings[min(len(timings) - 1, int(p * len(timings)))] * 1000, 1)
+
+        return {
+            "requests": requests,
+            "errors": errors,
+            "connections_opened": connections,
+            "reused": max(requests - connections, 0),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+        }
+
+
+def _tcp_connected(event_name: str) -> bool:
+    return event_name == "connection.connect_tcp.complete"
+
+
+class _MeteredTransport(httpx.HTTPTransport):
+    def __init__(self, stats: _UpstreamStats, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._stats = stats
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        def trace(event_name: str, info: dict) -> None:
+            if _tcp_connected(event_name):
+                self._stats.connected()
+
+        request.extensions["trace"] = trace
+        started = time.perf_counter()
+        try:
+            response = super().handle_request(request)
+        except Exception:
+            self._stats.record(time.perf_counter() - started, error=True)
+            raise
+        self._stats.record(time.perf_counter() - started, error=response.status_code >= 500)
+        return response
+
+
+class _AsyncMeteredTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, stats: _UpstreamStats, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async def trace(event_name: str, info: dict) -> None:
+            if _tcp_connected(event_name):
+                self._stats.connected()
+
+        request.extensions["trace"] = trace
+        started = time.perf_counter()
+        try:
+            response = await super().handle_async_request(request)
+        except Exception:
+            self._stats.record(time.perf_counter() - started, error=True)
+            raise
+        self._stats.record(time.perf_counter() - started, error=response.status_code >= 500)
+        return response
+
+
+def build_client(upstream: Upstream, stats: _UpstreamStats, verify: ssl.SSLContext):
+    """A metered httpx.Client or httpx.AsyncClient configured for `upstream`."""
+    transport_options = dict(
+        verify=verify,
+        limits=httpx.Limits(
+            max_connections=upstream.max_connections,
+            max_keepalive_connections=upstream.max_keepalive,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+    timeout = httpx.Timeout(upstream.timeout, connect=min(CONNECT_TIMEOUT, upstream.timeout))
+    if upstream.is_async:
+        return httpx.AsyncClient(transport=_AsyncMeteredTransport(stats, **transport_options), timeout=timeout)
+    return httpx.Client(transport=_MeteredTransport(stats, **transport_options), timeout=timeout)
+
+
+class HTTPClients:
+    """One keep-alive client per upstream, shared by the whole process."""
+
+    def __init__(self, upstreams: Optional[Dict[str, Upstream]] = None) -> None:
+        self.upstreams = upstreams if upstreams is not None else UPSTREAMS
+        self._clients: Dict[str, httpx.Client | httpx.AsyncClient] = {}
+        self._stats = {name: _UpstreamStats() for name in self.upstreams}
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._lock = threading.Lock()
+
+    def _client(self, name: str):
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+        with self._lock:
+            if name not in self._clients:
+                if self._ssl_context is None:
+                    self._ssl_context = httpx.create_ssl_context()
+                self._clients[name] = build_client(self.upstreams[name], self._stats[name], self._ssl_context)
+            return self._clients[name]
+
+    def async_client(self, name: str) -> httpx.AsyncClient:
+        if not self.upstreams[name].is_async:
+            raise ValueError(f"Upstream {name!r} has a sync client")
+        return self._client(name)
+
+    def sync_client(self, name: str) -> httpx.Client:
+        if self.upstreams[name].is_async:
+            raise ValueError(f"Upstream {name!r} has an async client")
+        return self._client(name)
+
+    def start(self) -> None:
+        """Create every client up front (called from main.lifespan)."""
+        for name in self.upstreams:
+            self._client(name)
+        logger.info(f"HTTP clients ready for {len(self.upstreams)} upstreams")
+
+    async def aclose(self) -> None:
+        """Close all clients; later calls get fresh ones."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                if isinstance(client, httpx.AsyncClient):
+                    await client.aclose()
+                else:
+                    client.close()
+            except Exception as e:
+                logger.warning(f"Closing HTTP client for {name} failed: {e}")
+
+    def stats(self) -> dict:
+        return {name: stats.snapshot() for name, stats in self._stats.items()}
+
+
+http_clients = HTTPClients()
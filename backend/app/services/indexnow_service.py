@@ -13,12 +13,15 @@ Docs: https://www.indexnow.org/documentation
 """
 
 import logging
-from typing import Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 import httpx
 
 from app.config import get_settings
+from app.services.http_clients import http_clients
 from app.models.blog import BlogPost
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -27,6 +30,12 @@ settings = get_settings()
 
 INDEXNOW_ENDPOINT = "https://api.indexnow.org/indexnow"
 
+# IndexNow spec: at most 10 000 URLs per POST
+MAX_URLS_PER_REQUEST = 10_000
+
+# Chunked POSTs in flight at once during a full reindex
+REINDEX_CONCURRENCY = 4
+
 
 class IndexNowService:
     """
@@ -41,6 +50,12 @@ class IndexNowService:
         self.site_url = settings.SITE_URL.rstrip("/")
         # Key file must be publicly accessible at {site_url}/{api_key}.txt
         self.key_location = f"{self.site_url}/{self.api_key}.txt" if self.api_key else None
+        self._client: Optional[httpx.Client] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """The shared keep-alive client, sized for REINDEX_CONCURRENCY; _client overrides it."""
+        return self._client or http_clients.sync_client("indexnow")
 
     # ── Low-level HTTP call ────────────────────────────────────────────────
 
@@ -63,11 +78,10 @@ class IndexNowService:
         }
 
         try:
-            resp = httpx.post(
+            resp = self.client.post(
                 INDEXNOW_ENDPOINT,
                 json=payload,
                 headers={"Content-Type": "application/json; charset=utf-8"},
-                timeout=15,
             )
 
             # IndexNow returns 200 (already known) or 202 (accepted) on success
@@ -96,10 +110,166 @@ class IndexNowService:
         return self._post([url])
 
     def submit_urls(self, urls: list[str]) -> tuple[bool, str]:
-        """Submit an arbitrary list of URLs (max 10 000 per IndexNow spec)."""
+        """
+        Submit an arbitrary list of URLs, split into POSTs of at most
+        MAX_URLS_PER_REQUEST (IndexNow spec limit).
+        """
         if not urls:
             return True, "no URLs to submit"
-        return self._post(urls)
+        if len(urls) <= MAX_URLS_PER_REQUEST:
+            return self._post(urls)
+
+        messages = []
+        for start in range(0, len(urls), MAX_URLS_PER_REQUEST):
+            ok, msg = self._post(urls[start:start + MAX_URLS_PER_REQUEST])
+            if not ok:
+                return False, msg
+            messages.append(msg)
+        return True, "; ".join(messages)
+
+    def submit_url_chunks(
+        self,
+        chunks: Iterable[tuple[Any, list[str]]],
+        on_result: Callable[[Any, bool, str], None],
+        concurrency: int = REINDEX_CONCURRENCY,
+    ) -> None:
+        """
+        POST a stream of URL chunks concurrently.
+
+        `chunks` yields (tag, urls) pairs with at most MAX_URLS_PER_REQUEST
+        URLs each; `on_result(tag, ok, message)` is called on the calling
+        thread as each POST finishes. At most `concurrency` chunks are held
+        in memory at once — the iterator is only advanced when a slot frees
+        up — so a lazily-produced stream stays memory-flat.
+        """
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="indexnow") as pool:
+            in_flight: dict = {}
+
+            def _drain() -> None:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tag = in_flight.pop(future)
+                    try:
+                        ok, msg = future.result()
+                    except Exception as exc:
+                        ok, msg = False, f"IndexNow request failed: {exc}"
+                    on_result(tag, ok, msg)
+
+            chunk_iter = iter(chunks)
+            while True:
+                # Free a slot *before* pulling the next chunk from the stream
+                if len(in_flight) >= concurrency:
+                    _drain()
+                try:
+                    tag, urls = next(chunk_iter)
+                except StopIteration:
+                    break
+                in_flight[pool.submit(self._post, urls)] = tag
+
+            while in_flight:
+                _drain()
+
+    # ── DB helper: full reindex ────────────────────────────────────────────
+
+    def _published_slug_chunks(
+        self,
+        db: Session,
+        chunk_size: int,
+    ) -> Iterator[tuple[list[int], list[str]]]:
+        """
+        Stream (post ids, URLs) for all published posts, `chunk_size` at a
+        time. Selects only id + slug (never the HTML body) and uses a
+        server-side cursor, so memory does not grow with the table.
+        """
+        stmt = (
+            select(BlogPost.id, BlogPost.slug)
+            .where(BlogPost.status == "published")
+            .order_by(BlogPost.published_at.desc())
+            .execution_options(yield_per=chunk_size)
+        )
+        for rows in db.execute(stmt).partitions():
+            yield (
+                [row.id for row in rows],
+                [f"{self.site_url}/blog/{row.slug}" for row in rows],
+            )
+
+    def reindex_published_posts(
+        self,
+        db: Session,
+        static_urls: Optional[list[str]] = None,
+        chunk_size: int = MAX_URLS_PER_REQUEST,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> dict:
+        """
+        Submit every published post (plus `static_urls`) to IndexNow.
+
+        Slugs are streamed from the DB in chunks, chunks are POSTed
+        concurrently, and `indexnow_submitted` is bulk-updated and committed
+        per successful chunk on a separate session (committing on `db`
+        would close the streaming cursor). `on_progress(done, total)` is
+        called with the number of blog URLs processed so far.
+
+        Returns { ok, total_urls, static_pages, blog_posts, chunks,
+        failed_chunks, errors }.
+        """
+        static_urls = static_urls or []
+        chunk_size = max(1, min(chunk_size, MAX_URLS_PER_REQUEST))
+        total = (
+            db.query(BlogPost.id).filter(BlogPost.status == "published").count()
+        )
+
+        stats = {"blog_posts": 0, "chunks": 0, "failed_chunks": 0}
+        errors: list[str] = []
+        done = 0
+
+        def chunks() -> Iterator[tuple[Any, list[str]]]:
+            if static_urls:
+                yield None, static_urls
+            for ids, urls in self._published_slug_chunks(db, chunk_size):
+                yield ids, urls
+
+        with Session(bind=db.get_bind()) as writer:
+
+            def on_result(ids: Optional[list[int]], ok: bool, msg: str) -> None:
+                nonlocal done
+                stats["chunks"] += 1
+                if not ok:
+                    stats["failed_chunks"] += 1
+                    errors.append(msg)
+                if ids is None:
+                    return  # static pages — nothing to record
+
+                if ok:
+                    writer.execute(
+                        update(BlogPost)
+                        .where(BlogPost.id.in_(ids))
+                        .values(
+                            indexnow_submitted=True,
+                            indexnow_submitted_at=datetime.utcnow(),
+                        )
+                    )
+                    writer.commit()
+                    stats["blog_posts"] += len(ids)
+                done += len(ids)
+                if on_progress:
+                    on_progress(done, total)
+
+            self.submit_url_chunks(chunks(), on_result)
+
+        logger.info(
+            f"IndexNow reindex: {stats['blog_posts']}/{total} posts + "
+            f"{len(static_urls)} static URLs in {stats['chunks']} chunk(s), "
+            f"{stats['failed_chunks']} failed"
+        )
+        return {
+            "ok":            stats["failed_chunks"] == 0,
+            "total_urls":    total + len(static_urls),
+            "static_pages":  len(static_urls),
+            "blog_posts":    stats["blog_posts"],
+            "chunks":        stats["chunks"],
+            "failed_chunks": stats["failed_chunks"],
+            "errors":        errors,
+        }
 
     # ── DB helper: mark posts submitted ───────────────────────────────────
 
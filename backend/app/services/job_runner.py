@@ -0,0 +1,428 @@
+"""
+Background job runner.
+
+Long cron endpoints (blog generation, IndexNow re-submission, keyword
+seeding, drip campaigns) no longer do their work inside the HTTP request.
+Instead they call `job_runner.enqueue()`, return the job id with 202, and
+the runner executes the registered handler afterwards:
+
+  1. pick the oldest queued job (FOR UPDATE SKIP LOCKED)
+  2. take a lock on the job's lock key — a Postgres session-level advisory
+     lock on a dedicated connection, so the job never runs twice at once
+     across API replicas (process-local lock on other databases)
+  3. run the handler with a fresh Session and a JobContext for progress
+  4. store the result or error, release the lock
+
+Only one queued-or-running job may exist per lock key (partial unique
+index), so a cron that fires while the previous run is still going gets
+the existing job id back instead of starting a second run.
+
+If a worker dies mid-job its advisory lock disappears with its connection;
+the next claimer finds the row still 'running' but the lock free and
+restarts it (up to JOB_MAX_ATTEMPTS).
+
+Progress is readable via GET /api/cron/jobs/{job_id}.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.background_job import BackgroundJob
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Statuses that hold the per-lock-key slot
+ACTIVE_STATUSES = ("queued", "running")
+
+# How many active rows one claim looks at before giving up
+CLAIM_SCAN_LIMIT = 20
+
+
+# ── Locking ────────────────────────────────────────────────────────────────
+
+_local_locks: dict[str, threading.Lock] = {}
+_local_locks_guard = threading.Lock()
+
+
+def _advisory_lock_id(lock_key: str) -> int:
+    """Map a lock key to a signed 64-bit advisory lock id."""
+    digest = hashlib.sha256(f"job:{lock_key}".encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class JobLock:
+    """
+    Non-blocking mutex for one lock key.
+
+    On Postgres this is a session-level advisory lock held on its own pooled
+    connection for the duration of the job; the lock is released explicitly
+    or, if the process dies, when the server drops the connection. Other
+    databases (SQLite in tests) fall back to a process-local lock.
+    """
+
+    def __init__(self, bind, lock_key: str) -> None:
+        self.bind = bind
+        self.lock_key = lock_key
+        self._conn = None
+        self._local: Optional[threading.Lock] = None
+
+    def acquire(self) -> bool:
+        if self.bind.dialect.name == "postgresql":
+            conn = self.bind.connect()
+            try:
+                got = conn.execute(
+                    text("SELECT pg_try_advisory_lock(:id)"),
+                    {"id": _advisory_lock_id(self.lock_key)},
+                ).scalar()
+                conn.commit()
+            except Exception:
+                conn.close()
+                raise
+            if not got:
+                conn.close()
+                return False
+            self._conn = conn
+            return True
+
+        with _local_locks_guard:
+            lock = _local_locks.setdefault(self.lock_key, threading.Lock())
+        if not lock.acquire(blocking=False):
+            return False
+        self._local = lock
+        return True
+
+    def release(self) -> None:
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            try:
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:id)"),
+                    {"id": _advisory_lock_id(self.lock_key)},
+                )
+                conn.commit()
+                conn.close()
+            except Exception as exc:
+                # Dropping the connection releases every lock it holds
+                logger.warning(f"Advisory unlock failed for '{self.lock_key}': {exc}")
+                conn.invalidate()
+                conn.close()
+        if self._local is not None:
+            self._local.release()
+            self._local = None
+
+
+# ── Progress reporting ─────────────────────────────────────────────────────
+
+class JobContext:
+    """Handed to job handlers so they can report progress."""
+
+    def __init__(self, runner: "JobRunner", job_id: str) -> None:
+        self.runner = runner
+        self.job_id = job_id
+        self._last: Optional[tuple[int, Optional[str]]] = None
+
+    def progress(self, percent: float, message: Optional[str] = None) -> None:
+        """
+        Record completion percentage (0-100) and an optional step message.
+
+        Written through a short-lived session so it is visible immediately,
+        independent of the handler's own transaction. Repeated identical
+        updates are skipped, so handlers may call this from tight loops.
+        """
+        percent = max(0, min(100, int(percent)))
+        if self._last == (percent, message):
+            return
+        self._last = (percent, message)
+
+        values: dict[str, Any] = {"progress": percent, "heartbeat_at": datetime.utcnow()}
+        if message is not None:
+            values["message"] = message[:255]
+
+        db = self.runner.session_factory()
+        try:
+            db.query(BackgroundJob).filter(BackgroundJob.id == self.job_id).update(
+                values, synchronize_session=False
+            )
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            logger.warning(f"Progress update for job {self.job_id} failed: {exc}")
+        finally:
+            db.close()
+
+
+JobHandler = Callable[[Session, dict, JobContext], Optional[dict]]
+
+
+# ── Runner ─────────────────────────────────────────────────────────────────
+
+class JobRunner:
+    """Enqueues, locks and executes background jobs."""
+
+    def __init__(self, session_factory=None) -> None:
+        self._session_factory = session_factory
+        self.handlers: dict[str, JobHandler] = {}
+        self.max_attempts = settings.JOB_MAX_ATTEMPTS
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def session_factory(self):
+        if self._session_factory is None:
+            from app.database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory
+
+    def register(self, job_type: str) -> Callable[[JobHandler], JobHandler]:
+        """
+        Decorator registering `handler(db, params, ctx) -> dict` for a job type.
+
+        The return value is stored as the job result and must be JSON-serializable.
+        """
+        def decorator(handler: JobHandler) -> JobHandler:
+            self.handlers[job_type] = handler
+            return handler
+        return decorator
+
+    # ── Enqueueing ─────────────────────────────────────────────────────────
+
+    def enqueue(
+        self,
+        db: Session,
+        job_type: str,
+        params: Optional[dict] = None,
+        lock_key: Optional[str] = None,
+    ) -> tuple[BackgroundJob, bool]:
+        """
+        Queue a job and commit.
+
+        Args:
+            db: Database session of the current request
+            job_type: Registered handler name
+            params: Keyword arguments for the handler (JSON-serializable)
+            lock_key: Mutual-exclusion key; defaults to job_type
+
+        Returns:
+            tuple: (job, created) — created is False when an active job with
+            the same lock key already existed and was returned instead
+
+        Raises:
+            ValueError: If job_type has no registered handler
+        """
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+        lock_key = lock_key or job_type
+
+        existing = self._active_job(db, lock_key)
+        if existing:
+            logger.info(f"Job '{lock_key}' already {existing.status} as {existing.id}")
+            return existing, False
+
+        job = BackgroundJob(
+            id       = str(uuid.uuid4()),
+            job_type = job_type,
+            lock_key = lock_key,
+            params   = json.loads(json.dumps(params or {}, default=str)),
+            status   = "queued",
+            progress = 0,
+            attempts = 0,
+        )
+        db.add(job)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another replica queued the same lock key in the meantime
+            db.rollback()
+            existing = self._active_job(db, lock_key)
+            if existing:
+                return existing, False
+            raise
+
+        logger.info(f"Queued job {job.id} ({job_type})")
+        return job, True
+
+    def get(self, db: Session, job_id: str) -> Optional[BackgroundJob]:
+        return db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+
+    def _active_job(self, db: Session, lock_key: str) -> Optional[BackgroundJob]:
+        return (
+            db.query(BackgroundJob)
+            .filter(
+                BackgroundJob.lock_key == lock_key,
+                BackgroundJob.status.in_(ACTIVE_STATUSES),
+            )
+            .first()
+        )
+
+    # ── Execution ──────────────────────────────────────────────────────────
+
+    def run_next(self) -> bool:
+        """
+        Claim and run one job synchronously.
+
+        Returns:
+            bool: True if a job was run, False if nothing was runnable
+        """
+        db = self.session_factory()
+        lock: Optional[JobLock] = None
+        try:
+            job, lock = self._claim(db)
+            if job is None:
+                return False
+            self._execute(db, job)
+            return True
+        finally:
+            if lock is not None:
+                lock.release()
+            db.close()
+
+    def run_pending(self) -> int:
+        """Run jobs until none are runnable. Returns how many ran."""
+        ran = 0
+        while self.run_next():
+            ran += 1
+        return ran
+
+    def _claim(self, db: Session) -> tuple[Optional[BackgroundJob], Optional[JobLock]]:
+        """Pick the oldest job whose lock key is free and mark it running."""
+        candidates = (
+            db.query(BackgroundJob)
+            .filter(BackgroundJob.status.in_(ACTIVE_STATUSES))
+            .order_by(BackgroundJob.created_at)
+            .limit(CLAIM_SCAN_LIMIT)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        bind = db.get_bind()
+
+        for job in candidates:
+            lock = JobLock(bind, job.lock_key)
+            if not lock.acquire():
+                continue  # running elsewhere
+
+            now = datetime.utcnow()
+            if job.status == "running":
+                # Running but nobody holds its lock: the worker died
+                logger.warning(
+                    f"Job {job.id} ({job.job_type}) lost its worker "
+                    f"after {job.attempts} attempt(s)"
+                )
+                if job.attempts >= self.max_attempts:
+                    job.status      = "failed"
+                    job.error       = "Worker stopped before the job finished"
+                    job.finished_at = now
+                    db.commit()
+                    lock.release()
+                    continue
+
+            job.status       = "running"
+            job.attempts     = (job.attempts or 0) + 1
+            job.started_at   = now
+            job.heartbeat_at = now
+            job.error        = None
+            db.commit()
+            return job, lock
+
+        db.commit()
+        return None, None
+
+    def _execute(self, db: Session, job: BackgroundJob) -> None:
+        """Run the job's handler and record its outcome."""
+        job_id, job_type = job.id, job.job_type
+        handler = self.handlers.get(job_type)
+        ctx = JobContext(self, job_id)
+        started = datetime.utcnow()
+        logger.info(f"Running job {job_id} ({job_type}), attempt {job.attempts}")
+
+        work_db = self.session_factory()
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job type '{job_type}'")
+            result = handler(work_db, dict(job.params or {}), ctx)
+            error = None
+        except Exception as exc:
+            work_db.rollback()
+            result, error = None, str(exc) or exc.__class__.__name__
+            logger.error(f"Job {job_id} ({job_type}) failed: {error}")
+        finally:
+            work_db.close()
+
+        job = self.get(db, job_id)
+        job.finished_at = datetime.utcnow()
+        if error is None:
+            job.status   = "succeeded"
+            job.progress = 100
+            job.result   = json.loads(json.dumps(result, default=str)) if result is not None else None
+        else:
+            job.status = "failed"
+            job.error  = error
+        db.commit()
+        logger.info(
+            f"Job {job_id} ({job_type}) {job.status} in "
+            f"{(job.finished_at - started).total_seconds():.1f}s"
+        )
+
+    # ── Background worker ──────────────────────────────────────────────────
+
+    def notify(self) -> None:
+        """Wake the worker so a freshly queued job starts right away."""
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # Event loop already closed (shutdown in progress)
+            pass
+
+    @property
+    def worker_running(self) -> bool:
+        return self._loop is not None
+
+    async def run_worker(
+        self,
+        concurrency: Optional[int] = None,
+        poll_seconds: Optional[int] = None,
+    ) -> None:
+        """Run jobs forever on `concurrency` threads; started from main.lifespan."""
+        slots = max(1, concurrency or settings.JOB_WORKER_CONCURRENCY)
+        poll = poll_seconds or settings.JOB_POLL_SECONDS
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        logger.info(f"Job worker started (slots={slots}, poll={poll}s)")
+
+        try:
+            await asyncio.gather(*(self._worker_slot(poll) for _ in range(slots)))
+        finally:
+            self._loop = None
+            self._wakeup = None
+            logger.info("Job worker stopped")
+
+    async def _worker_slot(self, poll: int) -> None:
+        while True:
+            try:
+                if await asyncio.to_thread(self.run_next):
+                    continue
+            except Exception as exc:
+                logger.error(f"Job worker iteration failed: {exc}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=poll)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+
+# Singleton instance
+job_runner = JobRunner()
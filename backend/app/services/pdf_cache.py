@@ -0,0 +1,157 @@
+"""
+Content-addressed cache of rendered resume PDFs.
+
+A PDF is fully determined by the normalized resume content, the template
+and the renderer code, so its cache key is
+
+    sha256(canonical JSON of content | template name | RENDERER_VERSION)
+
+Editing a resume, switching template or shipping template changes (bump
+pdf_service.RENDERER_VERSION) simply produces a new key — nothing is ever
+invalidated explicitly. The key doubles as a strong ETag, so a repeat
+download with If-None-Match is a 304 without touching the cache at all.
+
+Entries live on local disk (PDF_CACHE_DIR) under a size cap
+(PDF_CACHE_MAX_MB) with least-recently-used eviction; reads bump the
+file's mtime, which is what the LRU order is rebuilt from on startup.
+Several API processes may share the directory: each evicts by its own
+view of the LRU order, which is approximate but never serves wrong bytes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import get_settings
+from app.services.pdf_service import RENDERER_VERSION
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def pdf_cache_key(resume_content: Dict[str, Any], template_name: str) -> str:
+    """Hash of what a rendered PDF depends on."""
+    canonical = json.dumps(
+        resume_content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    digest = hashlib.sha256()
+    for part in (canonical, template_name, RENDERER_VERSION):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class PDFCache:
+    """Size-capped LRU of PDF bytes on local disk."""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+        self.directory = Path(
+            directory or settings.PDF_CACHE_DIR
+            or os.path.join(tempfile.gettempdir(), "resume-pdf-cache")
+        )
+        self.max_bytes = max_bytes if max_bytes is not None else settings.PDF_CACHE_MAX_MB * 1024 * 1024
+        self._entries: Optional[OrderedDict[str, int]] = None   # key → size, oldest first
+        self._total = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def _load_index(self) -> OrderedDict:
+        """Rebuild the LRU order from what's on disk (oldest mtime first)."""
+        if self._entries is None:
+            found = []
+            if self.directory.exists():
+                for path in self.directory.glob("*/*.pdf"):
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    found.append((stat.st_mtime, path.stem, stat.st_size))
+            found.sort()
+            self._entries = OrderedDict((key, size) for _, key, size in found)
+            self._total = sum(self._entries.values())
+        return self._entries
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached PDF bytes for `key`, or None."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # LRU bump that survives restarts
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+                entries = self._load_index()
+                if key in entries:
+                    self._total -= entries.pop(key)  # evicted by another process
+            return None
+
+        with self._lock:
+            self.hits += 1
+            entries = self._load_index()
+            if key in entries:
+                entries.move_to_end(key)
+            else:
+                entries[key] = len(data)
+                self._total += len(data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store PDF bytes, evicting least recently used entries over the cap."""
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+        with self._lock:
+            entries = self._load_index()
+            self._total += len(data) - entries.pop(key, 0)
+            entries[key] = len(data)
+            evicted = 0
+            while self._total > self.max_bytes and len(entries) > 1:
+                old_key, size = entries.popitem(last=False)
+                self._total -= size
+                try:
+                    self._path(old_key).unlink()
+                except FileNotFoundError:
+                    pass
+                evicted += 1
+        if evicted:
+            logger.info(f"PDF cache evicted {evicted} entr{'y' if evicted == 1 else 'ies'}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._load_index()
+            return {
+                "entries":   len(entries),
+                "bytes":     self._total,
+                "max_bytes": self.max_bytes,
+                "hits":      self.hits,
+                "misses":    self.misses,
+            }
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────
+
+pdf_cache = PDFCache()
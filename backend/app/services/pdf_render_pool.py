@@ -0,0 +1,240 @@
+"""
+Process pool for resume PDF rendering.
+
+ReportLab's doc.build() is pure-Python and CPU-bound: run inline in an
+async route it blocks the event loop for the whole render, and threads
+don't help because of the GIL. Renders are therefore dispatched to a
+ProcessPoolExecutor started in main.lifespan:
+
+  * workers are spawned and pre-warmed at startup — each imports the PDF
+    templates and renders a sample resume once, so the first real
+    download doesn't pay for imports, font metrics or style setup
+  * unless PDF_POOL_WORKERS is set, there is one worker per CPU this
+    process may run on, capped at PDF_POOL_AUTO_MAX_WORKERS — every API
+    process starts its own pool, so the host's core count would overcommit
+    memory in a container limited to a few CPUs
+  * admission is bounded at PDF_POOL_QUEUE_PER_WORKER renders per worker
+    (running + waiting); beyond that `render()` raises PDFPoolSaturated
+    and the route answers 503 with a Retry-After estimated from recent
+    render times
+  * each render's queue wait and render time are recorded; `stats()`
+    (exposed on /health) reports counts and p50 / p95
+
+Without a started pool (scripts, tests) renders run in the threadpool,
+which still keeps them off the event loop.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Render times kept for percentiles / Retry-After estimates
+TIMING_WINDOW = 500
+
+WARMUP_RESUME: Dict[str, Any] = {
+    "personalInfo": {"name": "Warm Up", "email": "warm@up.dev", "phone": "0", "location": "-"},
+    "summary": "Pre-warming the PDF renderer.",
+    "experience": [{"title": "Engineer", "company": "Acme", "duration": "2020 - 2024",
+                    "description": "Built things."}],
+    "education": [{"degree": "B.Tech", "institution": "IIT", "year": "2020"}],
+    "skills": ["Python", "SQL"],
+}
+
+
+class PDFPoolSaturated(Exception):
+    """Raised when the render queue is full; `retry_after` is in seconds."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"PDF render queue full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+# ── Worker-side functions (run in the pool processes) ──────────────────────
+
+def _init_worker() -> None:
+    """Import the templates and render every one of them once."""
+    from app.services.pdf_service import PDFService
+
+    for template_name in PDFService.TEMPLATES:
+        PDFService.generate_resume_pdf(WARMUP_RESUME, template_name)
+    logging.getLogger(__name__).info(f"PDF worker {os.getpid()} warmed up")
+
+
+def _render(resume_content: Dict[str, Any], template_name: str) -> tuple[bytes, float]:
+    """Render one resume; returns (pdf bytes, seconds spent rendering)."""
+    from app.services.pdf_service import PDFService
+
+    t0 = time.perf_counter()
+    pdf = PDFService.generate_resume_pdf(resume_content, template_name).getvalue()
+    return pdf, time.perf_counter() - t0
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _usable_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_workers() -> int:
+    """Pool size when PDF_POOL_WORKERS is 0."""
+    return max(1, min(_usable_cpus(), settings.PDF_POOL_AUTO_MAX_WORKERS))
+
+
+# ── Pool ───────────────────────────────────────────────────────────────────
+
+class PDFRenderPool:
+    """Bounded, pre-warmed process pool for PDF renders."""
+
+    def __init__(self) -> None:
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.workers = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._render_times: deque[float] = deque(maxlen=TIMING_WINDOW)
+        self._wait_times:   deque[float] = deque(maxlen=TIMING_WINDOW)
+        self.completed = 0
+        self.failed    = 0
+        self.rejected  = 0
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self, workers: Optional[int] = None, queue_per_worker: Optional[int] = None) -> None:
+        """Spawn and pre-warm the worker processes (blocking)."""
+        if self._executor is not None:
+            return
+        self.workers = workers or settings.PDF_POOL_WORKERS or default_workers()
+        self.max_in_flight = self.workers * (queue_per_worker or settings.PDF_POOL_QUEUE_PER_WORKER)
+
+        t0 = time.perf_counter()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # spawn: the API process runs threads (job worker, Redis), which
+            # fork() would copy mid-flight
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        # One task per worker forces every process to start (and warm up) now
+        pids = {f.result() for f in [self._executor.submit(_ping) for _ in range(self.workers)]}
+        logger.info(
+            f"PDF render pool ready: {len(pids)}/{self.workers} worker(s), "
+            f"max {self.max_in_flight} in flight, {time.perf_counter() - t0:.1f}s"
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _retry_after(self) -> int:
+        """Seconds until a slot frees up, from the recent median render time."""
+        typical = self._percentile(self._render_times, 0.5) or 1.0
+        return max(1, math.ceil(typical * self.max_in_flight / max(1, self.workers)))
+
+    async def render(self, resume_content: Dict[str, Any], template_name: str) -> bytes:
+        """
+        Render a resume PDF off the event loop and return its bytes.
+
+        Raises PDFPoolSaturated when the queue is full, ValueError for an
+        unknown template, and whatever the renderer raised otherwise.
+        """
+        if self._executor is None:
+            pdf, _ = await run_in_threadpool(_render, resume_content, template_name)
+            return pdf
+
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self.rejected += 1
+                raise PDFPoolSaturated(self._retry_after())
+            self._in_flight += 1
+
+        t0 = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            pdf, render_seconds = await loop.run_in_executor(
+                self._executor, _render, resume_content, template_name
+            )
+        except BrokenProcessPool:
+            # A worker died (OOM, segfault); replace the pool for later renders
+            logger.error("PDF render pool broken — restarting")
+            with self._lock:
+                self.failed += 1
+            self._restart()
+            raise
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        total = time.perf_counter() - t0
+        with self._lock:
+            self.completed += 1
+            self._render_times.append(render_seconds)
+            self._wait_times.append(max(0.0, total - render_seconds))
+        logger.info(
+            f"PDF rendered: template={template_name}, {len(pdf)}B, "
+            f"render={render_seconds * 1000:.0f}ms, wait={(total - render_seconds) * 1000:.0f}ms"
+        )
+        return pdf
+
+    def _restart(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        threading.Thread(target=self.start, args=(self.workers,), daemon=True).start()
+
+    @staticmethod
+    def _percentile(values, q: float) -> Optional[float]:
+        if not values:
+            return None
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def stats(self) -> dict:
+        """Counters and recent timing percentiles (milliseconds)."""
+        def ms(value: Optional[float]) -> Optional[float]:
+            return round(value * 1000, 1) if value is not None else None
+
+        with self._lock:
+            return {
+                "started":       self.started,
+                "workers":       self.workers,
+                "in_flight":     self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "completed":     self.completed,
+                "failed":        self.failed,
+                "rejected":      self.rejected,
+                "render_ms_p50": ms(self._percentile(self._render_times, 0.5)),
+                "render_ms_p95": ms(self._percentile(self._render_times, 0.95)),
+                "wait_ms_p50":   ms(self._percentile(self._wait_times, 0.5)),
+                "wait_ms_p95":   ms(self._percentile(self._wait_times, 0.95)),
+            }
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────
+
+pdf_render_pool = PDFRenderPool()
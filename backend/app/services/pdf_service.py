@@ -20,15 +20,130 @@ from reportlab.platypus import (
     KeepTogether,
 )
 from reportlab.pdfgen import canvas
+from collections import OrderedDict
 from io import BytesIO
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional
+import copy
+import hashlib
+import json
 import logging
+import threading
+
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Bump whenever template output changes (styles, layout, fonts) so cached
+# PDFs rendered by older code are no longer served (see pdf_cache)
+RENDERER_VERSION = "1"
+
+
+class ResumeParagraph(Paragraph):
+    """
+    Paragraph that memoizes its line breaks per wrap width.
+
+    breakLines() (word widths + line fitting) is the largest part of a
+    render, and KeepTogether wraps every child twice. The memo dict is
+    shared by shallow copies, so paragraphs cloned out of the section
+    cache skip line breaking entirely.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._line_breaks: Dict[Any, Any] = {}
+
+    def breakLines(self, width):
+        key = tuple(width) if isinstance(width, (list, tuple)) else width
+        lines = self._line_breaks.get(key)
+        if lines is None:
+            lines = self._line_breaks[key] = super().breakLines(width)
+        return lines
+
+
+class SectionFlowableCache:
+    """
+    LRU of built flowables per (template, section, section content).
+
+    While editing, a re-download usually differs from the last one in a
+    single section; the others are served from here instead of being
+    re-parsed into Paragraphs. doc.build() stores layout state (wrap
+    sizes, line breaks) on the flowables it is given, so a hit returns
+    shallow clones and the cached lists are never laid out themselves.
+    The cache is per process, i.e. per render-pool worker.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, List]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(section_content: Any) -> str:
+        canonical = json.dumps(section_content, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _clone(cls, flowables: List) -> List:
+        clones = []
+        for flowable in flowables:
+            clone = copy.copy(flowable)
+            if isinstance(flowable, KeepTogether):
+                clone._content = cls._clone(flowable._content)
+            clones.append(clone)
+        return clones
+
+    def get_or_build(
+        self,
+        template: "PDFTemplate",
+        section: str,
+        section_content: Any,
+        build: Callable[[Any], List],
+    ) -> List:
+        """Flowables for one section, built only if this content is new."""
+        if self.max_entries <= 0:
+            return build(section_content)
+
+        key = (type(template).__name__, section, self._digest(section_content))
+        with self._lock:
+            flowables = self._entries.get(key)
+            if flowables is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if flowables is None:
+            flowables = build(section_content)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = flowables
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return self._clone(flowables)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+section_cache = SectionFlowableCache(settings.PDF_SECTION_CACHE_SIZE)
 
 
 class PDFTemplate:
-    """Base class for PDF templates."""
+    """
+    Base class for PDF templates.
+
+    Building the stylesheet (getSampleStyleSheet + custom styles + template
+    overrides) costs more than laying out a short resume, and a template
+    holds no per-render state, so renders go through `shared()`: one
+    instance per template class, built once, whose `styles` is a read-only
+    name → ParagraphStyle mapping that concurrent renders share.
+    """
+
+    _shared: Dict[type, "PDFTemplate"] = {}
+    _shared_lock = threading.Lock()
 
     def __init__(self, page_size=letter):
         """
@@ -40,6 +155,19 @@ class PDFTemplate:
         self.page_size = page_size
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
+        # Freeze the registry: styles are only read once setup is done
+        self.styles = MappingProxyType(dict(self.styles.byName))
+
+    @classmethod
+    def shared(cls) -> "PDFTemplate":
+        """The process-wide instance of this template (styles built once)."""
+        template = PDFTemplate._shared.get(cls)
+        if template is None:
+            with PDFTemplate._shared_lock:
+                template = PDFTemplate._shared.get(cls)
+                if template is None:
+                    template = PDFTemplate._shared[cls] = cls()
+        return template
 
     def _setup_custom_styles(self):
         """Setup custom paragraph styles."""
@@ -146,40 +274,46 @@ class PDFTemplate:
 
         story = []
 
-        # Add content sections
-        story.extend(self._build_header(resume_content.get('personalInfo', {})))
+        # Add content sections (unchanged sections come from section_cache)
+        story.extend(self._section('personalInfo', resume_content.get('personalInfo', {}), self._build_header))
         story.append(Spacer(1, 0.2 * inch))
 
         if resume_content.get('summary'):
-            story.extend(self._build_summary(resume_content['summary']))
+            story.extend(self._section('summary', resume_content['summary'], self._build_summary))
 
         if resume_content.get('experience'):
-            story.extend(self._build_experience(resume_content['experience']))
+            story.extend(self._section('experience', resume_content['experience'], self._build_experience))
 
         if resume_content.get('education'):
-            story.extend(self._build_education(resume_content['education']))
+            story.extend(self._section('education', resume_content['education'], self._build_education))
 
         if resume_content.get('skills'):
-            story.extend(self._build_skills(resume_content['skills']))
+            story.extend(self._section('skills', resume_content['skills'], self._build_skills))
 
         if resume_content.get('certifications'):
-            story.extend(self._build_certifications(resume_content['certifications']))
+            story.extend(self._section(
+                'certifications', resume_content['certifications'], self._build_certifications
+            ))
 
         if resume_content.get('projects'):
-            story.extend(self._build_projects(resume_content['projects']))
+            story.extend(self._section('projects', resume_content['projects'], self._build_projects))
 
         # Build PDF
         doc.build(story)
         buffer.seek(0)
         return buffer
 
+    def _section(self, section: str, section_content: Any, build: Callable[[Any], List]) -> List:
+        """Flowables for one resume section, via the per-process section cache."""
+        return section_cache.get_or_build(self, section, section_content, build)
+
     def _build_header(self, personal_info: Dict[str, Any]) -> List:
         """Build header with personal information."""
         elements = []
 
         # Name
         name = personal_info.get('name', 'No Name')
-        elements.append(Paragraph(name, self.styles['Name']))
+        elements.append(ResumeParagraph(name, self.styles['Name']))
 
         # Contact info
         contact_parts = []
@@ -195,22 +329,22 @@ class PDFTemplate:
             contact_parts.append(f"GitHub: {personal_info['github']}")
 
         contact_text = ' | '.join(contact_parts)
-        elements.append(Paragraph(contact_text, self.styles['Contact']))
+        elements.append(ResumeParagraph(contact_text, self.styles['Contact']))
 
         return elements
 
     def _build_summary(self, summary: str) -> List:
         """Build professional summary section."""
         elements = []
-        elements.append(Paragraph('PROFESSIONAL SUMMARY', self.styles['SectionHeading']))
-        elements.append(Paragraph(summary, self.styles['ResumeBody']))
+        elements.append(ResumeParagraph('PROFESSIONAL SUMMARY', self.styles['SectionHeading']))
+        elements.append(ResumeParagraph(summary, self.styles['ResumeBody']))
         elements.append(Spacer(1, 0.1 * inch))
         return elements
 
     def _build_experience(self, experience: List[Dict[str, Any]]) -> List:
         """Build work experience section."""
         elements = []
-        elements.append(Paragraph('WORK EXPERIENCE', self.styles['SectionHeading']))
+        elements.append(ResumeParagraph('WORK EXPERIENCE', self.styles['SectionHeading']))
 
         for exp in experience:
             job_group = []
@@ -219,8 +353,8 @@ class PDFTemplate:
             title = exp.get('title') or exp.get('position', 'Position')
             company = exp.get('company', 'Company')
 
-            job_group.append(Paragraph(title, self.styles['JobTitle']))
-            job_group.append(Paragraph(company, self.styles['Company']))
+            job_group.append(ResumeParagraph(title, self.styles['JobTitle']))
+            job_group.append(ResumeParagraph(company, self.styles['Company']))
 
             # Duration and location
             duration_parts = []
@@ -231,7 +365,7 @@ class PDFTemplate:
 
             if duration_parts:
                 duration_text = ' | '.join(duration_parts)
-                job_group.append(Paragraph(duration_text, self.styles['Duration']))
+                job_group.append(ResumeParagraph(duration_text, self.styles['Duration']))
 
             # Bullets (updated to use 'bullets' field instead of 'description')
             bullets = exp.get('bullets') or exp.get('description', [])
@@ -241,7 +375,7 @@ class PDFTemplate:
                 if isinstance(bullets, list):
                     for item in bullets:
                         if item and item.strip():  # Skip empty bullets
-                            job_group.append(Paragraph(f'• {item}', self.styles['ResumeBody']))
+                            job_group.append(ResumeParagraph(f'• {item}', self.styles['ResumeBody']))
                 else:
                     # If it's a string, split by newlines and add bullets
                     lines = str(bullets).split('\n')
@@ -249,7 +383,7 @@ class PDFTemplate:
                         if line.strip():
                             if not line.strip().startswith('•'):
                                 line = f'• {line.strip()}'
-                            job_group.append(Paragraph(line, self.styles['ResumeBody']))
+                            job_group.append(ResumeParagraph(line, self.styles['ResumeBody']))
 
             elements.append(KeepTogether(job_group))
             elements.append(Spacer(1, 0.08 * inch))  # Reduced from 0.15 to minimize spacing
@@ -259,7 +393,7 @@ class PDFTemplate:
     def _build_education(self, education: List[Dict[str, Any]]) -> List:
         """Build education section."""
         elements = []
-        elements.append(Paragraph('EDUCATION', self.styles['SectionHeading']))
+        elements.append(ResumeParagraph('EDUCATION', self.styles['SectionHeading']))
 
         for edu in education:
             edu_group = []
@@ -267,8 +401,8 @@ class PDFTemplate:
             degree = edu.get('degree', 'Degree')
             institution = edu.get('institution', 'Institution')
 
-            edu_group.append(Paragraph(degree, self.styles['JobTitle']))
-            edu_group.append(Paragraph(institution, self.styles['Company']))
+            edu_group.append(ResumeParagraph(degree, self.styles['JobTitle']))
+            edu_group.append(ResumeParagraph(institution, self.styles['Company']))
 
             details = []
             if edu.get('year'):
@@ -279,14 +413,14 @@ class PDFTemplate:
                 details.append(edu['location'])
 
             if details:
-                edu_group.append(Paragraph(' | '.join(details), self.styles['Duration']))
+                edu_group.append(ResumeParagraph(' | '.join(details), self.styles['Duration']))
 
             if edu.get('achievements'):
                 if isinstance(edu['achievements'], list):
                     for achievement in edu['achievements']:
-                        edu_group.append(Paragraph(f'• {achievement}', self.styles['ResumeBody']))
+                        edu_group.append(ResumeParagraph(f'• {achievement}', self.styles['ResumeBody']))
                 else:
-                    edu_group.append(Paragraph(f'• {edu["achievements"]}', self.styles['ResumeBody']))
+                    edu_group.append(ResumeParagraph(f'• {edu["achievements"]}', self.styles['ResumeBody']))
 
             elements.append(KeepTogether(edu_group))
             elements.append(Spacer(1, 0.1 * inch))
@@ -296,24 +430,24 @@ class PDFTemplate:
     def _build_skills(self, skills: Any) -> List:
         """Build skills section."""
         elements = []
-        elements.append(Paragraph('SKILLS', self.styles['SectionHeading']))
+        elements.append(ResumeParagraph('SKILLS', self.styles['SectionHeading']))
 
         if isinstance(skills, dict):
             # Skills categorized by type
             for category, skill_list in skills.items():
                 if isinstance(skill_list, list):
                     skills_text = ', '.join(skill_list)
-                    elements.append(Paragraph(
+                    elements.append(ResumeParagraph(
                         f'<b>{category.title()}:</b> {skills_text}',
                         self.styles['ResumeBody']
                     ))
         elif isinstance(skills, list):
             # Simple list of skills
             skills_text = ', '.join(skills)
-            elements.append(Paragraph(skills_text, self.styles['ResumeBody']))
+            elements.append(ResumeParagraph(skills_text, self.styles['ResumeBody']))
         else:
             # String of skills
-            elements.append(Paragraph(str(skills), self.styles['ResumeBody']))
+            elements.append(ResumeParagraph(str(skills), self.styles['ResumeBody']))
 
         elements.append(Spacer(1, 0.1 * inch))
         return elements
@@ -321,17 +455,17 @@ class PDFTemplate:
     def _build_certifications(self, certifications: List) -> List:
         """Build certifications section."""
         elements = []
-        elements.append(Paragraph('CERTIFICATIONS', self.styles['SectionHeading']))
+        elements.append(ResumeParagraph('CERTIFICATIONS', self.styles['SectionHeading']))
 
         for cert in certifications:
             cert_group = []
 
             # Handle both string and dict formats
             if isinstance(cert, str):
-                cert_group.append(Paragraph(f'• {cert}', self.styles['ResumeBody']))
+                cert_group.append(ResumeParagraph(f'• {cert}', self.styles['ResumeBody']))
             elif isinstance(cert, dict):
                 name = cert.get('name', 'Certification')
-                cert_group.append(Paragraph(name, self.styles['JobTitle']))
+                cert_group.append(ResumeParagraph(name, self.styles['JobTitle']))
 
                 details = []
                 if cert.get('issuer'):
@@ -342,7 +476,7 @@ class PDFTemplate:
                     details.append(f"ID: {cert['credential_id']}")
 
                 if details:
-                    cert_group.append(Paragraph(' | '.join(details), self.styles['Duration']))
+                    cert_group.append(ResumeParagraph(' | '.join(details), self.styles['Duration']))
 
             elements.append(KeepTogether(cert_group))
             elements.append(Spacer(1, 0.1 * inch))
@@ -352,31 +486,31 @@ class PDFTemplate:
     def _build_projects(self, projects: List[Dict[str, Any]]) -> List:
         """Build projects section."""
         elements = []
-        elements.append(Paragraph('PROJECTS', self.styles['SectionHeading']))
+        elements.append(ResumeParagraph('PROJECTS', self.styles['SectionHeading']))
 
         for project in projects:
             project_group = []
 
             name = project.get('name', 'Project')
-            project_group.append(Paragraph(name, self.styles['JobTitle']))
+            project_group.append(ResumeParagraph(name, self.styles['JobTitle']))
 
             if project.get('technologies'):
                 tech = project['technologies']
                 if isinstance(tech, list):
                     tech = ', '.join(tech)
-                project_group.append(Paragraph(
+                project_group.append(ResumeParagraph(
                     f'<i>Technologies: {tech}</i>',
                     self.styles['Duration']
                 ))
 
             if project.get('description'):
-                project_group.append(Paragraph(
+                project_group.append(ResumeParagraph(
                     project['description'],
                     self.styles['ResumeBody']
                 ))
 
             if project.get('link'):
-                project_group.append(Paragraph(
+                project_group.append(ResumeParagraph(
                     f'Link: {project["link"]}',
                     self.styles['Duration']
                 ))
@@ -502,8 +636,7 @@ class PDFService:
 
         logger.info(f"Generating PDF with template: {template_name}")
 
-        template_class = PDFService.TEMPLATES[template_name]
-        template = template_class()
+        template = PDFService.TEMPLATES[template_name].shared()
 
         try:
             pdf_buffer = template.generate(resume_content)
@@ -514,5 +647,9 @@ class PDFService:
             raise
 
 
+# Build every template's styles at import, not on the first download
+for _template_class in PDFService.TEMPLATES.values():
+    _template_class.shared()
+
 # Service instance
 pdf_service = PDFService()
@@ -9,7 +9,8 @@ import json
 import time
 import asyncio
 import logging
-from typing import Optional, Any, Tuple, Dict
+from collections import OrderedDict
+from typing import Optional, Any, Tuple
 import redis.asyncio as aioredis
 from redis.exceptions import ConnectionError as RedisConnectionError
 
@@ -31,8 +32,11 @@ class RedisService:
         self.settings = settings
         self.redis: Optional[aioredis.Redis] = None
         self.is_connected = False
-        self._fallback_cache: Dict[str, Any] = {}  # In-memory fallback
+        # In-memory fallback while Redis is down: key -> (expires_at, value),
+        # least recently used first, bounded by REDIS_FALLBACK_MAX_ENTRIES
+        self._fallback_cache: OrderedDict[str, Tuple[Optional[float], Any]] = OrderedDict()
         self._reconnect_task: Optional[asyncio.Task] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None  # loop that owns the client
 
     async def connect(self) -> bool:
         """
@@ -41,6 +45,7 @@ class RedisService:
         Returns:
             bool: True if connected successfully, False otherwise
         """
+        self.loop = asyncio.get_running_loop()
         try:
             self.redis = await aioredis.from_url(
                 self.settings.REDIS_URL,
@@ -52,6 +57,8 @@ class RedisService:
             )
             await self.redis.ping()
             self.is_connected = True
+            # Entries written while disconnected may be stale by now
+            self._fallback_cache.clear()
             logger.info("✅ Redis connected successfully")
             return True
         except Exception as e:
@@ -195,6 +202,24 @@ class RedisService:
     # Cache Methods
     # ===============
 
+    def _fallback_get(self, key: str) -> Optional[Any]:
+        entry = self._fallback_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._fallback_cache[key]
+            return None
+        self._fallback_cache.move_to_end(key)
+        return value
+
+    def _fallback_set(self, key: str, value: Any, ttl: Optional[int]) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._fallback_cache[key] = (expires_at, value)
+        self._fallback_cache.move_to_end(key)
+        while len(self._fallback_cache) > self.settings.REDIS_FALLBACK_MAX_ENTRIES:
+            self._fallback_cache.popitem(last=False)
+
     async def get(self, key: str) -> Optional[Any]:
         """
         Get value from Redis cache with fallback to in-memory.
@@ -206,7 +231,7 @@ class RedisService:
             Optional[Any]: Cached value or None
         """
         if not self.is_connected:
-            return self._fallback_cache.get(key)
+            return self._fallback_get(key)
 
         try:
             value = await asyncio.wait_for(
@@ -217,30 +242,29 @@ class RedisService:
             return None
         except asyncio.TimeoutError:
             logger.warning(f"Redis timeout on GET {key}")
-            return self._fallback_cache.get(key)
+            return None
         except RedisConnectionError:
             logger.error("Redis connection lost, using fallback")
             self.is_connected = False
             if not self._reconnect_task:
                 self._reconnect_task = asyncio.create_task(self._reconnect())
-            return self._fallback_cache.get(key)
+            return None
         except Exception as e:
             logger.error(f"Cache GET failed for {key}: {e}")
             return None
 
     async def set(self, key: str, value: Any, ttl: int):
         """
-        Set value in Redis cache with TTL.
+        Set value in Redis cache with TTL (in the bounded in-memory
+        fallback instead while Redis is down).
 
         Args:
             key: Cache key
             value: Value to cache (will be JSON serialized)
             ttl: Time to live in seconds
         """
-        # Always update fallback cache
-        self._fallback_cache[key] = value
-
         if not self.is_connected:
+            self._fallback_set(key, value, ttl)
             return
 
         try:
@@ -298,6 +322,26 @@ class RedisService:
         regex_pattern = pattern.replace("*", ".*").replace("?", ".")
         return bool(re.match(f"^{regex_pattern}$", key))
 
+    async def incr(self, key: str) -> int:
+        """
+        Atomically increment a counter without TTL (e.g. a cache version).
+
+        Args:
+            key: Counter key
+
+        Returns:
+            int: Value after increment
+        """
+        if self.is_connected:
+            try:
+                return await self.redis.incr(key)
+            except Exception as e:
+                logger.error(f"Counter INCR failed for {key}: {e}")
+
+        value = int(self._fallback_get(key) or 0) + 1
+        self._fallback_set(key, value, None)
+        return value
+
     # =============
     # Quota Methods
     # =============
@@ -0,0 +1,285 @@
+"""
+Related-posts index for blog pages.
+
+Every published post is described by a small bag of features — the words
+of its primary keyword and LSI keywords, its tags and its category —
+weighted by TF-IDF and L2-normalised. Similarity is the cosine between
+two such sparse vectors, computed through an inverted index so each post
+is only compared with posts that share at least one feature.
+
+The top-N related posts per post are stored in blog_related_posts, so a
+blog page's "related articles" is a single indexed lookup:
+
+  * rebuild()          — recompute everything (rebuild_related_posts job)
+  * update_for_posts() — called by run_daily_generation for the posts it
+                         just published: they get their own top-N, and any
+                         existing post whose top-N they now beat is updated
+
+Either way, the pages of existing posts whose related list changed are
+queued for ISR revalidation when the session commits.
+
+Incremental updates score new pairs with the current IDF but leave older
+rows as they were; the periodic full rebuild re-weights everything.
+"""
+
+import heapq
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy.orm import Session, aliased, defer
+
+from app.config import get_settings
+from app.models.blog import BlogPost, BlogRelatedPost
+from app.services.revalidation_service import revalidate_on_commit
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Feature weights per source field (term frequency multipliers)
+PRIMARY_WEIGHT  = 2.0
+LSI_WEIGHT      = 1.0
+TAG_WEIGHT      = 1.5
+CATEGORY_WEIGHT = 1.0
+
+# Features carried by more than this share of posts say little about
+# relatedness and make the inverted index dense; they're dropped once the
+# corpus is large enough for document frequency to mean something.
+MAX_DF_RATIO     = 0.5
+MIN_DOCS_FOR_DF  = 20
+
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
+    "in", "is", "it", "of", "on", "or", "the", "to", "vs", "what", "which",
+    "with", "your", "you",
+})
+
+SparseVector = dict[str, float]
+
+
+def _terms(text: Optional[str]) -> list[str]:
+    return [
+        word for word in re.findall(r"[a-z0-9]+", (text or "").lower())
+        if word not in _STOPWORDS and len(word) > 1
+    ]
+
+
+def post_features(
+    primary_keyword: Optional[str],
+    lsi_keywords: Optional[Iterable[str]],
+    tags: Optional[Iterable[str]],
+    category: Optional[str],
+) -> Counter:
+    """Weighted term frequencies for one post."""
+    features: Counter = Counter()
+    for term in _terms(primary_keyword):
+        features[term] += PRIMARY_WEIGHT
+    for keyword in lsi_keywords or []:
+        for term in _terms(keyword):
+            features[term] += LSI_WEIGHT
+    for tag in tags or []:
+        tag = " ".join(_terms(tag))
+        if tag:
+            features[f"tag:{tag}"] += TAG_WEIGHT
+    if category:
+        features[f"cat:{category}"] += CATEGORY_WEIGHT
+    return features
+
+
+class _Corpus:
+    """TF-IDF vectors + inverted index over all published posts."""
+
+    def __init__(self, features: dict[int, Counter]) -> None:
+        n = len(features)
+        df: Counter = Counter()
+        for counts in features.values():
+            df.update(counts.keys())
+
+        max_df = MAX_DF_RATIO * n if n >= MIN_DOCS_FOR_DF else n
+        idf = {
+            term: math.log((1 + n) / (1 + count)) + 1.0
+            for term, count in df.items()
+            if count <= max_df
+        }
+
+        self.vectors: dict[int, SparseVector] = {}
+        self.postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        for post_id, counts in features.items():
+            vector = {t: tf * idf[t] for t, tf in counts.items() if t in idf}
+            norm = math.sqrt(sum(w * w for w in vector.values()))
+            if not norm:
+                continue
+            vector = {t: w / norm for t, w in vector.items()}
+            self.vectors[post_id] = vector
+            for term, weight in vector.items():
+                self.postings[term].append((post_id, weight))
+
+    def similarities(self, post_id: int) -> dict[int, float]:
+        """Cosine similarity of `post_id` to every post sharing a feature."""
+        scores: dict[int, float] = defaultdict(float)
+        for term, weight in self.vectors.get(post_id, {}).items():
+            for other_id, other_weight in self.postings[term]:
+                if other_id != post_id:
+                    scores[other_id] += weight * other_weight
+        return scores
+
+
+def _top(scores: dict[int, float], top_n: int) -> list[tuple[float, int]]:
+    # Ties go to the newer (higher id) post
+    return heapq.nlargest(top_n, ((score, pid) for pid, score in scores.items()))
+
+
+class RelatedPostsIndex:
+    """Builds and maintains blog_related_posts."""
+
+    def _load_corpus(self, db: Session) -> _Corpus:
+        rows = (
+            db.query(
+                BlogPost.id, BlogPost.primary_keyword, BlogPost.lsi_keywords,
+                BlogPost.tags, BlogPost.category,
+            )
+            .filter(BlogPost.status == "published")
+            .all()
+        )
+        return _Corpus({
+            row.id: post_features(row.primary_keyword, row.lsi_keywords, row.tags, row.category)
+            for row in rows
+        })
+
+    @staticmethod
+    def _revalidate(db: Session, post_ids: set[int]) -> None:
+        """Refresh the pages of posts whose related section changed."""
+        ids = sorted(post_ids)
+        for start in range(0, len(ids), 500):
+            rows = db.query(BlogPost.slug).filter(BlogPost.id.in_(ids[start:start + 500]))
+            revalidate_on_commit(db, (slug for (slug,) in rows))
+
+    @staticmethod
+    def _write(db: Session, post_id: int, ranked: list[tuple[float, int]]) -> None:
+        for position, (score, related_id) in enumerate(ranked):
+            db.add(BlogRelatedPost(
+                post_id=post_id, related_post_id=related_id,
+                position=position, score=round(score, 6),
+            ))
+
+    def rebuild(
+        self,
+        db: Session,
+        top_n: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> dict:
+        """
+        Recompute the related posts of every published post. Flushes but
+        does not commit. Returns {posts, rows}.
+        """
+        top_n = top_n or settings.BLOG_RELATED_POSTS
+        corpus = self._load_corpus(db)
+
+        previous: dict[int, list[int]] = defaultdict(list)
+        for post_id, related_id in (
+            db.query(BlogRelatedPost.post_id, BlogRelatedPost.related_post_id)
+            .order_by(BlogRelatedPost.post_id, BlogRelatedPost.position)
+        ):
+            previous[post_id].append(related_id)
+
+        db.query(BlogRelatedPost).delete(synchronize_session=False)
+        rows = 0
+        changed: set[int] = set()
+        total = len(corpus.vectors)
+        for done, post_id in enumerate(corpus.vectors, 1):
+            ranked = _top(corpus.similarities(post_id), top_n)
+            self._write(db, post_id, ranked)
+            rows += len(ranked)
+            if [related_id for _, related_id in ranked] != previous.get(post_id, []):
+                changed.add(post_id)
+            if done % 500 == 0:
+                db.flush()
+                if on_progress:
+                    on_progress(done, total)
+        db.flush()
+        self._revalidate(db, changed)
+        if on_progress:
+            on_progress(total, total)
+
+        logger.info(f"Related posts rebuilt: {total} posts, {rows} rows")
+        return {"posts": total, "rows": rows}
+
+    def update_for_posts(
+        self,
+        db: Session,
+        post_ids: list[int],
+        top_n: Optional[int] = None,
+    ) -> dict:
+        """
+        Index newly published posts (already flushed). Each gets its own
+        top-N, and existing posts they outrank are updated in place.
+        Flushes but does not commit. Returns {posts, updated}.
+        """
+        top_n = top_n or settings.BLOG_RELATED_POSTS
+        new_ids = set(post_ids)
+        corpus = self._load_corpus(db)
+
+        # Candidate (existing post → [(score, new post)]) from the new posts' side
+        offers: dict[int, list[tuple[float, int]]] = defaultdict(list)
+        indexed = 0
+        for post_id in new_ids:
+            scores = corpus.similarities(post_id)
+            db.query(BlogRelatedPost).filter(
+                BlogRelatedPost.post_id == post_id
+            ).delete(synchronize_session=False)
+            self._write(db, post_id, _top(scores, top_n))
+            indexed += 1
+            for other_id, score in scores.items():
+                if other_id not in new_ids:
+                    offers[other_id].append((score, post_id))
+
+        updated: set[int] = set()
+        if offers:
+            current: dict[int, list[BlogRelatedPost]] = defaultdict(list)
+            for row in (
+                db.query(BlogRelatedPost)
+                .filter(BlogRelatedPost.post_id.in_(offers.keys()))
+                .order_by(BlogRelatedPost.post_id, BlogRelatedPost.position)
+            ):
+                current[row.post_id].append(row)
+
+            for other_id, offered in offers.items():
+                rows = current.get(other_id, [])
+                if len(rows) >= top_n and max(offered)[0] <= rows[-1].score:
+                    continue  # nothing new makes the cut
+                merged = _top(
+                    {**{r.related_post_id: r.score for r in rows},
+                     **{pid: score for score, pid in offered}},
+                    top_n,
+                )
+                for row in rows:
+                    db.delete(row)
+                self._write(db, other_id, merged)
+                updated.add(other_id)
+
+        db.flush()
+        self._revalidate(db, updated)
+        logger.info(f"Related posts indexed {indexed} new post(s), updated {len(updated)} existing")
+        return {"posts": indexed, "updated": len(updated)}
+
+    def get_related(self, db: Session, slug: str, limit: int) -> list[BlogPost]:
+        """Published related posts for `slug`, most related first."""
+        source  = aliased(BlogPost)
+        related = aliased(BlogPost)
+        return (
+            db.query(related)
+            .options(defer(related.content))
+            .join(BlogRelatedPost, BlogRelatedPost.related_post_id == related.id)
+            .join(source, source.id == BlogRelatedPost.post_id)
+            .filter(source.slug == slug, related.status == "published")
+            .order_by(BlogRelatedPost.position)
+            .limit(limit)
+            .all()
+        )
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────
+
+related_posts_index = RelatedPostsIndex()
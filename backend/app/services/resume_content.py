@@ -0,0 +1,276 @@
+"""
+Canonical (normalized) resume content.
+
+Resumes are stored as the editor or parser produced them: camelCase from
+the builder, snake_case with start/end dates and sometimes stringified
+`personal_info` from uploads. PDF templates and AI prompts want one
+shape, so the normalized form is computed when content is written and
+stored next to it:
+
+    content           → normalized_content
+    optimized_content → normalized_optimized_content
+    content_schema_version = CONTENT_SCHEMA_VERSION
+
+A normalized column is NULL when the stored value is already canonical
+(builder content), so most rows don't carry a second copy.
+
+A before_flush hook keeps the columns in sync for every write path
+(create, update, upload, optimize). Bump CONTENT_SCHEMA_VERSION when
+normalize_resume_content changes; rows with an older version are
+normalized on read until the backfill_normalized_content job rewrites
+them.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import event, inspect, or_
+from sqlalchemy.orm import Session
+
+from app.models.resume import Resume
+
+logger = logging.getLogger(__name__)
+
+CONTENT_SCHEMA_VERSION = 2
+
+BACKFILL_BATCH = 200
+
+
+def normalize_resume_content(content: dict) -> dict:
+    """
+    Normalize resume content structure for PDF generation.
+    Converts snake_case keys to camelCase if needed. Keys it doesn't know
+    (e.g. bullets, achievements) are kept, so AI prompts built from the
+    normalized form still see them.
+    """
+    # If already in camelCase format, return as is
+    if "personalInfo" in content:
+        return content
+
+    # Convert from snake_case to camelCase
+    normalized = {}
+
+    # Handle personal_info -> personalInfo
+    if "personal_info" in content:
+        personal = content["personal_info"]
+
+        # Parse if it's a JSON string
+        if isinstance(personal, str):
+            try:
+                personal = json.loads(personal)
+            except:
+                personal = {}
+
+        if isinstance(personal, dict):
+            normalized["personalInfo"] = {
+                "name": personal.get("full_name") or personal.get("name", ""),
+                "email": personal.get("email", ""),
+                "phone": personal.get("phone", ""),
+                "location": personal.get("location", ""),
+                "linkedin": personal.get("linkedin", ""),
+                "github": personal.get("github") or personal.get("website", "")
+            }
+        else:
+            normalized["personalInfo"] = {
+                "name": "",
+                "email": "",
+                "phone": "",
+                "location": "",
+                "linkedin": "",
+                "github": ""
+            }
+    elif "personalInfo" in content:
+        normalized["personalInfo"] = content["personalInfo"]
+    else:
+        # Default empty personal info
+        normalized["personalInfo"] = {
+            "name": "",
+            "email": "",
+            "phone": "",
+            "location": "",
+            "linkedin": "",
+            "github": ""
+        }
+
+    # Copy other fields with defaults
+    normalized["summary"] = content.get("summary", "")
+
+    # Normalize experience - convert start_date/end_date to duration
+    experience = content.get("experience", [])
+    normalized_experience = []
+    for exp in experience:
+        if isinstance(exp, dict):
+            normalized_exp = dict(exp)
+            normalized_exp.update({
+                "company": exp.get("company", ""),
+                "position": exp.get("position", ""),
+                "location": exp.get("location", ""),
+                "description": exp.get("description", "")
+            })
+            # Convert dates to duration string
+            if "start_date" in exp or "end_date" in exp:
+                start = exp.get("start_date", "")
+                end = exp.get("end_date", "")
+                normalized_exp["duration"] = f"{start} - {end}" if start and end else exp.get("duration", "")
+            else:
+                normalized_exp["duration"] = exp.get("duration", "")
+            normalized_experience.append(normalized_exp)
+    normalized["experience"] = normalized_experience
+
+    # Normalize education - convert start_date/end_date to duration
+    education = content.get("education", [])
+    normalized_education = []
+    for edu in education:
+        if isinstance(edu, dict):
+            normalized_edu = dict(edu)
+            normalized_edu.update({
+                "institution": edu.get("institution", ""),
+                "degree": edu.get("degree", ""),
+                "gpa": edu.get("gpa", "")
+            })
+            # Convert dates to duration string
+            if "start_date" in edu or "end_date" in edu:
+                start = edu.get("start_date", "")
+                end = edu.get("end_date", "")
+                normalized_edu["duration"] = f"{start} - {end}" if start and end else edu.get("duration", "")
+            else:
+                normalized_edu["duration"] = edu.get("duration", "")
+            normalized_education.append(normalized_edu)
+    normalized["education"] = normalized_education
+
+    normalized["skills"] = content.get("skills", [])
+    normalized["projects"] = content.get("projects", [])
+    normalized["certifications"] = content.get("certifications", [])
+    normalized["languages"] = content.get("languages", [])
+
+    for key, value in content.items():
+        if key != "personal_info":
+            normalized.setdefault(key, value)
+
+    return normalized
+
+
+def normalize_stored_content(stored: Any) -> Optional[Dict[str, Any]]:
+    """
+    Normalized form of a stored content value (dict or JSON string).
+
+    Raises:
+        ValueError: If the value is not a JSON object
+    """
+    if stored is None:
+        return None
+    if isinstance(stored, str):
+        stored = json.loads(stored)   # JSONDecodeError is a ValueError
+    if not isinstance(stored, dict):
+        raise ValueError(f"Resume content must be an object, got {type(stored).__name__}")
+    return normalize_resume_content(stored)
+
+
+def _normalized_column(stored: Any) -> Optional[Dict[str, Any]]:
+    normalized = normalize_stored_content(stored)
+    # Already canonical: reads fall back to the stored value
+    return None if normalized is stored else normalized
+
+
+def refresh_normalized_content(resume: Resume) -> None:
+    """
+    Recompute both normalized columns of `resume` from its stored content.
+
+    If either value can't be normalized, both columns are cleared and the
+    schema version unset, so canonical_content() normalizes on read and
+    raises the error rather than serving the previous normalized copy.
+
+    Raises:
+        ValueError: If the stored content is not a JSON object
+    """
+    try:
+        normalized = _normalized_column(resume.content)
+        normalized_optimized = _normalized_column(resume.optimized_content)
+    except ValueError:
+        resume.normalized_content = None
+        resume.normalized_optimized_content = None
+        resume.content_schema_version = None
+        raise
+    resume.normalized_content = normalized
+    resume.normalized_optimized_content = normalized_optimized
+    resume.content_schema_version = CONTENT_SCHEMA_VERSION
+
+
+def canonical_content(resume: Any, use_optimized: bool = False) -> Dict[str, Any]:
+    """
+    Normalized content of a Resume (or a row with the same columns).
+
+    Optimized content is used when asked for and present, the original
+    otherwise. Rows written before the current schema version are
+    normalized on the fly.
+
+    Raises:
+        ValueError: If the stored content is not a JSON object
+    """
+    optimized = use_optimized and resume.optimized_content is not None
+    stored = resume.optimized_content if optimized else resume.content
+    if resume.content_schema_version == CONTENT_SCHEMA_VERSION:
+        normalized = resume.normalized_optimized_content if optimized else resume.normalized_content
+        return normalized if normalized is not None else stored
+    return normalize_stored_content(stored)
+
+
+def backfill_normalized_content(
+    db: Session,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> dict:
+    """Normalize every resume stored with an older (or no) schema version."""
+    stale = or_(
+        Resume.content_schema_version.is_(None),
+        Resume.content_schema_version != CONTENT_SCHEMA_VERSION,
+    )
+    total = db.query(Resume.id).filter(stale).count()
+    updated = failed = 0
+    after_id = 0
+    while True:
+        batch = (
+            db.query(Resume)
+            .filter(stale, Resume.id > after_id)
+            .order_by(Resume.id)
+            .limit(BACKFILL_BATCH)
+            .all()
+        )
+        if not batch:
+            break
+        for resume in batch:
+            try:
+                refresh_normalized_content(resume)
+                updated += 1
+            except ValueError as e:
+                logger.warning(f"Resume {resume.id} content could not be normalized: {str(e)}")
+                failed += 1
+        after_id = batch[-1].id
+        db.commit()
+        db.expunge_all()
+        if on_progress:
+            on_progress(updated + failed, total)
+    return {"updated": updated, "failed": failed, "schema_version": CONTENT_SCHEMA_VERSION}
+
+
+# ── Session hooks ──────────────────────────────────────────────────────────
+
+def _content_changed(resume: Resume) -> bool:
+    state = inspect(resume)
+    return (
+        state.attrs.content.history.has_changes()
+        or state.attrs.optimized_content.history.has_changes()
+        or resume.content_schema_version != CONTENT_SCHEMA_VERSION
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _normalize_on_write(session: Session, flush_context, instances) -> None:
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Resume) and _content_changed(obj):
+            try:
+                refresh_normalized_content(obj)
+            except ValueError as e:
+                # Keep the write; the columns are cleared, so canonical_content()
+                # reports the error on read
+                logger.warning(f"Resume {obj.id} content could not be normalized: {str(e)}")
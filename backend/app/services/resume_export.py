@@ -0,0 +1,205 @@
+"""
+Bulk resume export as a streamed ZIP.
+
+GET /api/resume/export renders every resume of a user (optionally a
+subset, in one or more templates) and streams them back as one archive:
+
+  * resumes are read in keyset-paginated batches on the export's own
+    session (the request session is closed before a streaming body runs)
+  * up to RESUME_EXPORT_CONCURRENCY renders run at once on the PDF
+    render pool, with the content-addressed PDF cache in front of it
+  * each PDF is written to the ZIP as soon as it finishes and the bytes
+    are flushed to the client straight away — entries are stored (PDFs
+    are already compressed) with data descriptors, so the archive never
+    needs to be seekable or held in memory
+
+Memory is bounded by one batch of resume rows plus the PDFs in flight;
+only the ZIP central directory (~100 bytes per entry) grows with the
+number of resumes. When the client disconnects, Starlette cancels the
+stream and every render not yet started is cancelled with it.
+"""
+
+import asyncio
+import logging
+import time
+import zipfile
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.resume import Resume
+from app.services.pdf_cache import pdf_cache, pdf_cache_key
+from app.services.pdf_render_pool import PDFPoolSaturated, pdf_render_pool
+from app.services.resume_content import canonical_content
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+EXPORT_BATCH = 25   # resume rows loaded per round-trip
+
+
+class _ZipSink:
+    """Write-only, unseekable file object that hands back what was written."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def export_filename(resume_id: int, title: str, template_name: str) -> str:
+    """Archive entry name; the id keeps same-titled resumes apart."""
+    safe_title = "".join(c if c.isalnum() or c in "-_" else "_" for c in title.strip()) or "resume"
+    return f"{resume_id}_{safe_title}_{template_name}.pdf"
+
+
+def _fetch_batch(
+    bind: Engine | Connection,
+    user_id: int,
+    resume_ids: Optional[List[int]],
+    after_id: int,
+) -> list:
+    query = (
+        select(
+            Resume.id, Resume.title, Resume.template_name,
+            Resume.content, Resume.optimized_content,
+            Resume.normalized_content, Resume.normalized_optimized_content, Resume.content_schema_version,
+        )
+        .where(Resume.user_id == user_id, Resume.id > after_id)
+        .order_by(Resume.id)
+        .limit(EXPORT_BATCH)
+    )
+    if resume_ids:
+        query = query.where(Resume.id.in_(resume_ids))
+    with Session(bind=bind) as session:
+        return session.execute(query).all()
+
+
+async def _render(content: Dict[str, Any], template_name: str) -> bytes:
+    """PDF bytes from the cache, or rendered on the pool (waiting out saturation)."""
+    cache_key = pdf_cache_key(content, template_name)
+    if settings.PDF_CACHE_ENABLED:
+        pdf = await run_in_threadpool(pdf_cache.get, cache_key)
+        if pdf is not None:
+            return pdf
+
+    while True:
+        try:
+            pdf = await pdf_render_pool.render(content, template_name)
+            break
+        except PDFPoolSaturated as e:
+            # Interactive downloads compete for the same pool; back off
+            await asyncio.sleep(e.retry_after)
+
+    if settings.PDF_CACHE_ENABLED:
+        await run_in_threadpool(pdf_cache.put, cache_key, pdf)
+    return pdf
+
+
+async def stream_resume_export(
+    bind: Engine | Connection,
+    user_id: int,
+    templates: Optional[List[str]] = None,
+    resume_ids: Optional[List[int]] = None,
+    use_optimized: bool = False,
+    prepare_content: Callable[[Any, bool], Dict[str, Any]] = canonical_content,
+) -> AsyncIterator[bytes]:
+    """
+    Yield a ZIP archive of the user's resumes as PDFs, entry by entry.
+
+    Args:
+        bind: Engine/connection to read resumes with
+        user_id: Owner of the resumes
+        templates: Templates to render each resume in (default: its own)
+        resume_ids: Restrict the export to these resumes
+        use_optimized: Prefer optimized content where it exists
+        prepare_content: Turns a resume row into PDF-ready content
+
+    Resumes that fail to render are listed in errors.txt at the end of
+    the archive instead of aborting the whole export.
+    """
+    concurrency = settings.RESUME_EXPORT_CONCURRENCY or max(1, pdf_render_pool.workers)
+    sink = _ZipSink()
+    archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED)
+    pending: Dict[asyncio.Task, str] = {}
+    failures: List[str] = []
+    written = 0
+    t0 = time.perf_counter()
+
+    async def jobs():
+        after_id = 0
+        while True:
+            rows = await run_in_threadpool(_fetch_batch, bind, user_id, resume_ids, after_id)
+            if not rows:
+                return
+            for row in rows:
+                try:
+                    content = prepare_content(row, use_optimized)
+                except Exception as e:
+                    failures.append(f"{export_filename(row.id, row.title, row.template_name)}: {e}")
+                    continue
+                for template_name in templates or [row.template_name]:
+                    yield export_filename(row.id, row.title, template_name), content, template_name
+            after_id = rows[-1].id
+
+    job_iter = jobs().__aiter__()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    name, content, template_name = await job_iter.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending[asyncio.create_task(_render(content, template_name))] = name
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = pending.pop(task)
+                try:
+                    pdf = task.result()
+                except Exception as e:
+                    logger.error(f"Resume export: {name} failed for user {user_id}: {str(e)}")
+                    failures.append(f"{name}: {e}")
+                    continue
+                info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+                info.compress_type = zipfile.ZIP_STORED
+                archive.writestr(info, pdf)
+                written += 1
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+
+        if failures:
+            archive.writestr("errors.txt", "\n".join(failures) + "\n")
+        archive.close()
+        yield sink.drain()
+        logger.info(
+            f"Resume export for user {user_id}: {written} PDF(s), {len(failures)} failure(s), "
+            f"{time.perf_counter() - t0:.1f}s"
+        )
+    finally:
+        if pending:
+            # Client went away (or the stream was closed): drop queued renders
+            for task in pending:
+                task.cancel()
+            logger.info(f"Resume export for user {user_id} cancelled after {written} PDF(s)")
+        await job_iter.aclose()
@@ -0,0 +1,202 @@
+"""
+Background parsing of uploaded resumes.
+
+POST /api/resume/upload used to hold the request open through text
+extraction and a Claude parse, which regularly outlived client and proxy
+timeouts. Now the route stores the file as a ResumeUpload, queues a
+parse_resume_upload job and answers 202 with the job id. The job moves
+through these stages (kept in the job's message):
+
+    queued → extracting → parsing → saving → saved
+                                          ↘ failed
+
+and creates the Resume row (deleting the upload) in its final
+transaction. Clients follow along with GET /api/resume/upload/{job_id}
+or the Server-Sent Events stream at /api/resume/upload/{job_id}/events.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.background_job import BackgroundJob
+from app.models.resume import Resume
+from app.models.resume_upload import ResumeUpload
+from app.models.user import User
+from app.services.job_runner import JobContext, job_runner
+from app.services.resume_parse_cache import get_cached_parse_sync, parse_cache_digest, store_parse_sync
+from app.services.resume_parser_service import resume_parser_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+UPLOAD_JOB = "parse_resume_upload"
+
+# Shown for failures whose message isn't meant for users
+PARSE_FAILED = "Failed to parse resume. Please ensure the file is valid and try again."
+
+EVENTS_POLL_SECONDS = 0.5
+EVENTS_KEEPALIVE_SECONDS = 15
+
+
+def enqueue_upload(
+    db: Session,
+    user: User,
+    file_content: bytes,
+    filename: str,
+    sha256: str,
+    file_type: str,
+) -> BackgroundJob:
+    """
+    Store an uploaded file and queue the job that parses it.
+
+    `sha256` and `file_type` were computed while the file streamed in
+    (see utils/uploads.py); the job uses them instead of re-reading the
+    stored bytes.
+    """
+    upload = ResumeUpload(user_id=user.id, filename=filename, file_content=file_content)
+    db.add(upload)
+    db.flush()
+    job, _ = job_runner.enqueue(
+        db,
+        UPLOAD_JOB,
+        params={"upload_id": upload.id, "user_id": user.id, "sha256": sha256, "file_type": file_type},
+        lock_key=f"{UPLOAD_JOB}:{upload.id}",
+    )
+    return job
+
+
+def get_upload_job(db: Session, job_id: str, user_id: int) -> Optional[BackgroundJob]:
+    """The upload job `job_id` if it belongs to `user_id`."""
+    job = job_runner.get(db, job_id)
+    if job is None or job.job_type != UPLOAD_JOB or (job.params or {}).get("user_id") != user_id:
+        return None
+    return job
+
+
+def upload_status(job: BackgroundJob) -> Dict[str, Any]:
+    """Client-facing status of an upload job."""
+    if job.status == "succeeded":
+        stage = "saved"
+    elif job.status == "failed":
+        stage = "failed"
+    elif job.status == "queued":
+        stage = "queued"
+    else:
+        stage = job.message or "extracting"
+    return {
+        "job_id":    job.id,
+        "status":    job.status,
+        "stage":     stage,
+        "progress":  job.progress,
+        "resume_id": (job.result or {}).get("resume_id"),
+        "error":     job.error,
+    }
+
+
+@job_runner.register(UPLOAD_JOB)
+def parse_resume_upload(db: Session, params: dict, ctx: JobContext) -> dict:
+    """
+    Parse an uploaded resume and save it as a new Resume.
+
+    The upload is deleted once the job finishes either way; if the
+    worker dies mid-parse it stays, and the restarted attempt uses it.
+    """
+    upload = db.get(ResumeUpload, params["upload_id"])
+    if upload is None:
+        raise ValueError("Uploaded file not found. Please upload it again.")
+
+    try:
+        user = db.get(User, upload.user_id)
+        file_type = params["file_type"]
+        digest = parse_cache_digest(params["sha256"], file_type)
+        parsed_data = get_cached_parse_sync(user.id, digest)
+        if parsed_data is None:
+            ctx.progress(10, "extracting")
+            resume_text = resume_parser_service.extract_text(upload.file_content, upload.filename, file_type)
+            ctx.progress(30, "parsing")
+            parsed_data = resume_parser_service.parse_resume_with_ai(resume_text)
+            store_parse_sync(user.id, digest, parsed_data)
+
+        ctx.progress(90, "saving")
+        # Checked again: other uploads may have finished since this one was queued
+        user_region = user.get_region() if hasattr(user, "get_region") else "IN"
+        resume_limit = settings.get_resume_limit(user.subscription_type, user_region)
+        if user.resume_count >= resume_limit:
+            raise ValueError(
+                f"Resume limit reached. Your {user.subscription_type} plan allows {resume_limit} resume(s) per month."
+            )
+
+        resume = Resume(
+            user_id=user.id,
+            title=f"Imported: {upload.filename.rsplit('.', 1)[0]}",
+            content=resume_parser_service.convert_to_resume_format(parsed_data),
+            template_name="modern",  # Default template
+        )
+        db.add(resume)
+        user.resume_count += 1
+        db.delete(upload)
+        db.commit()
+    except ValueError:
+        _discard_upload(db, params["upload_id"])
+        raise
+    except Exception as e:
+        logger.error(f"Resume upload {params['upload_id']} failed for user {params['user_id']}: {str(e)}")
+        _discard_upload(db, params["upload_id"])
+        raise RuntimeError(PARSE_FAILED) from e
+
+    logger.info(f"Resume imported successfully for user {resume.user_id}: {resume.id}")
+    return {"resume_id": resume.id, "title": resume.title}
+
+
+def _discard_upload(db: Session, upload_id: int) -> None:
+    db.rollback()
+    db.query(ResumeUpload).filter(ResumeUpload.id == upload_id).delete(synchronize_session=False)
+    db.commit()
+
+
+# ── Server-Sent Events ─────────────────────────────────────────────────────
+
+def _load_status(bind: Engine | Connection, job_id: str) -> Optional[Dict[str, Any]]:
+    with Session(bind=bind) as session:
+        job = job_runner.get(session, job_id)
+        return upload_status(job) if job is not None else None
+
+
+async def upload_events(bind: Engine | Connection, job_id: str) -> AsyncIterator[str]:
+    """
+    Yield an upload job's status as Server-Sent Events until it finishes.
+
+    Every change is sent as a `progress` event; the last one is `done` or
+    `failed`. A comment line goes out when nothing changed for a while so
+    proxies keep the connection open.
+    """
+    last: Optional[Dict[str, Any]] = None
+    idle = 0.0
+    while True:
+        current = await run_in_threadpool(_load_status, bind, job_id)
+        if current is None:
+            return
+        if current != last:
+            last, idle = current, 0.0
+            if current["status"] == "succeeded":
+                event = "done"
+            elif current["status"] == "failed":
+                event = "failed"
+            else:
+                event = "progress"
+            yield f"event: {event}\ndata: {json.dumps(current)}\n\n"
+            if event != "progress":
+                return
+        elif idle >= EVENTS_KEEPALIVE_SECONDS:
+            idle = 0.0
+            yield ": keep-alive\n\n"
+
+        await asyncio.sleep(EVENTS_POLL_SECONDS)
+        idle += EVENTS_POLL_SECONDS
@@ -0,0 +1,164 @@
+"""
+Cache of AI resume parses, keyed by the uploaded file.
+
+Parsing an upload means a full Claude call, yet users routinely upload
+the same file twice (a retry after a timeout, /parse followed by
+/upload, importing the same PDF again). The structured result of
+parse_resume_file() depends only on the file and the parser, so it is
+cached in Redis under
+
+    cache:resume_parse:user:{user_id}:{sha256(PARSER_VERSION | file type | sha256(file bytes))}
+
+  * Entries are scoped per user: a hit never hands one user's parse to
+    another, and hit/miss timing reveals nothing about other users' files.
+  * Changing the prompt, model or text extraction bumps
+    resume_parser_service.PARSER_VERSION; old entries are simply never
+    read again and expire after RESUME_PARSE_CACHE_TTL.
+  * Each user keeps at most RESUME_PARSE_CACHE_MAX_ENTRIES parses (oldest
+    written dropped first), tracked in a sorted set per user that is
+    trimmed in the same MULTI as the write, so concurrent uploads can't
+    lose each other's entries. Results larger than
+    RESUME_PARSE_CACHE_MAX_ENTRY_KB are not cached at all.
+  * Failed parses are never cached.
+
+Parses hold personal data, so they are only ever stored in Redis with a
+TTL (SETEX) — never in RedisService's in-process fallback. Without a
+connected Redis every call goes straight to the parser.
+Background jobs, which run on worker threads, use the *_sync variants.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.services.redis_service import get_redis_service
+from app.services.resume_parser_service import PARSER_VERSION
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def parse_cache_digest(file_sha256: str, file_type: str) -> str:
+    """Hash of what a parse result depends on, given the file's SHA-256."""
+    digest = hashlib.sha256()
+    for part in (PARSER_VERSION, file_type, file_sha256):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _entry_key(user_id: int, digest: str) -> str:
+    return f"cache:resume_parse:user:{user_id}:{digest}"
+
+
+def _index_key(user_id: int) -> str:
+    return f"cache:resume_parse:user:{user_id}:index"
+
+
+def _redis():
+    """The RedisService, if caching is on and Redis is connected."""
+    if not settings.RESUME_PARSE_CACHE_ENABLED:
+        return None
+    try:
+        redis = get_redis_service()
+    except RuntimeError:
+        return None  # Redis never initialized (scripts, tests)
+    return redis if redis.is_connected else None
+
+
+async def get_cached_parse(user_id: int, digest: str) -> Optional[Dict[str, Any]]:
+    """The user's cached parse result for `digest`, or None."""
+    redis = _redis()
+    if redis is None:
+        return None
+    try:
+        value = await redis.redis.get(_entry_key(user_id, digest))
+    except Exception as e:
+        logger.warning(f"Parse cache GET failed for user {user_id}: {e}")
+        return None
+    return json.loads(value) if value else None
+
+
+async def store_parse(user_id: int, digest: str, parsed_data: Dict[str, Any]) -> None:
+    """Cache a parse result, dropping the user's oldest entries over the limit."""
+    redis = _redis()
+    if redis is None:
+        return
+    serialized = json.dumps(parsed_data)
+    if len(serialized) > settings.RESUME_PARSE_CACHE_MAX_ENTRY_KB * 1024:
+        logger.info(f"Parse result for user {user_id} not cached: {len(serialized)} bytes")
+        return
+
+    ttl = settings.RESUME_PARSE_CACHE_TTL
+    index_key = _index_key(user_id)
+    keep = settings.RESUME_PARSE_CACHE_MAX_ENTRIES
+    try:
+        pipe = redis.redis.pipeline(transaction=True)
+        pipe.setex(_entry_key(user_id, digest), ttl, serialized)
+        pipe.zadd(index_key, {digest: time.time()})
+        pipe.zrange(index_key, 0, -(keep + 1))   # everything but the newest `keep`
+        pipe.zremrangebyrank(index_key, 0, -(keep + 1))
+        pipe.expire(index_key, ttl)
+        evicted = (await pipe.execute())[2]
+        if evicted:
+            await redis.redis.delete(*(_entry_key(user_id, old) for old in evicted))
+    except Exception as e:
+        logger.warning(f"Parse cache SET failed for user {user_id}: {e}")
+
+
+async def cached_parse(
+    user_id: int,
+    file_sha256: str,
+    file_type: str,
+    parse: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Return the user's cached parse of the file with this hash, or run
+    `parse()` in the threadpool and cache its result. Exceptions from
+    `parse` propagate and nothing is cached.
+    """
+    digest = parse_cache_digest(file_sha256, file_type)
+    cached = await get_cached_parse(user_id, digest)
+    if cached is not None:
+        logger.info(f"Parse cache hit for user {user_id}: {file_sha256[:12]}")
+        return cached
+
+    parsed_data = await run_in_threadpool(parse)
+    await store_parse(user_id, digest, parsed_data)
+    return parsed_data
+
+
+# ── From worker threads ────────────────────────────────────────────────────
+
+def _on_redis_loop(make_coro: Callable[[], Any]) -> Any:
+    """
+    Run a cache coroutine on the event loop that owns the Redis client.
+
+    For job handlers and other worker threads only — calling this on the
+    loop itself would deadlock. Cache errors are logged and read as a miss.
+    """
+    redis = _redis()
+    loop = redis.loop if redis is not None else None
+    if loop is None or loop.is_closed():
+        return None
+    try:
+        return asyncio.run_coroutine_threadsafe(make_coro(), loop).result(timeout=5)
+    except Exception as exc:
+        logger.warning(f"Parse cache unavailable: {exc}")
+        return None
+
+
+def get_cached_parse_sync(user_id: int, digest: str) -> Optional[Dict[str, Any]]:
+    """get_cached_parse() from a worker thread."""
+    return _on_redis_loop(lambda: get_cached_parse(user_id, digest))
+
+
+def store_parse_sync(user_id: int, digest: str, parsed_data: Dict[str, Any]) -> None:
+    """store_parse() from a worker thread."""
+    _on_redis_loop(lambda: store_parse(user_id, digest, parsed_data))
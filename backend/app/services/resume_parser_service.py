@@ -6,15 +6,113 @@ extract structured information using AI.
 """
 
 import logging
-from typing import Dict, Any, Optional
-from io import BytesIO
-import PyPDF2
-from docx import Document
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 from anthropic import Anthropic
 import os
 import json
 
+from app.config import get_settings
+from app.services.resume_preparser import PreParsedResume, preparse_resume
+from app.services.text_extraction import extract_docx_text, extract_pdf_text
+
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Bump whenever the prompt, model or text extraction changes so cached
+# parse results from older code are no longer served (see resume_parse_cache)
+PARSER_VERSION = "3"
+
+
+# Output schema field by field; the gap-filling prompt asks for a subset
+PARSE_SCHEMA = {
+    "full_name": '"extracted full name"',
+    "email": '"extracted email"',
+    "phone": '"extracted phone number"',
+    "location": '"extracted location/city"',
+    "linkedin": '"extracted LinkedIn profile URL"',
+    "summary": '"extracted professional summary or objective"',
+    "experience": """[
+        {
+            "company": "company name",
+            "position": "job title",
+            "start_date": "start date",
+            "end_date": "end date or Present",
+            "bullets": ["achievement or responsibility 1", "achievement or responsibility 2", "achievement or responsibility 3"]
+        }
+    ]""",
+    "education": """[
+        {
+            "institution": "school/university name",
+            "degree": "degree type and field",
+            "start_date": "start date",
+            "end_date": "end date",
+            "gpa": "GPA if mentioned"
+        }
+    ]""",
+    "skills": '["skill1", "skill2", "skill3"]',
+    "projects": """[
+        {
+            "name": "project name",
+            "description": "project description",
+            "technologies": ["tech1", "tech2"]
+        }
+    ]""",
+    "certifications": '["certification1", "certification2"]',
+    "languages": '["language1", "language2"]',
+}
+
+VERBATIM_RULE = (
+    "CRITICAL: Preserve the EXACT wording, keywords, and technical terms as written. "
+    "Do NOT paraphrase, summarize, or reword anything."
+)
+
+PARSE_INSTRUCTIONS = """CRITICAL INSTRUCTIONS:
+- Copy text VERBATIM - do not paraphrase or summarize
+- Preserve ALL keywords, metrics, and technical terms exactly as written
+- Extract every bullet point completely - do not shorten or combine them
+- Keep all numbers, percentages, and quantifications exactly as stated
+- Maintain the exact phrasing of achievements (e.g., "Led", "Developed", "Implemented")
+- If any field is not found, use null or empty array []
+- Ensure all dates are in readable format
+- Extract ALL skills mentioned, including technical tools, frameworks, and methodologies
+- For experience bullets: extract EVERY achievement separately, preserving exact wording
+- Return ONLY the JSON object, no additional text"""
+
+
+def _schema(fields: List[str]) -> str:
+    return "{\n" + ",\n".join(f'    "{field}": {PARSE_SCHEMA[field]}' for field in fields) + "\n}"
+
+
+def _full_prompt(resume_text: str) -> str:
+    """Prompt asking for every field of the whole resume."""
+    return f"""You are a resume parsing expert. Extract structured information from the following resume text.
+
+{VERBATIM_RULE}
+
+Resume Text:
+{resume_text}
+
+Extract and return ONLY a valid JSON object with the following structure. Do not include any other text or explanation:
+
+{_schema(list(PARSE_SCHEMA))}
+
+{PARSE_INSTRUCTIONS}"""
+
+
+def _gap_prompt(preparsed: PreParsedResume) -> str:
+    """Prompt asking only for the fields the pre-parser left unresolved."""
+    return f"""You are a resume parsing expert. Most of this resume has already been parsed; below are only the parts that still need it. Extract structured information from them.
+
+{VERBATIM_RULE}
+
+Resume Text (excerpt):
+{preparsed.unresolved_text()}
+
+Extract and return ONLY a valid JSON object with exactly the following fields. Do not include any other text or explanation:
+
+{_schema(preparsed.fields_to_fill)}
+
+{PARSE_INSTRUCTIONS}"""
 
 
 class ResumeParserService:
@@ -24,12 +122,12 @@ class ResumeParserService:
         """Initialize the resume parser service."""
         self.anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
-    def extract_text_from_pdf(self, file_content: bytes) -> str:
+    def extract_text_from_pdf(self, file_content: Union[bytes, BinaryIO]) -> str:
         """
         Extract text from PDF file.
 
         Args:
-            file_content: PDF file content as bytes
+            file_content: PDF file content as bytes or a binary file object
 
         Returns:
             str: Extracted text from the PDF
@@ -38,28 +136,21 @@ class ResumeParserService:
             Exception: If PDF extraction fails
         """
         try:
-            pdf_file = BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-
+            text = extract_pdf_text(file_content)
             logger.info(f"Extracted {len(text)} characters from PDF")
-            return text.strip()
+            return text
 
         except Exception as e:
             logger.error(f"Failed to extract text from PDF: {str(e)}")
             raise Exception(f"Failed to parse PDF file: {str(e)}")
 
-    def extract_text_from_docx(self, file_content: bytes) -> str:
+    def extract_text_from_docx(self, file_content: Union[bytes, BinaryIO]) -> str:
         """
-        Extract text from DOCX file.
+        Extract text from DOCX file, paragraphs and table cells in
+        document order.
 
         Args:
-            file_content: DOCX file content as bytes
+            file_content: DOCX file content as bytes or a binary file object
 
         Returns:
             str: Extracted text from the DOCX
@@ -68,31 +159,40 @@ class ResumeParserService:
             Exception: If DOCX extraction fails
         """
         try:
-            docx_file = BytesIO(file_content)
-            doc = Document(docx_file)
-
-            text = ""
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
-
-            # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text += cell.text + "\n"
-
+            text = extract_docx_text(file_content)
             logger.info(f"Extracted {len(text)} characters from DOCX")
-            return text.strip()
+            return text
 
         except Exception as e:
             logger.error(f"Failed to extract text from DOCX: {str(e)}")
             raise Exception(f"Failed to parse DOCX file: {str(e)}")
 
+    def build_parse_prompt(self, resume_text: str) -> Tuple[Optional[PreParsedResume], Optional[str]]:
+        """
+        Pre-parse resume text and build the Claude prompt for what is left.
+
+        Args:
+            resume_text: Raw text extracted from resume
+
+        Returns:
+            (pre-parse result, prompt): the prompt is None when the rules
+            resolved everything, and asks for every field when they found
+            no sections (or pre-parsing is disabled)
+        """
+        if not settings.RESUME_PREPARSE_ENABLED:
+            return None, _full_prompt(resume_text)
+
+        preparsed = preparse_resume(resume_text)
+        if not preparsed.sections:
+            return None, _full_prompt(resume_text)
+        if preparsed.complete:
+            return preparsed, None
+        return preparsed, _gap_prompt(preparsed)
+
     def parse_resume_with_ai(self, resume_text: str) -> Dict[str, Any]:
         """
-        Parse resume text using Claude AI to extract structured data.
+        Parse resume text into structured data, using Claude for the parts
+        the rule-based pre-parser can't resolve (see resume_preparser).
 
         Args:
             resume_text: Raw text extracted from resume
@@ -103,64 +203,20 @@ class ResumeParserService:
         Raises:
             Exception: If AI parsing fails
         """
-        try:
-            prompt = f"""You are a resume parsing expert. Extract structured information from the following resume text.
-
-CRITICAL: Preserve the EXACT wording, keywords, and technical terms as written. Do NOT paraphrase, summarize, or reword anything.
-
-Resume Text:
-{resume_text}
-
-Extract and return ONLY a valid JSON object with the following structure. Do not include any other text or explanation:
-
-{{
-    "full_name": "extracted full name",
-    "email": "extracted email",
-    "phone": "extracted phone number",
-    "location": "extracted location/city",
-    "summary": "extracted professional summary or objective",
-    "experience": [
-        {{
-            "company": "company name",
-            "position": "job title",
-            "start_date": "start date",
-            "end_date": "end date or Present",
-            "bullets": ["achievement or responsibility 1", "achievement or responsibility 2", "achievement or responsibility 3"]
-        }}
-    ],
-    "education": [
-        {{
-            "institution": "school/university name",
-            "degree": "degree type and field",
-            "start_date": "start date",
-            "end_date": "end date",
-            "gpa": "GPA if mentioned"
-        }}
-    ],
-    "skills": ["skill1", "skill2", "skill3"],
-    "projects": [
-        {{
-            "name": "project name",
-            "description": "project description",
-            "technologies": ["tech1", "tech2"]
-        }}
-    ],
-    "certifications": ["certification1", "certification2"],
-    "languages": ["language1", "language2"]
-}}
+        preparsed, prompt = self.build_parse_prompt(resume_text)
+        if prompt is None:
+            logger.info("Resume parsed by rules alone; no AI call needed")
+            return preparsed.data
 
-CRITICAL INSTRUCTIONS:
-- Copy text VERBATIM - do not paraphrase or summarize
-- Preserve ALL keywords, metrics, and technical terms exactly as written
-- Extract every bullet point completely - do not shorten or combine them
-- Keep all numbers, percentages, and quantifications exactly as stated
-- Maintain the exact phrasing of achievements (e.g., "Led", "Developed", "Implemented")
-- If any field is not found, use null or empty array []
-- Ensure all dates are in readable format
-- Extract ALL skills mentioned, including technical tools, frameworks, and methodologies
-- For experience bullets: extract EVERY achievement separately, preserving exact wording
-- Return ONLY the JSON object, no additional text"""
+        parsed_data = self._ask_claude(prompt)
+        if preparsed is None:
+            return parsed_data
+        logger.info(f"Resume pre-parsed; asked AI for {', '.join(preparsed.fields_to_fill)}")
+        return preparsed.merge(parsed_data)
 
+    def _ask_claude(self, prompt: str) -> Dict[str, Any]:
+        """Send a parse prompt to Claude and decode the JSON it answers with."""
+        try:
             response = self.anthropic_client.messages.create(
                 model="claude-sonnet-4-5-20250929",  # Claude 4.5 Sonnet
                 max_tokens=8192,  # Increased for better parsing
@@ -190,7 +246,10 @@ CRITICAL INSTRUCTIONS:
             # Parse JSON
             parsed_data = json.loads(response_text)
 
-            logger.info("Successfully parsed resume with AI")
+            logger.info(
+                f"Successfully parsed resume with AI "
+                f"({response.usage.input_tokens} input / {response.usage.output_tokens} output tokens)"
+            )
             return parsed_data
 
         except json.JSONDecodeError as e:
@@ -202,27 +261,30 @@ CRITICAL INSTRUCTIONS:
             logger.error(f"Failed to parse resume with AI: {str(e)}")
             raise Exception(f"Failed to parse resume: {str(e)}")
 
-    def parse_resume_file(
+    def extract_text(
         self,
-        file_content: bytes,
-        filename: str
-    ) -> Dict[str, Any]:
+        file_content: Union[bytes, BinaryIO],
+        filename: str,
+        file_type: Optional[str] = None
+    ) -> str:
         """
-        Parse a resume file (PDF or DOCX) and extract structured data.
+        Extract the text of a resume file (PDF or DOCX).
 
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes or a binary file object
             filename: Original filename
+            file_type: "pdf" or "docx" as detected from the content;
+                defaults to the filename's extension
 
         Returns:
-            Dict containing structured resume data
+            str: Extracted text, at least 50 characters
 
         Raises:
-            ValueError: If file format is not supported
-            Exception: If parsing fails
+            ValueError: If the file format is not supported or has no text
+            Exception: If extraction fails
         """
         # Determine file type
-        file_extension = filename.lower().split(".")[-1]
+        file_extension = file_type or filename.lower().split(".")[-1]
 
         # Extract text based on file type
         if file_extension == "pdf":
@@ -242,6 +304,31 @@ CRITICAL INSTRUCTIONS:
                 "Please ensure the file is not empty or corrupted."
             )
 
+        return resume_text
+
+    def parse_resume_file(
+        self,
+        file_content: Union[bytes, BinaryIO],
+        filename: str,
+        file_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Parse a resume file (PDF or DOCX) and extract structured data.
+
+        Args:
+            file_content: File content as bytes or a binary file object
+            filename: Original filename
+            file_type: "pdf" or "docx" as detected from the content
+
+        Returns:
+            Dict containing structured resume data
+
+        Raises:
+            ValueError: If file format is not supported
+            Exception: If parsing fails
+        """
+        resume_text = self.extract_text(file_content, filename, file_type)
+
         # Parse with AI
         parsed_data = self.parse_resume_with_ai(resume_text)
 
@@ -264,7 +351,7 @@ CRITICAL INSTRUCTIONS:
                 "email": parsed_data.get("email", ""),
                 "phone": parsed_data.get("phone", ""),
                 "location": parsed_data.get("location", ""),
-                "linkedin": "",
+                "linkedin": parsed_data.get("linkedin") or "",
                 "github": ""
             },
             "summary": parsed_data.get("summary") or "",
@@ -0,0 +1,497 @@
+"""
+Rule-based pre-parser for extracted resume text.
+
+parse_resume_with_ai used to send the whole text to Claude and ask for
+every field. Most resumes — certainly the ones exported from our own
+templates — follow a few layouts that plain rules read reliably, so the
+text is parsed locally first:
+
+  * section headings ("WORK EXPERIENCE", "Education:", ...) split the text
+  * email, phone and LinkedIn come from regular expressions; the name is
+    the first line when it looks like one
+  * experience and education entries are anchored on their date (or
+    year) line; the line(s) around it give title / company or degree /
+    institution, told apart by keywords
+  * bullets, comma or pipe separated lists and "Technologies:" lines are
+    split into items; wrapped lines are joined back
+
+Anything the rules aren't sure about is left unresolved rather than
+guessed. If nothing is, the result is used as is and Claude isn't called;
+otherwise Claude gets only the unresolved sections and is asked only for
+the missing fields (see ResumeParserService.parse_resume_with_ai).
+benchmarks/bench_resume_preparse.py compares prompt sizes and latency.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+CONTACT_FIELDS = ["full_name", "email", "phone", "location", "linkedin"]
+SECTION_FIELDS = ["summary", "experience", "education", "skills", "projects", "certifications", "languages"]
+
+# Fields that text under other headings ("Awards", "Internships" spelled
+# differently, ...) may belong to
+OPEN_LIST_FIELDS = ["experience", "education", "skills", "projects", "certifications", "languages"]
+
+SECTION_HEADINGS = {
+    "summary": [
+        "summary", "professional summary", "career summary", "profile", "professional profile",
+        "objective", "career objective", "about me", "about",
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "employment", "employment history",
+        "work history", "career history", "relevant experience", "internships", "internship",
+    ],
+    "education": [
+        "education", "academic background", "academic qualifications", "educational qualifications",
+        "education and training", "qualifications",
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core skills", "core competencies", "competencies",
+        "skills and tools", "skills & tools", "tools and technologies", "tools & technologies",
+    ],
+    "projects": ["projects", "personal projects", "key projects", "academic projects", "selected projects"],
+    "certifications": [
+        "certifications", "certificates", "certification", "licenses and certifications",
+        "licenses & certifications", "courses and certifications", "courses & certifications",
+    ],
+    "languages": ["languages", "spoken languages", "language proficiency"],
+}
+_HEADINGS = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+# Headings of sections without a field of their own, whose items may
+# still belong in one (an award listed as a certification, ...)
+OTHER_HEADINGS = {
+    "achievements", "awards", "honors", "honours", "awards and achievements", "awards & achievements",
+    "accomplishments", "publications", "volunteering", "volunteer experience",
+    "extracurricular activities", "activities", "leadership", "training", "trainings",
+    "positions of responsibility",
+}
+
+# Headings of sections with nothing the parse schema keeps; dropped
+IGNORED_HEADINGS = {
+    "interests", "hobbies", "hobbies and interests", "hobbies & interests", "references",
+    "declaration", "personal details", "personal information", "strengths",
+}
+
+BULLET_MARKERS = "•●▪◦‣∙·*-–—\x7f"
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+LINKEDIN_RE = re.compile(r"(?:https?://)?(?:[\w-]+\.)?linkedin\.com/(?:in|pub)/[\w%-]+/?", re.IGNORECASE)
+URL_RE = re.compile(r"^(?:https?://)?(?:www\.)?[\w-]+(?:\.[\w-]+)+(?:/\S*)?$", re.IGNORECASE)
+PHONE_RE = re.compile(r"^\+?[\d\s().-]{7,20}$")
+LOCATION_RE = re.compile(r"^[A-Z][\w.'-]*(?: [A-Z][\w.'-]*)*, ?[A-Z][\w.'-]*(?: [A-Z][\w.'-]*)*$|^Remote$")
+NAME_RE = re.compile(r"^[^\W\d_][^\W\d_.'-]*(?:[.'-]?[^\W\d_]+)*\.?(?: [^\W\d_][^\W\d_.'-]*(?:[.'-]?[^\W\d_]+)*\.?){1,4}$")
+LABEL_RE = re.compile(r"^(?:e-?mail|phone|mobile|tel|contact|linkedin|location|address|city)\s*:\s*", re.IGNORECASE)
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH},?\s+\d{{4}}|\d{{1,2}}/\d{{4}}|(?:19|20)\d{{2}})"
+DATE_RANGE_RE = re.compile(
+    rf"(?P<start>{_DATE})\s*(?:-|–|—|to)\s*(?P<end>{_DATE}|present|current|now|till date|ongoing)",
+    re.IGNORECASE,
+)
+SINGLE_DATE_RE = re.compile(rf"(?<![\w/]){_DATE}(?![\w/])", re.IGNORECASE)
+GPA_RE = re.compile(r"^(?:c?gpa|cpi|grade|percentage|score)\s*:?\s*(?P<value>[\d.]+\s*(?:/\s*[\d.]+|%)?)$", re.IGNORECASE)
+TECH_RE = re.compile(r"^(?:technologies|tech stack|tech|stack|tools|built with)\s*:\s*(?P<items>.+)$", re.IGNORECASE)
+
+POSITION_RE = re.compile(
+    r"\b(?:engineer|developer|manager|analyst|intern|lead|designer|consultant|director|scientist|architect|"
+    r"specialist|officer|associate|head|executive|administrator|coordinator|programmer|founder|co-founder|"
+    r"cto|ceo|cfo|vp|president|assistant|technician|trainee|researcher|fellow|tester|accountant|teacher|"
+    r"professor|lecturer|writer|editor|recruiter|representative|supervisor|advisor|strategist|sde|sre)s?\b",
+    re.IGNORECASE,
+)
+COMPANY_RE = re.compile(
+    r"\b(?:inc|ltd|llc|llp|pvt|plc|gmbh|corp|corporation|company|co|technologies|solutions|systems|labs|"
+    r"group|bank|consulting|services|software|studios?|ventures|partners)\b\.?",
+    re.IGNORECASE,
+)
+DEGREE_RE = re.compile(
+    r"\b(?:b\.?\s?tech|m\.?\s?tech|b\.?\s?e|m\.?\s?e|b\.?\s?sc|m\.?\s?sc|b\.?\s?com|m\.?\s?com|b\.?\s?a|"
+    r"m\.?\s?a|b\.?\s?s|m\.?\s?s|bba|mba|bca|mca|ph\.?\s?d|bachelor'?s?|master'?s?|diploma|doctorate|"
+    r"associate'?s? degree|class\s+(?:x|xii|10|12)(?:th)?|hsc|ssc|high school|higher secondary|a-levels|gcse)\b",
+    re.IGNORECASE,
+)
+INSTITUTION_RE = re.compile(
+    r"\b(?:university|college|institute|school|academy|polytechnic|vidyalaya|iit|nit|iiit|iim|bits)\b",
+    re.IGNORECASE,
+)
+
+_PART_SEPARATORS = re.compile(r"\s+[|•·]\s+|\s*\|\s*|\s+[–—-]\s+|\t+|\s{2,}")
+_LIST_SEPARATORS = re.compile(r"\s*[,;|•·]\s*")
+
+# Lines at least this long that don't end a sentence are taken to wrap
+# onto the next line
+WRAP_MIN_CHARS = 60
+
+
+def _empty_data() -> Dict[str, Any]:
+    data: Dict[str, Any] = {field: None for field in CONTACT_FIELDS}
+    data["summary"] = None
+    for field in SECTION_FIELDS[1:]:
+        data[field] = []
+    return data
+
+
+class PreParsedResume:
+    """What the rules could read from a resume, and what they couldn't."""
+
+    def __init__(self) -> None:
+        self.data = _empty_data()
+        self.unresolved: List[str] = []
+        self.header: List[str] = []
+        # section -> (heading as written, lines)
+        self.sections: Dict[str, Tuple[str, List[str]]] = {}
+        self.unknown_sections: List[Tuple[str, List[str]]] = []
+
+    @property
+    def complete(self) -> bool:
+        """Everything was resolved: no AI call is needed."""
+        return bool(self.sections) and not self.unresolved and not self.unknown_sections
+
+    @property
+    def fields_to_fill(self) -> List[str]:
+        """Fields to ask Claude for, in output order."""
+        wanted = set(self.unresolved)
+        if self.unknown_sections:
+            wanted.update(OPEN_LIST_FIELDS)
+        return [field for field in CONTACT_FIELDS + SECTION_FIELDS if field in wanted]
+
+    def unresolved_text(self) -> str:
+        """The parts of the resume Claude needs to see to fill the gaps."""
+        blocks = []
+        if any(field in self.unresolved for field in CONTACT_FIELDS) or (
+            "summary" in self.unresolved and "summary" not in self.sections
+        ):
+            blocks.append("\n".join(self.header))
+        for field in SECTION_FIELDS:
+            if field in self.unresolved and field in self.sections:
+                heading, lines = self.sections[field]
+                blocks.append("\n".join([heading] + lines))
+        for heading, lines in self.unknown_sections:
+            blocks.append("\n".join([heading] + lines))
+        return "\n\n".join(block for block in blocks if block.strip())
+
+    def merge(self, filled: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The full parse, with Claude's answers for the gaps.
+
+        Unresolved fields take Claude's value; items Claude found for
+        resolved list fields (from unrecognised sections) are appended.
+        """
+        data = dict(self.data)
+        for field, value in filled.items():
+            if field not in data:
+                continue
+            if field in self.unresolved:
+                data[field] = value
+            elif isinstance(data[field], list) and isinstance(value, list):
+                data[field] = _dedupe(data[field] + value)
+        return data
+
+
+# ── Line helpers ───────────────────────────────────────────────────────────
+
+def _is_bullet(line: str) -> bool:
+    return len(line) > 1 and line[0] in BULLET_MARKERS and (line[1].isspace() or line[0] not in "*-–—")
+
+
+def _strip_bullet(line: str) -> str:
+    return line[1:].strip() if _is_bullet(line) else line
+
+
+def _wraps(previous: str) -> bool:
+    return len(previous) >= WRAP_MIN_CHARS and previous[-1] not in ".!?:;"
+
+
+def _continues(previous: str, line: str) -> bool:
+    """`line` is the wrapped remainder of `previous`."""
+    return bool(previous) and not _is_bullet(line) and (_wraps(previous) or line[0].islower())
+
+
+def _parts(line: str) -> List[str]:
+    return [part.strip(" ,") for part in _PART_SEPARATORS.split(line) if part.strip(" ,")]
+
+
+def _dedupe(items: List[Any]) -> List[Any]:
+    seen, unique = set(), []
+    for item in items:
+        key = item.lower() if isinstance(item, str) else repr(item)
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def _heading(line: str) -> Optional[str]:
+    """
+    The section a heading line opens: a field name, "" for other
+    sections, "-" for ignored ones; None if the line is no heading.
+    """
+    text = line.strip().rstrip(":").strip()
+    if not text or len(text.split()) > 5 or any(c.isdigit() for c in text):
+        return None
+    normalized = re.sub(r"\s+", " ", re.sub(r"[^a-z& ]", " ", text.lower())).strip()
+    if normalized in _HEADINGS:
+        return _HEADINGS[normalized]
+    if normalized in IGNORED_HEADINGS:
+        return "-"
+    if normalized in OTHER_HEADINGS or re.fullmatch(r"[A-Z&/]+(?: [A-Z&/]+){1,3}", text):
+        return ""
+    return None
+
+
+# ── Header: name and contact details ───────────────────────────────────────
+
+def _parse_header(lines: List[str], result: PreParsedResume) -> None:
+    data = result.data
+    leftovers = []
+    for index, line in enumerate(lines):
+        for part in _parts(line) or [line]:
+            value = LABEL_RE.sub("", part).strip()
+            if EMAIL_RE.fullmatch(value):
+                data["email"] = data["email"] or value
+            elif LINKEDIN_RE.fullmatch(value):
+                data["linkedin"] = data["linkedin"] or value
+            elif PHONE_RE.match(value) and 7 <= sum(c.isdigit() for c in value) <= 15:
+                data["phone"] = data["phone"] or value
+            elif URL_RE.match(value) and "." in value and " " not in value:
+                continue  # portfolio / GitHub: not in the parse schema
+            elif LOCATION_RE.match(value):
+                data["location"] = data["location"] or value
+            elif index == 0 and data["full_name"] is None and NAME_RE.match(value):
+                data["full_name"] = value
+            elif index == 1 and data["full_name"] and POSITION_RE.search(value) and len(value.split()) <= 6:
+                continue  # headline under the name ("Senior Backend Engineer")
+            else:
+                leftovers.append(value)
+
+    if data["full_name"] is None:
+        result.unresolved.append("full_name")
+    if leftovers:
+        # Unlabelled text: possibly a location, or a summary without a heading
+        result.unresolved.append("location")
+        if "summary" not in result.sections:
+            result.unresolved.append("summary")
+
+
+# ── Sections ───────────────────────────────────────────────────────────────
+
+def _parse_summary(lines: List[str]) -> Optional[str]:
+    return " ".join(_strip_bullet(line) for line in lines) or None
+
+
+def _parse_list(lines: List[str]) -> Optional[List[str]]:
+    """Skills / languages: items separated by commas, pipes, bullets or lines."""
+    chunks: List[str] = []
+    for line in lines:
+        text = _strip_bullet(line)
+        label, colon, rest = text.partition(":")
+        if colon and rest.strip() and len(label.split()) <= 4:
+            text = rest.strip()  # "Languages: Python, Go"
+            chunks.append(text)
+        elif chunks and not _is_bullet(line) and _wraps(chunks[-1]):
+            chunks[-1] += " " + text
+        else:
+            chunks.append(text)
+    items = [item.strip(" .") for chunk in chunks for item in _LIST_SEPARATORS.split(chunk)]
+    return _dedupe([item for item in items if item])
+
+
+def _parse_certifications(lines: List[str]) -> Optional[List[str]]:
+    items: List[str] = []
+    for line in lines:
+        text = _strip_bullet(line)
+        if items and not _is_bullet(line) and SINGLE_DATE_RE.search(text) and not SINGLE_DATE_RE.search(items[-1]) \
+                and len(text.split()) <= 6:
+            items[-1] += " | " + text  # issuer / date line under the name
+        elif items and _continues(items[-1], line):
+            items[-1] += " " + text
+        else:
+            items.append(text)
+    return items
+
+
+def _body(lines: List[str]) -> Optional[List[str]]:
+    """Bullets of an entry, wrapped lines rejoined; None if other text is mixed in."""
+    bullets: List[str] = []
+    for line in lines:
+        if _is_bullet(line):
+            bullets.append(_strip_bullet(line))
+        elif bullets and _continues(bullets[-1], line):
+            bullets[-1] += " " + line
+        else:
+            return None
+    return bullets
+
+
+def _anchored_entries(lines: List[str], is_anchor) -> Optional[List[Tuple[List[str], str, List[str]]]]:
+    """
+    Split a section into entries around anchor (date) lines.
+
+    Returns (header parts, anchor line, body lines) per entry: the parts
+    come from the anchor line and up to two non-bullet lines just before
+    it, taken until two parts other than a location or grade are found.
+    """
+    anchors = [i for i, line in enumerate(lines) if not _is_bullet(line) and is_anchor(line) is not None]
+    if not anchors:
+        return None
+    headers = []
+    for i in anchors:
+        parts = _parts(is_anchor(lines[i]).strip(" |,–—-"))
+        start = i
+        while len(_names(parts)) < 2 and start > 0 and i - start < 2 and not _is_bullet(lines[start - 1]):
+            start -= 1
+            parts = _parts(lines[start]) + parts
+        headers.append((start, parts))
+
+    if headers[0][0] != 0:
+        return None  # text before the first entry
+    entries = []
+    for n, (i, (start, parts)) in enumerate(zip(anchors, headers)):
+        end = headers[n + 1][0] if n + 1 < len(headers) else len(lines)
+        entries.append((parts, lines[i], lines[i + 1:end]))
+    return entries
+
+
+def _names(parts: List[str]) -> List[str]:
+    return [part for part in parts if not LOCATION_RE.match(part) and not GPA_RE.match(part)]
+
+
+def _classify(parts: List[str], primary: re.Pattern, secondary: re.Pattern) -> Optional[Tuple[str, str]]:
+    """(primary part, secondary part) from two parts told apart by keywords."""
+    if len(parts) != 2:
+        return None
+    first, second = (bool(primary.search(part)) for part in parts)
+    if first != second:
+        return (parts[0], parts[1]) if first else (parts[1], parts[0])
+    first, second = (bool(secondary.search(part)) for part in parts)
+    if first != second:
+        return (parts[1], parts[0]) if first else (parts[0], parts[1])
+    return None
+
+
+def _date_range(line: str) -> Tuple[Optional[str], Optional[str]]:
+    match = DATE_RANGE_RE.search(line)
+    if match:
+        return match.group("start"), match.group("end")
+    match = SINGLE_DATE_RE.search(line)
+    return None, match.group(0) if match else None
+
+
+def _without_dates(line: str) -> Optional[str]:
+    """`line` minus its date range, or None when it has none."""
+    match = DATE_RANGE_RE.search(line)
+    return line[:match.start()] + line[match.end():] if match else None
+
+
+def _without_year(line: str) -> Optional[str]:
+    stripped = _without_dates(line)
+    if stripped is not None:
+        return stripped
+    match = SINGLE_DATE_RE.search(line)
+    return line[:match.start()] + line[match.end():] if match else None
+
+
+def _parse_experience(lines: List[str]) -> Optional[List[Dict[str, Any]]]:
+    entries = _anchored_entries(lines, _without_dates)
+    if entries is None:
+        return None
+    experience = []
+    for parts, anchor, body in entries:
+        roles = _classify(_names(parts), POSITION_RE, COMPANY_RE)
+        bullets = _body(body)
+        if roles is None or bullets is None:
+            return None
+        start, end = _date_range(anchor)
+        experience.append({
+            "company": roles[1], "position": roles[0],
+            "start_date": start, "end_date": end, "bullets": bullets,
+        })
+    return experience
+
+
+def _parse_education(lines: List[str]) -> Optional[List[Dict[str, Any]]]:
+    entries = _anchored_entries(lines, _without_year)
+    if entries is None:
+        return None
+    education = []
+    for parts, anchor, body in entries:
+        grades = [GPA_RE.match(part).group("value") for part in parts if GPA_RE.match(part)]
+        degree = _classify(_names(parts), DEGREE_RE, INSTITUTION_RE)
+        if degree is None or any(not _is_bullet(line) for line in body):
+            return None  # bullets (coursework, honours) have no field; other text is unexpected
+        start, end = _date_range(anchor)
+        education.append({
+            "institution": degree[1], "degree": degree[0],
+            "start_date": start, "end_date": end, "gpa": grades[0] if grades else None,
+        })
+    return education
+
+
+def _parse_projects(lines: List[str]) -> Optional[List[Dict[str, Any]]]:
+    anchors = [i for i, line in enumerate(lines) if TECH_RE.match(line)]
+    if not anchors or anchors[0] != 1 or any(b - a < 2 for a, b in zip(anchors, anchors[1:])):
+        return None  # every project is a name line followed by its technologies
+    projects = []
+    for n, i in enumerate(anchors):
+        end = anchors[n + 1] - 1 if n + 1 < len(anchors) else len(lines)
+        name = lines[i - 1]
+        if _is_bullet(name):
+            return None
+        technologies = [item.strip() for item in _LIST_SEPARATORS.split(TECH_RE.match(lines[i]).group("items"))]
+        projects.append({
+            "name": name,
+            "description": " ".join(_strip_bullet(line) for line in lines[i + 1:end]),
+            "technologies": [item for item in technologies if item],
+        })
+    return projects
+
+
+_SECTION_PARSERS = {
+    "summary": _parse_summary,
+    "experience": _parse_experience,
+    "education": _parse_education,
+    "skills": _parse_list,
+    "projects": _parse_projects,
+    "certifications": _parse_certifications,
+    "languages": _parse_list,
+}
+
+
+def preparse_resume(text: str) -> PreParsedResume:
+    """Read what the rules can from resume text; see the module docstring."""
+    result = PreParsedResume()
+    current: List[str] = result.header
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        section = _heading(line)
+        if section is None or (section == "" and not (result.sections or result.unknown_sections)):
+            current.append(line)  # includes all-caps names above the first heading
+        elif section == "":
+            result.unknown_sections.append((line, []))
+            current = result.unknown_sections[-1][1]
+        elif section == "-":
+            current = []
+        else:
+            _, lines = result.sections.setdefault(section, (line, []))
+            current = lines
+
+    for section, (_, lines) in result.sections.items():
+        value = _SECTION_PARSERS[section](lines) if lines else None
+        if value is None and lines:
+            result.unresolved.append(section)
+        elif value is not None:
+            result.data[section] = value
+    _parse_header(result.header, result)
+
+    # Contact details outside the header (a footer, a sidebar) still count
+    data = result.data
+    if data["email"] is None and (match := EMAIL_RE.search(text)):
+        data["email"] = match.group(0)
+    if data["linkedin"] is None and (match := LINKEDIN_RE.search(text)):
+        data["linkedin"] = match.group(0)
+
+    result.unresolved = [field for field in CONTACT_FIELDS + SECTION_FIELDS if field in result.unresolved]
+    return result
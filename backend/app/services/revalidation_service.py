@@ -0,0 +1,209 @@
+"""
+On-demand ISR revalidation for the Next.js blog.
+
+Blog pages are statically cached by Next.js. Instead of letting them
+re-fetch from this API every hour, the frontend is told exactly which
+paths changed via POST {REVALIDATE_URL} (src/app/api/revalidate/route.ts):
+
+    { "paths": ["/blog/ats-resume-tips", "/blog"] }
+
+Changes are picked up from the Session itself: any commit that publishes,
+edits or removes a BlogPost queues /blog/{slug} for each affected post
+plus the listing pages. Writers of other data shown on a post's page
+(its related posts) queue those pages with revalidate_on_commit().
+
+Queued paths are debounced — a flush happens once things have been
+quiet for REVALIDATE_DEBOUNCE_SECONDS (but no later than
+REVALIDATE_MAX_WAIT_SECONDS after the first change) — and sent in
+batches of MAX_PATHS_PER_REQUEST, so a daily run that publishes several
+posts costs one request.
+
+If REVALIDATE_SECRET is not set the notifier does nothing, and the
+frontend (which needs the same secret) keeps its hourly ISR interval
+instead of the daily safety net (src/lib/blog-api.ts).
+"""
+
+import logging
+import threading
+import time
+from typing import Iterable, Optional
+
+import httpx
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.blog import BlogPost
+from app.services.http_clients import http_clients
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Pages that list posts and must be refreshed whenever any post changes
+LISTING_PATHS = ("/blog",)
+
+MAX_PATHS_PER_REQUEST = 100
+MAX_ATTEMPTS          = 3
+
+# BlogPost columns that don't change the rendered page (precomputed bodies,
+# search-engine bookkeeping); changing only these doesn't revalidate
+_NON_RENDERED_COLUMNS = frozenset({
+    "content_hash", "body_gzip", "body_br",
+    "indexnow_submitted", "indexnow_submitted_at",
+    "google_submitted", "google_submitted_at",
+})
+
+
+class RevalidationNotifier:
+    """Debounced, batched revalidation requests to the Next.js frontend."""
+
+    def __init__(self) -> None:
+        self.url    = settings.REVALIDATE_URL or f"{settings.SITE_URL.rstrip('/')}/api/revalidate"
+        self.secret = settings.REVALIDATE_SECRET
+        self.debounce = settings.REVALIDATE_DEBOUNCE_SECONDS
+        self.max_wait = settings.REVALIDATE_MAX_WAIT_SECONDS
+        self._pending: set[str] = set()
+        self._first_queued: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.secret)
+
+    @property
+    def client(self) -> httpx.Client:
+        return self._client or http_clients.sync_client("revalidation")
+
+    # ── Queueing ───────────────────────────────────────────────────────────
+
+    def queue_posts(self, slugs: Iterable[str]) -> None:
+        """Queue /blog/{slug} for each slug, plus the listing pages."""
+        paths = {f"/blog/{slug}" for slug in slugs}
+        if paths:
+            self.queue_paths(paths | set(LISTING_PATHS))
+
+    def queue_paths(self, paths: Iterable[str]) -> None:
+        """Add paths to the pending batch and (re)arm the debounce timer."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._pending.update(paths)
+            now = time.monotonic()
+            if self._first_queued is None:
+                self._first_queued = now
+            # Trailing debounce, capped so a steady trickle still flushes
+            delay = min(self.debounce, max(0.0, self._first_queued + self.max_wait - now))
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    # ── Sending ────────────────────────────────────────────────────────────
+
+    def flush(self) -> dict:
+        """
+        Send every pending path now. Returns { sent, failed, errors }.
+        Called by the debounce timer; safe to call directly (e.g. shutdown).
+        """
+        with self._lock:
+            paths = sorted(self._pending)
+            self._pending.clear()
+            self._first_queued = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        sent = failed = 0
+        errors: list[str] = []
+        for start in range(0, len(paths), MAX_PATHS_PER_REQUEST):
+            batch = paths[start:start + MAX_PATHS_PER_REQUEST]
+            ok, msg = self._post(batch)
+            if ok:
+                sent += len(batch)
+            else:
+                failed += len(batch)
+                errors.append(msg)
+        if paths:
+            logger.info(f"ISR revalidation: {sent} path(s) sent, {failed} failed")
+        return {"sent": sent, "failed": failed, "errors": errors}
+
+    def _post(self, paths: list[str]) -> tuple[bool, str]:
+        """POST one batch, retrying transient failures with backoff."""
+        msg = ""
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                resp = self.client.post(
+                    self.url,
+                    json={"paths": paths},
+                    headers={"X-Revalidate-Secret": self.secret},
+                )
+                if resp.status_code == 200:
+                    return True, f"HTTP 200 — {len(paths)} path(s) revalidated"
+                msg = f"HTTP {resp.status_code}: {resp.text[:200]}"
+                if resp.status_code < 500 and resp.status_code != 429:
+                    break  # bad secret / payload — retrying won't help
+            except httpx.HTTPError as exc:
+                msg = f"Revalidation request failed: {exc}"
+            if attempt < MAX_ATTEMPTS:
+                time.sleep(2 ** attempt)
+
+        logger.warning(f"ISR revalidation failed for {len(paths)} path(s): {msg}")
+        return False, msg
+
+
+# ── Session hooks ──────────────────────────────────────────────────────────
+
+def _changed_post_slugs(session: Session) -> set[str]:
+    """Slugs of posts whose rendered page is affected by this flush."""
+    slugs: set[str] = set()
+    for obj in list(session.new) + list(session.deleted):
+        if isinstance(obj, BlogPost) and obj.slug:
+            slugs.add(obj.slug)
+    for obj in session.dirty:
+        if not isinstance(obj, BlogPost):
+            continue
+        state = inspect(obj)
+        for attr in state.mapper.column_attrs:
+            if attr.key in _NON_RENDERED_COLUMNS:
+                continue
+            if state.attrs[attr.key].history.has_changes():
+                slugs.add(obj.slug)
+                break
+    return slugs
+
+
+def revalidate_on_commit(session: Session, slugs: Iterable[str]) -> None:
+    """Queue /blog/{slug} for each slug once `session` commits."""
+    slugs = set(slugs)
+    if slugs:
+        session.info.setdefault("revalidate_slugs", set()).update(slugs)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_posts(session: Session, flush_context, instances) -> None:
+    revalidate_on_commit(session, _changed_post_slugs(session))
+
+
+@event.listens_for(Session, "after_commit")
+def _revalidate_on_commit(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    slugs = session.info.pop("revalidate_slugs", None)
+    if slugs:
+        revalidation_notifier.queue_posts(slugs)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    # The rolled-back changes never reached the DB. A SAVEPOINT rollback
+    # keeps the slugs: the rest of the outer transaction may still commit.
+    if not session.in_nested_transaction():
+        session.info.pop("revalidate_slugs", None)
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────
+
+revalidation_notifier = RevalidationNotifier()
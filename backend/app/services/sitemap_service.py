@@ -0,0 +1,188 @@
+"""
+Blog sitemap XML.
+
+Published posts are split into shards of at most 50 000 URLs (the
+sitemaps.org per-file limit), ordered by id, so new posts land in the last
+shard. Shards are consecutive buckets over the published posts, so when a
+post is unpublished or deleted, every later post moves up one place and
+posts at a shard boundary move into the previous shard:
+
+  GET /api/blog/sitemap.xml        → <sitemapindex> listing every shard
+  GET /api/blog/sitemap-{n}.xml    → <urlset> for shard n (1-based)
+
+Shard boundaries (first / last id, lastmod) come from one grouped query.
+A shard is streamed straight from a server-side cursor in batches, so
+memory stays flat however many posts there are; while it streams, the
+XML is gzip-compressed into the versioned blog cache, and later requests
+are answered from the cached gzip bytes until the next publish.
+"""
+
+import base64
+import logging
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Iterator, Optional
+from xml.sax.saxutils import escape
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool
+
+from app.config import get_settings
+from app.models.blog import BlogPost
+from app.services.blog_cache import blog_cache_key
+from app.services.redis_service import get_redis_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+SITEMAP_MAX_URLS = 50_000   # per sitemap file (sitemaps.org)
+STREAM_BATCH     = 1_000    # rows fetched per cursor round-trip
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+XMLNS      = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def sitemap_base_url() -> str:
+    """Public URL prefix of the blog sitemaps: {base}.xml and {base}-{n}.xml."""
+    return (settings.BLOG_SITEMAP_BASE_URL or f"{settings.SITE_URL.rstrip('/')}/sitemaps/blog").rstrip("/")
+
+
+def _w3c(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime("%Y-%m-%dT%H:%M:%S+00:00") if value else None
+
+
+def sitemap_shards(db: Session, shard_size: int = SITEMAP_MAX_URLS) -> list[dict]:
+    """
+    Split published posts into id ranges of at most `shard_size` posts.
+
+    Returns [{ shard, first_id, last_id, count, lastmod }], JSON-ready.
+    """
+    numbered = (
+        select(
+            BlogPost.id,
+            func.coalesce(BlogPost.updated_at, BlogPost.published_at).label("modified"),
+            ((func.row_number().over(order_by=BlogPost.id) - 1) // shard_size).label("bucket"),
+        )
+        .where(BlogPost.status == "published")
+        .subquery()
+    )
+    rows = db.execute(
+        select(
+            numbered.c.bucket,
+            func.min(numbered.c.id),
+            func.max(numbered.c.id),
+            func.count(),
+            func.max(numbered.c.modified),
+        )
+        .group_by(numbered.c.bucket)
+        .order_by(numbered.c.bucket)
+    ).all()
+
+    return [
+        {
+            "shard":    n,
+            "first_id": first_id,
+            "last_id":  last_id,
+            "count":    count,
+            "lastmod":  _w3c(lastmod) if isinstance(lastmod, datetime) else lastmod,
+        }
+        for n, (_, first_id, last_id, count, lastmod) in enumerate(rows, 1)
+    ]
+
+
+def iter_index_xml(shards: list[dict]) -> Iterator[str]:
+    """<sitemapindex> for the given shards."""
+    base = sitemap_base_url()
+    yield XML_HEADER
+    yield f'<sitemapindex xmlns="{XMLNS}">\n'
+    for shard in shards:
+        loc = escape(f"{base}-{shard['shard']}.xml")
+        yield f"  <sitemap><loc>{loc}</loc>"
+        if shard["lastmod"]:
+            yield f"<lastmod>{shard['lastmod']}</lastmod>"
+        yield "</sitemap>\n"
+    yield "</sitemapindex>\n"
+
+
+def iter_shard_xml(db: Session, shard: dict) -> Iterator[str]:
+    """
+    <urlset> for one shard, streamed from a server-side cursor.
+
+    Yields one string per STREAM_BATCH posts. Uses its own session on
+    db's engine so it can outlive the request's session.
+    """
+    site_url = settings.SITE_URL.rstrip("/")
+    stmt = (
+        select(BlogPost.slug, BlogPost.updated_at, BlogPost.published_at)
+        .where(
+            BlogPost.status == "published",
+            BlogPost.id.between(shard["first_id"], shard["last_id"]),
+        )
+        .order_by(BlogPost.id)
+        .execution_options(yield_per=STREAM_BATCH)
+    )
+
+    yield XML_HEADER
+    yield f'<urlset xmlns="{XMLNS}">\n'
+    with Session(bind=db.get_bind()) as reader:
+        for rows in reader.execute(stmt).partitions():
+            parts = []
+            for row in rows:
+                loc = escape(f"{site_url}/blog/{row.slug}")
+                lastmod = _w3c(row.updated_at or row.published_at)
+                parts.append(
+                    f"  <url><loc>{loc}</loc>"
+                    + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "")
+                    + "</url>\n"
+                )
+            yield "".join(parts)
+    yield "</urlset>\n"
+
+
+# ── Cached gzip shards ─────────────────────────────────────────────────────
+
+async def get_cached_shard(shard: int) -> Optional[bytes]:
+    """Gzip bytes of a previously streamed shard at the current blog version."""
+    cache_key = await blog_cache_key(f"sitemap:{shard}")
+    if cache_key is None:
+        return None
+    cached = await get_redis_service().get(cache_key)
+    return base64.b64decode(cached) if cached else None
+
+
+async def stream_and_cache_shard(db: Session, shard: dict) -> AsyncIterator[bytes]:
+    """
+    Stream a shard's XML (UTF-8) while gzip-compressing a copy into the
+    blog cache. Nothing is cached if the client disconnects mid-stream.
+    """
+    # Resolve the versioned key up front: if a publish bumps the version
+    # while we stream, this copy lands under the old key and is never read.
+    cache_key = await blog_cache_key(f"sitemap:{shard['shard']}")
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 31)  # wbits 31 → gzip container
+    compressed: list[bytes] = []
+
+    async for chunk in iterate_in_threadpool(iter_shard_xml(db, shard)):
+        data = chunk.encode("utf-8")
+        compressed.append(compressor.compress(data))
+        yield data
+    compressed.append(compressor.flush())
+
+    if cache_key:
+        body = b"".join(compressed)
+        await get_redis_service().set(
+            cache_key, base64.b64encode(body).decode("ascii"), settings.CACHE_BLOG_TTL
+        )
+        logger.info(f"Cached sitemap shard {shard['shard']}: {shard['count']} URLs, {len(body)}B gzip")
+
+
+def gunzip_chunks(body: bytes, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Decompress cached gzip bytes incrementally for identity clients."""
+    decompressor = zlib.decompressobj(31)
+    for start in range(0, len(body), chunk_size):
+        data = decompressor.decompress(body[start:start + chunk_size])
+        if data:
+            yield data
+    tail = decompressor.flush()
+    if tail:
+        yield tail
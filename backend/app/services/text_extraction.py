@@ -0,0 +1,210 @@
+"""
+Text extraction from uploaded PDF and DOCX resumes.
+
+The original extractors grew the text with `text += page_text` and, for
+DOCX, built python-docx's whole object model just to read paragraph and
+table-cell strings. Here:
+
+  * PDF pages are extracted one by one into a list that is joined once.
+    Long documents (RESUME_EXTRACT_PARALLEL_PAGES pages or more) are
+    split into page ranges: the calling thread extracts the first range
+    while a small process pool does the rest — PyPDF2 is pure Python, so
+    threads wouldn't run in parallel. The pool is spawned on first use
+    (never on single-CPU hosts, where it can only add overhead) and shut
+    down in main.lifespan.
+  * DOCX text is read by streaming word/document.xml out of the ZIP with
+    iterparse, clearing each paragraph once its text is taken, so memory
+    stays flat however large the document is. Paragraphs come out in
+    document order, table cells included where they appear (python-docx
+    listed all body paragraphs first and the tables after them).
+
+Both return non-empty lines joined with newlines; benchmarks/
+bench_resume_extract.py compares them against the old implementations.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import BinaryIO, List, Optional, Union
+from xml.etree import ElementTree
+
+import PyPDF2
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+RELATIONSHIPS = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+DEFAULT_MAIN_PART = "word/document.xml"
+
+# Run-level elements that stand for characters inside a paragraph
+_RUN_CHARACTERS = {
+    f"{W}tab": "\t",
+    f"{W}br": "\n",
+    f"{W}cr": "\n",
+    f"{W}noBreakHyphen": "-",
+}
+
+
+def _as_file(source: Union[bytes, BinaryIO]) -> BinaryIO:
+    if isinstance(source, bytes):
+        return BytesIO(source)
+    source.seek(0)
+    return source
+
+
+# ── PDF ────────────────────────────────────────────────────────────────────
+
+def _page_texts(reader: PyPDF2.PdfReader, start: int, stop: int) -> List[str]:
+    texts = []
+    for number in range(start, stop):
+        text = reader.pages[number].extract_text()
+        if text:
+            texts.append(text)
+    return texts
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[str]:
+    """Worker side: the texts of pages [start, stop) from a fresh reader."""
+    return _page_texts(PyPDF2.PdfReader(BytesIO(pdf_bytes)), start, stop)
+
+
+def _usable_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class _ExtractionPool:
+    """Process pool for page ranges of long PDFs, spawned on first use."""
+
+    def __init__(self) -> None:
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.workers = 0
+
+    def executor(self) -> Optional[ProcessPoolExecutor]:
+        """The pool, or None when extraction should stay serial."""
+        if settings.RESUME_EXTRACT_WORKERS <= 0 or _usable_cpus() < 2:
+            return None
+        with self._lock:
+            if self._executor is None:
+                # The calling thread extracts a share of the pages too
+                self.workers = min(settings.RESUME_EXTRACT_WORKERS, _usable_cpus() - 1)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    # spawn: see pdf_render_pool — fork() would copy the API
+                    # process's threads mid-flight
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def reset(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+extraction_pool = _ExtractionPool()
+
+
+def _page_ranges(page_count: int, parts: int) -> List[tuple[int, int]]:
+    size = -(-page_count // parts)
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def extract_pdf_text(source: Union[bytes, BinaryIO]) -> str:
+    """The text of a PDF, one line group per page."""
+    pdf_file = _as_file(source)
+    reader = PyPDF2.PdfReader(pdf_file)
+    page_count = len(reader.pages)
+
+    executor = None
+    if page_count >= max(settings.RESUME_EXTRACT_PARALLEL_PAGES, 2):
+        executor = extraction_pool.executor()
+    if executor is None:
+        return "\n".join(_page_texts(reader, 0, page_count)).strip()
+
+    ranges = _page_ranges(page_count, extraction_pool.workers + 1)
+    pdf_file.seek(0)
+    pdf_bytes = pdf_file.read()
+    try:
+        futures = [executor.submit(_extract_page_range, pdf_bytes, start, stop) for start, stop in ranges[1:]]
+        texts = _page_texts(reader, *ranges[0])
+        for future in futures:
+            texts.extend(future.result())
+    except BrokenProcessPool:
+        logger.warning("PDF extraction pool broke; extracting serially")
+        extraction_pool.reset()
+        texts = _page_texts(reader, 0, page_count)
+    return "\n".join(texts).strip()
+
+
+# ── DOCX ───────────────────────────────────────────────────────────────────
+
+def _main_part(archive: zipfile.ZipFile) -> str:
+    """Path of the main document part, from the package relationships."""
+    try:
+        with archive.open("_rels/.rels") as rels:
+            for relationship in ElementTree.parse(rels).getroot().iter(RELATIONSHIPS):
+                if relationship.get("Type") == OFFICE_DOCUMENT:
+                    return relationship.get("Target", DEFAULT_MAIN_PART).lstrip("/")
+    except KeyError:
+        pass
+    return DEFAULT_MAIN_PART
+
+
+def extract_docx_text(source: Union[bytes, BinaryIO]) -> str:
+    """The text of a DOCX, one line per non-empty paragraph in document order."""
+    lines: List[str] = []
+    with zipfile.ZipFile(_as_file(source)) as archive, archive.open(_main_part(archive)) as xml:
+        # Text of the open paragraphs, innermost last (text boxes nest
+        # paragraphs inside paragraphs)
+        open_paragraphs: List[List[str]] = []
+        # Inside mc:Fallback — a second copy of content already read
+        # from mc:Choice
+        fallback_depth = 0
+        for event, element in ElementTree.iterparse(xml, events=("start", "end")):
+            tag = element.tag
+            if tag == MC_FALLBACK:
+                fallback_depth += 1 if event == "start" else -1
+                if event == "end":
+                    element.clear()
+                continue
+            if fallback_depth:
+                continue
+
+            if event == "start":
+                if tag == f"{W}p":
+                    open_paragraphs.append([])
+                continue
+
+            if tag == f"{W}p":
+                text = "".join(open_paragraphs.pop())
+                if text.strip():
+                    lines.append(text)
+                element.clear()
+            elif not open_paragraphs:
+                continue
+            elif tag == f"{W}t":
+                open_paragraphs[-1].append(element.text or "")
+            elif tag in _RUN_CHARACTERS:
+                open_paragraphs[-1].append(_RUN_CHARACTERS[tag])
+
+    return "\n".join(lines).strip()
@@ -0,0 +1,262 @@
+"""
+Streaming, size-capped reader for resume file uploads.
+
+Declaring `file: UploadFile = File(...)` makes Starlette read the whole
+multipart body before the endpoint runs, and `await file.read()` then
+copies it into memory — a 200 MB upload was fully received and buffered
+before the 10 MB check rejected it. `resume_upload` instead parses the
+request stream itself:
+
+  * a Content-Length that is already over the limit is rejected before
+    a single body byte is read; otherwise the limit is enforced chunk by
+    chunk as the file part arrives
+  * the file is written to a SpooledTemporaryFile that stays in memory
+    up to RESUME_UPLOAD_SPOOL_KB and moves to disk above it
+  * the extension is checked as soon as the part headers arrive, and the
+    file type is decided by the first bytes (magic numbers), not by the
+    name — a renamed .exe is rejected before the rest is read
+  * the SHA-256 of the file is computed on the way through
+
+Endpoints take the result as a dependency and hand `upload.file` straight
+to the extractors, which read file objects.
+"""
+
+import hashlib
+import logging
+from tempfile import SpooledTemporaryFile
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ALLOWED_EXTENSIONS = ["pdf", "docx", "doc"]
+
+# Bytes the file type is decided from (PDF readers accept a header
+# anywhere in the first 1 KB)
+SNIFF_BYTES = 1024
+
+# Multipart framing around the file: boundaries and part headers
+MULTIPART_OVERHEAD = 16 * 1024
+
+# Request body documented for endpoints that use resume_upload
+UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+def sniff_file_type(head: bytes) -> Optional[str]:
+    """File type ("pdf", "docx", "doc") from the first bytes of a file, or None."""
+    if b"%PDF-" in head[:SNIFF_BYTES]:
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return "docx"  # a ZIP container; python-docx checks the rest
+    if head.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
+        return "doc"   # legacy OLE2 Word document
+    return None
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class SpooledUpload:
+    """An uploaded file, read and validated."""
+
+    def __init__(self, filename: str, file: SpooledTemporaryFile, size: int, file_type: str, sha256: str) -> None:
+        self.filename = filename
+        self.file = file          # positioned at 0
+        self.size = size
+        self.file_type = file_type
+        self.sha256 = sha256
+
+    def read(self) -> bytes:
+        """The whole file as bytes (for storing it)."""
+        self.file.seek(0)
+        data = self.file.read()
+        self.file.seek(0)
+        return data
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _UploadReader:
+    """MultipartParser callbacks that keep one file field, within limits."""
+
+    def __init__(self, field: str, max_bytes: int) -> None:
+        self.field = field
+        self.max_bytes = max_bytes
+        self.upload: Optional[SpooledUpload] = None
+        self._file: Optional[SpooledTemporaryFile] = None
+        self._filename = ""
+        self._file_type: Optional[str] = None
+        self._hash = hashlib.sha256()
+        self._head = b""
+        self._size = 0
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._in_file = False
+        self._pending: list[bytes] = []
+
+    # ── parser callbacks (sync, no I/O) ────────────────────────────────────
+
+    def on_part_begin(self) -> None:
+        self._disposition = b""
+        self._in_file = False
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        if options.get(b"name", b"").decode("utf-8", "replace") != self.field or b"filename" not in options:
+            return  # other fields are ignored
+        if self._file is not None:
+            raise _bad_request("Upload exactly one file")
+        filename = options[b"filename"].decode("utf-8", "replace")
+        extension = filename.lower().rsplit(".", 1)[-1]
+        if extension not in ALLOWED_EXTENSIONS:
+            raise _bad_request(f"Invalid file format. Supported formats: {', '.join(ALLOWED_EXTENSIONS)}")
+        self._file = SpooledTemporaryFile(max_size=settings.RESUME_UPLOAD_SPOOL_KB * 1024)
+        self._filename = filename
+        self._in_file = True
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if not self._in_file:
+            return
+        chunk = data[start:end]
+        self._size += len(chunk)
+        if self._size > self.max_bytes:
+            raise _bad_request(f"File size exceeds {self.max_bytes // (1024 * 1024)}MB limit")
+        if len(self._head) < SNIFF_BYTES:
+            self._head += chunk[:SNIFF_BYTES - len(self._head)]
+        self._pending.append(chunk)
+
+    def on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._finish()
+
+    # ── validation and writing ─────────────────────────────────────────────
+
+    def _check_head(self, final: bool) -> None:
+        if self._file_type is None and (final or len(self._head) >= SNIFF_BYTES):
+            file_type = sniff_file_type(self._head)
+            if file_type is None:
+                raise _bad_request("File content is not a PDF or Word document. Please upload a valid PDF or DOCX file.")
+            if file_type == "doc":
+                raise _bad_request("Legacy .doc files are not supported. Please save the file as DOCX or PDF.")
+            self._file_type = file_type
+
+    def _finish(self) -> None:
+        if self._size == 0:
+            raise _bad_request("Uploaded file is empty")
+        self._check_head(final=True)
+        self._flush_sync()
+        self._file.seek(0)
+        self.upload = SpooledUpload(self._filename, self._file, self._size, self._file_type, self._hash.hexdigest())
+
+    def _flush_sync(self) -> None:
+        for chunk in self._pending:
+            self._hash.update(chunk)
+            self._file.write(chunk)
+        self._pending.clear()
+
+    async def flush(self) -> None:
+        """Write buffered chunks; on disk that happens off the event loop."""
+        if not self._pending or self._file is None:
+            return
+        self._check_head(final=False)
+        if self._file._rolled:
+            await run_in_threadpool(self._flush_sync)
+        else:
+            self._flush_sync()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+async def read_upload(request: Request, field: str = "file", max_bytes: Optional[int] = None) -> SpooledUpload:
+    """
+    Stream the `field` file of a multipart request into a SpooledUpload.
+
+    Raises:
+        HTTPException 400: If the body is not multipart, the file is
+            missing, empty, too large, or not a PDF/DOCX
+    """
+    max_bytes = max_bytes or settings.RESUME_UPLOAD_MAX_MB * 1024 * 1024
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise _bad_request("Expected a multipart/form-data upload")
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes + MULTIPART_OVERHEAD:
+        raise _bad_request(f"File size exceeds {max_bytes // (1024 * 1024)}MB limit")
+
+    reader = _UploadReader(field, max_bytes)
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_begin":       reader.on_part_begin,
+        "on_part_data":        reader.on_part_data,
+        "on_part_end":         reader.on_part_end,
+        "on_header_field":     reader.on_header_field,
+        "on_header_value":     reader.on_header_value,
+        "on_header_end":       reader.on_header_end,
+        "on_headers_finished": reader.on_headers_finished,
+    })
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            await reader.flush()
+        parser.finalize()
+    except HTTPException:
+        reader.close()
+        raise
+    except Exception as e:
+        reader.close()
+        logger.warning(f"Malformed upload: {str(e)}")
+        raise _bad_request("Malformed multipart upload")
+
+    if reader.upload is None:
+        reader.close()
+        raise _bad_request("No file uploaded")
+    return reader.upload
+
+
+async def resume_upload(request: Request):
+    """
+    FastAPI dependency: the request's `file` upload, validated.
+
+    The spooled file is closed once the response has been sent.
+    """
+    upload = await read_upload(request)
+    try:
+        yield upload
+    finally:
+        upload.close()
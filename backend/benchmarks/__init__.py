@@ -0,0 +1,6 @@
+"""
+Micro-benchmarks for hot paths.
+
+Run from the backend directory, e.g.:
+    python -m benchmarks.bench_email_templates
+"""
@@ -0,0 +1,81 @@
+"""
+Benchmark: rendering drip emails (HTML + plain text).
+
+Compares the old approach (read the template file and do one str.replace
+pass per variable on every email) with the compiled template cache.
+
+Usage:
+    python -m benchmarks.bench_email_templates [--emails 100000]
+"""
+
+import argparse
+import time
+
+from app.services.email_service import email_service
+from app.services.drip_service import (
+    DRIP_TEMPLATE_NAMES,
+    DRIP_TEXT_TEMPLATES,
+    _build_drip_text,
+)
+
+
+def _legacy_render(template_name: str, step: int, variables: dict) -> tuple[str, str]:
+    """Previous implementation: disk read + per-variable replace passes."""
+    with open(email_service.template_dir / template_name, "r") as f:
+        html = f.read()
+    for key, value in variables.items():
+        html = html.replace(f"{{{{{key}}}}}", str(value))
+
+    text = DRIP_TEXT_TEMPLATES.get(step, "")
+    for key, value in variables.items():
+        text = text.replace(f"{{{{{key}}}}}", str(value))
+    return html, text
+
+
+def _cached_render(template_name: str, step: int, variables: dict) -> tuple[str, str]:
+    """Current implementation: compiled, mtime-checked template cache."""
+    html = email_service._load_template(template_name, variables)
+    text = _build_drip_text(step, variables)
+    return html, text
+
+
+def _variables(i: int) -> dict:
+    return {
+        "user_name": f"User {i}",
+        "discount_percent": "30",
+        "coupon_code": f"DRIP-{i:08d}",
+        "pricing_url": f"https://example.com/r/DRIP-{i:08d}",
+        "expiry_days": "3",
+        "frontend_url": "https://example.com",
+    }
+
+
+def _run(render, emails: int) -> float:
+    steps = sorted(DRIP_TEMPLATE_NAMES)
+    t0 = time.perf_counter()
+    for i in range(emails):
+        step = steps[i % len(steps)]
+        render(DRIP_TEMPLATE_NAMES[step], step, _variables(i))
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--emails", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Sanity check: both implementations produce identical output
+    for step, name in DRIP_TEMPLATE_NAMES.items():
+        assert _legacy_render(name, step, _variables(0)) == _cached_render(name, step, _variables(0))
+
+    legacy = _run(_legacy_render, args.emails)
+    cached = _run(_cached_render, args.emails)
+
+    print(f"Rendered {args.emails:,} drip emails (HTML + text)")
+    print(f"  legacy  : {legacy:8.3f}s  ({args.emails / legacy:,.0f} emails/s)")
+    print(f"  compiled: {cached:8.3f}s  ({args.emails / cached:,.0f} emails/s)")
+    print(f"  speedup : {legacy / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
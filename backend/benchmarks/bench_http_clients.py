@@ -0,0 +1,128 @@
+"""
+Benchmark: a new httpx.AsyncClient per request vs. the shared pooled client.
+
+Starts a local HTTP/1.1 keep-alive server that stands in for an upstream
+API such as Adzuna: each request waits --rtt ms (one network round trip
+plus server time), and each new connection first waits --setup round
+trips for the DNS + TCP + TLS handshakes a real HTTPS upstream costs. It
+then sends the same requests with:
+
+  * per-request — `async with httpx.AsyncClient(timeout=15.0)` around
+    every call, as routes/jobs.py and DodoService used to
+  * pooled — the client app.services.http_clients builds for "adzuna"
+
+in --concurrency parallel streams, and reports latency p50 / p95 / mean,
+and connections opened (from the server, and from the registry's metrics).
+
+Usage:
+    python -m benchmarks.bench_http_clients [--requests 200] [--concurrency 4] [--rtt 20] [--setup 3]
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+import httpx
+
+from app.services.http_clients import HTTPClients, UPSTREAMS
+
+RESPONSE = (b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: 11\r\n\r\n{\"jobs\":[]}")
+
+
+class UpstreamServer:
+    """Keep-alive HTTP server on its own thread and event loop."""
+
+    def __init__(self, rtt: float, setup_round_trips: int) -> None:
+        self.rtt = rtt
+        self.setup_round_trips = setup_round_trips
+        self.connections = 0
+        self.port = 0
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(self.rtt * self.setup_round_trips)
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                await asyncio.sleep(self.rtt)
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve(self) -> None:
+        server = await asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=1024)
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        async with server:
+            await server.serve_forever()
+
+    def start(self) -> str:
+        threading.Thread(target=self._loop.run_until_complete, args=(self._serve(),), daemon=True).start()
+        self._ready.wait()
+        return f"http://127.0.0.1:{self.port}/v1/api/jobs/in/search/1"
+
+
+async def per_request(url: str, **_) -> None:
+    async with httpx.AsyncClient(timeout=15.0) as client:
+        (await client.get(url, params={"what": "python"})).raise_for_status()
+
+
+async def pooled(url: str, clients: HTTPClients) -> None:
+    (await clients.async_client("adzuna").get(url, params={"what": "python"})).raise_for_status()
+
+
+async def _run(call, url: str, requests: int, concurrency: int, clients: HTTPClients) -> list[float]:
+    timings: list[float] = []
+
+    async def stream(count: int) -> None:
+        for _ in range(count):
+            t0 = time.perf_counter()
+            await call(url, clients=clients)
+            timings.append(time.perf_counter() - t0)
+
+    await asyncio.gather(*(stream(requests // concurrency) for _ in range(concurrency)))
+    await clients.aclose()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rtt", type=float, default=20, help="simulated round trip, ms")
+    parser.add_argument("--setup", type=int, default=3, help="round trips to open a connection")
+    args = parser.parse_args()
+
+    server = UpstreamServer(args.rtt / 1000, args.setup)
+    url = server.start()
+    print(f"{args.requests} requests in {args.concurrency} streams, "
+          f"{args.rtt:.0f}ms round trip, {args.setup} round trips per new connection")
+    print(f"  {'client':<14}{'p50':>9}{'p95':>9}{'mean':>9}{'connections':>13}")
+
+    results = {}
+    for name, call in (("per-request", per_request), ("pooled", pooled)):
+        clients = HTTPClients({"adzuna": UPSTREAMS["adzuna"]})
+        opened = server.connections
+        timings = sorted(asyncio.run(_run(call, url, args.requests, args.concurrency, clients)))
+        connections = server.connections - opened
+        results[name] = statistics.median(timings)
+        print(f"  {name:<14}{results[name] * 1000:>7.1f}ms{timings[int(0.95 * len(timings))] * 1000:>7.1f}ms"
+              f"{statistics.fmean(timings) * 1000:>7.1f}ms{connections:>13}")
+        if name == "pooled":
+            stats = clients.stats()["adzuna"]
+            print(f"  registry metrics: {stats['requests']} requests, {stats['connections_opened']} connections "
+                  f"opened, {stats['reused']} reused, p50 {stats['p50_ms']}ms, p95 {stats['p95_ms']}ms")
+
+    print(f"\n  p50 {results['per-request'] * 1000:.1f}ms → {results['pooled'] * 1000:.1f}ms "
+          f"({results['per-request'] / results['pooled']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: resume PDF downloads per second vs. render pool size.
+
+Renders the same two-page resume repeatedly, first inline on the event
+loop thread (the old download path), then through PDFRenderPool with
+1, 2, 4, ... workers up to the CPU count. Requests are issued the way the
+route issues them — concurrently, with up to max_in_flight outstanding —
+so the numbers include pickling and IPC overhead.
+
+Usage:
+    python -m benchmarks.bench_pdf_pool [--renders 200] [--template modern] [--max-workers N]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from app.services.pdf_render_pool import PDFRenderPool
+from app.services.pdf_service import PDFService
+
+
+def _resume() -> dict:
+    return {
+        "personalInfo": {
+            "name": "Priya Sharma",
+            "email": "priya@example.com",
+            "phone": "+91 98765 43210",
+            "location": "Bengaluru, India",
+        },
+        "summary": "Backend engineer with 6 years of experience building APIs. " * 4,
+        "experience": [
+            {
+                "title": f"Senior Engineer {i}",
+                "company": f"Company {i}",
+                "duration": "2019 - 2024",
+                "description": "Designed and shipped services handling 10k req/s. " * 6,
+            }
+            for i in range(6)
+        ],
+        "education": [{"degree": "B.Tech CSE", "institution": "NIT Trichy", "year": "2018"}],
+        "skills": ["Python", "FastAPI", "PostgreSQL", "Redis", "Kubernetes", "AWS"] * 3,
+        "projects": [
+            {"name": f"Project {i}", "description": "Open-source tooling for data pipelines. " * 3}
+            for i in range(4)
+        ],
+    }
+
+
+def _inline(renders: int, template: str) -> float:
+    content = _resume()
+    t0 = time.perf_counter()
+    for _ in range(renders):
+        PDFService.generate_resume_pdf(content, template).getvalue()
+    return time.perf_counter() - t0
+
+
+async def _pooled(pool: PDFRenderPool, renders: int, template: str) -> float:
+    content = _resume()
+    slots = asyncio.Semaphore(pool.max_in_flight)
+
+    async def one() -> None:
+        async with slots:
+            await pool.render(content, template)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(renders)))
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=200)
+    parser.add_argument("--template", default="modern", choices=sorted(PDFService.TEMPLATES))
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    sizes = sorted({1, *(2 ** i for i in range(1, 8) if 2 ** i < args.max_workers), args.max_workers})
+
+    print(f"{args.renders} renders of a 2-page '{args.template}' resume, {os.cpu_count()} CPU(s)")
+    inline = _inline(args.renders, args.template)
+    print(f"  inline      : {inline:7.2f}s  {args.renders / inline:7.1f} PDFs/s")
+
+    for workers in sizes:
+        pool = PDFRenderPool()
+        pool.start(workers=workers)
+        try:
+            elapsed = asyncio.run(_pooled(pool, args.renders, args.template))
+        finally:
+            stats = pool.stats()
+            pool.shutdown()
+        print(
+            f"  {workers:2d} worker(s): {elapsed:7.2f}s  {args.renders / elapsed:7.1f} PDFs/s  "
+            f"({inline / elapsed:.1f}x inline, render p50 {stats['render_ms_p50']}ms, "
+            f"wait p95 {stats['wait_ms_p95']}ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
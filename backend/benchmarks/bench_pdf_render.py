@@ -0,0 +1,256 @@
+"""
+Benchmark suite: PDF rendering across templates and resume sizes.
+
+Renders every template in PDFService.TEMPLATES against synthetic,
+unicode-heavy resumes of 1, 3 and 10 pages and reports, per case:
+
+  * render time: best of --repeats renders, and a machine-independent
+    score (render time in units of a fixed calibration workload)
+  * peak RSS of the rendering process, and its growth during the renders
+  * output size and page count
+
+Each case runs in a freshly spawned process so RSS numbers don't bleed
+between cases; the section flowable cache is disabled there so every
+render is a full one. With --rounds N every case is measured in N
+processes and the best sample kept.
+
+Baselines live in benchmarks/baselines/pdf_render.json. Raw times depend
+on the machine and its load, so regressions are judged on the score:
+each render is paired with a calibration run just before it and the
+score is the median ratio of the pairs. --check exits with status 1
+when a case's score, size or memory growth exceeds its baseline by more
+than --threshold. A case that looks slower is measured
+again (--retries) first, so a burst of load on a shared machine doesn't
+fail the run; only regressions that persist do.
+
+Usage:
+    python -m benchmarks.bench_pdf_render [--repeats 15] [--rounds 1] [--check] [--retries 2]
+                                          [--save-baseline] [--templates modern classic] [--sizes 1 3 10]
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import reportlab
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "pdf_render.json"
+
+# Experience entries that fill 1, 3 and 10 pages with the bundled templates
+SIZES = {1: 1, 3: 9, 10: 38}
+
+# Absolute RSS slack (MB) on top of the relative threshold: small deltas are noise
+RSS_SLACK_MB = 5.0
+
+
+def synthetic_resume(pages: int) -> dict:
+    """A deterministic resume of roughly `pages` pages with non-ASCII text throughout."""
+    jobs = SIZES[pages]
+    return {
+        "personalInfo": {
+            "name": "Zoë Ångström-Nguyễn 李明",
+            "email": "zoe@exämple.com",
+            "phone": "+49 30 123456",
+            "location": "München, Deutschland",
+            "linkedin": "linkedin.com/in/zoë",
+        },
+        "summary": (
+            "Ingénieure logicielle — 8 ans d’expérience · “naïve café” façade, "
+            "Ελληνικά, Русский, हिन्दी, 日本語 ✓ € £ ¥ ½. "
+        ) * 3,
+        "experience": [
+            {
+                "position": f"Développeuse Senior {i}",
+                "company": f"Société Générale – Zürich {i}",
+                "duration": "2019 – 2024",
+                "description": [
+                    f"Réduit la latence p99 de 40 % — “Straße” {j} • Ærøskøbing, señor, Łódź, İstanbul, Čeština."
+                    for j in range(5)
+                ],
+            }
+            for i in range(jobs)
+        ],
+        "education": [
+            {"degree": "M.Sc. Informatik", "institution": "Technische Universität München", "year": "2016"},
+        ],
+        "skills": ["Python", "Go", "Rust", "Kubernetes", "PostgreSQL", "Ärger-Management"],
+        "certifications": [{"name": "Zertifikat für Cloud-Architektur", "issuer": "Cloud Vendor", "date": "2023"}],
+    }
+
+
+def calibration_workload() -> None:
+    """A fixed pure-Python workload (string + dict churn, like ReportLab's)."""
+    words = [f"wörd{i % 97}" for i in range(10_000)]
+    widths: dict = {}
+    for word in words:
+        widths[word] = widths.get(word, 0) + len(word.encode("utf-8"))
+    " ".join(sorted(words)).split(" ")
+
+
+def _measure(template_name: str, pages: int, repeats: int) -> dict:
+    """
+    Runs in a fresh process: render one case `repeats` times.
+
+    Every render is paired with a calibration run right before it, and
+    the case's score is the median render / calibration ratio — load on
+    the machine slows both halves of a pair alike, so it mostly cancels.
+    """
+    import io
+    import logging
+    import resource
+
+    from pypdf import PdfReader
+
+    from app.services.pdf_service import PDFService, section_cache
+
+    logging.disable(logging.CRITICAL)
+    section_cache.max_entries = 0
+    content = synthetic_resume(pages)
+
+    PDFService.generate_resume_pdf(synthetic_resume(1), template_name)  # imports, font metrics
+    calibration_workload()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    renders, calibrations = [], []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        calibration_workload()
+        t1 = time.perf_counter()
+        pdf = PDFService.generate_resume_pdf(content, template_name).getvalue()
+        t2 = time.perf_counter()
+        calibrations.append(t1 - t0)
+        renders.append(t2 - t1)
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    kb_unit = 1024 if sys.platform == "darwin" else 1   # ru_maxrss is bytes on macOS
+    return {
+        "relative":      round(statistics.median(r / c for r, c in zip(renders, calibrations)), 3),
+        "seconds":       round(min(renders), 5),
+        "calibration":   round(min(calibrations), 5),
+        "peak_rss_mb":   round(rss_after / kb_unit / 1024, 1),
+        "rss_growth_mb": round((rss_after - rss_before) / kb_unit / 1024, 1),
+        "bytes":         len(pdf),
+        "pages":         len(PdfReader(io.BytesIO(pdf)).pages),
+    }
+
+
+def measure_case(case: str, repeats: int, rounds: int = 1) -> dict:
+    """Best of `rounds` fresh-process samples of `case` ("template/Np")."""
+    template_name, pages = case.split("/")
+    spawn = multiprocessing.get_context("spawn")
+    samples = []
+    for _ in range(rounds):
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+            samples.append(executor.submit(_measure, template_name, int(pages[:-1]), repeats).result())
+    return min(samples, key=lambda sample: sample["relative"])
+
+
+def run_suite(templates: list[str], sizes: list[int], repeats: int, rounds: int = 1) -> dict:
+    return {
+        case: measure_case(case, repeats, rounds)
+        for case in (f"{template_name}/{pages}p" for template_name in templates for pages in sizes)
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> dict[str, list[str]]:
+    """Regressions of `results` against `baseline`: case → human-readable lines."""
+    regressions: dict[str, list[str]] = {}
+    for case, current in results.items():
+        base = baseline["cases"].get(case)
+        if base is None:
+            continue
+        lines = regressions.setdefault(case, [])
+        allowed_relative = base["relative"] * (1 + threshold)
+        if current["relative"] > allowed_relative:
+            lines.append(
+                f"{case}: {current['relative']:.2f} > {allowed_relative:.2f} calibration units allowed "
+                f"(baseline {base['relative']:.2f}; best render now {current['seconds'] * 1000:.1f}ms)"
+            )
+        allowed_bytes = base["bytes"] * (1 + threshold)
+        if current["bytes"] > allowed_bytes:
+            lines.append(f"{case}: {current['bytes']}B > {allowed_bytes:.0f}B allowed")
+        allowed_rss = base["rss_growth_mb"] * (1 + threshold) + RSS_SLACK_MB
+        if current["rss_growth_mb"] > allowed_rss:
+            lines.append(f"{case}: RSS grew {current['rss_growth_mb']}MB > {allowed_rss:.1f}MB allowed")
+        if not lines:
+            del regressions[case]
+    return regressions
+
+
+def main() -> None:
+    from app.services.pdf_service import PDFService
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=15, help="renders per process")
+    parser.add_argument("--rounds", type=int, default=1, help="processes per case (best sample kept)")
+    parser.add_argument("--templates", nargs="+", default=list(PDFService.TEMPLATES),
+                        choices=sorted(PDFService.TEMPLATES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=sorted(SIZES), choices=sorted(SIZES))
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--check", action="store_true", help="exit 1 on regression against the baseline")
+    parser.add_argument("--retries", type=int, default=2, help="re-measurements of a case before it fails")
+    parser.add_argument("--save-baseline", action="store_true", help=f"write results to {BASELINE_PATH.name}")
+    args = parser.parse_args()
+
+    results = run_suite(args.templates, args.sizes, args.repeats, args.rounds)
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else None
+
+    regressions: dict[str, list[str]] = {}
+    if args.check and baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for _ in range(args.retries):
+            if not regressions:
+                break
+            for case in regressions:
+                retry = measure_case(case, args.repeats)
+                if retry["relative"] < results[case]["relative"]:
+                    results[case] = retry
+            regressions = compare(results, baseline, args.threshold)
+
+    # "score" / "baseline" are render time in calibration units
+    print(
+        f"{'case':<26}{'pages':>6}{'best':>10}{'score':>8}{'baseline':>10}"
+        f"{'peak RSS':>10}{'RSS +':>8}{'size':>9}"
+    )
+    for case, r in results.items():
+        base = (baseline or {}).get("cases", {}).get(case)
+        base_score = f"{base['relative']:.2f}" if base else "n/a"
+        print(
+            f"{case:<26}{r['pages']:>6}{r['seconds'] * 1000:>8.1f}ms{r['relative']:>8.2f}{base_score:>10}"
+            f"{r['peak_rss_mb']:>8.1f}MB{r['rss_growth_mb']:>6.1f}MB{r['bytes']:>8}B"
+        )
+
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        cases = {**(baseline or {}).get("cases", {}), **results}
+        BASELINE_PATH.write_text(json.dumps(
+            {
+                "repeats": args.repeats,
+                "python": platform.python_version(),
+                "reportlab": reportlab.Version,
+                "cases": cases,
+            },
+            indent=2, sort_keys=True,
+        ) + "\n")
+        print(f"baseline written to {BASELINE_PATH}")
+
+    if args.check:
+        if baseline is None:
+            sys.exit(f"no baseline at {BASELINE_PATH}; run with --save-baseline first")
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed over {args.threshold:.0%}:")
+            for lines in regressions.values():
+                for line in lines:
+                    print(f"  {line}")
+            sys.exit(1)
+        print(f"no regressions over {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
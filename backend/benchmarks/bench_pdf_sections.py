@@ -0,0 +1,129 @@
+"""
+Benchmark: re-rendering a 3-page resume after editing one section.
+
+Simulates an editing session: each iteration changes one experience
+bullet and renders again. With the section flowable cache only the
+experience section is rebuilt; without it every section is re-parsed.
+Reports median times for the story-building phase on its own and for
+the full render; cached paragraphs also keep their line breaks, which
+is most of what doc.build() spends its time on.
+
+Usage:
+    python -m benchmarks.bench_pdf_sections [--edits 100] [--template modern]
+"""
+
+import argparse
+import copy
+import statistics
+import time
+
+from pypdf import PdfReader
+
+from app.services.pdf_service import PDFService, section_cache
+
+
+def _resume() -> dict:
+    return {
+        "personalInfo": {
+            "name": "Priya Sharma",
+            "email": "priya@example.com",
+            "phone": "+91 98765 43210",
+            "location": "Bengaluru, India",
+            "linkedin": "linkedin.com/in/priya",
+        },
+        "summary": "Backend engineer with 6 years of experience building APIs. " * 5,
+        "experience": [
+            {
+                "title": f"Senior Engineer {i}",
+                "company": f"Company {i}",
+                "duration": "2019 - 2024",
+                "description": [f"Shipped service {i}.{j} handling 10k req/s with p99 under 50ms." for j in range(5)],
+            }
+            for i in range(6)
+        ],
+        "education": [
+            {"degree": "B.Tech CSE", "institution": "NIT Trichy", "year": "2018", "gpa": "8.9"},
+            {"degree": "Class XII", "institution": "DPS Bengaluru", "year": "2014"},
+        ],
+        "skills": ["Python", "FastAPI", "PostgreSQL", "Redis", "Kubernetes", "AWS", "Go", "Kafka"] * 3,
+        "certifications": [
+            {"name": f"Certification {i}", "issuer": "Cloud Vendor", "date": "2023"} for i in range(5)
+        ],
+        "projects": [
+            {
+                "name": f"Project {i}",
+                "description": "Open-source tooling for data pipelines and observability. " * 3,
+                "technologies": ["Python", "Rust"],
+            }
+            for i in range(4)
+        ],
+    }
+
+
+def _edit(resume: dict, n: int) -> dict:
+    """The resume after the user's n-th edit to one bullet."""
+    edited = copy.deepcopy(resume)
+    edited["experience"][n % 6]["description"][0] = f"Shipped service (revision {n})."
+    return edited
+
+
+def _build_story(template, resume: dict) -> None:
+    for key, build in (
+        ("personalInfo", template._build_header), ("summary", template._build_summary),
+        ("experience", template._build_experience), ("education", template._build_education),
+        ("skills", template._build_skills), ("certifications", template._build_certifications),
+        ("projects", template._build_projects),
+    ):
+        template._section(key, resume[key], build)
+
+
+def _run(resume: dict, edits: int, template_name: str, cache_size: int, full: bool) -> tuple[float, float]:
+    """
+    Median ms per edit (uncached, cached) for the story phase or the full
+    render. The two modes alternate edit by edit so both see the same load.
+    """
+    section_cache.clear()
+    section_cache.max_entries = cache_size
+    template = PDFService.TEMPLATES[template_name].shared()
+    PDFService.generate_resume_pdf(resume, template_name)  # the download before editing starts
+
+    timings: dict[int, list[float]] = {0: [], cache_size: []}
+    for n in range(edits):
+        edited = _edit(resume, n)
+        for size in timings:
+            section_cache.max_entries = size
+            t0 = time.perf_counter()
+            if full:
+                PDFService.generate_resume_pdf(edited, template_name)
+            else:
+                _build_story(template, edited)
+            timings[size].append((time.perf_counter() - t0) * 1000)
+    return statistics.median(timings[0]), statistics.median(timings[cache_size])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edits", type=int, default=100)
+    parser.add_argument("--template", default="modern", choices=sorted(PDFService.TEMPLATES))
+    args = parser.parse_args()
+
+    resume = _resume()
+    pages = len(PdfReader(PDFService.generate_resume_pdf(resume, args.template)).pages)
+    print(f"{args.edits} single-bullet edits of a {pages}-page '{args.template}' resume")
+
+    saved_size = section_cache.max_entries
+    try:
+        cold_story, warm_story = _run(resume, args.edits, args.template, saved_size or 512, full=False)
+        cold_total, warm_total = _run(resume, args.edits, args.template, saved_size or 512, full=True)
+    finally:
+        section_cache.max_entries = saved_size
+        section_cache.clear()
+
+    print(f"  {'':<16}{'story build':>12}{'full render':>13}")
+    print(f"  {'no cache':<16}{cold_story:>10.2f}ms{cold_total:>11.2f}ms")
+    print(f"  {'section cache':<16}{warm_story:>10.2f}ms{warm_total:>11.2f}ms")
+    print(f"  {'speedup':<16}{cold_story / warm_story:>11.1f}x{cold_total / warm_total:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
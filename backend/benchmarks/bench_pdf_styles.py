@@ -0,0 +1,57 @@
+"""
+Benchmark: per-render template setup vs. shared template instances.
+
+Before, every download instantiated its template class, rebuilding the
+sample stylesheet and every custom ParagraphStyle. Renders now use
+PDFTemplate.shared(), built once per process. This measures the setup
+cost on its own and the end-to-end render time with each approach.
+
+Usage:
+    python -m benchmarks.bench_pdf_styles [--iterations 2000] [--renders 100]
+"""
+
+import argparse
+import time
+
+from app.services.pdf_render_pool import WARMUP_RESUME
+from app.services.pdf_service import PDFService
+
+
+def _setup_us(template_class, iterations: int, shared: bool) -> float:
+    """Microseconds per template acquisition."""
+    acquire = template_class.shared if shared else template_class
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        acquire()
+    return (time.perf_counter() - t0) / iterations * 1e6
+
+
+def _render_ms(template_class, renders: int, shared: bool) -> float:
+    """Milliseconds per full render, template acquisition included."""
+    acquire = template_class.shared if shared else template_class
+    t0 = time.perf_counter()
+    for _ in range(renders):
+        acquire().generate(WARMUP_RESUME).getvalue()
+    return (time.perf_counter() - t0) / renders * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--renders", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'template':<22}{'setup new':>12}{'setup shared':>14}{'render new':>13}{'render shared':>15}")
+    for name, template_class in PDFService.TEMPLATES.items():
+        setup_new = _setup_us(template_class, args.iterations, shared=False)
+        setup_shared = _setup_us(template_class, args.iterations, shared=True)
+        render_new = _render_ms(template_class, args.renders, shared=False)
+        render_shared = _render_ms(template_class, args.renders, shared=True)
+        print(
+            f"{name:<22}{setup_new:>10.1f}us{setup_shared:>12.2f}us"
+            f"{render_new:>11.2f}ms{render_shared:>13.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
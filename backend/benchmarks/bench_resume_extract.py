@@ -0,0 +1,165 @@
+"""
+Benchmark: resume text extraction, old extractors vs app.services.text_extraction.
+
+Builds a corpus of PDFs (rendered with the "modern" template at 1, 3, 10
+and 30 pages) and DOCX files (a one-page resume and a long one with
+several tables), then extracts each document with:
+
+  * legacy — the previous ResumeParserService code: PyPDF2 with
+    `text += page_text`, python-docx paragraphs then table cells
+  * engine — extract_pdf_text / extract_docx_text, with the page-parallel
+    PDF path enabled from --parallel-pages pages on --workers processes
+    (single-CPU hosts always extract serially)
+
+and reports per document the median time, pages/s for PDFs, and the peak
+Python allocation during one extraction (tracemalloc; allocations in the
+parallel workers are not included — they hold one copy of the file each).
+Corpus totals are given in documents per second.
+
+Usage:
+    python -m benchmarks.bench_resume_extract [--repeats 10] [--workers 2] [--parallel-pages 8]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from io import BytesIO
+
+import PyPDF2
+from docx import Document
+from pypdf import PdfReader
+
+from app.services import text_extraction
+from app.services.pdf_service import PDFService
+from app.services.text_extraction import extract_docx_text, extract_pdf_text, extraction_pool
+from benchmarks.bench_pdf_render import synthetic_resume
+
+
+# ── Previous implementations ───────────────────────────────────────────────
+
+def legacy_pdf(data: bytes) -> str:
+    text = ""
+    for page in PyPDF2.PdfReader(BytesIO(data)).pages:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text + "\n"
+    return text.strip()
+
+
+def legacy_docx(data: bytes) -> str:
+    doc = Document(BytesIO(data))
+    text = ""
+    for paragraph in doc.paragraphs:
+        if paragraph.text.strip():
+            text += paragraph.text + "\n"
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    text += cell.text + "\n"
+    return text.strip()
+
+
+# ── Corpus ─────────────────────────────────────────────────────────────────
+
+def _pdf(pages: int) -> bytes:
+    if pages == 30:
+        resume = synthetic_resume(10)
+        resume["experience"] *= 3
+    else:
+        resume = synthetic_resume(pages)
+    return PDFService.generate_resume_pdf(resume, "modern").getvalue()
+
+
+def _docx(jobs: int, tables: int) -> bytes:
+    document = Document()
+    document.add_heading("Zoë Ångström-Nguyễn", 0)
+    document.add_paragraph("zoe@exämple.com · +49 30 123456 · München")
+    for i in range(jobs):
+        document.add_heading(f"Développeuse Senior {i} — Société Générale", 2)
+        for j in range(5):
+            document.add_paragraph(f"Réduit la latence p99 de 40 % — “Straße” {j} • Łódź, İstanbul.",
+                                   style="List Bullet")
+    for t in range(tables):
+        table = document.add_table(rows=30 if tables > 1 else 6, cols=4)
+        for r, row in enumerate(table.rows):
+            for c, cell in enumerate(row.cells):
+                cell.text = f"Skill {t}.{r}.{c}"
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_corpus() -> list[tuple[str, str, bytes]]:
+    """(name, file type, bytes) for every document."""
+    corpus = [(f"pdf {pages:>2}p", "pdf", _pdf(pages)) for pages in (1, 3, 10, 30)]
+    corpus.append(("docx short", "docx", _docx(jobs=3, tables=1)))
+    corpus.append(("docx long", "docx", _docx(jobs=60, tables=5)))
+    return corpus
+
+
+# ── Measurement ────────────────────────────────────────────────────────────
+
+def _time(extract, data: bytes, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        extract(data)
+        timings.append(time.perf_counter() - t0)
+    return statistics.median(timings)
+
+
+def _peak_kb(extract, data: bytes) -> float:
+    tracemalloc.start()
+    extract(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--parallel-pages", type=int, default=8)
+    args = parser.parse_args()
+
+    text_extraction.settings.RESUME_EXTRACT_WORKERS = args.workers
+    text_extraction.settings.RESUME_EXTRACT_PARALLEL_PAGES = args.parallel_pages
+    corpus = build_corpus()
+    implementations = {
+        "pdf":  (legacy_pdf, extract_pdf_text),
+        "docx": (legacy_docx, extract_docx_text),
+    }
+
+    cpus = text_extraction._usable_cpus()
+    parallel = f"{args.workers} worker(s) from {args.parallel_pages} pages" if cpus > 1 else "serial (1 CPU)"
+    print(f"{len(corpus)} documents, median of {args.repeats}, PDF engine {parallel}")
+    print(f"  {'document':<12}{'legacy':>10}{'engine':>10}{'speedup':>9}"
+          f"{'pages/s':>15}{'peak alloc':>22}")
+    totals = [0.0, 0.0]
+    try:
+        for name, file_type, data in corpus:
+            legacy, engine = implementations[file_type]
+            engine(data)  # warm up (and spawn the pool for long PDFs)
+            old, new = _time(legacy, data, args.repeats), _time(engine, data, args.repeats)
+            old_kb, new_kb = _peak_kb(legacy, data), _peak_kb(engine, data)
+            totals[0] += old
+            totals[1] += new
+
+            rate = ""
+            if file_type == "pdf":
+                pages = len(PdfReader(BytesIO(data)).pages)
+                rate = f"{pages / old:>7.0f} → {pages / new:<5.0f}"
+            print(f"  {name:<12}{old * 1000:>8.1f}ms{new * 1000:>8.1f}ms{old / new:>8.1f}x"
+                  f"{rate:>15}{old_kb:>9.0f}KB → {new_kb:>6.0f}KB")
+    finally:
+        extraction_pool.shutdown()
+
+    print(f"  {'corpus':<12}{len(corpus) / totals[0]:>6.1f}doc/s{len(corpus) / totals[1]:>6.1f}doc/s"
+          f"{totals[0] / totals[1]:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Benchmark: resume parse prompts with and without the rule-based pre-parser.
+
+Runs a sample corpus through ResumeParserService.build_parse_prompt:
+resumes exported from each of our PDF templates (text extracted the way
+uploads are) and hand-written texts in other common layouts, including
+ones the rules can only partly read. Reports per resume:
+
+  * what happened: parsed locally, gaps sent to Claude, or the full text
+  * pre-parse time
+  * prompt input tokens, full prompt vs. the prompt actually sent
+    (estimated at 4 characters per token; exact with --live)
+
+With --live (needs ANTHROPIC_API_KEY) both prompts are also sent to
+Claude, and input / output tokens and latency per upload are measured.
+
+Usage:
+    python -m benchmarks.bench_resume_preparse [--repeats 50] [--live]
+"""
+
+import argparse
+import statistics
+import time
+
+from app.services.pdf_service import PDFService
+from app.services.resume_parser_service import _full_prompt, resume_parser_service
+from app.services.text_extraction import extract_pdf_text
+from benchmarks.bench_pdf_sections import _resume
+
+MODEL = "claude-sonnet-4-5-20250929"
+
+SAMPLES = {
+    "pipes": """Rahul Verma
+rahul.verma@gmail.com | (555) 123-4567 | Austin, TX | linkedin.com/in/rahulverma
+
+Summary
+Full-stack developer with 5 years of experience shipping React and Node.js products.
+
+Experience
+Software Engineer | Stripe | Jan 2021 - Present
+• Built the payouts dashboard used by 40k merchants.
+• Cut API latency by 35% by adding a Redis cache in front of the ledger service and moving
+reporting queries to a read replica.
+Junior Developer | Freshworks | Jun 2018 - Dec 2020
+• Maintained the billing service written in Ruby on Rails.
+
+Education
+B.S. Computer Science | University of Texas | 2014 - 2018
+
+Skills
+Languages: JavaScript, TypeScript, Python
+Frameworks: React, Node.js, Express, Next.js
+""",
+    "dashes": """ANANYA IYER
+Data Analyst
+Email: ananya.iyer@outlook.com
+Phone: +91 99887 76655
+Location: Chennai, India
+
+PROFESSIONAL SUMMARY
+Data analyst turning messy operational data into dashboards that leadership reads every week.
+
+WORK EXPERIENCE
+Senior Data Analyst
+Zoho Corporation
+Mar 2021 – Present
+- Built 30+ Tableau dashboards tracking churn and expansion revenue.
+- Automated the weekly revenue report with Python and Airflow, saving 6 hours a week.
+Data Analyst
+Mu Sigma
+Jul 2018 – Feb 2021
+- Modelled demand for a US retail client across 1,200 stores.
+
+EDUCATION
+M.Sc Statistics
+Madras Christian College
+2016 - 2018 | CGPA: 8.4/10
+
+TECHNICAL SKILLS
+SQL
+Python
+Tableau
+Power BI
+Airflow
+
+CERTIFICATIONS
+- Tableau Desktop Specialist (2022)
+- Google Data Analytics Professional Certificate (2021)
+
+HOBBIES
+Carnatic music, trekking
+""",
+    "awards": """Marcus Chen
+marcus.chen@proton.me · +1 415 555 0199 · San Francisco, CA
+
+Experience
+Product Designer | Figma | 2020 - 2024
+• Led the redesign of the plugin marketplace, lifting installs by 22%.
+• Ran 40 usability studies with enterprise customers.
+
+Education
+BFA Interaction Design | California College of the Arts | 2016 - 2020
+
+Skills
+Figma, Prototyping, User Research, Design Systems
+
+Awards
+Figma Community Creator of the Year 2023
+Core77 Design Awards — Student Notable 2019
+""",
+    "no headings": """Priya Nair, Bengaluru. priya.nair@example.com, 98450 12345.
+I have spent six years building payment systems, first at Razorpay where I owned the
+settlement engine and later at PhonePe where I led a team of five on UPI reconciliation.
+I studied computer science at BITS Pilani and graduated in 2017. Day to day I work in Go,
+Kafka, PostgreSQL and Kubernetes, and I hold the CKA certification.
+""",
+    "ambiguous": """Kwame Mensah
+kwame@mensah.dev | Accra, Ghana
+
+Experience
+Flutterwave | Remote
+2019 - 2023
+Platform work across payments and payouts
+• Migrated 14 services from Heroku to Kubernetes.
+• Wrote the on-call runbooks still used today.
+Andela
+2016 - 2019
+• Mentored 25 junior engineers.
+
+Education
+Kwame Nkrumah University of Science and Technology
+BSc Computer Engineering, 2016
+
+Skills
+Go, Python, Terraform, AWS
+""",
+}
+
+
+def build_corpus() -> dict[str, str]:
+    """Resume texts by name: template exports, then the hand-written samples."""
+    resume = _resume()
+    resume["experience"] = resume["experience"][:3]
+    resume["projects"] = resume["projects"][:2]
+    corpus = {
+        f"template {name}": extract_pdf_text(PDFService.generate_resume_pdf(resume, name).getvalue())
+        for name in PDFService.TEMPLATES
+    }
+    corpus.update(SAMPLES)
+    return corpus
+
+
+def _estimate(prompt: str | None) -> int:
+    return len(prompt) // 4 if prompt else 0
+
+
+def _call(client, prompt: str) -> tuple[int, int, float]:
+    """(input tokens, output tokens, seconds) for one parse request."""
+    t0 = time.perf_counter()
+    response = client.messages.create(model=MODEL, max_tokens=8192, messages=[{"role": "user", "content": prompt}])
+    return response.usage.input_tokens, response.usage.output_tokens, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--live", action="store_true", help="send the prompts to Claude (uses API credits)")
+    args = parser.parse_args()
+
+    corpus = build_corpus()
+    client = resume_parser_service.anthropic_client
+    print(f"{len(corpus)} resumes, pre-parse time median of {args.repeats}"
+          + (", tokens and latency measured live" if args.live else ", tokens estimated"))
+    header = f"  {'resume':<32}{'outcome':<26}{'pre-parse':>10}{'prompt in':>18}"
+    if args.live:
+        header += f"{'out tokens':>16}{'latency':>18}"
+    print(header)
+
+    totals = {"full": 0, "sent": 0, "full_out": 0, "sent_out": 0, "full_s": 0.0, "sent_s": 0.0, "local": 0}
+    for name, text in corpus.items():
+        timings = []
+        for _ in range(args.repeats):
+            t0 = time.perf_counter()
+            preparsed, prompt = resume_parser_service.build_parse_prompt(text)
+            timings.append(time.perf_counter() - t0)
+        full = _full_prompt(text)
+
+        if prompt is None:
+            outcome = "parsed locally"
+            totals["local"] += 1
+        elif preparsed is None:
+            outcome = "full text to Claude"
+        else:
+            outcome = f"gaps: {','.join(preparsed.fields_to_fill)}"[:25]
+
+        if args.live:
+            full_in, full_out, full_s = _call(client, full)
+            sent_in, sent_out, sent_s = _call(client, prompt) if prompt else (0, 0, 0.0)
+        else:
+            full_in, full_out, full_s = _estimate(full), 0, 0.0
+            sent_in, sent_out, sent_s = _estimate(prompt), 0, 0.0
+        totals["full"] += full_in
+        totals["sent"] += sent_in
+        totals["full_out"] += full_out
+        totals["sent_out"] += sent_out
+        totals["full_s"] += full_s
+        totals["sent_s"] += sent_s + statistics.median(timings)
+
+        line = f"  {name:<32}{outcome:<26}{statistics.median(timings) * 1000:>8.2f}ms{full_in:>8} → {sent_in:<6}"
+        if args.live:
+            line += f"{full_out:>7} → {sent_out:<6}{full_s:>8.1f}s → {sent_s:<5.1f}s"
+        print(line)
+
+    saved = 1 - totals["sent"] / totals["full"]
+    print(f"\n  {totals['local']}/{len(corpus)} uploads needed no AI call; "
+          f"prompt input tokens {totals['full']} → {totals['sent']} ({saved:.0%} fewer)")
+    if args.live:
+        print(f"  output tokens {totals['full_out']} → {totals['sent_out']}; "
+              f"mean latency per upload {totals['full_s'] / len(corpus):.1f}s → {totals['sent_s'] / len(corpus):.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+-- Migration: Add background jobs table for long-running cron work
+-- Run: psql $DATABASE_URL -f migrations/add_background_jobs.sql
+
+CREATE TABLE IF NOT EXISTS background_jobs (
+    id                  VARCHAR(36) PRIMARY KEY,            -- UUID4
+    job_type            VARCHAR(50) NOT NULL,               -- generate_blogs / reindex_all / seed_keywords / drip_emails
+    lock_key            VARCHAR(100) NOT NULL,              -- jobs sharing a key never run concurrently
+    params              JSON NOT NULL DEFAULT '{}',
+    status              VARCHAR(20) NOT NULL DEFAULT 'queued', -- queued / running / succeeded / failed
+    progress            INTEGER NOT NULL DEFAULT 0,         -- 0-100
+    message             VARCHAR(255) DEFAULT NULL,
+    result              JSON DEFAULT NULL,
+    error               TEXT DEFAULT NULL,
+    attempts            INTEGER NOT NULL DEFAULT 0,
+    started_at          TIMESTAMP DEFAULT NULL,
+    heartbeat_at        TIMESTAMP DEFAULT NULL,
+    finished_at         TIMESTAMP DEFAULT NULL,
+    created_at          TIMESTAMP DEFAULT NOW() NOT NULL,
+    updated_at          TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_background_jobs_status ON background_jobs(status, created_at);
+
+-- At most one queued-or-running job per lock key
+CREATE UNIQUE INDEX IF NOT EXISTS uq_background_jobs_active_lock
+    ON background_jobs(lock_key) WHERE status IN ('queued', 'running');
@@ -0,0 +1,4 @@
+-- Migration: Per-post generation timing on daily blog reports
+-- Run: psql $DATABASE_URL -f migrations/add_blog_post_timings.sql
+
+ALTER TABLE blog_daily_reports ADD COLUMN IF NOT EXISTS post_timings JSONB DEFAULT '[]';  -- [{keyword, slug, seconds, status}]
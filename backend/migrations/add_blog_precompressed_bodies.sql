@@ -0,0 +1,7 @@
+-- Migration: Precompressed blog post responses + content hash (ETag)
+-- Run: psql $DATABASE_URL -f migrations/add_blog_precompressed_bodies.sql
+-- Existing posts are backfilled lazily on their first GET /api/blog/{slug}.
+
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) DEFAULT NULL;  -- sha256 of the JSON body
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS body_gzip    BYTEA DEFAULT NULL;
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS body_br      BYTEA DEFAULT NULL;
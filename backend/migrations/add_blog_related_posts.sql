@@ -0,0 +1,14 @@
+-- Migration: Precomputed related posts per blog post
+-- Run: psql $DATABASE_URL -f migrations/add_blog_related_posts.sql
+-- Then populate once: POST /api/cron/rebuild-related-posts
+
+CREATE TABLE IF NOT EXISTS blog_related_posts (
+    id               SERIAL PRIMARY KEY,
+    post_id          INTEGER NOT NULL REFERENCES blog_posts(id) ON DELETE CASCADE,
+    related_post_id  INTEGER NOT NULL REFERENCES blog_posts(id) ON DELETE CASCADE,
+    position         INTEGER NOT NULL,                 -- 0 = most related
+    score            DOUBLE PRECISION NOT NULL,        -- cosine similarity
+    created_at       TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_blog_related_posts_post ON blog_related_posts(post_id, position);
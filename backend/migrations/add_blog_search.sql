@@ -0,0 +1,13 @@
+-- Migration: Full-text search over blog posts (GET /api/blog/search)
+-- Run: psql $DATABASE_URL -f migrations/add_blog_search.sql
+-- Adding a STORED generated column rewrites blog_posts once.
+
+ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+     || setweight(to_tsvector('english', coalesce(lsi_keywords::text, '')), 'B')
+     || setweight(to_tsvector('english', coalesce(excerpt, '')), 'B')
+     || setweight(to_tsvector('english', regexp_replace(coalesce(content, ''), '<[^>]+>', ' ', 'g')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_blog_posts_search ON blog_posts USING GIN (search_vector);
@@ -0,0 +1,19 @@
+-- Migration: Add transactional email outbox
+-- Run: psql $DATABASE_URL -f migrations/add_email_outbox.sql
+
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id                  SERIAL PRIMARY KEY,
+    idempotency_key     VARCHAR(255) UNIQUE NOT NULL,      -- e.g. welcome:42, payment_success:pay_xxx
+    email_type          VARCHAR(50) NOT NULL,              -- welcome / password_reset / payment_success / ...
+    to_email            VARCHAR(255) NOT NULL,
+    payload             JSON NOT NULL DEFAULT '{}',        -- kwargs for the EmailService sender
+    status              VARCHAR(20) NOT NULL DEFAULT 'pending', -- pending / sending / sent / failed
+    attempts            INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at     TIMESTAMP NOT NULL DEFAULT NOW(),
+    last_error          TEXT DEFAULT NULL,
+    sent_at             TIMESTAMP DEFAULT NULL,
+    created_at          TIMESTAMP DEFAULT NOW() NOT NULL,
+    updated_at          TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_email_outbox_due ON email_outbox(status, next_attempt_at);
@@ -0,0 +1,8 @@
+-- Migration: Normalized resume content stored alongside the original
+-- Run: psql $DATABASE_URL -f migrations/add_resume_normalized_content.sql
+-- Then backfill once: POST /api/cron/backfill-normalized-content
+-- (rows not yet backfilled are normalized on read)
+
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS normalized_content JSON;
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS normalized_optimized_content JSON;
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS content_schema_version INTEGER;
@@ -0,0 +1,12 @@
+-- Migration: Pending resume uploads parsed by the parse_resume_upload job
+-- Run: psql $DATABASE_URL -f migrations/add_resume_uploads.sql
+
+CREATE TABLE IF NOT EXISTS resume_uploads (
+    id                  SERIAL PRIMARY KEY,
+    user_id             INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    filename            VARCHAR(255) NOT NULL,
+    file_content        BYTEA NOT NULL,                     -- removed once the job finishes
+    created_at          TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_resume_uploads_user_id ON resume_uploads(user_id);
@@ -50,6 +50,37 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def isolated_db():
+    """
+    Build private in-memory databases holding only the tables a test needs.
+
+    Call the yielded factory with model classes; it returns a sessionmaker
+    bound to a fresh SQLite database with just those tables. Every database
+    is disposed after the test.
+
+    Yields:
+        Callable[..., sessionmaker]: Factory taking model classes
+    """
+    engines = []
+
+    def make(*models):
+        db_engine = create_engine(
+            SQLALCHEMY_DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        for model in models:
+            model.__table__.create(bind=db_engine)
+        engines.append(db_engine)
+        return sessionmaker(bind=db_engine)
+
+    yield make
+
+    for db_engine in engines:
+        db_engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """
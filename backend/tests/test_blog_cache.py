@@ -0,0 +1,224 @@
+"""
+Tests for precomputed blog post responses.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import fnmatch
+import json
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+import app.services.redis_service as redis_service_module
+from app.config import get_settings
+from app.models.blog import BlogPost
+from app.models.email_outbox import EmailOutbox
+from app.services.blog_cache import (
+    BLOG_VERSION_KEY,
+    _blog_listing_changed,
+    _bump,
+    brotli,
+    cached_blog_response,
+    choose_encoding,
+    etag_matches,
+    http_date,
+    not_modified_since,
+    precompress_post,
+)
+
+
+def _post() -> BlogPost:
+    return BlogPost(
+        id=1,
+        slug="ats-resume-tips",
+        title="ATS Resume Tips",
+        excerpt="Short excerpt",
+        content="<p>" + "Hello ATS " * 500 + "</p>",
+        category="resume-tips",
+        tags=["ats"],
+        lsi_keywords=[],
+        word_count=1000,
+        author="Resume Builder Team",
+        read_time=3,
+        featured=False,
+        status="published",
+        published_at=datetime(2026, 1, 2, 3, 4, 5),
+        created_at=datetime(2026, 1, 2, 3, 4, 5),
+    )
+
+
+class TestBlogCache:
+    """Test suite for blog body precompression and HTTP negotiation."""
+
+    def test_precompress_roundtrip(self):
+        """Stored variants decompress to the hashed JSON response body."""
+        post = _post()
+        precompress_post(post)
+
+        body = gzip.decompress(post.body_gzip)
+        assert hashlib.sha256(body).hexdigest() == post.content_hash
+        assert json.loads(body)["content"] == post.content
+        assert len(post.body_gzip) < len(body)
+        if brotli:
+            assert brotli.decompress(post.body_br) == body
+
+    def test_precompress_is_deterministic(self):
+        """Same post → same bytes, so the ETag is stable across re-renders."""
+        a, b = _post(), _post()
+        precompress_post(a)
+        precompress_post(b)
+        assert a.content_hash == b.content_hash
+        assert a.body_gzip == b.body_gzip
+
+    def test_bodies_are_not_loaded_with_posts(self, isolated_db):
+        """Post queries skip the compressed bodies until they are accessed."""
+        db = isolated_db(BlogPost)()
+        post = _post()
+        precompress_post(post)
+        db.add(post)
+        db.commit()
+        db.expunge_all()
+
+        loaded = db.query(BlogPost).one()
+        assert "body_gzip" not in loaded.__dict__ and "body_br" not in loaded.__dict__
+        assert gzip.decompress(loaded.body_gzip)
+        db.close()
+
+    def test_choose_encoding(self):
+        """Accept-Encoding negotiation honours q-values and availability."""
+        both = {"br", "gzip"}
+        assert choose_encoding("gzip, deflate, br", both) == "br"
+        assert choose_encoding("gzip, deflate, br", {"gzip"}) == "gzip"
+        assert choose_encoding("br;q=0.5, gzip", both) == "gzip"
+        assert choose_encoding("br;q=0, gzip;q=0", both) == "identity"
+        assert choose_encoding("*", both) == "br"
+        assert choose_encoding(None, both) == "identity"
+
+    def test_etag_matches(self):
+        """If-None-Match accepts lists, weak tags and the wildcard."""
+        etag = '"abc"'
+        assert etag_matches('"abc"', etag)
+        assert etag_matches('"x", W/"abc"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"abd"', etag)
+        assert not etag_matches(None, etag)
+
+    def test_not_modified_since(self):
+        """If-Modified-Since compares at one-second resolution."""
+        modified = datetime(2026, 1, 2, 3, 4, 5, 678000)
+        header = http_date(modified)
+
+        assert header == "Fri, 02 Jan 2026 03:04:05 GMT"
+        assert not_modified_since(header, modified)
+        assert not not_modified_since("Fri, 02 Jan 2026 03:04:04 GMT", modified)
+        assert not not_modified_since("garbage", modified)
+
+
+class _MemoryRedis:
+    """The few redis.asyncio.Redis commands the blog cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match):
+        for key in [key for key in self.data if fnmatch.fnmatch(key, match)]:
+            yield key
+
+
+class TestBlogListingCache:
+    """Test suite for the versioned blog listing cache."""
+
+    def setup_method(self):
+        """Use a RedisService connected to an in-memory Redis."""
+        self.previous = redis_service_module.redis_service
+        self.redis = redis_service_module.RedisService(get_settings())
+        self.redis.redis = _MemoryRedis()
+        self.redis.is_connected = True
+        redis_service_module.redis_service = self.redis
+
+    def teardown_method(self):
+        redis_service_module.redis_service = self.previous
+
+    def test_cache_hit_until_version_bump(self):
+        """Reads are cached per version; bumping the version forces a rebuild."""
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {"n": len(builds)}
+
+        async def scenario():
+            first  = await cached_blog_response("slugs", build)
+            second = await cached_blog_response("slugs", build)
+            await self.redis.incr(BLOG_VERSION_KEY)
+            third  = await cached_blog_response("slugs", build)
+            return first, second, third
+
+        assert asyncio.run(scenario()) == ({"n": 1}, {"n": 1}, {"n": 2})
+        assert len(builds) == 2
+
+    def test_bump_drops_old_entries_everywhere(self):
+        """A version bump deletes the old keys and keeps nothing in process memory."""
+        async def scenario():
+            for bump in range(3):
+                for n in range(100):
+                    await cached_blog_response(f"page:{n}", lambda: {"n": n})
+                await _bump(self.redis)
+
+        asyncio.run(scenario())
+        assert list(self.redis.redis.data) == [BLOG_VERSION_KEY]
+        assert len(self.redis._fallback_cache) == 0
+
+    def test_not_cached_without_redis(self):
+        """Per-process caches can't see other workers' bumps, so nothing is cached."""
+        self.redis.is_connected = False
+        builds = []
+
+        async def scenario():
+            for _ in range(2):
+                await cached_blog_response("slugs", lambda: builds.append(1))
+
+        asyncio.run(scenario())
+        assert len(builds) == 2
+        assert len(self.redis._fallback_cache) == 0
+
+    def test_fallback_cache_is_bounded(self, monkeypatch):
+        """The disconnected fallback evicts least recently used entries and honours TTLs."""
+        monkeypatch.setattr(self.redis.settings, "REDIS_FALLBACK_MAX_ENTRIES", 2)
+        self.redis.is_connected = False
+
+        async def scenario():
+            await self.redis.set("a", 1, 60)
+            await self.redis.set("b", 2, 60)
+            await self.redis.get("a")
+            await self.redis.set("c", 3, 60)
+            await self.redis.set("d", 4, -1)
+            return [await self.redis.get(key) for key in "abcd"]
+
+        assert asyncio.run(scenario()) == [None, None, 3, None]
+
+    def test_new_post_marks_listing_changed(self):
+        """Pending BlogPost inserts invalidate listings; other models don't."""
+        session = Session()
+        session.add(EmailOutbox(idempotency_key="k", email_type="welcome", to_email="a@b.c"))
+        assert not _blog_listing_changed(session)
+
+        session.add(_post())
+        assert _blog_listing_changed(session)
+        session.close()
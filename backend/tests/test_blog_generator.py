@@ -0,0 +1,94 @@
+"""
+Tests for the concurrent daily blog generation run.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.models.blog import BlogDailyReport, BlogKeyword, BlogPost, BlogRelatedPost
+from app.services import blog_generator as generator_module
+from app.services.blog_generator import BlogGeneratorService, blog_generator
+
+# keyword → seconds its Claude call takes; the first keyword finishes last
+DELAYS = {"ats resume format": 0.3, "tcs interview questions": 0.1, "salary negotiation tips": 0.0}
+
+
+def _claude(keyword: str, category: str, existing: list) -> dict:
+    time.sleep(DELAYS[keyword])
+    slug = keyword.replace(" ", "-")
+    return {
+        "title": keyword.title(),
+        "slug": slug,
+        "excerpt": f"All about {keyword}.",
+        "content": f"<p>{keyword} " * 200 + "</p>",
+        "tags": [keyword.split()[0]],
+        "lsi_keywords": [keyword],
+    }
+
+
+class TestDailyGeneration:
+    """Test suite for run_daily_generation."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """Create an isolated SQLite database with pending keywords."""
+        self.db = isolated_db(BlogPost, BlogKeyword, BlogDailyReport, BlogRelatedPost)()
+        self.db.add_all([
+            BlogKeyword(keyword=keyword, category="resume-tips", buyer_intent=10 - n)
+            for n, keyword in enumerate(DELAYS)
+        ])
+        self.db.commit()
+        yield
+        self.db.close()
+
+    def _run(self, precompress=generator_module.precompress_post, on_progress=None) -> BlogDailyReport:
+        with patch.object(BlogGeneratorService, "_call_claude", side_effect=_claude), \
+                patch.object(generator_module, "precompress_post", precompress), \
+                patch.object(generator_module.indexnow_service, "submit_urls", return_value=(True, "ok")), \
+                patch.object(generator_module.google_indexing_service, "submit_blog_posts",
+                             side_effect=lambda slugs: {slug: (True, "ok") for slug in slugs}):
+            return blog_generator.run_daily_generation(self.db, count=3, on_progress=on_progress)
+
+    def test_results_keep_keyword_order_and_timings_are_reported(self):
+        """Posts, keywords_used and post_timings follow buyer intent, not completion order."""
+        progress = []
+        report = self._run(on_progress=lambda done, total: progress.append((done, total)))
+
+        keywords = list(DELAYS)
+        assert report.keywords_used == keywords
+        assert [t["keyword"] for t in report.post_timings] == keywords
+        assert [t["status"] for t in report.post_timings] == ["ok"] * 3
+        assert [t["slug"] for t in report.post_timings] == [k.replace(" ", "-") for k in keywords]
+        assert report.post_timings[0]["seconds"] >= 0.3
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+
+        posts = self.db.query(BlogPost).order_by(BlogPost.id).all()
+        assert [p.primary_keyword for p in posts] == keywords
+        stored = self.db.query(BlogDailyReport).one()
+        assert stored.post_timings == report.post_timings
+        assert stored.blogs_published == 3
+
+    def test_failing_post_rolls_back_only_its_savepoint(self):
+        """A post that fails after being flushed is undone; the others are kept."""
+        original = generator_module.precompress_post
+
+        def precompress(post):
+            if post.slug == "tcs-interview-questions":
+                raise RuntimeError("render failed")
+            original(post)
+
+        report = self._run(precompress)
+
+        assert sorted(p.slug for p in self.db.query(BlogPost)) == [
+            "ats-resume-format", "salary-negotiation-tips",
+        ]
+        assert report.blogs_published == 2
+        assert [t["status"] for t in report.post_timings] == ["ok", "skipped", "ok"]
+        assert any("tcs interview questions" in e for e in report.errors)
+
+        keywords = {kw.keyword: kw for kw in self.db.query(BlogKeyword)}
+        assert keywords["tcs interview questions"].status == "skipped"
+        assert keywords["tcs interview questions"].blog_id is None
+        assert keywords["ats resume format"].status == "used"
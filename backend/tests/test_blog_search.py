@@ -0,0 +1,106 @@
+"""
+Tests for blog full-text search (SQLite FTS5 path).
+"""
+
+from datetime import datetime
+
+import pytest
+
+import app.routes.blog as blog_routes
+from app.models.blog import BlogPost
+from app.services.blog_search import _fts5_query, ensure_search_index, search_posts
+
+
+def _post(slug: str, title: str, content: str, **kwargs) -> BlogPost:
+    return BlogPost(
+        slug=slug,
+        title=title,
+        excerpt=kwargs.pop("excerpt", ""),
+        content=content,
+        category=kwargs.pop("category", "resume-tips"),
+        status=kwargs.pop("status", "published"),
+        lsi_keywords=kwargs.pop("lsi_keywords", []),
+        published_at=datetime(2026, 1, 1),
+        **kwargs,
+    )
+
+
+class TestBlogSearch:
+    """Test suite for ranking, filtering and snippets."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """Create an isolated SQLite database with the blog posts + FTS tables."""
+        self.db = isolated_db(BlogPost)()
+        ensure_search_index(self.db.get_bind())
+
+        self.db.add_all([
+            _post("ats-format", "ATS resume format for freshers",
+                  "<p>Use a simple layout so the ATS can parse your resume.</p>"),
+            _post("interview-tcs", "TCS interview questions",
+                  "<p>Prepare for aptitude rounds. A clean resume helps too.</p>",
+                  category="interview-prep"),
+            _post("salary", "Salary negotiation tips",
+                  "<p>Research market rates before the HR round.</p>",
+                  category="career-advice"),
+            _post("draft-ats", "ATS draft", "<p>ATS resume draft</p>", status="draft"),
+        ])
+        self.db.commit()
+        yield
+        self.db.close()
+
+    def test_title_match_ranks_first(self):
+        """Title hits outrank body-only hits; drafts are never returned."""
+        results = search_posts(self.db, "resume")
+        slugs = [r["slug"] for r in results]
+
+        assert slugs == ["ats-format", "interview-tcs"]
+        assert results[0]["rank"] >= results[1]["rank"]
+
+    def test_snippet_highlights_terms(self):
+        """Snippets wrap matched terms in <mark>."""
+        results = search_posts(self.db, "aptitude")
+        assert results[0]["slug"] == "interview-tcs"
+        assert "<mark>aptitude</mark>" in results[0]["snippet"]
+        assert "<p>" not in results[0]["snippet"]
+
+    def test_category_filter_and_limit(self):
+        """Category narrows results and limit caps them."""
+        results = search_posts(self.db, "resume", category="interview-prep")
+        assert [r["slug"] for r in results] == ["interview-tcs"]
+        assert len(search_posts(self.db, "resume", limit=1)) == 1
+
+    def test_index_follows_updates(self):
+        """Trigger-maintained index reflects edits and status changes."""
+        post = self.db.query(BlogPost).filter(BlogPost.slug == "salary").one()
+        post.title = "Salary tips"
+        self.db.commit()
+        assert search_posts(self.db, "negotiation") == []
+        assert [r["slug"] for r in search_posts(self.db, "market rates")] == ["salary"]
+
+        post.status = "draft"
+        self.db.commit()
+        assert search_posts(self.db, "market rates") == []
+
+    def test_query_sanitizing(self):
+        """FTS5 syntax characters in user input can't break the query."""
+        assert _fts5_query('ats "resume" OR (') == '"ats" "resume" "or"'
+        assert _fts5_query("!!!") is None
+        assert search_posts(self.db, "!!!") == []
+        assert [r["slug"] for r in search_posts(self.db, 'ats" format*')] == ["ats-format"]
+
+
+class TestSearchCaching:
+    """Test suite for which searches are cached."""
+
+    def test_only_repeated_searches_are_cached(self, monkeypatch):
+        """One-off queries skip the cache; the set of tracked queries is bounded."""
+        monkeypatch.setattr(blog_routes, "SEARCH_TRACKED_QUERIES", 2)
+        monkeypatch.setattr(blog_routes, "_recent_searches", blog_routes.OrderedDict())
+
+        assert not blog_routes._is_repeat_search("a")
+        assert blog_routes._is_repeat_search("a")
+        blog_routes._is_repeat_search("b")
+        blog_routes._is_repeat_search("c")
+        assert not blog_routes._is_repeat_search("a")
+        assert len(blog_routes._recent_searches) == 2
@@ -286,6 +286,36 @@ class TestEmailService:
         assert "Test User" in html
         assert "Resume Builder" in html
 
+    def test_compiled_template_render(self):
+        """Compiled templates substitute in one pass and keep unknown placeholders."""
+        from app.services.email_service import CompiledTemplate
+
+        template = CompiledTemplate(
+            "<style>p { color: red; }</style><p>Hi {{user_name}}, {{code}} {{missing}}</p>"
+        )
+        html = template.render({"user_name": "Test User", "code": 42})
+
+        assert html == "<style>p { color: red; }</style><p>Hi Test User, 42 {{missing}}</p>"
+
+    def test_template_cache_reloads_on_change(self, tmp_path):
+        """Cached templates are re-parsed when the file mtime changes."""
+        import os
+        from app.services.email_service import _TemplateCache
+
+        cache = _TemplateCache(check_interval=0)
+        path = tmp_path / "t.html"
+        path.write_text("v1 {{user_name}}")
+
+        first = cache.get(str(path))
+        assert cache.get(str(path)) is first
+        assert first.render({"user_name": "A"}) == "v1 A"
+
+        path.write_text("v2 {{user_name}}")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get(str(path)).render({"user_name": "A"}) == "v2 A"
+
     def test_email_service_configuration(self):
         """Test email service configuration from environment."""
         # Verify configuration is loaded
@@ -321,6 +351,197 @@ class TestEmailService:
         assert isinstance(email_service, EmailService)
 
 
+class TestEmailOutbox:
+    """Test suite for the transactional email outbox."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """Create an isolated SQLite database with only the outbox table."""
+        from app.models.email_outbox import EmailOutbox
+
+        self.db = isolated_db(EmailOutbox)()
+        yield
+        self.db.close()
+
+    def test_enqueue_is_idempotent(self):
+        """Enqueueing the same key twice stores a single row."""
+        from app.models.email_outbox import EmailOutbox
+        from app.services.email_outbox_service import enqueue_email
+
+        first = enqueue_email(
+            self.db, "welcome", "a@example.com", idempotency_key="welcome:1",
+            user_email="a@example.com", user_name="A",
+        )
+        self.db.commit()
+        second = enqueue_email(
+            self.db, "welcome", "a@example.com", idempotency_key="welcome:1",
+            user_email="a@example.com", user_name="A",
+        )
+        self.db.commit()
+
+        assert first is not None
+        assert second is None
+        assert self.db.query(EmailOutbox).count() == 1
+
+    def test_enqueue_unknown_type(self):
+        """Unknown email types are rejected at enqueue time."""
+        from app.services.email_outbox_service import enqueue_email
+
+        with pytest.raises(ValueError):
+            enqueue_email(self.db, "nope", "a@example.com", idempotency_key="x")
+
+    def test_enqueue_rolls_back_with_transaction(self):
+        """A rolled-back business change leaves no email behind."""
+        from app.models.email_outbox import EmailOutbox
+        from app.services.email_outbox_service import enqueue_email
+
+        enqueue_email(
+            self.db, "welcome", "a@example.com", idempotency_key="welcome:2",
+            user_email="a@example.com", user_name="A",
+        )
+        self.db.rollback()
+
+        assert self.db.query(EmailOutbox).count() == 0
+
+    def test_drain_sends_with_idempotency_key(self):
+        """Draining calls the sender with the row key and marks it sent."""
+        from app.models.email_outbox import EmailOutbox
+        from app.services.email_outbox_service import EmailOutboxService, enqueue_email
+
+        sender = Mock()
+        sender.send_welcome_email.return_value = True
+        enqueue_email(
+            self.db, "welcome", "a@example.com", idempotency_key="welcome:3",
+            user_email="a@example.com", user_name="A",
+        )
+        self.db.commit()
+
+        stats = EmailOutboxService(sender=sender).drain(self.db)
+
+        assert stats["sent"] == 1
+        sender.send_welcome_email.assert_called_once_with(
+            user_email="a@example.com", user_name="A", idempotency_key="welcome:3"
+        )
+        row = self.db.query(EmailOutbox).one()
+        assert row.status == "sent"
+        assert row.sent_at is not None
+
+        # Nothing left to do on the next drain
+        assert EmailOutboxService(sender=sender).drain(self.db)["claimed"] == 0
+
+    def test_drain_retries_with_backoff_then_fails(self):
+        """Failed sends are rescheduled until max attempts is reached."""
+        from datetime import datetime
+        from app.models.email_outbox import EmailOutbox
+        from app.services.email_outbox_service import EmailOutboxService, enqueue_email
+
+        sender = Mock()
+        sender.send_welcome_email.side_effect = Exception("provider down")
+        service = EmailOutboxService(sender=sender)
+        service.max_attempts = 2
+        enqueue_email(
+            self.db, "welcome", "a@example.com", idempotency_key="welcome:4",
+            user_email="a@example.com", user_name="A",
+        )
+        self.db.commit()
+
+        assert service.drain(self.db)["retried"] == 1
+        row = self.db.query(EmailOutbox).one()
+        assert row.status == "pending"
+        assert row.next_attempt_at > datetime.utcnow()
+        assert "provider down" in row.last_error
+
+        # Not due yet — the backoff keeps it out of the next batch
+        assert service.drain(self.db)["claimed"] == 0
+
+        row.next_attempt_at = datetime.utcnow()
+        self.db.commit()
+        assert service.drain(self.db)["failed"] == 1
+        assert self.db.query(EmailOutbox).one().status == "failed"
+
+    def test_drain_skips_when_sending_disabled(self):
+        """With email disabled rows are skipped on the first attempt, not retried."""
+        from app.models.email_outbox import EmailOutbox
+        from app.services.email_outbox_service import EmailOutboxService, enqueue_email
+
+        sender = Mock()
+        sender.enabled = False
+        enqueue_email(
+            self.db, "welcome", "a@example.com", idempotency_key="welcome:5",
+            user_email="a@example.com", user_name="A",
+        )
+        self.db.commit()
+
+        stats = EmailOutboxService(sender=sender).drain(self.db)
+
+        assert (stats["skipped"], stats["retried"], stats["failed"]) == (1, 0, 0)
+        sender.send_welcome_email.assert_not_called()
+        row = self.db.query(EmailOutbox).one()
+        assert (row.status, row.attempts) == ("skipped", 1)
+
+        # Skipped rows are never claimed again
+        assert EmailOutboxService(sender=sender).drain(self.db)["claimed"] == 0
+
+    def test_reset_token_removed_once_finished(self):
+        """The live reset token is kept only while the row may still be sent."""
+        from app.models.email_outbox import EmailOutbox
+        from app.services.email_outbox_service import EmailOutboxService, enqueue_email
+
+        sender = Mock()
+        sender.send_password_reset_email.side_effect = [Exception("provider down"), True]
+        service = EmailOutboxService(sender=sender)
+        enqueue_email(
+            self.db, "password_reset", "a@example.com", idempotency_key="reset:1",
+            user_email="a@example.com", user_name="A", reset_token="secret-token",
+        )
+        self.db.commit()
+
+        assert service.drain(self.db)["retried"] == 1
+        row = self.db.query(EmailOutbox).one()
+        assert row.payload["reset_token"] == "secret-token"
+
+        row.next_attempt_at = row.created_at
+        self.db.commit()
+        assert service.drain(self.db)["sent"] == 1
+        sender.send_password_reset_email.assert_called_with(
+            user_email="a@example.com", user_name="A", reset_token="secret-token",
+            idempotency_key="reset:1",
+        )
+        self.db.expire_all()
+        assert self.db.query(EmailOutbox).one().payload == {
+            "user_email": "a@example.com", "user_name": "A",
+        }
+
+    def test_drain_prunes_old_finished_rows(self):
+        """Finished rows past the retention window are deleted; others are kept."""
+        from datetime import datetime, timedelta
+        from app.config import get_settings
+        from app.models.email_outbox import EmailOutbox
+        from app.services.email_outbox_service import EmailOutboxService
+
+        old = datetime.utcnow() - timedelta(days=get_settings().EMAIL_OUTBOX_RETENTION_DAYS + 1)
+        for key, status, updated_at in (
+            ("old-sent", "sent", old),
+            ("old-failed", "failed", old),
+            ("old-pending", "pending", old),
+            ("new-sent", "sent", datetime.utcnow()),
+        ):
+            self.db.add(EmailOutbox(
+                idempotency_key=key, email_type="welcome", to_email="a@example.com",
+                payload={}, status=status, attempts=1,
+                next_attempt_at=datetime.utcnow() + timedelta(hours=1), updated_at=updated_at,
+            ))
+        self.db.commit()
+
+        service = EmailOutboxService(sender=Mock())
+        assert service.drain(self.db)["pruned"] == 2
+        assert sorted(r.idempotency_key for r in self.db.query(EmailOutbox)) == [
+            "new-sent", "old-pending",
+        ]
+        # Pruning is rate limited per service instance
+        assert service.prune(self.db) == 0
+
+
 class TestEmailIntegration:
     """Integration tests for email service."""
 
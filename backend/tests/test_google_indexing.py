@@ -0,0 +1,96 @@
+"""
+Tests for the Google Indexing API service.
+"""
+
+from datetime import datetime, timedelta
+
+import httpx
+
+import app.services.google_indexing_service as gis
+from app.services.google_indexing_service import GoogleIndexingService
+
+
+def _batch_reply(boundary: str, statuses: list[int]) -> str:
+    """Build a multipart/mixed batch response like Google returns."""
+    parts = []
+    for i, code in enumerate(statuses):
+        body = (
+            '{"urlNotificationMetadata": {"latestUpdate": {"notifyTime": "t%d"}}}' % i
+            if code == 200 else '{"error": {"code": %d}}' % code
+        )
+        parts.append(
+            f"--{boundary}\r\n"
+            f"Content-Type: application/http\r\n"
+            f"Content-ID: <response-item{i}>\r\n"
+            f"\r\n"
+            f"HTTP/1.1 {code} X\r\n"
+            f"Content-Type: application/json; charset=UTF-8\r\n"
+            f"\r\n"
+            f"{body}\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n")
+    return "".join(parts)
+
+
+class TestGoogleIndexingService:
+    """Test suite for token caching and batched notifications."""
+
+    def setup_method(self):
+        self.service = GoogleIndexingService()
+        self.service.sa_json = "{}"
+        self.service.site_url = "https://example.com"
+        self.token_calls = 0
+
+    def _fake_token(self, expires_in: timedelta):
+        def fetch(_sa_json):
+            self.token_calls += 1
+            return f"tok{self.token_calls}", datetime.utcnow() + expires_in
+        return fetch
+
+    def test_token_cached_until_near_expiry(self, monkeypatch):
+        """The JWT exchange happens once while the token is still fresh."""
+        monkeypatch.setattr(gis, "_get_access_token", self._fake_token(timedelta(hours=1)))
+
+        assert self.service._fresh_token() == "tok1"
+        assert self.service._fresh_token() == "tok1"
+        assert self.token_calls == 1
+
+    def test_token_refreshed_inside_margin(self, monkeypatch):
+        """A token about to expire is replaced before use."""
+        monkeypatch.setattr(gis, "_get_access_token", self._fake_token(timedelta(minutes=2)))
+
+        assert self.service._fresh_token() == "tok1"
+        assert self.service._fresh_token() == "tok2"
+
+    def test_batch_notifies_all_urls_in_one_request(self, monkeypatch):
+        """Many slugs go out in a single multipart request with per-URL results."""
+        monkeypatch.setattr(gis, "_get_access_token", self._fake_token(timedelta(hours=1)))
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            boundary = "resp_boundary"
+            return httpx.Response(
+                200,
+                headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+                text=_batch_reply(boundary, [200, 429, 200]),
+            )
+
+        self.service._client = httpx.Client(transport=httpx.MockTransport(handler))
+        results = self.service.submit_blog_posts(["a", "b", "c"])
+
+        assert len(requests) == 1
+        assert str(requests[0].url) == gis.BATCH_URL
+        body = requests[0].content.decode()
+        assert body.count("POST /v3/urlNotifications:publish") == 3
+        assert "https://example.com/blog/b" in body
+
+        assert results["a"] == (True, "Google notified (notifyTime=t0)")
+        assert results["b"][0] is False and results["b"][1].startswith("HTTP 429")
+        assert results["c"][0] is True
+
+    def test_batch_without_credentials(self):
+        """Missing credentials fail every URL without any HTTP call."""
+        self.service.sa_json = None
+        results = self.service.submit_blog_posts(["a", "b"])
+        assert all(ok is False for ok, _ in results.values())
@@ -0,0 +1,104 @@
+"""
+Tests for the shared upstream HTTP clients.
+"""
+
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.services.http_clients import HTTPClients, Upstream, http_clients
+from app.services.indexnow_service import IndexNowService
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+
+    def do_GET(self):
+        status = 503 if self.path == "/down" else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestHTTPClients:
+    """Test suite for the pooled clients and their metrics."""
+
+    def setup_method(self):
+        self.clients = HTTPClients({
+            "sync":  Upstream(timeout=5, max_connections=2, max_keepalive=1),
+            "async": Upstream(timeout=5, max_connections=2, max_keepalive=1, is_async=True),
+        })
+
+    def test_sync_requests_reuse_one_connection(self, server_url):
+        """Sequential calls share a kept-alive connection, and are metered."""
+        for _ in range(3):
+            assert self.clients.sync_client("sync").get(f"{server_url}/ok").status_code == 200
+        self.clients.sync_client("sync").get(f"{server_url}/down")
+
+        stats = self.clients.stats()["sync"]
+        assert (stats["requests"], stats["errors"], stats["connections_opened"], stats["reused"]) == (4, 1, 1, 3)
+        assert stats["p50_ms"] is not None and stats["p95_ms"] >= stats["p50_ms"]
+        assert self.clients.stats()["async"]["requests"] == 0
+
+    def test_async_requests_reuse_one_connection(self, server_url):
+        """The async client pools too, and transport failures count as errors."""
+        async def calls():
+            client = self.clients.async_client("async")
+            for _ in range(3):
+                await client.get(f"{server_url}/ok")
+            with pytest.raises(httpx.ConnectError):
+                await client.get(f"http://127.0.0.1:{_closed_port()}/")
+            await self.clients.aclose()
+
+        asyncio.run(calls())
+
+        stats = self.clients.stats()["async"]
+        assert (stats["requests"], stats["errors"], stats["connections_opened"]) == (4, 1, 1)
+
+    def test_lifecycle(self):
+        """Clients are created once, closed together, and recreated on demand."""
+        self.clients.start()
+        client = self.clients.sync_client("sync")
+        assert self.clients.sync_client("sync") is client
+        assert client.timeout.read == 5 and client.timeout.connect == 5
+
+        asyncio.run(self.clients.aclose())
+        assert client.is_closed
+        assert self.clients.sync_client("sync") is not client
+
+        with pytest.raises(ValueError):
+            self.clients.async_client("sync")
+
+    def test_services_use_the_shared_client(self):
+        """Service clients come from the registry unless one is injected."""
+        service = IndexNowService()
+        assert service.client is http_clients.sync_client("indexnow")
+
+        injected = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        service._client = injected
+        assert service.client is injected
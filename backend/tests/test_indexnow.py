@@ -0,0 +1,75 @@
+"""
+Tests for the IndexNow submission service.
+"""
+
+import json
+import threading
+
+import httpx
+
+import app.services.indexnow_service as ins
+from app.services.indexnow_service import IndexNowService
+
+
+class TestIndexNowService:
+    """Test suite for chunked IndexNow submissions."""
+
+    def setup_method(self):
+        self.service = IndexNowService()
+        self.service.api_key = "key"
+        self.service.site_url = "https://example.com"
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def _use_transport(self, status_for=lambda urls: 202):
+        def handler(request: httpx.Request) -> httpx.Response:
+            urls = json.loads(request.content)["urlList"]
+            with self.lock:
+                self.requests.append(urls)
+            return httpx.Response(status_for(urls))
+
+        self.service._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_submit_urls_splits_at_spec_limit(self, monkeypatch):
+        """Lists over the per-request cap are sent as several POSTs."""
+        monkeypatch.setattr(ins, "MAX_URLS_PER_REQUEST", 3)
+        self._use_transport()
+
+        ok, _ = self.service.submit_urls([f"https://example.com/{i}" for i in range(7)])
+
+        assert ok
+        assert [len(r) for r in self.requests] == [3, 3, 1]
+
+    def test_chunks_are_consumed_lazily(self):
+        """No more than `concurrency` chunks are pulled ahead of completed POSTs."""
+        self._use_transport()
+        pulled = []
+        finished = []
+
+        def chunks():
+            for i in range(10):
+                pulled.append(i)
+                # Everything pulled so far is either finished or in flight
+                assert len(pulled) - len(finished) <= 2
+                yield i, [f"https://example.com/blog/{i}"]
+
+        self.service.submit_url_chunks(
+            chunks(), lambda tag, ok, msg: finished.append((tag, ok)), concurrency=2,
+        )
+
+        assert sorted(tag for tag, _ in finished) == list(range(10))
+        assert all(ok for _, ok in finished)
+        assert len(self.requests) == 10
+
+    def test_failed_chunk_is_reported(self):
+        """A rejected chunk is reported with ok=False and doesn't stop the rest."""
+        self._use_transport(lambda urls: 429 if urls[0].endswith("/1") else 200)
+        results = {}
+
+        self.service.submit_url_chunks(
+            ((i, [f"https://example.com/blog/{i}"]) for i in range(3)),
+            lambda tag, ok, msg: results.__setitem__(tag, (ok, msg)),
+        )
+
+        assert results[0][0] and results[2][0]
+        assert results[1] == (False, "HTTP 429: ")
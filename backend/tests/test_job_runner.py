@@ -0,0 +1,116 @@
+"""
+Tests for the background job runner.
+"""
+
+import pytest
+
+from app.models.background_job import BackgroundJob
+from app.services.job_runner import JobLock, JobRunner
+
+
+class TestJobRunner:
+    """Test suite for enqueueing, locking and executing background jobs."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """Create an isolated SQLite database with only the jobs table."""
+        self.Session = isolated_db(BackgroundJob)
+        self.db = self.Session()
+        self.runner = JobRunner(session_factory=self.Session)
+        self.calls = []
+
+        @self.runner.register("count")
+        def count(db, params, ctx):
+            ctx.progress(50, "halfway")
+            self.calls.append(params)
+            return {"n": params["n"] * 2}
+
+        @self.runner.register("boom")
+        def boom(db, params, ctx):
+            raise RuntimeError("kaboom")
+
+        yield
+        self.db.close()
+
+    def test_enqueue_and_run(self):
+        """A queued job runs once and stores its result."""
+        job, created = self.runner.enqueue(self.db, "count", params={"n": 21})
+        job_id = job.id
+
+        assert created
+        assert job.status == "queued"
+        assert self.runner.run_next() is True
+        assert self.runner.run_next() is False
+
+        self.db.expire_all()
+        job = self.runner.get(self.db, job_id)
+        assert job.status == "succeeded"
+        assert job.progress == 100
+        assert job.message == "halfway"
+        assert job.result == {"n": 42}
+        assert job.attempts == 1
+        assert self.calls == [{"n": 21}]
+
+    def test_enqueue_deduplicates_active_job(self):
+        """A second enqueue while the first is pending returns the same job."""
+        first, created_first = self.runner.enqueue(self.db, "count", params={"n": 1})
+        second, created_second = self.runner.enqueue(self.db, "count", params={"n": 2})
+
+        assert created_first and not created_second
+        assert first.id == second.id
+        assert self.db.query(BackgroundJob).count() == 1
+
+        # Once finished, the lock key is free for a new run
+        self.runner.run_pending()
+        third, created_third = self.runner.enqueue(self.db, "count", params={"n": 3})
+        assert created_third
+        assert third.id != first.id
+
+    def test_enqueue_unknown_type(self):
+        """Unknown job types are rejected at enqueue time."""
+        with pytest.raises(ValueError):
+            self.runner.enqueue(self.db, "nope")
+
+    def test_failed_job_records_error(self):
+        """Handler exceptions mark the job failed with the error message."""
+        job, _ = self.runner.enqueue(self.db, "boom")
+        job_id = job.id
+
+        assert self.runner.run_next() is True
+
+        self.db.expire_all()
+        job = self.runner.get(self.db, job_id)
+        assert job.status == "failed"
+        assert job.error == "kaboom"
+        assert job.finished_at is not None
+
+    def test_locked_job_is_not_run(self):
+        """A job whose lock key is held elsewhere stays queued."""
+        job, _ = self.runner.enqueue(self.db, "count", params={"n": 1})
+        job_id = job.id
+
+        lock = JobLock(self.db.get_bind(), "count")
+        assert lock.acquire()
+        try:
+            assert self.runner.run_next() is False
+        finally:
+            lock.release()
+
+        self.db.expire_all()
+        assert self.runner.get(self.db, job_id).status == "queued"
+        assert self.runner.run_next() is True
+
+    def test_orphaned_running_job_is_restarted(self):
+        """A 'running' job nobody holds the lock for is picked up again."""
+        job, _ = self.runner.enqueue(self.db, "count", params={"n": 5})
+        job_id = job.id
+        job.status = "running"
+        job.attempts = 1
+        self.db.commit()
+
+        assert self.runner.run_next() is True
+
+        self.db.expire_all()
+        job = self.runner.get(self.db, job_id)
+        assert job.status == "succeeded"
+        assert job.attempts == 2
@@ -15,7 +15,8 @@ from app.services.pdf_service import (
     ModernTemplate,
     ClassicTemplate,
     MinimalTemplate,
-    ProfessionalTemplate
+    ProfessionalTemplate,
+    section_cache,
 )
 
 
@@ -234,6 +235,48 @@ class TestPDFService:
             assert hasattr(template, 'styles')
             assert hasattr(template, 'generate')
 
+    def test_shared_template_instances(self):
+        """Each template class is built once and its styles are read-only."""
+        template = ClassicTemplate.shared()
+
+        assert ClassicTemplate.shared() is template
+        assert ModernTemplate.shared() is not template
+        assert template.styles['ResumeBody'].fontName == 'Times-Roman'
+        assert ModernTemplate.shared().styles['ResumeBody'].fontName != 'Times-Roman'
+        with pytest.raises(TypeError):
+            template.styles['Name'] = template.styles['ResumeBody']
+
+    def test_render_does_not_mutate_shared_styles(self, sample_resume_data):
+        """Rendering leaves the shared stylesheet exactly as it was."""
+        styles = MinimalTemplate.shared().styles
+        before = {name: dict(vars(style)) for name, style in styles.items()}
+
+        PDFService.generate_resume_pdf(sample_resume_data, 'minimal')
+
+        assert {name: dict(vars(style)) for name, style in styles.items()} == before
+
+    def test_section_cache_rebuilds_only_edited_section(self, sample_resume_data, monkeypatch):
+        """Unchanged sections are reused and the PDF matches an uncached render."""
+        from reportlab import rl_config
+
+        monkeypatch.setattr(rl_config, 'invariant', 1)  # no timestamps / random IDs
+        monkeypatch.setattr(section_cache, 'max_entries', 0)
+        edited = {
+            **sample_resume_data,
+            'experience': [{**sample_resume_data['experience'][0], 'title': 'Staff Engineer'}],
+        }
+        uncached = PDFService.generate_resume_pdf(edited, 'classic').getvalue()
+
+        section_cache.clear()
+        monkeypatch.setattr(section_cache, 'max_entries', 64)
+        PDFService.generate_resume_pdf(sample_resume_data, 'classic')
+        first_misses = section_cache.misses
+        cached = PDFService.generate_resume_pdf(edited, 'classic').getvalue()
+
+        assert section_cache.misses == first_misses + 1   # only experience rebuilt
+        assert section_cache.hits == first_misses - 1
+        assert cached == uncached
+
 
 # PDF Download Endpoint Tests
 
@@ -0,0 +1,73 @@
+"""
+Tests for the content-addressed PDF cache.
+"""
+
+import os
+import time
+
+import app.services.pdf_cache as pdf_cache_module
+from app.services.pdf_cache import PDFCache, pdf_cache_key
+
+
+CONTENT = {"personalInfo": {"name": "Asha", "email": "asha@example.com"}, "skills": ["Python"]}
+
+
+class TestPDFCacheKey:
+    """Test suite for cache keys."""
+
+    def test_key_ignores_dict_order(self):
+        """Same content in a different key order → same key."""
+        reordered = {"skills": ["Python"], "personalInfo": {"email": "asha@example.com", "name": "Asha"}}
+        assert pdf_cache_key(CONTENT, "modern") == pdf_cache_key(reordered, "modern")
+
+    def test_key_changes_with_inputs(self, monkeypatch):
+        """Content, template and renderer version all change the key."""
+        base = pdf_cache_key(CONTENT, "modern")
+        assert pdf_cache_key(CONTENT, "classic") != base
+        assert pdf_cache_key({**CONTENT, "skills": ["Go"]}, "modern") != base
+
+        monkeypatch.setattr(pdf_cache_module, "RENDERER_VERSION", "999")
+        assert pdf_cache_key(CONTENT, "modern") != base
+
+
+class TestPDFCache:
+    """Test suite for the on-disk LRU."""
+
+    def test_roundtrip(self, tmp_path):
+        """Stored bytes come back; unknown keys miss."""
+        cache = PDFCache(str(tmp_path), max_bytes=1024)
+        cache.put("ab" * 32, b"%PDF-1")
+
+        assert cache.get("ab" * 32) == b"%PDF-1"
+        assert cache.get("cd" * 32) is None
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Over the cap, the least recently used entries are removed."""
+        cache = PDFCache(str(tmp_path), max_bytes=250)
+        a, b, c = "a" * 64, "b" * 64, "c" * 64
+        cache.put(a, b"x" * 100)
+        cache.put(b, b"y" * 100)
+        cache.get(a)                      # a is now most recent
+        cache.put(c, b"z" * 100)          # 300B > 250B → evict b
+
+        assert cache.get(b) is None
+        assert cache.get(a) == b"x" * 100
+        assert cache.get(c) == b"z" * 100
+        assert cache.stats()["bytes"] == 200
+
+    def test_index_rebuilt_from_disk(self, tmp_path):
+        """A fresh process picks up existing entries in mtime (LRU) order."""
+        first = PDFCache(str(tmp_path), max_bytes=1000)
+        old, new = "1" * 64, "2" * 64
+        first.put(old, b"o" * 100)
+        first.put(new, b"n" * 100)
+        past = time.time() - 60
+        os.utime(first._path(old), (past, past))
+
+        second = PDFCache(str(tmp_path), max_bytes=250)
+        assert second.stats()["entries"] == 2
+        second.put("3" * 64, b"t" * 100)  # evicts the oldest: `old`
+
+        assert second.get(old) is None
+        assert second.get(new) == b"n" * 100
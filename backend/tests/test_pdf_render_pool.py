@@ -0,0 +1,74 @@
+"""
+Tests for the PDF render process pool.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import pdf_render_pool as pool_module
+from app.services.pdf_render_pool import (
+    WARMUP_RESUME,
+    PDFPoolSaturated,
+    PDFRenderPool,
+    default_workers,
+)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """One pre-warmed single-worker pool shared by the module."""
+    render_pool = PDFRenderPool()
+    render_pool.start(workers=1, queue_per_worker=2)
+    yield render_pool
+    render_pool.shutdown()
+
+
+class TestPDFRenderPool:
+    """Test suite for pooled rendering, backpressure and metrics."""
+
+    def test_render_on_pool(self, pool):
+        """Renders run in the worker process and are timed."""
+        pdf = asyncio.run(pool.render(WARMUP_RESUME, "classic"))
+
+        assert pdf.startswith(b"%PDF")
+        stats = pool.stats()
+        assert stats["started"] and stats["workers"] == 1
+        assert stats["completed"] >= 1
+        assert stats["render_ms_p50"] > 0
+        assert stats["in_flight"] == 0
+
+    def test_invalid_template_propagates(self, pool):
+        """Errors raised in the worker reach the caller unchanged."""
+        with pytest.raises(ValueError, match="Invalid template"):
+            asyncio.run(pool.render(WARMUP_RESUME, "nope"))
+        assert pool.stats()["failed"] >= 1
+
+    def test_saturated_queue_is_rejected(self, pool):
+        """Beyond max_in_flight, render() fails fast with a Retry-After hint."""
+        async def scenario():
+            renders = [pool.render(WARMUP_RESUME, "modern") for _ in range(pool.max_in_flight + 1)]
+            return await asyncio.gather(*renders, return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        rejected = [r for r in results if isinstance(r, PDFPoolSaturated)]
+
+        assert len(rejected) == 1
+        assert rejected[0].retry_after >= 1
+        assert sum(isinstance(r, bytes) for r in results) == pool.max_in_flight
+        assert pool.stats()["rejected"] == 1
+
+    def test_fallback_without_pool(self):
+        """An unstarted pool still renders (in the threadpool)."""
+        pdf = asyncio.run(PDFRenderPool().render(WARMUP_RESUME, "minimal"))
+        assert pdf.startswith(b"%PDF")
+
+    def test_default_size_uses_usable_cpus_with_a_cap(self, monkeypatch):
+        """Auto-sizing follows the CPU affinity, not the host's core count, and is capped."""
+        monkeypatch.setattr(pool_module.os, "cpu_count", lambda: 64)
+        monkeypatch.setattr(pool_module.settings, "PDF_POOL_AUTO_MAX_WORKERS", 2)
+
+        monkeypatch.setattr(pool_module, "_usable_cpus", lambda: 1)
+        assert default_workers() == 1
+        monkeypatch.setattr(pool_module, "_usable_cpus", lambda: 16)
+        assert default_workers() == 2
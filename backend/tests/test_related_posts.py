@@ -0,0 +1,127 @@
+"""
+Tests for the precomputed related-posts index.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.models.blog import BlogPost, BlogRelatedPost
+from app.services.related_posts import post_features, related_posts_index
+from app.services.revalidation_service import revalidation_notifier
+
+
+def _post(slug: str, primary_keyword: str, category: str, **kwargs) -> BlogPost:
+    return BlogPost(
+        slug=slug,
+        title=primary_keyword.title(),
+        content="<p>...</p>",
+        category=category,
+        primary_keyword=primary_keyword,
+        lsi_keywords=kwargs.pop("lsi_keywords", []),
+        tags=kwargs.pop("tags", []),
+        status=kwargs.pop("status", "published"),
+        published_at=datetime(2026, 1, 1),
+        **kwargs,
+    )
+
+
+class TestRelatedPosts:
+    """Test suite for building, updating and reading related posts."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """Create an isolated SQLite database with the blog tables."""
+        self.db = isolated_db(BlogPost, BlogRelatedPost)()
+
+        self.db.add_all([
+            _post("tcs-interview", "TCS interview questions", "interview-prep",
+                  tags=["TCS", "Interview"], lsi_keywords=["TCS NQT", "aptitude test"]),
+            _post("tcs-resume", "resume format for TCS freshers", "resume-tips",
+                  tags=["TCS", "Freshers"], lsi_keywords=["fresher resume"]),
+            _post("ats-resume", "ATS resume format", "resume-tips",
+                  tags=["ATS"], lsi_keywords=["ATS friendly resume", "resume keywords"]),
+            _post("salary", "salary negotiation tips", "career-advice",
+                  tags=["Salary"], lsi_keywords=["HR round"]),
+            _post("draft", "TCS aptitude test", "interview-prep",
+                  tags=["TCS"], status="draft"),
+        ])
+        self.db.commit()
+        yield
+        self.db.close()
+
+    def _related(self, slug: str) -> list[str]:
+        return [p.slug for p in related_posts_index.get_related(self.db, slug, 10)]
+
+    def test_features(self):
+        """Keywords are tokenized; tags and category become namespaced features."""
+        features = post_features("Resume format for TCS", ["TCS NQT"], ["TCS"], "resume-tips")
+        assert features["tcs"] == 3.0          # 2 (primary) + 1 (lsi)
+        assert features["tag:tcs"] == 1.5
+        assert features["cat:resume-tips"] == 1.0
+        assert "for" not in features
+
+    def test_rebuild_ranks_by_similarity(self):
+        """Shared keywords/tags rank first; drafts and unrelated posts are excluded."""
+        summary = related_posts_index.rebuild(self.db, top_n=3)
+        self.db.commit()
+
+        assert summary["posts"] == 4
+        assert set(self._related("tcs-resume")) == {"ats-resume", "tcs-interview"}
+        assert self._related("tcs-interview")[0] == "tcs-resume"
+        assert "draft" not in self._related("tcs-interview")
+        assert self._related("salary") == []
+
+    def test_incremental_update_matches_rebuild(self):
+        """A newly published post gets its own list and joins its neighbours' lists."""
+        related_posts_index.rebuild(self.db, top_n=3)
+        self.db.commit()
+
+        new = _post("tcs-nqt", "TCS NQT interview questions", "interview-prep",
+                    tags=["TCS", "Interview"], lsi_keywords=["aptitude test"])
+        self.db.add(new)
+        self.db.flush()
+        summary = related_posts_index.update_for_posts(self.db, [new.id], top_n=3)
+        self.db.commit()
+
+        assert summary["posts"] == 1
+        assert summary["updated"] >= 1
+        assert self._related("tcs-nqt")[0] == "tcs-interview"
+        assert self._related("tcs-interview")[0] == "tcs-nqt"
+        incremental = {p: self._related(p) for p in ("tcs-nqt", "tcs-interview", "tcs-resume")}
+
+        related_posts_index.rebuild(self.db, top_n=3)
+        self.db.commit()
+        assert {p: self._related(p) for p in incremental} == incremental
+
+    def test_unpublished_related_posts_are_hidden(self):
+        """Related posts that are later unpublished drop out at read time."""
+        related_posts_index.rebuild(self.db, top_n=3)
+        self.db.commit()
+
+        post = self.db.query(BlogPost).filter(BlogPost.slug == "tcs-resume").one()
+        post.status = "draft"
+        self.db.commit()
+
+        assert "tcs-resume" not in self._related("tcs-interview")
+
+    def test_changed_related_sections_are_revalidated(self, monkeypatch):
+        """Existing posts whose related list changes get their pages refreshed."""
+        queued = []
+        monkeypatch.setattr(revalidation_notifier, "queue_posts", lambda slugs: queued.append(set(slugs)))
+
+        related_posts_index.rebuild(self.db, top_n=3)
+        self.db.commit()
+        assert queued == [{"tcs-interview", "tcs-resume", "ats-resume"}]
+
+        related_posts_index.rebuild(self.db, top_n=3)
+        self.db.commit()
+        assert len(queued) == 1  # nothing changed
+
+        new = _post("tcs-nqt", "TCS NQT interview questions", "interview-prep",
+                    tags=["TCS", "Interview"], lsi_keywords=["aptitude test"])
+        self.db.add(new)
+        self.db.flush()
+        related_posts_index.update_for_posts(self.db, [new.id], top_n=3)
+        self.db.commit()
+        assert {"tcs-nqt", "tcs-interview"} <= queued[-1]
@@ -0,0 +1,122 @@
+"""
+Tests for write-time normalization of resume content.
+"""
+
+import pytest
+
+from app.models.resume import Resume
+from app.models.user import User
+from app.services.resume_content import (
+    CONTENT_SCHEMA_VERSION,
+    backfill_normalized_content,
+    canonical_content,
+)
+
+BUILDER_CONTENT = {
+    "personalInfo": {"name": "Asha", "email": "asha@example.com"},
+    "summary": "Backend engineer",
+    "experience": [{"company": "Acme", "position": "Engineer", "duration": "2020 - 2024"}],
+}
+
+UPLOADED_CONTENT = {
+    "personal_info": '{"full_name": "Ravi", "email": "ravi@example.com"}',
+    "summary": "Data engineer",
+    "experience": [{"company": "Initech", "position": "Analyst", "start_date": "2019", "end_date": "2021"}],
+}
+
+
+class TestResumeContent:
+    """Test suite for normalized resume content."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """Create an isolated SQLite database with one user."""
+        self.db = isolated_db(User, Resume)()
+        user = User(email="owner@example.com", name="Owner", password_hash="x")
+        self.db.add(user)
+        self.db.commit()
+        self.user_id = user.id
+        yield
+        self.db.close()
+
+    def _add(self, content, **kwargs) -> Resume:
+        resume = Resume(user_id=self.user_id, title="Resume", content=content, **kwargs)
+        self.db.add(resume)
+        self.db.commit()
+        return resume
+
+    def test_uploaded_content_is_normalized_on_write(self):
+        """snake_case content gets a normalized copy when it is saved."""
+        resume = self._add(UPLOADED_CONTENT)
+
+        assert resume.content_schema_version == CONTENT_SCHEMA_VERSION
+        assert resume.normalized_content["personalInfo"]["name"] == "Ravi"
+        assert resume.normalized_content["experience"][0]["duration"] == "2019 - 2021"
+        assert canonical_content(resume) == resume.normalized_content
+
+    def test_builder_content_is_not_duplicated(self):
+        """Content that is already canonical leaves the column NULL."""
+        resume = self._add(BUILDER_CONTENT)
+
+        assert resume.normalized_content is None
+        assert resume.content_schema_version == CONTENT_SCHEMA_VERSION
+        assert canonical_content(resume) == BUILDER_CONTENT
+
+    def test_updates_refresh_normalized_content(self):
+        """Replacing content or adding optimized content re-normalizes."""
+        resume = self._add(BUILDER_CONTENT)
+
+        resume.content = UPLOADED_CONTENT
+        resume.optimized_content = {**UPLOADED_CONTENT, "summary": "Optimized"}
+        self.db.commit()
+
+        assert canonical_content(resume)["personalInfo"]["name"] == "Ravi"
+        assert canonical_content(resume, use_optimized=True)["summary"] == "Optimized"
+
+    def test_stale_rows_are_normalized_on_read_and_backfilled(self):
+        """Rows from before the schema version work, and the backfill stores them."""
+        resume = self._add(UPLOADED_CONTENT)
+        resume_id = resume.id
+        self.db.query(Resume).update(
+            {Resume.normalized_content: None, Resume.content_schema_version: None},
+            synchronize_session=False,
+        )
+        self.db.commit()
+        self.db.refresh(resume)
+
+        assert canonical_content(resume)["personalInfo"]["name"] == "Ravi"
+
+        progress = []
+        summary = backfill_normalized_content(self.db, on_progress=lambda done, total: progress.append((done, total)))
+
+        assert summary == {"updated": 1, "failed": 0, "schema_version": CONTENT_SCHEMA_VERSION}
+        assert progress == [(1, 1)]
+        stored = self.db.get(Resume, resume_id)
+        assert stored.content_schema_version == CONTENT_SCHEMA_VERSION
+        assert stored.normalized_content["personalInfo"]["name"] == "Ravi"
+
+    def test_failed_normalization_is_not_masked(self):
+        """Content that can't be normalized clears the old copy and errors on read."""
+        resume = self._add(UPLOADED_CONTENT)
+
+        resume.content = ["not", "an", "object"]
+        self.db.commit()
+
+        assert resume.normalized_content is None
+        assert resume.content_schema_version is None
+        with pytest.raises(ValueError):
+            canonical_content(resume)
+
+    def test_unknown_keys_are_kept(self):
+        """Fields the normalizer doesn't map still reach prompts built from it."""
+        content = {
+            **UPLOADED_CONTENT,
+            "experience": [{**UPLOADED_CONTENT["experience"][0], "bullets": ["Built the ETL"]}],
+            "achievements": ["Hackathon winner"],
+        }
+        normalized = canonical_content(self._add(content))
+
+        assert normalized["experience"][0]["bullets"] == ["Built the ETL"]
+        assert normalized["experience"][0]["duration"] == "2019 - 2021"
+        assert normalized["achievements"] == ["Hackathon winner"]
+        assert "personal_info" not in normalized
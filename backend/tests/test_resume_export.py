@@ -0,0 +1,139 @@
+"""
+Tests for the streamed bulk resume export.
+"""
+
+import asyncio
+import io
+import zipfile
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pypdf import PdfReader
+
+from app.models.resume import Resume
+from app.dependencies import get_current_user
+from app.models.user import SubscriptionType, User
+from app.routes.resume import require_pro_plan
+from app.services.resume_content import canonical_content
+from app.services.resume_export import settings as export_settings, stream_resume_export
+
+
+def _content(name: str, summary: str) -> dict:
+    return {"personalInfo": {"name": name, "email": "a@b.c"}, "summary": summary, "skills": ["Python"]}
+
+
+async def _collect(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+class TestResumeExport:
+    """Test suite for building and cancelling ZIP exports."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """Create an isolated SQLite database with two users' resumes."""
+        db = isolated_db(User, Resume)()
+        self.engine = db.get_bind()
+        owner = User(email="owner@example.com", name="Owner", password_hash="x")
+        other = User(email="other@example.com", name="Other", password_hash="x")
+        db.add_all([owner, other])
+        db.flush()
+        db.add_all([
+            Resume(user_id=owner.id, title="Backend Engineer", template_name="modern",
+                   content=_content("Asha", "Original summary"),
+                   optimized_content=_content("Asha", "Optimized summary")),
+            Resume(user_id=owner.id, title="Data/ML", template_name="minimal",
+                   content=_content("Asha", "Data summary")),
+            Resume(user_id=other.id, title="Not mine", template_name="modern",
+                   content=_content("Ravi", "Other summary")),
+        ])
+        db.commit()
+        self.owner_id = owner.id
+        self.resume_ids = [r.id for r in db.query(Resume).filter(Resume.user_id == owner.id).order_by(Resume.id)]
+        db.close()
+
+    @pytest.fixture(autouse=True)
+    def _settings(self, monkeypatch):
+        monkeypatch.setattr(export_settings, "PDF_CACHE_ENABLED", False)
+        monkeypatch.setattr(export_settings, "RESUME_EXPORT_CONCURRENCY", 2)
+
+    def _export(self, **kwargs):
+        return stream_resume_export(self.engine, self.owner_id, **kwargs)
+
+    def test_streams_every_resume_in_every_template(self):
+        """One entry per (resume, template); the archive arrives in several chunks."""
+        chunks = asyncio.run(_collect(self._export(templates=["modern", "classic"])))
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+        first, second = self.resume_ids
+        assert sorted(archive.namelist()) == sorted([
+            f"{first}_Backend_Engineer_modern.pdf", f"{first}_Backend_Engineer_classic.pdf",
+            f"{second}_Data_ML_modern.pdf", f"{second}_Data_ML_classic.pdf",
+        ])
+        assert all(archive.read(name).startswith(b"%PDF") for name in archive.namelist())
+        assert len(chunks) > 2
+        assert archive.testzip() is None
+
+    def test_subset_with_optimized_content(self):
+        """resume_ids restricts the export; optimized content wins when asked for."""
+        first = self.resume_ids[0]
+        chunks = asyncio.run(_collect(self._export(resume_ids=[first], use_optimized=True)))
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+        assert archive.namelist() == [f"{first}_Backend_Engineer_modern.pdf"]
+        text = PdfReader(io.BytesIO(archive.read(archive.namelist()[0]))).pages[0].extract_text()
+        assert "Optimized summary" in text
+
+    def test_failures_are_listed_not_fatal(self):
+        """A resume that cannot be prepared ends up in errors.txt."""
+        def prepare(row, use_optimized):
+            if row.content["summary"] == "Data summary":
+                raise ValueError("bad content")
+            return canonical_content(row, use_optimized)
+
+        stream = stream_resume_export(self.engine, self.owner_id, prepare_content=prepare)
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(asyncio.run(_collect(stream)))))
+
+        assert len([n for n in archive.namelist() if n.endswith(".pdf")]) == 1
+        assert "bad content" in archive.read("errors.txt").decode()
+
+    def test_closing_stream_cancels_pending_renders(self):
+        """Closing the stream early leaves no render tasks behind."""
+        async def scenario():
+            stream = self._export(templates=["modern", "classic", "minimal"])
+            first_chunk = await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0)
+            return first_chunk, [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+        first_chunk, leftover = asyncio.run(scenario())
+
+        assert first_chunk.startswith(b"PK")
+        assert leftover == []
+
+
+class TestExportAccess:
+    """Test suite for who may run bulk exports."""
+
+    @pytest.mark.parametrize("subscription_type, expiry_days, allowed", [
+        (SubscriptionType.PRO, 30, True),
+        (SubscriptionType.PRO, -1, False),
+        (SubscriptionType.STARTER, 30, False),
+    ])
+    def test_requires_an_active_pro_plan(self, subscription_type, expiry_days, allowed):
+        """Expired Pro subscribers are refused just like other plans."""
+        user = User(id=1, email="u@example.com", name="U", password_hash="x",
+                    subscription_type=subscription_type,
+                    subscription_expiry=datetime.utcnow() + timedelta(days=expiry_days))
+        app = FastAPI()
+
+        @app.get("/export")
+        def export(current_user: User = Depends(require_pro_plan)):
+            return {"user": current_user.id}
+
+        app.dependency_overrides[get_current_user] = lambda: user
+        response = TestClient(app).get("/export")
+
+        assert response.status_code == (200 if allowed else 403)
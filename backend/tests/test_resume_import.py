@@ -0,0 +1,142 @@
+"""
+Tests for background parsing of uploaded resumes.
+"""
+
+import asyncio
+import hashlib
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.models.background_job import BackgroundJob
+from app.models.resume import Resume
+from app.models.resume_upload import ResumeUpload
+from app.models.user import User
+from app.services import resume_import
+from app.services.job_runner import job_runner
+from app.services.resume_import import enqueue_upload, get_upload_job, upload_events, upload_status
+
+FILE = b"%PDF-1.4 resume"
+PARSED = {"full_name": "Test User", "email": "test@example.com", "skills": ["Python"], "experience": []}
+
+
+def _events(chunks: list[str]) -> list[tuple[str, dict]]:
+    events = []
+    for chunk in chunks:
+        name, data = chunk.strip().split("\n")
+        events.append((name.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+class TestResumeImport:
+    """Test suite for the parse_resume_upload job and its status reporting."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """Create an isolated SQLite database and point the job runner at it."""
+        self.Session = isolated_db(User, Resume, ResumeUpload, BackgroundJob)
+        self.db = self.Session()
+        self.user = User(email="owner@example.com", name="Owner", password_hash="x")
+        self.db.add(self.user)
+        self.db.commit()
+        self.previous_factory = job_runner._session_factory
+        job_runner._session_factory = self.Session
+        yield
+        job_runner._session_factory = self.previous_factory
+        self.db.close()
+
+    def _upload(self, filename: str = "Jane Doe.pdf") -> str:
+        return enqueue_upload(
+            self.db, self.user, FILE, filename, hashlib.sha256(FILE).hexdigest(), "pdf"
+        ).id
+
+    def _status(self, job_id: str) -> dict:
+        self.db.expire_all()
+        return upload_status(job_runner.get(self.db, job_id))
+
+    def test_upload_is_parsed_and_saved(self):
+        """The job walks through the stages and creates the resume."""
+        job_id = self._upload()
+        assert self._status(job_id)["stage"] == "queued"
+
+        stages = []
+        progress = resume_import.JobContext.progress
+
+        def record(ctx, percent, message=None):
+            stages.append(message)
+            progress(ctx, percent, message)
+
+        with patch.object(resume_import.JobContext, "progress", record), \
+             patch.object(resume_import.resume_parser_service, "extract_text", return_value="text " * 20) as extract, \
+             patch.object(resume_import.resume_parser_service, "parse_resume_with_ai", return_value=PARSED), \
+             patch.object(resume_import, "parse_cache_digest", wraps=resume_import.parse_cache_digest) as digest:
+            job_runner.run_pending()
+
+        status = self._status(job_id)
+        assert stages == ["extracting", "parsing", "saving"]
+        # File type and hash come from the upload, not from re-reading the stored bytes
+        extract.assert_called_once_with(FILE, "Jane Doe.pdf", "pdf")
+        digest.assert_called_once_with(hashlib.sha256(FILE).hexdigest(), "pdf")
+        assert status["stage"] == "saved"
+        assert status["progress"] == 100
+        resume = self.db.get(Resume, status["resume_id"])
+        assert resume.title == "Imported: Jane Doe"
+        assert resume.content["personalInfo"]["name"] == "Test User"
+        assert self.db.get(User, self.user.id).resume_count == 1
+        assert self.db.query(ResumeUpload).count() == 0
+
+    def test_failed_parse_reports_error(self):
+        """Unreadable files fail the job with a user-facing message and no resume."""
+        job_id = self._upload()
+
+        with patch.object(resume_import.resume_parser_service, "extract_text",
+                          side_effect=ValueError("Could not extract meaningful text from the file.")):
+            job_runner.run_pending()
+
+        status = self._status(job_id)
+        assert status["stage"] == "failed"
+        assert status["error"] == "Could not extract meaningful text from the file."
+        assert status["resume_id"] is None
+        assert self.db.query(Resume).count() == 0
+        assert self.db.query(ResumeUpload).count() == 0
+
+    def test_unexpected_errors_are_not_leaked(self):
+        """Internal errors are logged; the client gets a generic message."""
+        job_id = self._upload()
+
+        with patch.object(resume_import.resume_parser_service, "extract_text", return_value="text " * 20), \
+             patch.object(resume_import.resume_parser_service, "parse_resume_with_ai",
+                          side_effect=Exception("API key invalid")):
+            job_runner.run_pending()
+
+        assert self._status(job_id)["error"] == resume_import.PARSE_FAILED
+
+    def test_jobs_are_private(self):
+        """Another user's upload looks like a missing one."""
+        job_id = self._upload()
+
+        assert get_upload_job(self.db, job_id, self.user.id) is not None
+        assert get_upload_job(self.db, job_id, self.user.id + 1) is None
+        assert get_upload_job(self.db, "missing", self.user.id) is None
+
+    def test_events_stream_until_done(self, monkeypatch):
+        """SSE sends the current stage, then each change, and ends on completion."""
+        monkeypatch.setattr(resume_import, "EVENTS_POLL_SECONDS", 0.01)
+        job_id = self._upload()
+
+        async def scenario():
+            stream = upload_events(self.db.get_bind(), job_id)
+            first = await stream.__anext__()
+            with patch.object(resume_import.resume_parser_service, "extract_text", return_value="text " * 20), \
+                 patch.object(resume_import.resume_parser_service, "parse_resume_with_ai", return_value=PARSED):
+                await asyncio.to_thread(job_runner.run_pending)
+            return [first] + [chunk async for chunk in stream]
+
+        chunks = asyncio.run(scenario())
+        events = _events(chunks)
+
+        assert [name for name, _ in events] == ["progress", "done"]
+        assert events[0][1]["stage"] == "queued"
+        assert events[1][1]["stage"] == "saved"
+        assert events[1][1]["resume_id"] is not None
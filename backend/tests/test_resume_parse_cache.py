@@ -0,0 +1,157 @@
+"""
+Tests for the per-user cache of AI resume parses.
+"""
+
+import asyncio
+import hashlib
+
+import pytest
+
+import app.services.redis_service as redis_service_module
+from app.config import get_settings
+from app.services import resume_parse_cache
+from app.services.resume_parse_cache import cached_parse, parse_cache_digest
+
+
+class _MemoryRedis:
+    """The redis.asyncio.Redis commands the parse cache uses, TTLs recorded."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def _ranked(self, key):
+        return sorted(self.data.get(key, {}), key=self.data.get(key, {}).get)
+
+    def zrange(self, key, start, stop):
+        ranked = self._ranked(key)
+        return ranked[start:len(ranked) + stop + 1 if stop < 0 else stop + 1]
+
+    def zremrangebyrank(self, key, start, stop):
+        for member in self.zrange(key, start, stop):
+            del self.data[key][member]
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((getattr(self.redis, name), args))
+
+    async def execute(self):
+        return [command(*args) for command, args in self.commands]
+
+
+class TestResumeParseCache:
+    """Test suite for caching parse results by file hash."""
+
+    def setup_method(self):
+        """Use a RedisService connected to an in-memory Redis."""
+        self.previous = redis_service_module.redis_service
+        self.redis = redis_service_module.RedisService(get_settings())
+        self.redis.redis = _MemoryRedis()
+        self.redis.is_connected = True
+        redis_service_module.redis_service = self.redis
+        self.calls = []
+
+    def teardown_method(self):
+        redis_service_module.redis_service = self.previous
+
+    def _run(self, user_id: int, file_content: bytes, file_type: str = "pdf") -> dict:
+        def parse():
+            self.calls.append(file_type)
+            return {"full_name": f"Parsed {len(self.calls)}", "skills": ["Python"]}
+
+        sha = hashlib.sha256(file_content).hexdigest()
+        return asyncio.run(cached_parse(user_id, sha, file_type, parse))
+
+    def test_reupload_is_served_from_cache(self):
+        """The same bytes from the same user parse once."""
+        first = self._run(1, b"%PDF-1.4 resume")
+        second = self._run(1, b"%PDF-1.4 resume")
+
+        assert first == second == {"full_name": "Parsed 1", "skills": ["Python"]}
+        assert self.calls == ["pdf"]
+
+    def test_entries_are_scoped_per_user_and_file(self):
+        """Other users, other bytes and another parser version all miss."""
+        self._run(1, b"%PDF-1.4 resume")
+        self._run(2, b"%PDF-1.4 resume")
+        self._run(1, b"%PDF-1.4 edited resume")
+        assert len(self.calls) == 3
+
+        sha = hashlib.sha256(b"%PDF-1.4 resume").hexdigest()
+        digest = parse_cache_digest(sha, "pdf")
+        assert parse_cache_digest(sha, "docx") != digest
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(resume_parse_cache, "PARSER_VERSION", "next")
+            assert parse_cache_digest(sha, "pdf") != digest
+
+    def test_failures_are_not_cached(self):
+        """A parse that raises is retried on the next upload."""
+        def failing():
+            raise ValueError("Could not extract meaningful text from the file.")
+
+        sha = hashlib.sha256(b"%PDF-1.4 resume").hexdigest()
+        with pytest.raises(ValueError):
+            asyncio.run(cached_parse(1, sha, "pdf", failing))
+
+        assert self._run(1, b"%PDF-1.4 resume")["full_name"] == "Parsed 1"
+
+    def test_size_limits(self, monkeypatch):
+        """Each user keeps the newest entries only; huge results are skipped."""
+        settings = resume_parse_cache.settings
+        monkeypatch.setattr(settings, "RESUME_PARSE_CACHE_MAX_ENTRIES", 2)
+        for n in range(3):
+            self._run(1, f"file {n}".encode())
+
+        self._run(1, b"file 0")   # evicted → parsed again
+        self._run(1, b"file 2")   # still cached
+        assert len(self.calls) == 4
+
+        monkeypatch.setattr(settings, "RESUME_PARSE_CACHE_MAX_ENTRY_KB", 0)
+        self._run(1, b"file 9")
+        self._run(1, b"file 9")
+        assert len(self.calls) == 6
+
+    def test_entries_expire(self):
+        """Entries and the per-user index are written with the configured TTL."""
+        self._run(1, b"%PDF-1.4 resume")
+
+        ttl = resume_parse_cache.settings.RESUME_PARSE_CACHE_TTL
+        assert set(self.redis.redis.ttls.values()) == {ttl}
+        assert len(self.redis.redis.ttls) == 2
+
+    def test_disabled_without_redis(self):
+        """Without Redis every upload is parsed, and nothing is kept in memory."""
+        self.redis.is_connected = False
+        self._run(1, b"%PDF-1.4 resume")
+        self._run(1, b"%PDF-1.4 resume")
+        assert len(self.calls) == 2
+        assert len(self.redis._fallback_cache) == 0
+
+        redis_service_module.redis_service = None
+        self._run(1, b"%PDF-1.4 resume")
+        assert len(self.calls) == 3
@@ -0,0 +1,151 @@
+"""
+Tests for the rule-based resume pre-parser and how parsing uses it.
+"""
+
+from unittest.mock import patch
+
+from app.services import resume_parser_service as parser_module
+from app.services.pdf_service import PDFService
+from app.services.resume_parser_service import ResumeParserService
+from app.services.resume_preparser import preparse_resume
+from app.services.text_extraction import extract_pdf_text
+
+PIPES = """Rahul Verma
+rahul.verma@gmail.com | (555) 123-4567 | Austin, TX | linkedin.com/in/rahulverma
+
+Summary
+Full-stack developer with 5 years of experience.
+
+Experience
+Software Engineer | Stripe | Jan 2021 - Present
+• Built the payouts dashboard used by 40k merchants.
+• Cut API latency by 35% by adding a Redis cache in front of the ledger service and moving
+reporting queries to a read replica.
+Junior Developer | Freshworks | Jun 2018 - Dec 2020
+• Maintained the billing service.
+
+Education
+B.S. Computer Science | University of Texas | 2014 - 2018
+
+Skills
+Languages: JavaScript, TypeScript, Python
+Frameworks: React, Node.js, Python
+"""
+
+# Experience entries without a job title
+AMBIGUOUS = PIPES.replace("Software Engineer | Stripe", "Stripe | Remote")
+
+AWARDS = PIPES + """
+Awards
+Figma Community Creator of the Year 2023
+"""
+
+
+class TestPreparser:
+    """Test suite for preparse_resume."""
+
+    def test_template_export_is_fully_parsed(self):
+        """Resumes downloaded from our own templates need no AI call."""
+        resume = {
+            "personalInfo": {"name": "Priya Sharma", "email": "priya@example.com", "phone": "+91 98765 43210",
+                             "location": "Bengaluru, India", "linkedin": "linkedin.com/in/priya"},
+            "summary": "Backend engineer building APIs.",
+            "experience": [{"title": "Senior Engineer", "company": "Acme Labs", "duration": "2019 - 2024",
+                            "description": ["Shipped the billing service.", "Cut p99 latency by 40%."]}],
+            "education": [{"degree": "B.Tech CSE", "institution": "NIT Trichy", "year": "2018", "gpa": "8.9"}],
+            "skills": ["Python", "FastAPI", "PostgreSQL"],
+            "certifications": [{"name": "AWS Solutions Architect", "issuer": "Amazon", "date": "2023"}],
+            "projects": [{"name": "Pipeline", "description": "Data tooling.", "technologies": ["Python", "Rust"]}],
+        }
+        text = extract_pdf_text(PDFService.generate_resume_pdf(resume, "modern").getvalue())
+
+        preparsed = preparse_resume(text)
+
+        assert preparsed.complete
+        data = preparsed.data
+        assert (data["full_name"], data["email"], data["phone"], data["location"], data["linkedin"]) == (
+            "Priya Sharma", "priya@example.com", "+91 98765 43210", "Bengaluru, India", "linkedin.com/in/priya",
+        )
+        assert data["experience"] == [{
+            "company": "Acme Labs", "position": "Senior Engineer", "start_date": "2019", "end_date": "2024",
+            "bullets": ["Shipped the billing service.", "Cut p99 latency by 40%."],
+        }]
+        assert data["education"] == [{
+            "institution": "NIT Trichy", "degree": "B.Tech CSE", "start_date": None, "end_date": "2018", "gpa": "8.9",
+        }]
+        assert data["skills"] == ["Python", "FastAPI", "PostgreSQL"]
+        assert data["certifications"] == ["AWS Solutions Architect | Amazon | 2023"]
+        assert data["projects"] == [{"name": "Pipeline", "description": "Data tooling.", "technologies": ["Python", "Rust"]}]
+
+    def test_pipe_separated_layout(self):
+        """One-line entries, wrapped bullets and labelled skill lists."""
+        data = preparse_resume(PIPES).data
+
+        assert data["experience"][0]["position"] == "Software Engineer"
+        assert data["experience"][0]["company"] == "Stripe"
+        assert (data["experience"][0]["start_date"], data["experience"][0]["end_date"]) == ("Jan 2021", "Present")
+        assert data["experience"][0]["bullets"][1].endswith("moving reporting queries to a read replica.")
+        assert data["education"][0]["degree"] == "B.S. Computer Science"
+        assert data["skills"] == ["JavaScript", "TypeScript", "Python", "React", "Node.js"]
+
+    def test_unsure_sections_are_left_for_claude(self):
+        """An entry the rules can't read leaves its whole section unresolved."""
+        preparsed = preparse_resume(AMBIGUOUS)
+
+        assert not preparsed.complete
+        assert preparsed.unresolved == ["experience"]
+        assert preparsed.data["experience"] == []
+        excerpt = preparsed.unresolved_text()
+        assert excerpt.startswith("Experience\nStripe | Remote")
+        assert "Education" not in excerpt and "rahul.verma@gmail.com" not in excerpt
+
+    def test_unrecognised_sections_are_merged_into_lists(self):
+        """Claude's items from an unknown section are appended, not substituted."""
+        preparsed = preparse_resume(AWARDS)
+
+        assert preparsed.unresolved == []
+        assert "certifications" in preparsed.fields_to_fill
+        assert preparsed.unresolved_text() == "Awards\nFigma Community Creator of the Year 2023"
+
+        merged = preparsed.merge({"certifications": ["Figma Community Creator of the Year 2023"], "skills": ["Python"]})
+        assert merged["certifications"] == ["Figma Community Creator of the Year 2023"]
+        assert merged["skills"] == ["JavaScript", "TypeScript", "Python", "React", "Node.js"]
+
+
+class TestParseWithPreparser:
+    """Test suite for how parse_resume_with_ai uses the pre-parser."""
+
+    def setup_method(self):
+        self.service = ResumeParserService()
+
+    def test_complete_parse_skips_claude(self):
+        """Nothing is sent to Claude when the rules resolved everything."""
+        with patch.object(ResumeParserService, "_ask_claude") as ask:
+            result = self.service.parse_resume_with_ai(PIPES)
+
+        ask.assert_not_called()
+        assert result["full_name"] == "Rahul Verma"
+
+    def test_gaps_are_filled_by_claude(self):
+        """Claude sees only the unresolved section and is asked only for its field."""
+        filled = [{"company": "Stripe", "position": None, "start_date": "Jan 2021", "end_date": "Present",
+                   "bullets": ["Built the payouts dashboard used by 40k merchants."]}]
+        with patch.object(ResumeParserService, "_ask_claude", return_value={"experience": filled}) as ask:
+            result = self.service.parse_resume_with_ai(AMBIGUOUS)
+
+        prompt = ask.call_args.args[0]
+        assert '"experience": [' in prompt and '"skills"' not in prompt
+        assert "University of Texas" not in prompt
+        assert result["experience"] == filled
+        assert result["education"][0]["institution"] == "University of Texas"
+
+    def test_unstructured_text_gets_the_full_prompt(self, monkeypatch):
+        """Without any recognised section, or with pre-parsing off, Claude parses everything."""
+        prose = "Priya Nair from Bengaluru has built payment systems at Razorpay and PhonePe since 2017."
+        with patch.object(ResumeParserService, "_ask_claude", return_value={"full_name": "Priya Nair"}) as ask:
+            assert self.service.parse_resume_with_ai(prose) == {"full_name": "Priya Nair"}
+            assert '"languages"' in ask.call_args.args[0]
+
+            monkeypatch.setattr(parser_module.settings, "RESUME_PREPARSE_ENABLED", False)
+            self.service.parse_resume_with_ai(PIPES)
+            assert PIPES in ask.call_args.args[0]
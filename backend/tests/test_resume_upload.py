@@ -6,11 +6,25 @@ PDF/DOCX extraction and AI-powered data extraction.
 """
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch, MagicMock
 from io import BytesIO
 
-from app.services.resume_parser_service import ResumeParserService
+from docx import Document
+
+from app.config import get_settings
+from app.database import get_db
+from app.dependencies import get_current_user
+from app.models.background_job import BackgroundJob
+from app.models.resume import Resume
+from app.models.resume_upload import ResumeUpload
+from app.models.user import User
+from app.routes import resume_router
+from app.services.job_runner import job_runner
+from app.services.resume_parser_service import ResumeParserService, resume_parser_service
+
+PARSED = {"full_name": "Test User", "email": "test@example.com", "skills": ["Python"], "experience": []}
 
 
 class TestResumeParserService:
@@ -47,23 +61,17 @@ class TestResumeParserService:
 
     def test_extract_text_from_docx(self):
         """Test DOCX text extraction."""
-        with patch('docx.Document') as mock_doc:
-            # Mock paragraphs
-            mock_para1 = Mock()
-            mock_para1.text = "John Doe"
-            mock_para2 = Mock()
-            mock_para2.text = "Software Engineer"
+        document = Document()
+        document.add_paragraph("John Doe")
+        document.add_paragraph("Software Engineer")
+        buffer = BytesIO()
+        document.save(buffer)
 
-            mock_doc_instance = Mock()
-            mock_doc_instance.paragraphs = [mock_para1, mock_para2]
-            mock_doc_instance.tables = []
-            mock_doc.return_value = mock_doc_instance
+        text = self.parser_service.extract_text_from_docx(buffer.getvalue())
 
-            text = self.parser_service.extract_text_from_docx(b"mock docx content")
-
-            assert text is not None
-            assert "John Doe" in text
-            assert "Software Engineer" in text
+        assert text is not None
+        assert "John Doe" in text
+        assert "Software Engineer" in text
 
     @patch.object(ResumeParserService, 'parse_resume_with_ai')
     def test_parse_resume_with_ai_success(self, mock_parse):
@@ -166,166 +174,134 @@ class TestResumeParserService:
 
 
 class TestResumeUploadEndpoint:
-    """Test suite for resume upload endpoint."""
-
-    @pytest.fixture
-    def test_client(self, client, test_user_token):
-        """Get test client with authentication."""
-        return client
-
-    @pytest.fixture
-    def auth_headers(self, test_user_token):
-        """Get authentication headers."""
-        return {"Authorization": f"Bearer {test_user_token}"}
-
-    def test_upload_resume_pdf_success(self, test_client, auth_headers, db_session):
-        """Test successful PDF resume upload."""
-        # Create mock PDF file
-        pdf_content = b"%PDF-1.4\n1 0 obj<</Type/Catalog>>endobj"
-        files = {
-            "file": ("resume.pdf", BytesIO(pdf_content), "application/pdf")
-        }
-
-        with patch('app.services.resume_parser_service.resume_parser_service.parse_resume_file') as mock_parse:
-            mock_parse.return_value = {
-                "full_name": "Test User",
-                "email": "test@example.com",
-                "skills": ["Python"],
-                "experience": [],
-                "education": []
-            }
-
-            with patch('app.services.resume_parser_service.resume_parser_service.convert_to_resume_format') as mock_convert:
-                mock_convert.return_value = {
-                    "personal_info": {
-                        "full_name": "Test User",
-                        "email": "test@example.com"
-                    },
-                    "skills": ["Python"],
-                    "experience": [],
-                    "education": []
-                }
-
-                response = test_client.post(
-                    "/api/resumes/upload",
-                    files=files,
-                    headers=auth_headers
-                )
-
-                assert response.status_code == 201
-                data = response.json()
-                assert "id" in data
-                assert "Imported: resume" in data["title"]
-
-    def test_upload_resume_docx_success(self, test_client, auth_headers):
-        """Test successful DOCX resume upload."""
-        docx_content = b"PK\x03\x04..."  # Simplified DOCX
-        files = {
-            "file": ("resume.docx", BytesIO(docx_content), "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
-        }
-
-        with patch('app.services.resume_parser_service.resume_parser_service.parse_resume_file') as mock_parse:
-            mock_parse.return_value = {
-                "full_name": "Test User",
-                "email": "test@example.com",
-                "skills": [],
-                "experience": [],
-                "education": []
-            }
-
-            with patch('app.services.resume_parser_service.resume_parser_service.convert_to_resume_format') as mock_convert:
-                mock_convert.return_value = {
-                    "personal_info": {"full_name": "Test User"},
-                    "skills": [],
-                    "experience": [],
-                    "education": []
-                }
-
-                response = test_client.post(
-                    "/api/resumes/upload",
-                    files=files,
-                    headers=auth_headers
-                )
+    """Test suite for POST /api/resume/upload and its job status endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def _app(self, isolated_db, monkeypatch):
+        """The resume router on an isolated database, signed in as a free user."""
+        Session = isolated_db(User, Resume, ResumeUpload, BackgroundJob)
+        self.db = Session()
+        self.user = User(email="owner@example.com", name="Owner", password_hash="x")
+        self.db.add(self.user)
+        self.db.commit()
+        # No worker runs in tests: the route runs the job as a background task
+        monkeypatch.setattr(job_runner, "_session_factory", Session)
+
+        self.app = FastAPI()
+        self.app.include_router(resume_router, prefix="/api/resume")
+        self.app.dependency_overrides[get_db] = lambda: self.db
+        self.app.dependency_overrides[get_current_user] = lambda: self.user
+        self.client = TestClient(self.app)
+        yield
+        self.db.close()
+
+    def _post(self, filename: str, content: bytes, content_type: str = "application/pdf"):
+        return self.client.post(
+            "/api/resume/upload", files={"file": (filename, BytesIO(content), content_type)}
+        )
 
-                assert response.status_code == 201
+    def _job(self, job_id: str) -> dict:
+        self.db.expire_all()
+        response = self.client.get(f"/api/resume/upload/{job_id}")
+        assert response.status_code == 200
+        return response.json()
+
+    def test_upload_resume_pdf_success(self):
+        """A PDF is accepted with 202 and the job creates the resume."""
+        with patch.object(resume_parser_service, "extract_text", return_value="text " * 20) as extract, \
+             patch.object(resume_parser_service, "parse_resume_with_ai", return_value=PARSED):
+            response = self._post("resume.pdf", b"%PDF-1.4\n1 0 obj<</Type/Catalog>>endobj")
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["stage"] == "queued"
+        assert data["status_url"] == f"/api/resume/upload/{data['job_id']}"
+        assert extract.call_args.args[2] == "pdf"
+
+        job = self._job(data["job_id"])
+        assert job["stage"] == "saved"
+        resume = self.db.get(Resume, job["resume_id"])
+        assert resume.title == "Imported: resume"
+        assert resume.user_id == self.user.id
+
+    def test_upload_resume_docx_success(self):
+        """A DOCX is accepted and extracted as one."""
+        with patch.object(resume_parser_service, "extract_text", return_value="text " * 20) as extract, \
+             patch.object(resume_parser_service, "parse_resume_with_ai", return_value=PARSED):
+            response = self._post(
+                "resume.docx", b"PK\x03\x04...",
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            )
 
-    def test_upload_resume_invalid_format(self, test_client, auth_headers):
-        """Test upload with invalid file format."""
-        files = {
-            "file": ("resume.txt", BytesIO(b"plain text"), "text/plain")
-        }
+        assert response.status_code == 202
+        assert extract.call_args.args[2] == "docx"
+        assert self._job(response.json()["job_id"])["stage"] == "saved"
 
-        response = test_client.post(
-            "/api/resumes/upload",
-            files=files,
-            headers=auth_headers
-        )
+    def test_upload_resume_invalid_format(self):
+        """Files with an unsupported extension are rejected."""
+        response = self._post("resume.txt", b"plain text", "text/plain")
 
         assert response.status_code == 400
         assert "Invalid file format" in response.json()["detail"]
 
-    def test_upload_resume_file_too_large(self, test_client, auth_headers):
-        """Test upload with file exceeding size limit."""
-        # Create file larger than 10MB
-        large_content = b"x" * (11 * 1024 * 1024)
-        files = {
-            "file": ("large_resume.pdf", BytesIO(large_content), "application/pdf")
-        }
-
-        response = test_client.post(
-            "/api/resumes/upload",
-            files=files,
-            headers=auth_headers
-        )
+    def test_upload_resume_file_too_large(self):
+        """Files over the size limit are rejected."""
+        response = self._post("large_resume.pdf", b"%PDF-1.4" + b"x" * (11 * 1024 * 1024))
 
         assert response.status_code == 400
         assert "exceeds 10MB limit" in response.json()["detail"]
 
-    def test_upload_resume_unauthorized(self, test_client):
-        """Test upload without authentication."""
-        files = {
-            "file": ("resume.pdf", BytesIO(b"test"), "application/pdf")
-        }
+    def test_upload_resume_unauthorized(self):
+        """Uploads need a signed-in user."""
+        del self.app.dependency_overrides[get_current_user]
 
-        response = test_client.post("/api/resumes/upload", files=files)
+        response = self._post("resume.pdf", b"%PDF-1.4 resume")
 
-        assert response.status_code == 401
+        assert response.status_code == 403
 
-    def test_upload_resume_limit_exceeded(self, test_client, auth_headers, test_user, db_session):
-        """Test upload when resume limit is exceeded."""
-        # Set user's resume count to limit
-        test_user.resume_count = 1  # FREE tier limit
-        db_session.commit()
+    def test_upload_resume_limit_exceeded(self):
+        """Users at their monthly resume limit are refused before the upload is read."""
+        self.user.resume_count = get_settings().FREE_RESUME_LIMIT
+        self.db.commit()
 
-        files = {
-            "file": ("resume.pdf", BytesIO(b"test"), "application/pdf")
-        }
-
-        response = test_client.post(
-            "/api/resumes/upload",
-            files=files,
-            headers=auth_headers
-        )
+        response = self._post("resume.pdf", b"%PDF-1.4 resume")
 
         assert response.status_code == 429
         assert "Resume limit reached" in response.json()["detail"]
+        assert self.db.query(ResumeUpload).count() == 0
 
-    def test_upload_resume_parsing_error(self, test_client, auth_headers):
-        """Test upload when parsing fails."""
-        files = {
-            "file": ("resume.pdf", BytesIO(b"corrupted pdf"), "application/pdf")
-        }
-
-        with patch('app.services.resume_parser_service.resume_parser_service.parse_resume_file') as mock_parse:
-            mock_parse.side_effect = ValueError("Could not extract text")
+    def test_upload_rejects_content_that_is_not_a_pdf(self):
+        """A .pdf name with other content is refused before anything is stored."""
+        response = self._post("resume.pdf", b"corrupted pdf")
 
-            response = test_client.post(
-                "/api/resumes/upload",
-                files=files,
-                headers=auth_headers
-            )
-
-            assert response.status_code == 400
+        assert response.status_code == 400
+        assert "not a PDF or Word document" in response.json()["detail"]
+        assert self.db.query(ResumeUpload).count() == 0
+
+    def test_upload_resume_parsing_error(self):
+        """Text extraction errors fail the job with their message; the upload is still accepted."""
+        with patch.object(resume_parser_service, "extract_text",
+                          side_effect=ValueError("Could not extract text from PDF")):
+            response = self._post("resume.pdf", b"%PDF-1.4 corrupted")
+
+        assert response.status_code == 202
+        job = self._job(response.json()["job_id"])
+        assert job["stage"] == "failed"
+        assert job["error"] == "Could not extract text from PDF"
+        assert job["resume_id"] is None
+        assert self.db.query(Resume).count() == 0
+
+    def test_upload_resume_ai_error(self):
+        """AI parsing errors fail the job with a generic message."""
+        with patch.object(resume_parser_service, "extract_text", return_value="text " * 20), \
+             patch.object(resume_parser_service, "parse_resume_with_ai", side_effect=Exception("API key invalid")):
+            response = self._post("resume.pdf", b"%PDF-1.4 resume")
+
+        assert response.status_code == 202
+        job = self._job(response.json()["job_id"])
+        assert job["stage"] == "failed"
+        assert "API key" not in job["error"]
+        assert self.db.query(Resume).count() == 0
 
 
 if __name__ == "__main__":
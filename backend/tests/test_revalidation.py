@@ -0,0 +1,83 @@
+"""
+Tests for the on-demand ISR revalidation notifier.
+"""
+
+import json
+import threading
+import time
+
+import httpx
+
+import app.services.revalidation_service as rs
+from app.models.blog import BlogPost
+from app.services.revalidation_service import RevalidationNotifier
+
+
+class TestRevalidationNotifier:
+    """Test suite for debouncing, batching and change detection."""
+
+    def setup_method(self):
+        self.notifier = RevalidationNotifier()
+        self.notifier.secret = "s3cret"
+        self.notifier.debounce = 0.05
+        self.notifier.max_wait = 1.0
+        self.requests = []
+        self.sent = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append((request.headers["X-Revalidate-Secret"], json.loads(request.content)["paths"]))
+            self.sent.set()
+            return httpx.Response(200, json={"revalidated": 1})
+
+        self.notifier._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_debounced_into_one_request(self):
+        """Changes in quick succession go out as one deduplicated batch."""
+        self.notifier.queue_posts(["a"])
+        self.notifier.queue_posts(["b", "a"])
+        assert self.requests == []
+
+        assert self.sent.wait(2)
+        time.sleep(0.1)
+        assert self.requests == [("s3cret", ["/blog", "/blog/a", "/blog/b"])]
+
+    def test_flush_batches_large_sets(self, monkeypatch):
+        """More paths than the per-request cap are split into several POSTs."""
+        monkeypatch.setattr(rs, "MAX_PATHS_PER_REQUEST", 2)
+        self.notifier.debounce = 60
+        self.notifier.queue_posts(["a", "b", "c"])
+
+        result = self.notifier.flush()
+
+        assert result == {"sent": 4, "failed": 0, "errors": []}
+        assert [len(paths) for _, paths in self.requests] == [2, 2]
+
+    def test_disabled_without_secret(self):
+        """No secret → nothing is queued or sent."""
+        self.notifier.secret = None
+        self.notifier.queue_posts(["a"])
+        assert self.notifier.flush()["sent"] == 0
+        assert self.requests == []
+
+    def test_commit_queues_changed_posts(self, monkeypatch, isolated_db):
+        """Committed post changes are queued; bookkeeping-only updates are not."""
+        queued = []
+        monkeypatch.setattr(rs.revalidation_notifier, "queue_posts", lambda slugs: queued.append(sorted(slugs)))
+
+        db = isolated_db(BlogPost)()
+
+        post = BlogPost(slug="ats-tips", title="ATS tips", category="resume-tips")
+        db.add(post)
+        db.commit()
+        assert queued == [["ats-tips"]]
+
+        post.indexnow_submitted = True
+        db.commit()
+        assert queued == [["ats-tips"]]
+
+        post.title = "ATS tips (2026)"
+        db.flush()
+        db.rollback()
+        assert queued == [["ats-tips"]]
+
+        db.close()
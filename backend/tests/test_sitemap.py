@@ -0,0 +1,111 @@
+"""
+Tests for the sharded, streamed blog sitemap.
+"""
+
+import asyncio
+import gzip
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+import pytest
+
+import app.services.redis_service as redis_service_module
+from app.config import get_settings
+from app.models.blog import BlogPost
+from app.services.sitemap_service import (
+    XMLNS,
+    get_cached_shard,
+    gunzip_chunks,
+    iter_index_xml,
+    iter_shard_xml,
+    sitemap_base_url,
+    sitemap_shards,
+    stream_and_cache_shard,
+)
+
+NS = {"sm": XMLNS}
+
+
+class _MemoryRedis:
+    """The few redis.asyncio.Redis commands the shard cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+class TestSitemap:
+    """Test suite for shard boundaries, XML output and shard caching."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, isolated_db):
+        """SQLite blog table with 7 published posts and a draft; in-memory Redis."""
+        self.db = isolated_db(BlogPost)()
+
+        for i in range(1, 9):
+            self.db.add(BlogPost(
+                slug=f"post-{i}" if i != 5 else "q&a-post",
+                title=f"Post {i}",
+                category="resume-tips",
+                status="draft" if i == 4 else "published",
+                published_at=datetime(2026, 1, i),
+                updated_at=datetime(2026, 2, i, 10, 30),
+            ))
+        self.db.commit()
+
+        self.previous = redis_service_module.redis_service
+        self.redis = redis_service_module.RedisService(get_settings())
+        self.redis.redis = _MemoryRedis()
+        self.redis.is_connected = True
+        redis_service_module.redis_service = self.redis
+        yield
+        redis_service_module.redis_service = self.previous
+        self.db.close()
+
+    def _locs(self, xml: str) -> list[str]:
+        root = ET.fromstring(xml)
+        return [el.text for el in root.iter(f"{{{XMLNS}}}loc")]
+
+    def test_shard_boundaries(self):
+        """Published posts split into id ranges of at most shard_size posts."""
+        shards = sitemap_shards(self.db, shard_size=3)
+
+        assert [(s["shard"], s["first_id"], s["last_id"], s["count"]) for s in shards] == [
+            (1, 1, 3, 3), (2, 5, 7, 3), (3, 8, 8, 1),
+        ]
+        assert shards[1]["lastmod"] == "2026-02-07T10:30:00+00:00"
+
+    def test_index_and_shard_xml(self):
+        """Index points at every shard; shards list escaped post URLs, drafts excluded."""
+        shards = sitemap_shards(self.db, shard_size=3)
+
+        index = "".join(iter_index_xml(shards))
+        assert self._locs(index) == [f"{sitemap_base_url()}-{n}.xml" for n in (1, 2, 3)]
+
+        shard = "".join(iter_shard_xml(self.db, shards[1]))
+        site_url = get_settings().SITE_URL.rstrip("/")
+        assert "q&amp;a-post" in shard
+        assert self._locs(shard) == [
+            f"{site_url}/blog/q&a-post", f"{site_url}/blog/post-6", f"{site_url}/blog/post-7",
+        ]
+        assert ET.fromstring(shard).find("sm:url/sm:lastmod", NS).text == "2026-02-05T10:30:00+00:00"
+
+    def test_streamed_shard_is_cached_as_gzip(self):
+        """The first request streams and caches gzip; the cached copy decompresses to the same XML."""
+        shard = sitemap_shards(self.db)[0]
+
+        async def scenario():
+            assert await get_cached_shard(1) is None
+            streamed = b"".join([chunk async for chunk in stream_and_cache_shard(self.db, shard)])
+            return streamed, await get_cached_shard(1)
+
+        streamed, cached = asyncio.run(scenario())
+
+        assert len(self._locs(streamed.decode())) == 7
+        assert gzip.decompress(cached) == streamed
+        assert b"".join(gunzip_chunks(cached, chunk_size=16)) == streamed
@@ -0,0 +1,114 @@
+"""
+Tests for PDF and DOCX text extraction.
+"""
+
+import zipfile
+from io import BytesIO
+
+import pytest
+from docx import Document
+from reportlab.pdfgen import canvas
+
+from app.services import text_extraction
+from app.services.text_extraction import extract_docx_text, extract_pdf_text, extraction_pool
+
+
+def _pdf(pages: int) -> bytes:
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for n in range(1, pages + 1):
+        pdf.drawString(72, 720, f"Page {n} heading")
+        pdf.drawString(72, 700, f"Experience line {n}")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def _docx_xml(body: str) -> bytes:
+    document = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+        'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+class TestPdfExtraction:
+    """Test suite for page-wise and page-parallel PDF extraction."""
+
+    def test_pages_in_order(self):
+        """Every page's text comes out once, in page order."""
+        text = extract_pdf_text(_pdf(3))
+
+        assert [line for line in text.splitlines() if line] == [
+            "Page 1 heading", "Experience line 1",
+            "Page 2 heading", "Experience line 2",
+            "Page 3 heading", "Experience line 3",
+        ]
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        """Long documents split across worker processes give the same text."""
+        pdf = _pdf(9)
+        monkeypatch.setattr(text_extraction.settings, "RESUME_EXTRACT_WORKERS", 0)
+        serial = extract_pdf_text(pdf)
+
+        monkeypatch.setattr(text_extraction.settings, "RESUME_EXTRACT_WORKERS", 2)
+        monkeypatch.setattr(text_extraction.settings, "RESUME_EXTRACT_PARALLEL_PAGES", 4)
+        monkeypatch.setattr(text_extraction, "_usable_cpus", lambda: 4)
+        try:
+            parallel = extract_pdf_text(BytesIO(pdf))
+            assert extraction_pool.workers == 2
+        finally:
+            extraction_pool.shutdown()
+
+        assert parallel == serial
+        assert "Page 9 heading" in parallel
+
+    def test_invalid_pdf(self):
+        """Garbage raises instead of returning empty text."""
+        with pytest.raises(Exception):
+            extract_pdf_text(b"%PDF-1.4 not really")
+
+
+class TestDocxExtraction:
+    """Test suite for streaming DOCX extraction."""
+
+    def test_document_order_with_tables(self):
+        """Table cells appear where the table is, between the paragraphs around it."""
+        document = Document()
+        document.add_paragraph("Jane Doe")
+        table = document.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "Python"
+        table.cell(0, 1).text = "Expert"
+        document.add_paragraph("")
+        document.add_paragraph("Experience")
+        buffer = BytesIO()
+        document.save(buffer)
+
+        assert extract_docx_text(buffer).splitlines() == ["Jane Doe", "Python", "Expert", "Experience"]
+
+    def test_runs_tabs_breaks_and_text_boxes(self):
+        """Run text is joined; text boxes are read once, not from the fallback copy."""
+        body = (
+            "<w:p><w:r><w:t>Jane</w:t></w:r><w:r><w:tab/><w:t xml:space='preserve'>Doe </w:t></w:r>"
+            "<w:r><w:br/><w:t>Berlin</w:t></w:r></w:p>"
+            "<w:p><w:r><mc:AlternateContent>"
+            "<mc:Choice><w:txbxContent><w:p><w:r><w:t>Skills box</w:t></w:r></w:p></w:txbxContent></mc:Choice>"
+            "<mc:Fallback><w:txbxContent><w:p><w:r><w:t>Skills box</w:t></w:r></w:p></w:txbxContent></mc:Fallback>"
+            "</mc:AlternateContent></w:r></w:p>"
+            "<w:p><w:del><w:r><w:delText>removed</w:delText></w:r></w:del></w:p>"
+        )
+
+        assert extract_docx_text(_docx_xml(body)).splitlines() == ["Jane\tDoe ", "Berlin", "Skills box"]
+
+    def test_not_a_docx(self):
+        """A ZIP without a Word document raises."""
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("hello.txt", "hi")
+
+        with pytest.raises(KeyError):
+            extract_docx_text(buffer.getvalue())
@@ -0,0 +1,129 @@
+"""
+Tests for the streaming, size-capped upload reader.
+"""
+
+import asyncio
+import hashlib
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.utils import uploads
+from app.utils.uploads import SpooledUpload, read_upload, resume_upload, sniff_file_type
+
+PDF = b"%PDF-1.4\n" + b"resume text " * 200
+BOUNDARY = "upload-test-boundary"
+
+
+def _multipart(filename: str, content: bytes, field: str = "file") -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + content + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+class TestUploadReader:
+    """Test suite for resume_upload and magic-byte sniffing."""
+
+    def setup_method(self):
+        """A throwaway app with one endpoint that reports what it received."""
+        app = FastAPI()
+        self.received = []
+
+        @app.post("/upload")
+        async def upload(upload: SpooledUpload = Depends(resume_upload)):
+            self.received.append(upload)
+            return {
+                "filename":  upload.filename,
+                "size":      upload.size,
+                "file_type": upload.file_type,
+                "sha256":    upload.sha256,
+                "on_disk":   upload.file._rolled,
+                "head":      upload.file.read(8).decode("latin-1"),
+            }
+
+        self.client = TestClient(app)
+
+    @pytest.fixture(autouse=True)
+    def _limits(self, monkeypatch):
+        monkeypatch.setattr(uploads.settings, "RESUME_UPLOAD_MAX_MB", 1)
+        monkeypatch.setattr(uploads.settings, "RESUME_UPLOAD_SPOOL_KB", 1024)
+
+    def _post(self, body, **headers):
+        headers["Content-Type"] = f"multipart/form-data; boundary={BOUNDARY}"
+        return self.client.post("/upload", content=body, headers=headers)
+
+    def test_valid_pdf(self):
+        """A PDF is read into memory, hashed and handed over at position 0."""
+        response = self._post(_multipart("cv.pdf", PDF))
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "filename": "cv.pdf", "size": len(PDF), "file_type": "pdf",
+            "sha256": hashlib.sha256(PDF).hexdigest(), "on_disk": False, "head": "%PDF-1.4",
+        }
+        assert self.received[0].file.closed
+
+    def test_large_files_spool_to_disk(self, monkeypatch):
+        """Above the in-memory threshold the file moves to a temporary file."""
+        monkeypatch.setattr(uploads.settings, "RESUME_UPLOAD_SPOOL_KB", 1)
+        response = self._post(_multipart("cv.pdf", PDF * 20))
+
+        assert response.status_code == 200
+        assert response.json()["on_disk"] is True
+        assert response.json()["size"] == len(PDF) * 20
+
+    def test_file_type_comes_from_content(self):
+        """A DOCX named .pdf is a DOCX; text named .pdf is rejected."""
+        docx = b"PK\x03\x04" + b"\0" * 2000
+        assert self._post(_multipart("cv.pdf", docx)).json()["file_type"] == "docx"
+
+        response = self._post(_multipart("cv.pdf", b"MZ\x90\0" + b"\0" * 2000))
+        assert response.status_code == 400
+        assert "not a PDF or Word document" in response.json()["detail"]
+
+    def test_rejections(self):
+        """Wrong extension, legacy .doc, empty and missing files are 400s."""
+        cases = [
+            (_multipart("cv.txt", PDF), "Invalid file format"),
+            (_multipart("cv.doc", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 100), "Legacy .doc"),
+            (_multipart("cv.pdf", b""), "Uploaded file is empty"),
+            (_multipart("cv.pdf", PDF, field="other"), "No file uploaded"),
+        ]
+        for body, detail in cases:
+            response = self._post(body)
+            assert response.status_code == 400
+            assert detail in response.json()["detail"]
+
+    def test_size_limit_is_enforced_while_streaming(self):
+        """Oversized uploads fail on Content-Length, or mid-stream without one."""
+        body = _multipart("cv.pdf", PDF * 1000)
+
+        response = self._post(body)
+        assert response.status_code == 400
+        assert "exceeds 1MB limit" in response.json()["detail"]
+
+        chunks_read = []
+
+        class ChunkedRequest:
+            headers = {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+            async def stream(self):
+                for start in range(0, len(body), 64 * 1024):
+                    chunks_read.append(start)
+                    yield body[start:start + 64 * 1024]
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(read_upload(ChunkedRequest()))
+        assert "exceeds 1MB limit" in exc.value.detail
+        assert len(chunks_read) == 17   # stopped right after the first MB
+
+    def test_sniff_file_type(self):
+        """Magic numbers, not names, decide the type."""
+        assert sniff_file_type(b"%PDF-1.7") == "pdf"
+        assert sniff_file_type(b"\n\n%PDF-1.3") == "pdf"
+        assert sniff_file_type(b"PK\x03\x04rest") == "docx"
+        assert sniff_file_type(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1") == "doc"
+        assert sniff_file_type(b"{\\rtf1") is None
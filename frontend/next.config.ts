@@ -1,6 +1,21 @@
 import type { NextConfig } from "next";
 
+const API_URL = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000";
+
 const nextConfig: NextConfig = {
+  // Blog sitemaps are generated (sharded, 50k URLs each) by the backend
+  async rewrites() {
+    return [
+      {
+        source: "/sitemaps/blog.xml",
+        destination: `${API_URL}/api/blog/sitemap.xml`,
+      },
+      {
+        source: "/sitemaps/blog-:shard.xml",
+        destination: `${API_URL}/api/blog/sitemap-:shard.xml`,
+      },
+    ];
+  },
   async redirects() {
     return [
       {
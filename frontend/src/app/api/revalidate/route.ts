@@ -0,0 +1,43 @@
+import { revalidatePath } from 'next/cache';
+import { NextRequest, NextResponse } from 'next/server';
+
+/**
+ * On-demand ISR revalidation, called by the backend whenever blog posts
+ * are published or edited (backend/app/services/revalidation_service.py).
+ *
+ * POST { "paths": ["/blog/some-post", "/blog"] }
+ * Header: X-Revalidate-Secret: $REVALIDATE_SECRET
+ */
+
+const MAX_PATHS = 100;
+
+export async function POST(request: NextRequest) {
+  const secret = process.env.REVALIDATE_SECRET;
+  if (!secret || request.headers.get('x-revalidate-secret') !== secret) {
+    return NextResponse.json({ error: 'Invalid secret' }, { status: 401 });
+  }
+
+  let paths: unknown;
+  try {
+    ({ paths } = await request.json());
+  } catch {
+    return NextResponse.json({ error: 'Invalid JSON body' }, { status: 400 });
+  }
+
+  if (
+    !Array.isArray(paths) ||
+    paths.length > MAX_PATHS ||
+    !paths.every((p) => typeof p === 'string' && p.startsWith('/blog'))
+  ) {
+    return NextResponse.json(
+      { error: `paths must be up to ${MAX_PATHS} /blog paths` },
+      { status: 400 },
+    );
+  }
+
+  for (const path of paths as string[]) {
+    revalidatePath(path);
+  }
+
+  return NextResponse.json({ revalidated: paths.length, now: Date.now() });
+}
@@ -4,8 +4,11 @@ import { notFound } from 'next/navigation';
 import { fetchAllSlugs, fetchBlogPost, fetchRelatedPosts } from '@/lib/blog-api';
 import ReadingProgress from '@/components/blog/ReadingProgress';
 
-// ISR — revalidate every hour so updated posts appear automatically
-export const revalidate = 3600;
+// ISR — with REVALIDATE_SECRET set, pages are revalidated on demand when
+// posts change (src/app/api/revalidate) and the daily interval is only a
+// safety net. Without it the blog API fetches lower this to an hour (see
+// BLOG_REVALIDATE_SECONDS in src/lib/blog-api.ts).
+export const revalidate = 86400;
 
 interface PageProps {
   params: Promise<{ slug: string }>;
@@ -7,8 +7,11 @@ import {
   type BlogPost,
 } from '@/lib/blog-api';
 
-// ISR — revalidate every hour so new published blogs appear automatically
-export const revalidate = 3600;
+// ISR — with REVALIDATE_SECRET set, pages are revalidated on demand when
+// posts change (src/app/api/revalidate) and the daily interval is only a
+// safety net. Without it the blog API fetches lower this to an hour (see
+// BLOG_REVALIDATE_SECONDS in src/lib/blog-api.ts).
+export const revalidate = 86400;
 
 export const metadata: Metadata = {
   title: 'Career Blog | Resume Tips, Interview Prep & Job Search Advice',
@@ -9,6 +9,11 @@ import { Resume } from '@/types/resume';
 import { formatDate, getSubscriptionColor, getATSScoreColor } from '@/lib/utils';
 import UpgradeModal from '@/components/UpgradeModal';
 
+// Background resume parsing: how often to check the job, and when to stop
+// waiting (e.g. the worker died and the job never leaves queued/running)
+const UPLOAD_POLL_INTERVAL_MS = 1500;
+const UPLOAD_POLL_TIMEOUT_MS  = 3 * 60 * 1000;
+
 export default function DashboardPage() {
   const router = useRouter();
   const { user, isAuthenticated, checkAuth } = useAuthStore();
@@ -79,8 +84,21 @@ export default function DashboardPage() {
       const formData = new FormData();
       formData.append('file', file);
       const response = await api.post('/api/resume/upload', formData, { headers: { 'Content-Type': 'multipart/form-data' } });
+      // Parsing runs in the background; poll the job until the resume is saved
+      let job = response.data;
+      const deadline = Date.now() + UPLOAD_POLL_TIMEOUT_MS;
+      while (job.stage !== 'saved' && job.stage !== 'failed') {
+        if (Date.now() > deadline) {
+          alert('Your resume is taking longer than expected to process. Please check your dashboard again in a few minutes.');
+          fetchResumes();
+          return;
+        }
+        await new Promise(resolve => setTimeout(resolve, UPLOAD_POLL_INTERVAL_MS));
+        job = (await api.get(`/api/resume/upload/${job.job_id}`)).data;
+      }
+      if (job.stage === 'failed') { alert(job.error || 'Failed to upload resume. Please try again.'); return; }
       alert('Resume uploaded successfully! Redirecting to builder...');
-      router.push(`/builder?id=${response.data.id}`);
+      router.push(`/builder?id=${job.resume_id}`);
     } catch (error: any) {
       if (error.response?.status === 429) {
         alert(error.response.data.detail || 'Resume limit reached for your plan');
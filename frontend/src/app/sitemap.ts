@@ -1,6 +1,5 @@
 import { MetadataRoute } from 'next';
 import { getAllJobSlugs, getAllCompanySlugs } from '@/data/jobs';
-import { fetchSitemapData } from '@/lib/blog-api';
 
 export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
   const baseUrl = 'https://resumebuilder.pulsestack.in';
@@ -106,18 +105,8 @@ export default async function sitemap(): Promise<MetadataRoute.Sitemap> {
     priority: 0.9,
   }));
 
-  // Blog posts - use actual publishedAt dates from API
-  const sitemapData = await fetchSitemapData();
-  const blogPages: MetadataRoute.Sitemap = sitemapData.map((entry) => ({
-    url: `${baseUrl}/blog/${entry.slug}`,
-    lastModified: entry.updated_at
-      ? new Date(entry.updated_at)
-      : entry.published_at
-        ? new Date(entry.published_at)
-        : new Date('2026-02-20'),
-    changeFrequency: 'weekly' as const,
-    priority: 0.8,
-  }));
+  // Blog posts are listed in the backend-generated, sharded sitemap index
+  // at /sitemaps/blog.xml (see robots.ts and the rewrites in next.config.ts)
 
-  return [...staticPages, ...jobPages, ...companyPages, ...blogPages];
+  return [...staticPages, ...jobPages, ...companyPages];
 }
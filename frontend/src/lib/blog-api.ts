@@ -1,8 +1,10 @@
 /**
  * Blog API client — server-side only (Next.js Server Components + ISR).
  *
- * All functions use native fetch() with Next.js ISR cache tags so that
- * Railway revalidates stale pages automatically every hour. No axios,
+ * All functions use native fetch() with Next.js ISR caching. When
+ * REVALIDATE_SECRET is configured the backend revalidates changed pages on
+ * demand (/api/revalidate) and the daily interval is only a safety net;
+ * without it pages refresh hourly. No axios,
  * no localStorage — these run on the server.
  *
  * API base: NEXT_PUBLIC_API_URL (e.g. https://…railway.app)
@@ -10,9 +12,17 @@
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL ?? 'http://localhost:8000';
 
+// A fetch's interval caps the interval of every page that uses it, so this
+// also sets how often the blog pages refresh on their own.
+export const BLOG_REVALIDATE_SECONDS = process.env.REVALIDATE_SECRET ? 86400 : 3600;
+
 // ── Shared fetch helper ────────────────────────────────────────────────────
 
-async function apiFetch<T>(path: string, revalidate = 3600, timeoutMs = 8000): Promise<T | null> {
+async function apiFetch<T>(
+  path: string,
+  revalidate = BLOG_REVALIDATE_SECONDS,
+  timeoutMs = 8000,
+): Promise<T | null> {
   try {
     const controller = new AbortController();
     const timer = setTimeout(() => controller.abort(), timeoutMs);
@@ -156,9 +166,16 @@ export async function fetchSitemapData(): Promise<BlogSitemapEntry[]> {
 }
 
 /**
- * Fetch related posts: same category, excluding the given slug (up to `limit`).
+ * Fetch related posts from the precomputed index (shared keywords, tags and
+ * category), most related first. Falls back to the latest posts in the same
+ * category while the index has nothing for this post yet.
  */
 export async function fetchRelatedPosts(slug: string, category: string, limit = 3): Promise<BlogPost[]> {
+  const related = await apiFetch<ApiPost[]>(
+    `/api/blog/${encodeURIComponent(slug)}/related?limit=${limit}`,
+  );
+  if (related && related.length > 0) return related.map(toPost);
+
   const data = await apiFetch<ApiListResponse>(
     `/api/blog?category=${encodeURIComponent(category)}&per_page=${limit + 1}`,
   );